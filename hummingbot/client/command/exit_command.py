@@ -3,6 +3,7 @@
 import asyncio
 from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -37,4 +38,5 @@ class ExitCommand:
         for notifier in self.notifiers:
             notifier.stop()
 
+        await HttpClientRegistry.get_instance().close()
         self.app.exit()
@@ -60,8 +60,19 @@ class StatusCommand:
 
         return "\n".join(lines)
 
+    def clock_status(self,  # type: HummingbotApplication
+                     ):
+        if self.clock is None:
+            self._notify("  Clock tick stats are not available before the bot is started.")
+            return
+        self._notify("\n  Clock:\n" + self.clock.format_tick_stats() + "\n")
+
     def status(self,  # type: HummingbotApplication
-               ) -> bool:
+               clock: bool = False) -> bool:
+        if clock:
+            self.clock_status()
+            return True
+
         # Preliminary checks.
         self._notify("\n  Preliminary checks:")
         if self.config_complete:
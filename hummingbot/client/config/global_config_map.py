@@ -224,6 +224,12 @@ global_config_map = {
         ConfigVar(key="telegram_chat_id",
                   prompt="What is your telegram chat id? >>> ",
                   required_if=lambda: False),
+    "order_book_tracker_process_enabled":
+        ConfigVar(key="order_book_tracker_process_enabled",
+                  prompt="Would you like to track order books in a separate process (y/n)? >>> ",
+                  type_str="bool",
+                  default=False,
+                  required_if=lambda: False),
     "exchange_rate_default_data_feed":
         ConfigVar(key="exchange_rate_default_data_feed",
                   prompt="What is your default exchange rate data feed name? >>> ",
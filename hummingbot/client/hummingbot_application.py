@@ -228,6 +228,7 @@ class HummingbotApplication(*commands):
 
     def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
         ethereum_rpc_url = global_config_map.get("ethereum_rpc_url").value
+        order_book_tracker_process = global_config_map.get("order_book_tracker_process_enabled").value
 
         # aggregate symbols if there are duplicate markets
         market_symbols_map = {}
@@ -273,7 +274,8 @@ class HummingbotApplication(*commands):
                                        binance_api_secret,
                                        order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
                                        symbols=symbols,
-                                       trading_required=self._trading_required)
+                                       trading_required=self._trading_required,
+                                       order_book_tracker_process=order_book_tracker_process)
 
             elif market_name == "radar_relay" and self.wallet:
                 market = RadarRelayMarket(wallet=self.wallet,
@@ -308,7 +310,8 @@ class HummingbotApplication(*commands):
                                      huobi_secret_key,
                                      order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
                                      symbols=symbols,
-                                     trading_required=self._trading_required)
+                                     trading_required=self._trading_required,
+                                     order_book_tracker_process=order_book_tracker_process)
             elif market_name == "bittrex":
                 bittrex_api_key = global_config_map.get("bittrex_api_key").value
                 bittrex_secret_key = global_config_map.get("bittrex_secret_key").value
@@ -29,6 +29,7 @@ from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
 )
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
@@ -187,7 +188,7 @@ class LiquidityBounty(NetworkBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            return HttpClientRegistry.get_instance().client()
         return self._shared_client
 
     async def fetch_active_bounties(self):
@@ -89,6 +89,7 @@ def load_parser(hummingbot) -> ThrowingArgumentParser:
     start_parser.set_defaults(func=hummingbot.start)
 
     status_parser = subparsers.add_parser("status", help="Get current bot status")
+    status_parser.add_argument("--clock", action="store_true", help="Show how long the bot's clock ticks take")
     status_parser.set_defaults(func=hummingbot.status)
 
     stop_parser = subparsers.add_parser('stop', help='Stop the bot\'s active strategy')
@@ -1,5 +1,18 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+
+
+cdef class IteratorTickStats:
+    cdef:
+        int64_t _tick_count
+        double _total_tick_time
+        double _max_tick_time
+        list _histogram
+
+    cdef c_record_tick(self, double duration)
+
+
 cdef class Clock:
     cdef:
         object _clock_mode
@@ -10,3 +23,19 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        dict _iterator_tick_stats
+        int64_t _tick_count
+        int64_t _overrun_tick_count
+        int64_t _missed_tick_count
+        double _max_tick_work_time
+        double _last_tick_drift
+        double _max_tick_drift
+        double _total_tick_drift
+        dict _pending_event_ticks
+        dict _last_event_tick_times
+        int64_t _event_tick_count
+        int64_t _coalesced_event_tick_count
+
+    cdef c_tick_iterator(self, object iterator, double timestamp)
+    cdef c_record_tick(self, double work_time, double drift)
+    cdef c_request_event_tick(self, object iterator, object key, double min_interval)
@@ -2,8 +2,13 @@
 
 import asyncio
 import logging
+import pandas as pd
 import time
-from typing import List
+from typing import (
+    Any,
+    Dict,
+    List,
+)
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
@@ -12,6 +17,54 @@ from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
+# Upper bounds of the tick duration histogram buckets, in seconds. The last bucket counts anything slower.
+TICK_DURATION_BUCKETS = (0.001, 0.01, 0.1, 1.0)
+
+
+cdef class IteratorTickStats:
+    """
+    How long the c_tick() and c_event_tick() calls of a clock's child iterator took.
+    """
+    def __init__(self):
+        self._tick_count = 0
+        self._total_tick_time = 0.0
+        self._max_tick_time = 0.0
+        self._histogram = [0] * (len(TICK_DURATION_BUCKETS) + 1)
+
+    @property
+    def tick_count(self) -> int:
+        return self._tick_count
+
+    @property
+    def total_tick_time(self) -> float:
+        return self._total_tick_time
+
+    @property
+    def mean_tick_time(self) -> float:
+        return self._total_tick_time / self._tick_count if self._tick_count > 0 else 0.0
+
+    @property
+    def max_tick_time(self) -> float:
+        return self._max_tick_time
+
+    @property
+    def histogram(self) -> List[int]:
+        """
+        Number of ticks in each TICK_DURATION_BUCKETS bucket, plus the ticks slower than the last bucket.
+        """
+        return self._histogram.copy()
+
+    cdef c_record_tick(self, double duration):
+        cdef:
+            int bucket = 0
+        self._tick_count += 1
+        self._total_tick_time += duration
+        if duration > self._max_tick_time:
+            self._max_tick_time = duration
+        while bucket < len(TICK_DURATION_BUCKETS) and duration > TICK_DURATION_BUCKETS[bucket]:
+            bucket += 1
+        self._histogram[bucket] += 1
+
 
 cdef class Clock:
     @classmethod
@@ -36,6 +89,18 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._iterator_tick_stats = {}
+        self._pending_event_ticks = {}
+        self._last_event_tick_times = {}
+        self._tick_count = 0
+        self._overrun_tick_count = 0
+        self._missed_tick_count = 0
+        self._max_tick_work_time = 0.0
+        self._last_tick_drift = 0.0
+        self._max_tick_drift = 0.0
+        self._total_tick_drift = 0.0
+        self._event_tick_count = 0
+        self._coalesced_event_tick_count = 0
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +122,70 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def tick_stats(self) -> Dict[str, Any]:
+        """
+        Tick instrumentation. A tick overruns when its total work takes longer than the tick size. Tick drift is how
+        late the clock started working on a tick, versus the wall clock - it's only measured in real time mode.
+        Missed ticks are ticks skipped by the real time clock, because it fell behind. Event ticks are counted separately
+        from regular ticks, and coalesced event ticks are event tick requests merged into an already pending one.
+        """
+        return {
+            "tick_count": self._tick_count,
+            "overrun_tick_count": self._overrun_tick_count,
+            "missed_tick_count": self._missed_tick_count,
+            "max_tick_work_time": self._max_tick_work_time,
+            "last_tick_drift": self._last_tick_drift,
+            "max_tick_drift": self._max_tick_drift,
+            "mean_tick_drift": self._total_tick_drift / self._tick_count if self._tick_count > 0 else 0.0,
+            "event_tick_count": self._event_tick_count,
+            "coalesced_event_tick_count": self._coalesced_event_tick_count,
+        }
+
+    @property
+    def iterator_tick_stats(self) -> Dict[TimeIterator, IteratorTickStats]:
+        return self._iterator_tick_stats
+
+    def reset_tick_stats(self):
+        self._iterator_tick_stats = {}
+        self._tick_count = 0
+        self._overrun_tick_count = 0
+        self._missed_tick_count = 0
+        self._max_tick_work_time = 0.0
+        self._last_tick_drift = 0.0
+        self._max_tick_drift = 0.0
+        self._total_tick_drift = 0.0
+        self._event_tick_count = 0
+        self._coalesced_event_tick_count = 0
+
+    def format_tick_stats(self) -> str:
+        cdef:
+            IteratorTickStats iterator_stats
+        tick_stats = self.tick_stats
+        lines = [
+            f"  Clock ticks: {tick_stats['tick_count']} ({tick_stats['overrun_tick_count']} overrun, "
+            f"{tick_stats['missed_tick_count']} missed)",
+            f"  Max tick work time: {tick_stats['max_tick_work_time'] * 1e3:.3f} ms",
+            f"  Tick drift: {tick_stats['last_tick_drift'] * 1e3:.3f} ms last, "
+            f"{tick_stats['mean_tick_drift'] * 1e3:.3f} ms mean, {tick_stats['max_tick_drift'] * 1e3:.3f} ms max",
+            f"  Event ticks: {tick_stats['event_tick_count']} ({tick_stats['coalesced_event_tick_count']} coalesced "
+            f"requests)",
+        ]
+        if len(self._iterator_tick_stats) < 1:
+            return "\n".join(lines)
+
+        bucket_columns = [f"<={bucket * 1e3:g}ms" for bucket in TICK_DURATION_BUCKETS]
+        bucket_columns.append(f">{TICK_DURATION_BUCKETS[-1] * 1e3:g}ms")
+        rows = []
+        for iterator, iterator_stats in self._iterator_tick_stats.items():
+            rows.append([type(iterator).__name__,
+                         iterator_stats.tick_count,
+                         f"{iterator_stats.mean_tick_time * 1e3:.3f}",
+                         f"{iterator_stats.max_tick_time * 1e3:.3f}"] + iterator_stats.histogram)
+        df = pd.DataFrame(data=rows, columns=["Iterator", "Ticks", "Mean (ms)", "Max (ms)"] + bucket_columns)
+        lines.extend(["", "  Iterator tick times:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+        return "\n".join(lines)
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -64,6 +193,9 @@ cdef class Clock:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        for timer_handle in self._pending_event_ticks.values():
+            timer_handle.cancel()
+        self._pending_event_ticks.clear()
         if self._current_context is not None:
             for iterator in self._current_context:
                 (<TimeIterator>iterator).c_stop(self)
@@ -81,6 +213,12 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        # Don't keep removed iterators alive through the stats and event tick bookkeeping.
+        self._iterator_tick_stats.pop(iterator, None)
+        for event_key in [event_key for event_key in self._pending_event_ticks.keys() if event_key[0] is iterator]:
+            self._pending_event_ticks.pop(event_key).cancel()
+        for event_key in [event_key for event_key in self._last_event_tick_times.keys() if event_key[0] is iterator]:
+            del self._last_event_tick_times[event_key]
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +228,7 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start_time
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -109,26 +248,32 @@ cdef class Clock:
 
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+                if self._started and next_tick_time - self._current_tick > self._tick_size * 1.5:
+                    self._missed_tick_count += <int64_t>round((next_tick_time - self._current_tick) /
+                                                              self._tick_size) - 1
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
+                tick_start_time = time.time()
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
-                    child_iterator = ci
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_iterator(ci, self._current_tick)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                self.c_record_tick(time.time() - tick_start_time, tick_start_time - next_tick_time)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            double tick_start_time
 
         if not self._started:
             for ci in self._child_iterators:
@@ -139,14 +284,15 @@ cdef class Clock:
         try:
             while not (self._current_tick >= timestamp):
                 self._current_tick += self._tick_size
+                tick_start_time = time.perf_counter()
                 for ci in self._child_iterators:
-                    child_iterator = ci
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_iterator(ci, self._current_tick)
                     except StopIteration:
                         raise
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                self.c_record_tick(time.perf_counter() - tick_start_time, 0.0)
         except StopIteration:
             return
         finally:
@@ -157,3 +303,78 @@ cdef class Clock:
     def backtest(self):
         self.backtest_til(self._end_time)
 
+    cdef c_tick_iterator(self, object iterator, double timestamp):
+        cdef:
+            TimeIterator child_iterator = iterator
+            IteratorTickStats iterator_stats = self._iterator_tick_stats.get(iterator)
+            double start_time = time.perf_counter()
+        try:
+            child_iterator.c_tick(timestamp)
+        finally:
+            if iterator_stats is None:
+                iterator_stats = IteratorTickStats()
+                self._iterator_tick_stats[iterator] = iterator_stats
+            iterator_stats.c_record_tick(time.perf_counter() - start_time)
+
+    cdef c_record_tick(self, double work_time, double drift):
+        self._tick_count += 1
+        if work_time > self._tick_size:
+            self._overrun_tick_count += 1
+        if work_time > self._max_tick_work_time:
+            self._max_tick_work_time = work_time
+        self._last_tick_drift = drift
+        self._total_tick_drift += drift
+        if drift > self._max_tick_drift:
+            self._max_tick_drift = drift
+
+    cdef c_request_event_tick(self, object iterator, object key, double min_interval):
+        """
+        Schedules an out of band c_event_tick() call to a child iterator, e.g. for a strategy to react to an order book
+        change before the next tick. Requests are debounced per (iterator, key): the event tick runs as soon as
+        possible, but no sooner than min_interval seconds after the last event tick for the same key. Requests made
+        while an event tick is already pending are coalesced into it.
+
+        Event ticks are only run in real time mode, inside the clock context. In back testing mode, the regular ticks
+        already see every order book change, so requests are ignored.
+        """
+        cdef:
+            tuple event_key = (iterator, key)
+            double now
+            double delay
+        if self._clock_mode is not ClockMode.REALTIME or self._current_context is None:
+            return
+        if event_key in self._pending_event_ticks:
+            self._coalesced_event_tick_count += 1
+            return
+        now = time.time()
+        delay = max(0.0, self._last_event_tick_times.get(event_key, 0.0) + min_interval - now)
+        self._pending_event_ticks[event_key] = asyncio.get_event_loop().call_later(delay,
+                                                                                  self._run_event_tick,
+                                                                                  event_key)
+
+    def request_event_tick(self, iterator: TimeIterator, key: Any, min_interval: float):
+        self.c_request_event_tick(iterator, key, min_interval)
+
+    def _run_event_tick(self, event_key: tuple):
+        cdef:
+            TimeIterator child_iterator
+            IteratorTickStats iterator_stats
+            double timestamp = time.time()
+            double start_time = time.perf_counter()
+        self._pending_event_ticks.pop(event_key, None)
+        iterator, key = event_key
+        if self._current_context is None or iterator not in self._current_context:
+            return
+        child_iterator = iterator
+        self._last_event_tick_times[event_key] = timestamp
+        self._event_tick_count += 1
+        try:
+            child_iterator.c_event_tick(timestamp, key)
+        except Exception:
+            self.logger().error("Unexpected error running clock event tick.", exc_info=True)
+        finally:
+            iterator_stats = self._iterator_tick_stats.get(iterator)
+            if iterator_stats is None:
+                iterator_stats = IteratorTickStats()
+                self._iterator_tick_stats[iterator] = iterator_stats
+            iterator_stats.c_record_tick(time.perf_counter() - start_time)
@@ -62,6 +62,10 @@ LimitOrder &LimitOrder::operator=(const LimitOrder &other) {
 }
 
 bool operator<(LimitOrder const &a, LimitOrder const &b) {
+    if ((bool)(PyObject_RichCompareBool(a.price, b.price, Py_EQ))) {
+        // Orders at the same price are ordered by client order ID, so they don't replace each other in a set.
+        return a.clientOrderID < b.clientOrderID;
+    }
     return (bool)(PyObject_RichCompareBool(a.price, b.price, Py_LT));
 }
 
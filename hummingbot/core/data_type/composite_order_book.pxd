@@ -1,8 +1,30 @@
 # distutils: language=c++
+from libc.stdint cimport int64_t
+cimport numpy as np
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
+        OrderBook _bid_side_book
+        OrderBook _ask_side_book
+        int64_t _bid_side_book_version
+        int64_t _ask_side_book_version
+        int64_t _bid_side_traded_version
+        int64_t _ask_side_traded_version
 
-    cdef double c_get_price(self, bint is_buy) except? -1
\ No newline at end of file
+    cdef double c_get_price(self, bint is_buy) except? -1
+    cdef OrderBook c_composite_side_book(self, bint is_buy)
+    cdef tuple c_fill_numpy_snapshot(self,
+                                     np.ndarray[np.float64_t, ndim=2] bids_array,
+                                     np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef list c_get_price_for_volumes(self, bint is_buy, list volumes)
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, list volumes)
+    cdef list c_get_volume_for_prices(self, bint is_buy, list prices)
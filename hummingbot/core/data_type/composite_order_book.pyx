@@ -9,6 +9,7 @@ from cython.operator cimport (
     address as ref
 )
 from libcpp.vector cimport vector
+cimport numpy as np
 
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -24,6 +25,10 @@ cdef class CompositeOrderBook(OrderBook):
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
         self._traded_order_book = OrderBook()
+        self._bid_side_book = None
+        self._ask_side_book = None
+        self._bid_side_book_version = self._ask_side_book_version = -1
+        self._bid_side_traded_version = self._ask_side_traded_version = -1
 
     @property
     def traded_order_book(self) -> OrderBook:
@@ -32,6 +37,8 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._traded_order_book._version += 1
+        self._version += 1
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -75,6 +82,8 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        # The composite view has changed, even though the underlying order book has not.
+        self._version += 1
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -129,7 +138,8 @@ cdef class CompositeOrderBook(OrderBook):
 
             inc(order_it)
 
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+        if cpp_bids_changes.size() > 0 or cpp_asks_changes.size() > 0:
+            self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
 
     def ask_entries(self) -> Iterator[OrderBookRow]:
@@ -178,7 +188,8 @@ cdef class CompositeOrderBook(OrderBook):
 
             inc(order_it)
 
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+        if cpp_bids_changes.size() > 0 or cpp_asks_changes.size() > 0:
+            self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
@@ -197,3 +208,80 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    cdef OrderBook c_composite_side_book(self, bint is_buy):
+        # The native depth queries in OrderBook walk the raw C++ books, which would ignore the recorded fills. So
+        # materialize the composite entries for the queried side into a plain order book and query that instead. The
+        # materialized side is kept until either the order book or the recorded fills change.
+        cdef:
+            OrderBook side_book
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+
+        if is_buy:
+            if (self._ask_side_book is not None and
+                    self._ask_side_book_version == self._version and
+                    self._ask_side_traded_version == self._traded_order_book._version):
+                return self._ask_side_book
+        elif (self._bid_side_book is not None and
+                self._bid_side_book_version == self._version and
+                self._bid_side_traded_version == self._traded_order_book._version):
+            return self._bid_side_book
+
+        side_book = OrderBook()
+        if is_buy:
+            for row in self.ask_entries():
+                cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        else:
+            for row in self.bid_entries():
+                cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        side_book.c_apply_snapshot(cpp_bids, cpp_asks, self._snapshot_uid)
+
+        # The versions are taken after the walk, since it may clean up the recorded fills - which doesn't change the
+        # composite entries.
+        if is_buy:
+            self._ask_side_book = side_book
+            self._ask_side_book_version = self._version
+            self._ask_side_traded_version = self._traded_order_book._version
+        else:
+            self._bid_side_book = side_book
+            self._bid_side_book_version = self._version
+            self._bid_side_traded_version = self._traded_order_book._version
+        return side_book
+
+    cdef tuple c_fill_numpy_snapshot(self,
+                                     np.ndarray[np.float64_t, ndim=2] bids_array,
+                                     np.ndarray[np.float64_t, ndim=2] asks_array):
+        cdef:
+            OrderBook bid_book = self.c_composite_side_book(False)
+            OrderBook ask_book = self.c_composite_side_book(True)
+            tuple bid_counts = bid_book.c_fill_numpy_snapshot(bids_array, asks_array)
+            tuple ask_counts = ask_book.c_fill_numpy_snapshot(bids_array, asks_array)
+        return bid_counts[0], ask_counts[1]
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        return self.c_composite_side_book(is_buy).c_get_price_for_volume(is_buy, volume)
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        return self.c_composite_side_book(is_buy).c_get_price_for_quote_volume(is_buy, quote_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        return self.c_composite_side_book(is_buy).c_get_volume_for_price(is_buy, price)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        return self.c_composite_side_book(is_buy).c_get_quote_volume_for_price(is_buy, price)
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        return self.c_composite_side_book(is_buy).c_get_vwap_for_volume(is_buy, volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        return self.c_composite_side_book(is_buy).c_get_quote_volume_for_base_amount(is_buy, base_amount)
+
+    cdef list c_get_price_for_volumes(self, bint is_buy, list volumes):
+        return self.c_composite_side_book(is_buy).c_get_price_for_volumes(is_buy, volumes)
+
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, list volumes):
+        return self.c_composite_side_book(is_buy).c_get_vwap_for_volumes(is_buy, volumes)
+
+    cdef list c_get_volume_for_prices(self, bint is_buy, list prices):
+        return self.c_composite_side_book(is_buy).c_get_volume_for_prices(is_buy, prices)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import multiprocessing
+import queue
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.shared_order_book_ring import (
+    SharedOrderBookRing,
+    TopOfBookFrame,
+)
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTradeEvent,
+)
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+class OrderBookTrackerPublisher:
+    """
+    Runs in the worker process of a MultiProcessOrderBookTracker. Publishes the order books of the worker's tracker to
+    the shared ring whenever they change, and forwards their trades to the main process.
+    """
+    def __init__(self,
+                 order_book_tracker: OrderBookTracker,
+                 ring: SharedOrderBookRing,
+                 trade_queue: multiprocessing.Queue):
+        self._order_book_tracker: OrderBookTracker = order_book_tracker
+        self._ring: SharedOrderBookRing = ring
+        self._trade_queue: multiprocessing.Queue = trade_queue
+        self._published_versions: Dict[str, int] = {}
+        self._trade_forwarders: Dict[str, EventForwarder] = {}
+
+    def publish_order_books(self):
+        symbols: List[str] = self._ring.symbols
+        order_books: Dict[str, OrderBook] = self._order_book_tracker.order_books
+        for symbol in symbols:
+            order_book: Optional[OrderBook] = order_books.get(symbol)
+            if order_book is None:
+                continue
+            if symbol not in self._trade_forwarders:
+                self._trade_forwarders[symbol] = EventForwarder(self._trade_queue.put_nowait)
+                order_book.add_listener(OrderBookEvent.TradeEvent, self._trade_forwarders[symbol])
+            if order_book.version == self._published_versions.get(symbol):
+                continue
+            bids_array, asks_array = order_book.get_numpy_snapshot(self._ring.depth)
+            update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
+            self._ring.publish(symbol, bids_array, asks_array, update_id, time.time())
+            self._published_versions[symbol] = order_book.version
+
+    async def run(self, publish_interval: float):
+        safe_ensure_future(self._order_book_tracker.start())
+        while True:
+            self.publish_order_books()
+            await asyncio.sleep(publish_interval)
+
+
+def run_order_book_tracker_worker(tracker_factory: Callable[[], OrderBookTracker],
+                                  ring: SharedOrderBookRing,
+                                  trade_queue: multiprocessing.Queue,
+                                  publish_interval: float):
+    ev_loop: asyncio.BaseEventLoop = asyncio.new_event_loop()
+    asyncio.set_event_loop(ev_loop)
+    # The tracker is created in the worker process, so it's bound to the worker's event loop.
+    publisher: OrderBookTrackerPublisher = OrderBookTrackerPublisher(tracker_factory(), ring, trade_queue)
+    ev_loop.run_until_complete(publisher.run(publish_interval))
+
+
+class MultiProcessOrderBookTracker(OrderBookTracker):
+    """
+    Runs another order book tracker in a worker process, so that decoding the exchange's messages and applying diffs
+    doesn't hold up the main event loop, which also runs the clock and the strategies.
+
+    The worker publishes the top `depth` levels of each order book to a SharedOrderBookRing whenever it changes. The
+    order books of this tracker are refreshed from the ring every `poll_interval` seconds, so the usual OrderBook API
+    - c_get_price(), c_get_vwap_for_volume() and so on - works on them as before, over the top `depth` levels. Trades
+    are forwarded from the worker, and emitted by the order books in the main process as usual.
+
+    `tracker_factory` is called in the worker process, and must be picklable - e.g. functools.partial() of a tracker
+    class. The trading pairs must be given up front.
+    """
+    WORKER_JOIN_TIMEOUT = 5.0
+
+    _mpobt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mpobt_logger is None:
+            cls._mpobt_logger = logging.getLogger(__name__)
+        return cls._mpobt_logger
+
+    def __init__(self,
+                 tracker_factory: Callable[[], OrderBookTracker],
+                 symbols: List[str],
+                 exchange_name: str,
+                 depth: int = 20,
+                 ring_size: int = 8,
+                 publish_interval: float = 0.005,
+                 poll_interval: float = 0.005,
+                 order_book_create_function: Callable[[], OrderBook] = OrderBook):
+        super().__init__()
+        if not symbols:
+            raise ValueError("The trading pairs of a multi-process order book tracker must be given up front.")
+        self._tracker_factory: Callable[[], OrderBookTracker] = tracker_factory
+        self._exchange_name: str = exchange_name
+        self._ring: SharedOrderBookRing = SharedOrderBookRing(symbols, depth=depth, ring_size=ring_size)
+        self._publish_interval: float = publish_interval
+        self._poll_interval: float = poll_interval
+        self._order_books = {symbol: order_book_create_function() for symbol in symbols}
+        self._last_sequences: Dict[str, int] = {symbol: 0 for symbol in symbols}
+        self._mp_context = multiprocessing.get_context("spawn")
+        self._trade_queue: Optional[multiprocessing.Queue] = None
+        self._worker_process: Optional[multiprocessing.Process] = None
+        self._refresh_order_books_task: Optional[asyncio.Task] = None
+
+        self._frames_applied: int = 0
+        self._frames_skipped: int = 0
+        self._trades_applied: int = 0
+        self._last_frame_lag: float = 0.0
+
+    @property
+    def data_source(self) -> Optional[OrderBookTrackerDataSource]:
+        # The data source lives in the worker process.
+        return None
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    @property
+    def ring(self) -> SharedOrderBookRing:
+        return self._ring
+
+    @property
+    def ready(self) -> bool:
+        return all(sequence > 0 for sequence in self._last_sequences.values())
+
+    @property
+    def worker_stats(self) -> Dict[str, Any]:
+        """
+        Frames applied to the order books in the main process, frames skipped because the worker published newer ones
+        in between two refreshes, trades forwarded, and the time from publishing to applying the latest frame.
+        """
+        return {
+            "worker_alive": self._worker_process is not None and self._worker_process.is_alive(),
+            "frames_applied": self._frames_applied,
+            "frames_skipped": self._frames_skipped,
+            "trades_applied": self._trades_applied,
+            "last_frame_lag": self._last_frame_lag,
+        }
+
+    def refresh_order_books(self):
+        """
+        Applies the latest frame of every order book that has been updated by the worker, and emits the trades it has
+        forwarded since the last refresh.
+        """
+        for symbol, order_book in self._order_books.items():
+            last_sequence: int = self._last_sequences[symbol]
+            frame: Optional[TopOfBookFrame] = self._ring.read(symbol, last_sequence)
+            if frame is None:
+                continue
+            order_book.apply_numpy_snapshot(frame.bids, frame.asks, frame.update_id)
+            self._last_sequences[symbol] = frame.sequence
+            self._frames_applied += 1
+            self._frames_skipped += frame.sequence - last_sequence - 1 if last_sequence > 0 else 0
+            self._last_frame_lag = time.time() - frame.timestamp
+
+        if self._ready_timestamp is None and self.ready:
+            self._ready_timestamp = time.time()
+
+        if self._trade_queue is None:
+            return
+        while True:
+            try:
+                trade_event: OrderBookTradeEvent = self._trade_queue.get_nowait()
+            except queue.Empty:
+                break
+            order_book: Optional[OrderBook] = self._order_books.get(trade_event.symbol)
+            if order_book is not None:
+                order_book.apply_trade(trade_event)
+                self._trades_applied += 1
+
+    async def _refresh_order_books_loop(self):
+        while True:
+            try:
+                self.refresh_order_books()
+                await asyncio.sleep(self._poll_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error refreshing {self._exchange_name} order books from the worker process.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error refreshing order books. Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+
+    async def start(self):
+        self.stop()
+        self._start_timestamp = time.time()
+        self._ready_timestamp = None
+        self._trade_queue = self._mp_context.Queue()
+        self._worker_process = self._mp_context.Process(
+            target=run_order_book_tracker_worker,
+            args=(self._tracker_factory, self._ring, self._trade_queue, self._publish_interval),
+            name=f"{self._exchange_name}_order_book_tracker",
+            daemon=True
+        )
+        self._worker_process.start()
+        self._refresh_order_books_task = safe_ensure_future(self._refresh_order_books_loop())
+
+    def stop(self):
+        if self._refresh_order_books_task is not None:
+            self._refresh_order_books_task.cancel()
+            self._refresh_order_books_task = None
+        if self._worker_process is not None:
+            self._worker_process.terminate()
+            self._worker_process.join(self.WORKER_JOIN_TIMEOUT)
+            self._worker_process = None
+        if self._trade_queue is not None:
+            self._trade_queue.close()
+            self._trade_queue = None
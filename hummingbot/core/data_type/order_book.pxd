@@ -16,20 +16,41 @@ cdef class OrderBook(PubSub):
     cdef int64_t _last_diff_uid
     cdef double _best_bid
     cdef double _best_ask
+    cdef int64_t _version
+    cdef int64_t _bid_index_version
+    cdef int64_t _ask_index_version
+    cdef vector[double] _bid_prices
+    cdef vector[double] _bid_cumulative_base
+    cdef vector[double] _bid_cumulative_quote
+    cdef vector[double] _ask_prices
+    cdef vector[double] _ask_cumulative_base
+    cdef vector[double] _ask_cumulative_quote
+    cdef int _top_levels_watched
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef double c_get_level_price(self, bint is_bid, int level)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=*)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=*)
+    cdef tuple c_fill_numpy_snapshot(self,
+                                     np.ndarray[np.float64_t, ndim=2] bids_array,
+                                     np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_build_depth_index(self, bint is_buy)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef double c_get_amount_at_price(self, bint is_bid, double price)
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef list c_get_price_for_volumes(self, bint is_buy, list volumes)
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, list volumes)
+    cdef list c_get_volume_for_prices(self, bint is_buy, list prices)
@@ -9,6 +9,7 @@ from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookTopChangedEvent,
     OrderBookTradeEvent
 )
 from typing import (
@@ -21,7 +22,10 @@ from typing import (
 from aiokafka import ConsumerRecord
 import pandas as pd
 import numpy as np
-from .order_book_message import OrderBookMessage
+from .order_book_message import (
+    OrderBookMessage,
+    CompactOrderBookMessage
+)
 from .order_book_row import OrderBookRow
 from .order_book_query_result import OrderBookQueryResult
 from sqlalchemy.engine import RowProxy
@@ -32,8 +36,56 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef int64_t c_numpy_rows_to_entries(np.ndarray[np.float64_t, ndim=2] array, vector[OrderBookEntry] &entries):
+    # Converts [price, amount, update_id] rows into order book entries, and returns the largest update ID seen.
+    cdef:
+        size_t num_rows = array.shape[0]
+        size_t i
+        int64_t last_update_id = 0
+
+    entries.reserve(entries.size() + num_rows)
+    for i in range(num_rows):
+        entries.push_back(OrderBookEntry(array[i, 0], array[i, 1], <int64_t>array[i, 2]))
+        last_update_id = max(last_update_id, <int64_t>array[i, 2])
+    return last_update_id
+
+
+cdef inline size_t c_lower_bound_index(vector[double] &values, double target):
+    # Index of the first value that is >= target, or values.size() if there's none. values must be non-decreasing.
+    cdef:
+        size_t low = 0
+        size_t high = values.size()
+        size_t mid
+
+    while low < high:
+        mid = (low + high) >> 1
+        if values[mid] < target:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+cdef inline size_t c_count_levels_within_price(vector[double] &prices, double price, bint is_buy):
+    # Number of levels, counting from the best price outwards, that can be taken without going beyond price. Ask
+    # prices are ascending and bid prices are descending.
+    cdef:
+        size_t low = 0
+        size_t high = prices.size()
+        size_t mid
+
+    while low < high:
+        mid = (low + high) >> 1
+        if (is_buy and prices[mid] <= price) or (not is_buy and prices[mid] >= price):
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_CHANGED_EVENT_TAG = OrderBookEvent.TopOfBookChanged.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -47,6 +99,9 @@ cdef class OrderBook(PubSub):
         self._snapshot_uid = 0
         self._last_diff_uid = 0
         self._best_bid = self._best_ask = float("NaN")
+        self._version = 0
+        self._bid_index_version = self._ask_index_version = -1
+        self._top_levels_watched = 0
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -57,6 +112,15 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double bid_watch_price
+            double ask_watch_price
+            bint bids_changed = False
+            bint asks_changed = False
+
+        # Remember the lowest bid and highest ask price within the watched top levels, before applying the diffs.
+        if self._top_levels_watched > 0:
+            bid_watch_price = self.c_get_level_price(True, self._top_levels_watched)
+            ask_watch_price = self.c_get_level_price(False, self._top_levels_watched)
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -88,6 +152,23 @@ cdef class OrderBook(PubSub):
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        # Invalidate the cumulative depth index.
+        self._version += 1
+
+        # Signal changes within the watched top levels.
+        if self._top_levels_watched > 0:
+            for bid in bids:
+                if bid.getPrice() >= bid_watch_price:
+                    bids_changed = True
+                    break
+            for ask in asks:
+                if ask.getPrice() <= ask_watch_price:
+                    asks_changed = True
+                    break
+            if bids_changed or asks_changed:
+                self.c_trigger_event(self.ORDER_BOOK_TOP_CHANGED_EVENT_TAG,
+                                     OrderBookTopChangedEvent(bids_changed, asks_changed))
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
@@ -112,9 +193,51 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        # Invalidate the cumulative depth index.
+        self._version += 1
+
+        if self._top_levels_watched > 0:
+            self.c_trigger_event(self.ORDER_BOOK_TOP_CHANGED_EVENT_TAG, OrderBookTopChangedEvent(True, True))
+
     cdef c_apply_trade(self, object trade_event):
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef double c_get_level_price(self, bint is_bid, int level):
+        """
+        Price of the given (1-based) price level on one side of the order book. If the order book side has fewer levels
+        than that, -inf is returned for bids and inf for asks - so any price is within the levels.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+            int i
+        if is_bid:
+            if <size_t>level > self._bid_book.size():
+                return float("-inf")
+            for i in range(level - 1):
+                inc(bid_it)
+            entry = deref(bid_it)
+        else:
+            if <size_t>level > self._ask_book.size():
+                return float("inf")
+            for i in range(level - 1):
+                inc(ask_it)
+            entry = deref(ask_it)
+        return entry.getPrice()
+
+    @property
+    def top_levels_watched(self) -> int:
+        """
+        Number of price levels on each side of the order book, whose changes are signalled by TopOfBookChanged
+        events. 0 disables the events.
+        """
+        return self._top_levels_watched
+
+    @top_levels_watched.setter
+    def top_levels_watched(self, int value):
+        self._top_levels_watched = value
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -123,14 +246,89 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def version(self) -> int:
+        """
+        A counter that is incremented every time the order book contents change. Callers can use it to cache results
+        derived from the order book, and only recompute them when the version has moved on.
+        """
+        return self._version
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        return self.get_snapshot()
+
+    def get_snapshot(self, depth: int = 0) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Returns the bids and asks as data frames with the columns [price, amount, update_id], best prices first.
+
+        :param depth: if positive, only the top `depth` levels of each side are included
+        """
+        bids_array, asks_array = self.get_numpy_snapshot(depth)
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, copy=False)
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, copy=False)
         return bids_df, asks_df
 
+    def get_numpy_snapshot(self, depth: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the bids and asks as contiguous float64 arrays of shape (levels, 3), with the columns
+        [price, amount, update_id], best prices first.
+
+        :param depth: if positive, only the top `depth` levels of each side are included
+        """
+        cdef:
+            size_t num_bids = self._bid_book.size()
+            size_t num_asks = self._ask_book.size()
+        if depth > 0:
+            num_bids = min(num_bids, <size_t>depth)
+            num_asks = min(num_asks, <size_t>depth)
+        bids_array = np.empty((num_bids, 3), dtype="float64")
+        asks_array = np.empty((num_asks, 3), dtype="float64")
+        num_bids, num_asks = self.c_fill_numpy_snapshot(bids_array, asks_array)
+        return bids_array[:num_bids], asks_array[:num_asks]
+
+    def fill_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray) -> Tuple[int, int]:
+        """
+        Copies the order book into preallocated float64 arrays with 3 columns, [price, amount, update_id], best prices
+        first. Each side is truncated to the number of rows in its array. Rows beyond the end of the order book are
+        left untouched.
+
+        :return: the number of bid and ask rows written
+        """
+        return self.c_fill_numpy_snapshot(bids_array, asks_array)
+
+    cdef tuple c_fill_numpy_snapshot(self,
+                                     np.ndarray[np.float64_t, ndim=2] bids_array,
+                                     np.ndarray[np.float64_t, ndim=2] asks_array):
+        cdef:
+            size_t max_bids = bids_array.shape[0]
+            size_t max_asks = asks_array.shape[0]
+            size_t num_bids = 0
+            size_t num_asks = 0
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+
+        if (max_bids > 0 and bids_array.shape[1] < 3) or (max_asks > 0 and asks_array.shape[1] < 3):
+            raise ValueError("Order book snapshot arrays must have 3 columns - [price, amount, update_id].")
+
+        while num_bids < max_bids and bid_it != self._bid_book.rend():
+            entry = deref(bid_it)
+            bids_array[num_bids, 0] = entry.getPrice()
+            bids_array[num_bids, 1] = entry.getAmount()
+            bids_array[num_bids, 2] = <double>entry.getUpdateId()
+            num_bids += 1
+            inc(bid_it)
+        while num_asks < max_asks and ask_it != self._ask_book.end():
+            entry = deref(ask_it)
+            asks_array[num_asks, 0] = entry.getPrice()
+            asks_array[num_asks, 1] = entry.getAmount()
+            asks_array[num_asks, 2] = <double>entry.getUpdateId()
+            num_asks += 1
+            inc(ask_it)
+
+        return num_bids, num_asks
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -162,16 +360,19 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int = -1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+
+        If update_id is not given, the largest update ID among the rows is used.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -179,26 +380,24 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
+            int64_t last_update_id = max(c_numpy_rows_to_entries(bids_array, cpp_bids),
+                                         c_numpy_rows_to_entries(asks_array, cpp_asks))
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id if update_id >= 0 else last_update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int = -1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+
+        If update_id is not given, the largest update ID among the rows is used.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -206,15 +405,10 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
+            int64_t last_update_id = max(c_numpy_rows_to_entries(bids_array, cpp_bids),
+                                         c_numpy_rows_to_entries(asks_array, cpp_asks))
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id if update_id >= 0 else last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -272,144 +466,223 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
-    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+    cdef double c_get_amount_at_price(self, bint is_bid, double price):
+        """
+        Amount resting at exactly the given price on one side of the order book, or 0 if there's no such price level.
+        """
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = deref(book).find(OrderBookEntry(price, 0, 0))
+            OrderBookEntry entry
+        if it == deref(book).end():
+            return 0
+        entry = deref(it)
+        return entry.getAmount()
+
+    def get_amount_at_price(self, is_bid: bool, price: float) -> float:
+        return self.c_get_amount_at_price(is_bid, price)
+
+    cdef c_build_depth_index(self, bint is_buy):
+        """
+        Rebuild the cumulative depth arrays for one side of the order book, if the book has changed since they were
+        last built. Levels are stored from the best price outwards - i.e. ascending prices for asks, descending prices
+        for bids.
+        """
+        cdef:
+            vector[double] *prices
+            vector[double] *cumulative_base
+            vector[double] *cumulative_quote
+            double base_total = 0
+            double quote_total = 0
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookEntry entry
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            if self._ask_index_version == self._version:
+                return
+            prices = ref(self._ask_prices)
+            cumulative_base = ref(self._ask_cumulative_base)
+            cumulative_quote = ref(self._ask_cumulative_quote)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            if self._bid_index_version == self._version:
+                return
+            prices = ref(self._bid_prices)
+            cumulative_base = ref(self._bid_cumulative_base)
+            cumulative_quote = ref(self._bid_cumulative_quote)
 
-        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+        deref(prices).clear()
+        deref(cumulative_base).clear()
+        deref(cumulative_quote).clear()
 
-    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
-        cdef:
-            double total_cost = 0
-            double total_volume = 0
-            double result_vwap = NaN
         if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    incremental_amount = total_volume - volume
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            deref(prices).reserve(self._ask_book.size())
+            deref(cumulative_base).reserve(self._ask_book.size())
+            deref(cumulative_quote).reserve(self._ask_book.size())
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                base_total += entry.getAmount()
+                quote_total += entry.getAmount() * entry.getPrice()
+                deref(prices).push_back(entry.getPrice())
+                deref(cumulative_base).push_back(base_total)
+                deref(cumulative_quote).push_back(quote_total)
+                inc(ask_it)
+            self._ask_index_version = self._version
         else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    incremental_amount = total_volume - volume
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            deref(prices).reserve(self._bid_book.size())
+            deref(cumulative_base).reserve(self._bid_book.size())
+            deref(cumulative_quote).reserve(self._bid_book.size())
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                base_total += entry.getAmount()
+                quote_total += entry.getAmount() * entry.getPrice()
+                deref(prices).push_back(entry.getPrice())
+                deref(cumulative_base).push_back(base_total)
+                deref(cumulative_quote).push_back(quote_total)
+                inc(bid_it)
+            self._bid_index_version = self._version
 
-        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
-
-    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
+            vector[double] *prices = ref(self._ask_prices) if is_buy else ref(self._bid_prices)
+            vector[double] *cumulative_base = (ref(self._ask_cumulative_base) if is_buy
+                                               else ref(self._bid_cumulative_base))
+            size_t num_levels
+            size_t index
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_build_depth_index(is_buy)
+        num_levels = deref(prices).size()
+        index = c_lower_bound_index(deref(cumulative_base), volume)
 
-        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+        if index < num_levels:
+            return OrderBookQueryResult(NaN, volume, deref(prices)[index], volume)
+        return OrderBookQueryResult(NaN, volume, NaN,
+                                    min(deref(cumulative_base)[num_levels - 1] if num_levels > 0 else 0.0, volume))
 
-    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
-            double cumulative_volume = 0
-            double cumulative_base_amount = 0
-            double row_amount = 0
+            vector[double] *prices = ref(self._ask_prices) if is_buy else ref(self._bid_prices)
+            vector[double] *cumulative_base = (ref(self._ask_cumulative_base) if is_buy
+                                               else ref(self._bid_cumulative_base))
+            vector[double] *cumulative_quote = (ref(self._ask_cumulative_quote) if is_buy
+                                                else ref(self._bid_cumulative_quote))
+            size_t num_levels
+            size_t index
+            double previous_base = 0
+            double previous_quote = 0
+
+        self.c_build_depth_index(is_buy)
+        num_levels = deref(prices).size()
+        index = c_lower_bound_index(deref(cumulative_base), volume)
+
+        if index >= num_levels:
+            return OrderBookQueryResult(NaN, volume, NaN,
+                                        min(deref(cumulative_base)[num_levels - 1] if num_levels > 0 else 0.0,
+                                            volume))
+        if index > 0:
+            previous_base = deref(cumulative_base)[index - 1]
+            previous_quote = deref(cumulative_quote)[index - 1]
+        if volume <= 0:
+            return OrderBookQueryResult(NaN, volume, deref(prices)[index], volume)
+
+        # Only the part of the last level that is needed to reach the queried volume is taken.
+        return OrderBookQueryResult(
+            NaN,
+            volume,
+            (previous_quote + (volume - previous_base) * deref(prices)[index]) / volume,
+            volume
+        )
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            vector[double] *prices = ref(self._ask_prices) if is_buy else ref(self._bid_prices)
+            vector[double] *cumulative_quote = (ref(self._ask_cumulative_quote) if is_buy
+                                                else ref(self._bid_cumulative_quote))
+            size_t num_levels
+            size_t index
+
+        self.c_build_depth_index(is_buy)
+        num_levels = deref(prices).size()
+        index = c_lower_bound_index(deref(cumulative_quote), quote_volume)
+
+        if index < num_levels:
+            return OrderBookQueryResult(NaN, quote_volume, deref(prices)[index], quote_volume)
+        return OrderBookQueryResult(NaN, quote_volume, NaN,
+                                    min(deref(cumulative_quote)[num_levels - 1] if num_levels > 0 else 0.0,
+                                        quote_volume))
 
-        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            vector[double] *prices = ref(self._ask_prices) if is_buy else ref(self._bid_prices)
+            vector[double] *cumulative_base = (ref(self._ask_cumulative_base) if is_buy
+                                               else ref(self._bid_cumulative_base))
+            vector[double] *cumulative_quote = (ref(self._ask_cumulative_quote) if is_buy
+                                                else ref(self._bid_cumulative_quote))
+            size_t num_levels
+            size_t index
+            double previous_base = 0
+            double previous_quote = 0
+
+        self.c_build_depth_index(is_buy)
+        num_levels = deref(prices).size()
+        index = c_lower_bound_index(deref(cumulative_base), base_amount)
+
+        if index >= num_levels:
+            return OrderBookQueryResult(NaN, base_amount, NaN,
+                                        deref(cumulative_quote)[num_levels - 1] if num_levels > 0 else 0.0)
+        if index > 0:
+            previous_base = deref(cumulative_base)[index - 1]
+            previous_quote = deref(cumulative_quote)[index - 1]
+        return OrderBookQueryResult(NaN, base_amount, NaN,
+                                    previous_quote + (base_amount - previous_base) * deref(prices)[index])
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
+            vector[double] *prices = ref(self._ask_prices) if is_buy else ref(self._bid_prices)
+            vector[double] *cumulative_base = (ref(self._ask_cumulative_base) if is_buy
+                                               else ref(self._bid_cumulative_base))
+            size_t num_levels
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        self.c_build_depth_index(is_buy)
+        num_levels = c_count_levels_within_price(deref(prices), price, is_buy)
 
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        if num_levels < 1:
+            return OrderBookQueryResult(price, NaN, NaN, 0)
+        return OrderBookQueryResult(price, NaN, deref(prices)[num_levels - 1], deref(cumulative_base)[num_levels - 1])
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
+            vector[double] *prices = ref(self._ask_prices) if is_buy else ref(self._bid_prices)
+            vector[double] *cumulative_quote = (ref(self._ask_cumulative_quote) if is_buy
+                                                else ref(self._bid_cumulative_quote))
+            size_t num_levels
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        self.c_build_depth_index(is_buy)
+        num_levels = c_count_levels_within_price(deref(prices), price, is_buy)
+
+        if num_levels < 1:
+            return OrderBookQueryResult(price, NaN, NaN, 0)
+        return OrderBookQueryResult(price, NaN, deref(prices)[num_levels - 1], deref(cumulative_quote)[num_levels - 1])
 
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+    cdef list c_get_price_for_volumes(self, bint is_buy, list volumes):
+        """
+        Batched version of c_get_price_for_volume(). Results are returned in the same order as the queries.
+        """
+        return [self.c_get_price_for_volume(is_buy, volume) for volume in volumes]
+
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, list volumes):
+        """
+        Batched version of c_get_vwap_for_volume(). Results are returned in the same order as the queries.
+        """
+        return [self.c_get_vwap_for_volume(is_buy, volume) for volume in volumes]
+
+    cdef list c_get_volume_for_prices(self, bint is_buy, list prices):
+        """
+        Batched version of c_get_volume_for_price(). Results are returned in the same order as the queries.
+        """
+        return [self.c_get_volume_for_price(is_buy, price) for price in prices]
 
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
@@ -429,6 +702,15 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_price_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        return self.c_get_price_for_volumes(is_buy, [float(v) for v in volumes])
+
+    def get_vwap_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        return self.c_get_vwap_for_volumes(is_buy, [float(v) for v in volumes])
+
+    def get_volume_for_prices(self, is_buy: bool, prices: List[float]) -> List[OrderBookQueryResult]:
+        return self.c_get_volume_for_prices(is_buy, [float(p) for p in prices])
+
     @classmethod
     def snapshot_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
         pass
@@ -452,6 +734,12 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        if isinstance(snapshot, CompactOrderBookMessage):
+            self.c_apply_numpy_snapshot(snapshot.bids_array, snapshot.asks_array, snapshot.update_id)
+        else:
+            self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            if isinstance(diff, CompactOrderBookMessage):
+                self.c_apply_numpy_diffs(diff.bids_array, diff.asks_array, diff.update_id)
+            else:
+                self.apply_diffs(diff.bids, diff.asks, diff.update_id)
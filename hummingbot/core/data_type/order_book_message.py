@@ -3,6 +3,7 @@
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
+import numpy as np
 import pandas as pd
 from typing import Optional, List, Dict
 
@@ -38,6 +39,16 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
         else:
             return -1
 
+    @property
+    def first_update_id(self) -> int:
+        """
+        The first update ID covered by a diff message, for exchanges whose diffs span a range of update IDs. -1 if the
+        exchange doesn't report it.
+        """
+        if self.type is OrderBookMessageType.DIFF:
+            return self.content.get("first_update_id", -1)
+        return -1
+
     @property
     def trade_id(self) -> int:
         if self.type is OrderBookMessageType.TRADE:
@@ -89,6 +100,87 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
                 return self.has_update_id
 
 
+def order_book_rows_to_array(rows: List[List[any]], update_id: int) -> np.ndarray:
+    """
+    Parses raw [price, amount, ...] order book rows from an exchange into a float64 array of shape (len(rows), 3), with
+    the columns [price, amount, update_id].
+    """
+    retval: np.ndarray = np.empty((len(rows), 3), dtype="float64")
+    if len(rows) > 0:
+        try:
+            parsed: np.ndarray = np.array(rows, dtype="float64")
+            if parsed.ndim != 2:
+                raise ValueError("Order book rows have different lengths.")
+        except (ValueError, TypeError):
+            # Some rows carry extra non-numeric fields - only take the price and amount.
+            parsed = np.array([row[:2] for row in rows], dtype="float64")
+        retval[:, 0:2] = parsed[:, 0:2]
+    retval[:, 2] = update_id
+    return retval
+
+
+class CompactOrderBookMessage(OrderBookMessage):
+    """
+    A diff or snapshot message whose symbol, update ID and price levels are parsed once at construction, instead of on
+    every access. The price levels are kept as float64 arrays with the columns [price, amount, update_id], which can be
+    applied to an order book directly with OrderBook.apply_numpy_diffs() or OrderBook.apply_numpy_snapshot().
+    """
+    def __new__(
+        cls,
+        message_type: OrderBookMessageType,
+        content: Dict[str, any],
+        timestamp: Optional[float] = None,
+        *args,
+        **kwargs,
+    ):
+        retval: "CompactOrderBookMessage" = super(CompactOrderBookMessage, cls).__new__(
+            cls, message_type, content, timestamp, *args, **kwargs
+        )
+        retval._symbol = content["symbol"]
+        retval._update_id = content["update_id"]
+        retval._first_update_id = (content.get("first_update_id", -1) if message_type is OrderBookMessageType.DIFF
+                                   else -1)
+        retval._bids_array = order_book_rows_to_array(content["bids"], retval._update_id)
+        retval._asks_array = order_book_rows_to_array(content["asks"], retval._update_id)
+        return retval
+
+    @property
+    def update_id(self) -> int:
+        return self._update_id
+
+    @property
+    def first_update_id(self) -> int:
+        return self._first_update_id
+
+    @property
+    def symbol(self) -> str:
+        return self._symbol
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        return self._bids_array
+
+    @property
+    def asks_array(self) -> np.ndarray:
+        return self._asks_array
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        return [OrderBookRow(price, amount, self._update_id) for price, amount, _ in self._asks_array.tolist()]
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        return [OrderBookRow(price, amount, self._update_id) for price, amount, _ in self._bids_array.tolist()]
+
+    @property
+    def has_update_id(self) -> bool:
+        return True
+
+    @property
+    def has_trade_id(self) -> bool:
+        return False
+
+
 class DDEXOrderBookMessage(OrderBookMessage):
     def __new__(
         cls,
@@ -359,29 +451,28 @@ class CoinbaseProOrderBookMessage(OrderBookMessage):
             if message_type is OrderBookMessageType.SNAPSHOT:
                 raise ValueError("timestamp must not be None when initializing snapshot messages.")
             timestamp = pd.Timestamp(content["time"], tz="UTC").timestamp()
-        return super(CoinbaseProOrderBookMessage, cls).__new__(
+        retval: "CoinbaseProOrderBookMessage" = super(CoinbaseProOrderBookMessage, cls).__new__(
             cls, message_type, content, timestamp=timestamp, *args, **kwargs
         )
+        # The sequence number and symbol are looked up repeatedly by the order book tracker, so parse them only once.
+        sequence: Optional[int] = int(content["sequence"]) if "sequence" in content else None
+        retval._update_id = (sequence if message_type in (OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT)
+                             else -1)
+        retval._trade_id = sequence if message_type is OrderBookMessageType.TRADE else -1
+        retval._symbol = content.get("product_id") or content.get("symbol")
+        return retval
 
     @property
     def update_id(self) -> int:
-        if self.type in [OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT]:
-            return int(self.content["sequence"])
-        else:
-            return -1
+        return self._update_id
 
     @property
     def trade_id(self) -> int:
-        if self.type is OrderBookMessageType.TRADE:
-            return int(self.content["sequence"])
-        return -1
+        return self._trade_id
 
     @property
     def symbol(self) -> str:
-        if "product_id" in self.content:
-            return self.content["product_id"]
-        elif "symbol" in self.content:
-            return self.content["symbol"]
+        return self._symbol
 
     @property
     def asks(self) -> List[OrderBookRow]:
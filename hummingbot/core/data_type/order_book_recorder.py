@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import numpy as np
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_recording import OrderBookRecordingWriter
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+# (symbol, update_id, bids, asks)
+CheckpointSnapshot = Tuple[str, int, np.ndarray, np.ndarray]
+
+
+class OrderBookRecorder:
+    """
+    Records the order book messages received by an order book tracker to an order book recording on disk.
+
+    record() only appends the message to an in-memory buffer, so it's cheap to call from the tracker's routers. The
+    buffer is handed over to a single writer thread every flush interval - parsing and disk writes never happen on the
+    event loop. If the writer thread falls behind, at most max_pending_messages are buffered and any further messages
+    are dropped.
+
+    Snapshots of the tracked order books are written every checkpoint interval, so replays can seek into a recording.
+    """
+    _obrec_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obrec_logger is None:
+            cls._obrec_logger = logging.getLogger(__name__)
+        return cls._obrec_logger
+
+    def __init__(self,
+                 path: str,
+                 flush_interval: float = 1.0,
+                 checkpoint_interval: float = 300.0,
+                 max_pending_messages: int = 1000000):
+        self._writer: OrderBookRecordingWriter = OrderBookRecordingWriter(path)
+        self._flush_interval: float = flush_interval
+        self._checkpoint_interval: float = checkpoint_interval
+        self._max_pending_messages: int = max_pending_messages
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._order_books: Dict[str, OrderBook] = {}
+        self._pending_messages: List[OrderBookMessage] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._last_checkpoint_timestamp: float = 0.0
+        self._messages_recorded: int = 0
+        self._messages_dropped: int = 0
+        self._checkpoints_recorded: int = 0
+        self._write_time: float = 0.0
+
+    @property
+    def path(self) -> str:
+        return self._writer.path
+
+    @property
+    def started(self) -> bool:
+        return self._flush_task is not None
+
+    @property
+    def recording_stats(self) -> Dict[str, Any]:
+        return {
+            "messages_recorded": self._messages_recorded,
+            "messages_pending": len(self._pending_messages),
+            "messages_dropped": self._messages_dropped,
+            "messages_skipped": self._writer.messages_skipped,
+            "messages_written": self._writer.messages_written,
+            "checkpoints_recorded": self._checkpoints_recorded,
+            "bytes_written": self._writer.bytes_written,
+            "write_time": self._write_time,
+        }
+
+    def record(self, message: OrderBookMessage):
+        if len(self._pending_messages) >= self._max_pending_messages:
+            if self._messages_dropped == 0:
+                self.logger().warning(f"Order book recorder is falling behind. Dropping messages beyond "
+                                      f"{self._max_pending_messages} pending messages.")
+            self._messages_dropped += 1
+            return
+        self._pending_messages.append(message)
+        self._messages_recorded += 1
+
+    def start(self, order_books: Dict[str, OrderBook]):
+        """
+        :param order_books: the tracker's order books, to take checkpoint snapshots from
+        """
+        self.stop()
+        self._order_books = order_books
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._last_checkpoint_timestamp = 0.0
+        self._flush_task = safe_ensure_future(self._flush_loop())
+
+    def stop(self):
+        """
+        Stops the recorder. Messages that are still pending are written out in the background.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._executor is not None:
+            self._executor.submit(self._write_batch, self._take_pending_messages(), [])
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _take_pending_messages(self) -> List[OrderBookMessage]:
+        pending_messages: List[OrderBookMessage] = self._pending_messages
+        self._pending_messages = []
+        return pending_messages
+
+    def _take_checkpoint_snapshots(self) -> List[CheckpointSnapshot]:
+        now: float = time.time()
+        if now - self._last_checkpoint_timestamp < self._checkpoint_interval:
+            return []
+        self._last_checkpoint_timestamp = now
+        snapshots: List[CheckpointSnapshot] = []
+        for symbol, order_book in list(self._order_books.items()):
+            bids, asks = order_book.get_numpy_snapshot()
+            if len(bids) + len(asks) < 1:
+                continue
+            update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
+            snapshots.append((symbol, update_id, bids, asks))
+        return snapshots
+
+    def _write_batch(self, messages: List[OrderBookMessage], snapshots: List[CheckpointSnapshot]):
+        # Runs on the writer thread.
+        start_time: float = time.perf_counter()
+        for message in messages:
+            self._writer.write_message(message)
+        for symbol, update_id, bids, asks in snapshots:
+            if self._writer.write_snapshot(symbol, update_id, bids, asks):
+                self._checkpoints_recorded += 1
+        self._writer.flush()
+        self._write_time += time.perf_counter() - start_time
+
+    async def flush(self):
+        """
+        Writes out all pending messages, and takes checkpoint snapshots if they are due.
+        """
+        messages: List[OrderBookMessage] = self._take_pending_messages()
+        snapshots: List[CheckpointSnapshot] = self._take_checkpoint_snapshots()
+        if len(messages) < 1 and len(snapshots) < 1:
+            return
+        await asyncio.get_event_loop().run_in_executor(self._executor, self._write_batch, messages, snapshots)
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.sleep(self._flush_interval)
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error writing order book recording.", exc_info=True)
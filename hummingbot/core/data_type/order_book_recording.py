@@ -0,0 +1,337 @@
+#!/usr/bin/env python
+
+import logging
+import numpy as np
+import os
+from typing import (
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+)
+from urllib.parse import (
+    quote,
+    unquote,
+)
+
+from hummingbot.core.data_type.order_book_message import (
+    CompactOrderBookMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+    order_book_rows_to_array,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.logger import HummingbotLogger
+
+# An order book recording is a directory with one sub-directory per symbol. Every symbol is stored as a set of raw,
+# append-only column files, which are memory-mapped when the recording is read.
+#
+# Message columns have one row per recorded message, ordered by timestamp. The price levels of message i are the rows
+# [levels_end[i - 1], levels_end[i]) of the level columns - bids first, up to bids_end[i], then asks. A trade message
+# has a single level row with the trade's price and amount.
+MESSAGE_COLUMNS: Dict[str, str] = {
+    "timestamp": "<f8",
+    "message_type": "<i1",
+    # Update ID for diffs and snapshots, trade ID for trades.
+    "update_id": "<i8",
+    # TradeType value for trades, 0 otherwise.
+    "trade_type": "<i1",
+    "bids_end": "<i8",
+    "levels_end": "<i8",
+}
+LEVEL_COLUMNS: Dict[str, str] = {
+    "price": "<f8",
+    "amount": "<f8",
+}
+COLUMN_FILE_EXTENSION = ".col"
+
+
+def symbol_to_directory_name(symbol: str) -> str:
+    # Symbols like "coinalpha/eth" aren't valid directory names.
+    return quote(symbol, safe="")
+
+
+def directory_name_to_symbol(directory_name: str) -> str:
+    return unquote(directory_name)
+
+
+class SymbolRecording(NamedTuple):
+    symbol: str
+    timestamp: np.ndarray
+    message_type: np.ndarray
+    update_id: np.ndarray
+    trade_type: np.ndarray
+    bids_end: np.ndarray
+    levels_end: np.ndarray
+    price: np.ndarray
+    amount: np.ndarray
+
+    @property
+    def message_count(self) -> int:
+        return len(self.timestamp)
+
+    def levels_start(self, message_index: int) -> int:
+        return int(self.levels_end[message_index - 1]) if message_index > 0 else 0
+
+    def last_snapshot_index(self, timestamp: float) -> int:
+        """
+        Index of the last snapshot at or before the given timestamp, or -1 if there's none.
+        """
+        end: int = int(np.searchsorted(self.timestamp, timestamp, side="right"))
+        snapshot_indices: np.ndarray = np.flatnonzero(self.message_type[:end] == OrderBookMessageType.SNAPSHOT.value)
+        return int(snapshot_indices[-1]) if len(snapshot_indices) > 0 else -1
+
+
+class OrderBookRecording:
+    """
+    Read access to an order book recording on disk. Column files are memory-mapped, so only the parts of a recording
+    that are actually replayed are read from disk.
+    """
+    _obr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obr_logger is None:
+            cls._obr_logger = logging.getLogger(__name__)
+        return cls._obr_logger
+
+    def __init__(self, path: str):
+        self._path: str = path
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def symbols(self) -> List[str]:
+        if not os.path.isdir(self._path):
+            return []
+        return sorted(directory_name_to_symbol(name)
+                      for name in os.listdir(self._path)
+                      if os.path.isdir(os.path.join(self._path, name)))
+
+    @staticmethod
+    def _load_column(directory: str, column_name: str, dtype: str) -> np.ndarray:
+        file_path: str = os.path.join(directory, column_name + COLUMN_FILE_EXTENSION)
+        if not os.path.exists(file_path) or os.path.getsize(file_path) < np.dtype(dtype).itemsize:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(file_path, dtype=dtype, mode="r")
+
+    def load(self, symbol: str) -> SymbolRecording:
+        directory: str = os.path.join(self._path, symbol_to_directory_name(symbol))
+        if not os.path.isdir(directory):
+            raise ValueError(f"Symbol '{symbol}' is not found in the order book recording at {self._path}.")
+
+        columns: Dict[str, np.ndarray] = {
+            column_name: self._load_column(directory, column_name, dtype)
+            for column_name, dtype in {**MESSAGE_COLUMNS, **LEVEL_COLUMNS}.items()
+        }
+
+        # A recording that was interrupted in the middle of a write may have columns of different lengths. Only keep
+        # the messages that were written completely.
+        message_count: int = min(len(columns[column_name]) for column_name in MESSAGE_COLUMNS.keys())
+        level_count: int = min(len(columns[column_name]) for column_name in LEVEL_COLUMNS.keys())
+        levels_end: np.ndarray = columns["levels_end"][:message_count]
+        message_count = int(np.searchsorted(levels_end, level_count, side="right"))
+        if message_count < len(columns["timestamp"]):
+            self.logger().warning(f"Ignoring {len(columns['timestamp']) - message_count} incomplete messages at the "
+                                  f"end of the {symbol} order book recording.")
+
+        for column_name in MESSAGE_COLUMNS.keys():
+            columns[column_name] = columns[column_name][:message_count]
+        level_count = int(columns["levels_end"][-1]) if message_count > 0 else 0
+        for column_name in LEVEL_COLUMNS.keys():
+            columns[column_name] = columns[column_name][:level_count]
+
+        return SymbolRecording(symbol=symbol, **columns)
+
+
+class _SymbolColumnBuffer:
+    def __init__(self, level_count: int):
+        self.level_count: int = level_count
+        self.message_columns: Dict[str, List] = {column_name: [] for column_name in MESSAGE_COLUMNS.keys()}
+        self.prices: List[np.ndarray] = []
+        self.amounts: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self.message_columns["timestamp"])
+
+    def append(self,
+               timestamp: float,
+               message_type: int,
+               update_id: int,
+               trade_type: int,
+               bids: np.ndarray,
+               asks: np.ndarray):
+        bids_end: int = self.level_count + len(bids)
+        self.level_count = bids_end + len(asks)
+        self.prices.extend([bids[:, 0], asks[:, 0]])
+        self.amounts.extend([bids[:, 1], asks[:, 1]])
+        self.message_columns["timestamp"].append(timestamp)
+        self.message_columns["message_type"].append(message_type)
+        self.message_columns["update_id"].append(update_id)
+        self.message_columns["trade_type"].append(trade_type)
+        self.message_columns["bids_end"].append(bids_end)
+        self.message_columns["levels_end"].append(self.level_count)
+
+
+class OrderBookRecordingWriter:
+    """
+    Appends order book messages to a recording on disk. Messages are parsed into column buffers as they are written,
+    and the buffers are appended to the column files when flush() is called.
+
+    The writer is not thread safe - see OrderBookRecorder for writing a recording from a live order book tracker.
+    """
+    _obrw_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obrw_logger is None:
+            cls._obrw_logger = logging.getLogger(__name__)
+        return cls._obrw_logger
+
+    def __init__(self, path: str):
+        self._path: str = path
+        self._buffers: Dict[str, _SymbolColumnBuffer] = {}
+        self._level_counts: Dict[str, int] = {}
+        self._last_timestamps: Dict[str, float] = {}
+        self._messages_written: int = 0
+        self._messages_skipped: int = 0
+        self._bytes_written: int = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def pending_message_count(self) -> int:
+        return sum(len(buffer) for buffer in self._buffers.values())
+
+    @property
+    def messages_written(self) -> int:
+        return self._messages_written
+
+    @property
+    def messages_skipped(self) -> int:
+        return self._messages_skipped
+
+    @property
+    def bytes_written(self) -> int:
+        return self._bytes_written
+
+    @staticmethod
+    def _rows_to_array(rows: List[OrderBookRow]) -> np.ndarray:
+        retval: np.ndarray = np.empty((len(rows), 2), dtype="float64")
+        for i, row in enumerate(rows):
+            retval[i, 0] = row.price
+            retval[i, 1] = row.amount
+        return retval
+
+    @staticmethod
+    def _trade_id(message: OrderBookMessage) -> int:
+        # Some exchanges have non-numeric trade IDs.
+        try:
+            return int(message.content.get("trade_id", -1))
+        except (TypeError, ValueError):
+            return -1
+
+    def _symbol_buffer(self, symbol: str) -> _SymbolColumnBuffer:
+        if symbol not in self._buffers:
+            if symbol not in self._level_counts:
+                # Continue the level offsets of an existing recording.
+                levels_file_path: str = os.path.join(self._path,
+                                                     symbol_to_directory_name(symbol),
+                                                     "price" + COLUMN_FILE_EXTENSION)
+                self._level_counts[symbol] = (os.path.getsize(levels_file_path) // np.dtype("<f8").itemsize
+                                              if os.path.exists(levels_file_path) else 0)
+            self._buffers[symbol] = _SymbolColumnBuffer(self._level_counts[symbol])
+        return self._buffers[symbol]
+
+    def write_message(self, message: OrderBookMessage):
+        """
+        Parses a diff, snapshot or trade message into the column buffers. Messages that don't carry price levels - e.g.
+        the order level diffs of some DEXes - are skipped.
+
+        Some exchanges timestamp trades with the exchange's time, and diffs with the local time. Timestamps are
+        clamped to the last timestamp written for the symbol, so the timestamp column stays sorted for seeking.
+        """
+        try:
+            if message.type is OrderBookMessageType.TRADE:
+                trade_level: np.ndarray = np.array([[float(message.content["price"]),
+                                                     float(message.content["amount"])]])
+                update_id: int = self._trade_id(message)
+                trade_type: int = int(float(message.content["trade_type"]))
+                bids, asks = np.zeros((0, 2), dtype="float64"), trade_level
+            elif isinstance(message, CompactOrderBookMessage):
+                update_id = message.update_id
+                trade_type = 0
+                bids, asks = message.bids_array, message.asks_array
+            elif type(message) is OrderBookMessage:
+                # Plain messages carry raw [price, amount, ...] rows, which can be parsed in bulk.
+                update_id = int(message.update_id)
+                trade_type = 0
+                bids = order_book_rows_to_array(message.content["bids"], update_id)
+                asks = order_book_rows_to_array(message.content["asks"], update_id)
+            else:
+                update_id = int(message.update_id)
+                trade_type = 0
+                bids, asks = self._rows_to_array(message.bids), self._rows_to_array(message.asks)
+            symbol: str = message.symbol
+            timestamp: float = float(message.timestamp)
+        except Exception:
+            self._messages_skipped += 1
+            return
+        if symbol in self._last_timestamps:
+            timestamp = max(timestamp, self._last_timestamps[symbol])
+        self._symbol_buffer(symbol).append(timestamp, message.type.value, update_id, trade_type, bids, asks)
+        self._last_timestamps[symbol] = timestamp
+
+    def write_snapshot(self, symbol: str, update_id: int, bids: np.ndarray, asks: np.ndarray) -> bool:
+        """
+        Writes a snapshot of an order book, given as [price, amount, ...] arrays. Snapshots are written periodically as
+        checkpoints, so a replay can start from the middle of a recording without going through all diffs before it.
+
+        The snapshot takes the timestamp of the last message written for the symbol, to keep timestamps in the
+        recording ordered. It's not written if no message has been written for the symbol yet.
+
+        :return: True if the snapshot was written
+        """
+        if symbol not in self._last_timestamps:
+            return False
+        self._symbol_buffer(symbol).append(self._last_timestamps[symbol], OrderBookMessageType.SNAPSHOT.value,
+                                           update_id, 0, bids, asks)
+        return True
+
+    def _write_symbol(self, symbol: str, buffer: _SymbolColumnBuffer):
+        directory: str = os.path.join(self._path, symbol_to_directory_name(symbol))
+        os.makedirs(directory, exist_ok=True)
+
+        # Levels are written before messages, so an interrupted write never leaves a message without its levels.
+        level_columns: Dict[str, np.ndarray] = {"price": np.concatenate(buffer.prices),
+                                                "amount": np.concatenate(buffer.amounts)}
+        for column_name, dtype in LEVEL_COLUMNS.items():
+            self._append_column(directory, column_name, np.asarray(level_columns[column_name], dtype=dtype))
+        for column_name, dtype in MESSAGE_COLUMNS.items():
+            self._append_column(directory, column_name, np.asarray(buffer.message_columns[column_name], dtype=dtype))
+
+        self._level_counts[symbol] = buffer.level_count
+        self._messages_written += len(buffer)
+
+    def _append_column(self, directory: str, column_name: str, values: np.ndarray):
+        data: bytes = values.tobytes()
+        with open(os.path.join(directory, column_name + COLUMN_FILE_EXTENSION), "ab") as fd:
+            fd.write(data)
+        self._bytes_written += len(data)
+
+    def flush(self):
+        buffers: Dict[str, _SymbolColumnBuffer] = self._buffers
+        self._buffers = {}
+        for symbol, buffer in buffers.items():
+            if len(buffer) < 1:
+                continue
+            try:
+                self._write_symbol(symbol, buffer)
+            except Exception:
+                # The level offsets on disk are unknown after a failed write, so read them again next time.
+                self._level_counts.pop(symbol, None)
+                self.logger().error(f"Error writing {len(buffer)} order book messages for {symbol}.", exc_info=True)
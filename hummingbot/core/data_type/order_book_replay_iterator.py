@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import ReplayOrderBookTrackerDataSource
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class OrderBookReplayIterator(PyTimeIterator):
+    """
+    Replays recorded order book messages up to the current clock time on every tick. Raises StopIteration once the
+    recording is exhausted, which ends Clock.backtest().
+
+    On the first tick, the replay seeks to the last snapshot before the clock time - so a backtest can start from the
+    middle of a long recording.
+    """
+    def __init__(self, data_source: ReplayOrderBookTrackerDataSource):
+        super().__init__()
+        self._data_source: ReplayOrderBookTrackerDataSource = data_source
+        self._seek_done: bool = False
+
+    @property
+    def data_source(self) -> ReplayOrderBookTrackerDataSource:
+        return self._data_source
+
+    def tick(self, timestamp: float):
+        if self._data_source.exhausted:
+            raise StopIteration
+        if not self._seek_done:
+            self._seek_done = True
+            self._data_source.seek(timestamp)
+        else:
+            self._data_source.replay_until(timestamp)
@@ -4,6 +4,7 @@ from abc import abstractmethod, ABC
 from collections import deque
 from enum import Enum
 import logging
+import numpy as np
 import pandas as pd
 import re
 import time
@@ -13,16 +14,20 @@ from typing import (
     Deque,
     Optional,
     Tuple,
-    List)
+    List,
+    Any)
 
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
+    CompactOrderBookMessage,
 )
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 
@@ -37,6 +42,7 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    MAX_MESSAGE_BATCH_SIZE: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -65,6 +71,20 @@ class OrderBookTracker(ABC):
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._refresh_tracking_task: Optional[asyncio.Task] = None
 
+        # Time from start() to the tracker becoming ready.
+        self._start_timestamp: Optional[float] = None
+        self._ready_timestamp: Optional[float] = None
+
+        # Diff batching statistics.
+        self._diff_batches_applied: int = 0
+        self._diff_messages_batched: int = 0
+        self._max_diff_batch_size: int = 0
+        self._diff_rows_received: int = 0
+        self._diff_rows_applied: int = 0
+
+        # Optional on-disk recording of the received order book messages.
+        self._recorder: Optional[OrderBookRecorder] = None
+
     @property
     @abstractmethod
     def data_source(self) -> OrderBookTrackerDataSource:
@@ -88,6 +108,15 @@ class OrderBookTracker(ABC):
         # if no symbols wait for at least 1 order book else wait for symbols
         return len(symbols) <= len(self._order_books) and len(self._order_books) > 0
 
+    @property
+    def startup_duration(self) -> Optional[float]:
+        """
+        Seconds it took from start() until all order books were initialized, or None if the tracker is not ready yet.
+        """
+        if self._start_timestamp is None or self._ready_timestamp is None:
+            return None
+        return self._ready_timestamp - self._start_timestamp
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -95,7 +124,51 @@ class OrderBookTracker(ABC):
             for symbol, order_book in self._order_books.items()
         }
 
+    @property
+    def diff_batch_stats(self) -> Dict[str, Any]:
+        """
+        Statistics on how order book diffs have been batched and coalesced before being applied. The coalescing ratio
+        is the number of price level updates actually applied to the order books, over the number received.
+        """
+        return {
+            "batches_applied": self._diff_batches_applied,
+            "messages_batched": self._diff_messages_batched,
+            "max_batch_size": self._max_diff_batch_size,
+            "average_batch_size": (self._diff_messages_batched / self._diff_batches_applied
+                                   if self._diff_batches_applied > 0 else 0.0),
+            "rows_received": self._diff_rows_received,
+            "rows_applied": self._diff_rows_applied,
+            "coalescing_ratio": (self._diff_rows_applied / self._diff_rows_received
+                                 if self._diff_rows_received > 0 else 1.0),
+        }
+
+    @property
+    def recorder(self) -> Optional[OrderBookRecorder]:
+        return self._recorder
+
+    def start_recording(self, path: str, **kwargs) -> OrderBookRecorder:
+        """
+        Starts recording every order book diff, snapshot and trade message received by the tracker to an order book
+        recording at the given path, which can be replayed with ReplayOrderBookTracker. Keyword arguments are passed to
+        OrderBookRecorder.
+        """
+        self.stop_recording()
+        self._recorder = OrderBookRecorder(path, **kwargs)
+        self._recorder.start(self._order_books)
+        return self._recorder
+
+    def stop_recording(self):
+        if self._recorder is not None:
+            self._recorder.stop()
+            self._recorder = None
+
+    def _record_message(self, message: OrderBookMessage):
+        if self._recorder is not None:
+            self._recorder.record(message)
+
     async def start(self):
+        self._start_timestamp = time.time()
+        self._ready_timestamp = None
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
@@ -119,6 +192,7 @@ class OrderBookTracker(ABC):
         if self._order_book_snapshot_router_task is not None:
             self._order_book_snapshot_router_task.cancel()
             self._order_book_snapshot_router_task = None
+        self.stop_recording()
 
     async def _refresh_tracking_tasks(self):
         """
@@ -144,6 +218,11 @@ class OrderBookTracker(ABC):
             del self._tracking_message_queues[symbol]
             self.logger().info("Stopped order book tracking for %s.", symbol)
 
+        if self._ready_timestamp is None and self._start_timestamp is not None and self.ready:
+            self._ready_timestamp = time.time()
+            self.logger().info("Order book tracker ready. %d order books initialized in %.2f seconds.",
+                               len(self._order_books), self.startup_duration)
+
     async def _refresh_tracking_loop(self):
         """
         Refreshes the tracking of new markets, removes inactive markets, every once in a while.
@@ -169,6 +248,7 @@ class OrderBookTracker(ABC):
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
+                self._record_message(ob_message)
                 symbol: str = ob_message.symbol
 
                 if symbol not in self._tracking_message_queues:
@@ -207,6 +287,7 @@ class OrderBookTracker(ABC):
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
+                self._record_message(ob_message)
                 symbol: str = ob_message.symbol
                 if symbol not in self._tracking_message_queues:
                     continue
@@ -218,6 +299,109 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    async def _next_message_batch(self,
+                                  message_queue: asyncio.Queue,
+                                  pending_messages: Optional[Deque[OrderBookMessage]] = None
+                                  ) -> List[OrderBookMessage]:
+        """
+        Waits for the next message for an order book, and then drains whatever else is already waiting in the queue,
+        up to MAX_MESSAGE_BATCH_SIZE messages. Messages in pending_messages, if given, are taken before the queue.
+        """
+        batch: List[OrderBookMessage] = []
+        if pending_messages is not None:
+            while len(pending_messages) > 0 and len(batch) < self.MAX_MESSAGE_BATCH_SIZE:
+                batch.append(pending_messages.popleft())
+        if len(batch) < 1:
+            batch.append(await message_queue.get())
+        while len(batch) < self.MAX_MESSAGE_BATCH_SIZE and not message_queue.empty():
+            batch.append(message_queue.get_nowait())
+        return batch
+
+    def _apply_coalesced_diffs(self, order_book: OrderBook, diff_messages: List[OrderBookMessage]):
+        """
+        Merges a run of diff messages into a single diff - the last update to a price level wins - and applies it to
+        the order book in one go.
+        """
+        if len(diff_messages) < 1:
+            return
+        if all(isinstance(message, CompactOrderBookMessage) for message in diff_messages):
+            self._apply_coalesced_compact_diffs(order_book, diff_messages)
+            return
+
+        bids: Dict[float, OrderBookRow] = {}
+        asks: Dict[float, OrderBookRow] = {}
+        rows_received: int = 0
+        for message in diff_messages:
+            message_bids: List[OrderBookRow] = message.bids
+            message_asks: List[OrderBookRow] = message.asks
+            rows_received += len(message_bids) + len(message_asks)
+            for row in message_bids:
+                bids[row.price] = row
+            for row in message_asks:
+                asks[row.price] = row
+        order_book.apply_diffs(list(bids.values()), list(asks.values()), diff_messages[-1].update_id)
+
+        self._diff_batches_applied += 1
+        self._diff_messages_batched += len(diff_messages)
+        self._max_diff_batch_size = max(self._max_diff_batch_size, len(diff_messages))
+        self._diff_rows_received += rows_received
+        self._diff_rows_applied += len(bids) + len(asks)
+
+    @staticmethod
+    def _coalesce_diff_arrays(arrays: List[np.ndarray]) -> np.ndarray:
+        """
+        Concatenates [price, amount, update_id] diff rows, and keeps only the last row for every price.
+        """
+        combined: np.ndarray = np.concatenate(arrays) if len(arrays) > 1 else arrays[0]
+        if len(combined) < 2:
+            return combined
+        # np.unique() returns the first occurrence of every price, so search the rows in reverse.
+        _, reversed_indices = np.unique(combined[::-1, 0], return_index=True)
+        return combined[len(combined) - 1 - reversed_indices]
+
+    def _apply_coalesced_compact_diffs(self, order_book: OrderBook, diff_messages: List[CompactOrderBookMessage]):
+        bids_array: np.ndarray = self._coalesce_diff_arrays([message.bids_array for message in diff_messages])
+        asks_array: np.ndarray = self._coalesce_diff_arrays([message.asks_array for message in diff_messages])
+        order_book.apply_numpy_diffs(bids_array, asks_array, diff_messages[-1].update_id)
+
+        self._diff_batches_applied += 1
+        self._diff_messages_batched += len(diff_messages)
+        self._max_diff_batch_size = max(self._max_diff_batch_size, len(diff_messages))
+        self._diff_rows_received += sum(len(message.bids_array) + len(message.asks_array)
+                                        for message in diff_messages)
+        self._diff_rows_applied += len(bids_array) + len(asks_array)
+
+    def _apply_message_batch(self,
+                             symbol: str,
+                             order_book: OrderBook,
+                             messages: List[OrderBookMessage],
+                             past_diffs_window: Deque[OrderBookMessage]) -> int:
+        """
+        Applies a batch of order book messages in order. Consecutive diff messages are coalesced and applied together,
+        and snapshots are restored on top of the past diffs window as usual.
+
+        :return: the number of diff messages applied
+        """
+        pending_diffs: List[OrderBookMessage] = []
+        diff_messages_applied: int = 0
+
+        for message in messages:
+            if message.type is OrderBookMessageType.DIFF:
+                pending_diffs.append(message)
+                past_diffs_window.append(message)
+                while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
+                    past_diffs_window.popleft()
+                diff_messages_applied += 1
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                self._apply_coalesced_diffs(order_book, pending_diffs)
+                pending_diffs = []
+                past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                self.logger().debug("Processed order book snapshot for %s.", symbol)
+        self._apply_coalesced_diffs(order_book, pending_diffs)
+
+        return diff_messages_applied
+
     async def _track_single_book(self, symbol: str):
         past_diffs_window: Deque[OrderBookMessage] = deque()
         self._past_diffs_windows[symbol] = past_diffs_window
@@ -229,25 +413,16 @@ class OrderBookTracker(ABC):
 
         while True:
             try:
-                message: OrderBookMessage = await message_queue.get()
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug("Processed %d order book diffs for %s.",
-                                            diff_messages_accepted, symbol)
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
-                    self.logger().debug("Processed order book snapshot for %s.", symbol)
+                messages: List[OrderBookMessage] = await self._next_message_batch(message_queue)
+                diff_messages_accepted += self._apply_message_batch(symbol, order_book, messages, past_diffs_window)
+
+                # Output some statistics periodically.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                    self.logger().debug("Processed %d order book diffs for %s. Diff batch stats: %s",
+                                        diff_messages_accepted, symbol, self.diff_batch_stats)
+                    diff_messages_accepted = 0
+                last_message_timestamp = now
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -261,6 +436,7 @@ class OrderBookTracker(ABC):
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
+                self._record_message(trade_message)
                 symbol: str = trade_message.symbol
 
                 if symbol not in self._order_books:
@@ -19,6 +19,7 @@ from websockets.exceptions import ConnectionClosed
 import conf
 from hummingbot.market.binance.binance_order_book import BinanceOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 
@@ -53,7 +54,7 @@ class RemoteAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_client_session(self) -> aiohttp.ClientSession:
         if self._client_session is None:
-            self._client_session = aiohttp.ClientSession()
+            return HttpClientRegistry.get_instance().client()
         return self._client_session
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
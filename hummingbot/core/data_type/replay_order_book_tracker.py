@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+import logging
+import time
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_replay_iterator import OrderBookReplayIterator
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import ReplayOrderBookTrackerDataSource
+from hummingbot.logger import HummingbotLogger
+
+
+class ReplayOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker for backtesting on recorded order book data, e.g. with PaperTradeMarket.
+
+    The order books are only updated when replay_iterator is ticked by a clock, so it must be added to the clock
+    before any market or strategy that reads from the order books.
+    """
+    _robt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._robt_logger is None:
+            cls._robt_logger = logging.getLogger(__name__)
+        return cls._robt_logger
+
+    def __init__(self, recording_path: str, symbols: Optional[List[str]] = None, exchange_name: str = "replay"):
+        super().__init__()
+        self._data_source: ReplayOrderBookTrackerDataSource = ReplayOrderBookTrackerDataSource(
+            recording_path,
+            symbols=symbols
+        )
+        self._exchange_name: str = exchange_name
+        self._replay_iterator: OrderBookReplayIterator = OrderBookReplayIterator(self._data_source)
+
+    @property
+    def data_source(self) -> ReplayOrderBookTrackerDataSource:
+        return self._data_source
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    @property
+    def replay_iterator(self) -> OrderBookReplayIterator:
+        return self._replay_iterator
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        # Order books are created on first access, after the market has set its order book create function.
+        return self._data_source.order_books
+
+    @property
+    def ready(self) -> bool:
+        return len(self.order_books) > 0
+
+    async def start(self):
+        self._start_timestamp = time.time()
+        self._data_source.create_order_books()
+        self._ready_timestamp = time.time()
+
+    def stop(self):
+        pass
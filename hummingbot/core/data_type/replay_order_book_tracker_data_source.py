@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import numpy as np
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_recording import (
+    OrderBookRecording,
+    SymbolRecording,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType,
+)
+from hummingbot.logger import HummingbotLogger
+
+DIFF_MESSAGE_TYPE: int = OrderBookMessageType.DIFF.value
+SNAPSHOT_MESSAGE_TYPE: int = OrderBookMessageType.SNAPSHOT.value
+TRADE_MESSAGE_TYPE: int = OrderBookMessageType.TRADE.value
+
+
+class ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Replays an order book recording into order books, in timestamp order. The replay is driven by replay_until(), which
+    is called on every clock tick by OrderBookReplayIterator - so recorded messages are never ahead of the clock.
+
+    Runs of consecutive diff messages of a symbol are coalesced and applied with a single apply_numpy_diffs() call.
+    Messages of different symbols within the same clock tick are replayed symbol by symbol.
+    """
+    _rdsobds_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._rdsobds_logger is None:
+            cls._rdsobds_logger = logging.getLogger(__name__)
+        return cls._rdsobds_logger
+
+    def __init__(self, recording_path: str, symbols: Optional[List[str]] = None):
+        super().__init__()
+        self._recording: OrderBookRecording = OrderBookRecording(recording_path)
+        self._symbols: List[str] = symbols if symbols is not None else self._recording.symbols
+        self._symbol_recordings: Dict[str, SymbolRecording] = {}
+        self._replay_positions: Dict[str, int] = {}
+        self._order_books: Dict[str, OrderBook] = {}
+
+        self._replay_start_timestamp: Optional[float] = None
+        self._replay_timestamp: Optional[float] = None
+        self._messages_replayed: int = 0
+        self._levels_replayed: int = 0
+        self._replay_time: float = 0.0
+        self._exhausted_logged: bool = False
+
+    @property
+    def recording(self) -> OrderBookRecording:
+        return self._recording
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        if len(self._order_books) < 1:
+            self.create_order_books()
+        return self._order_books
+
+    def create_order_books(self) -> Dict[str, OrderBook]:
+        """
+        Loads the recording of every symbol, and creates an empty order book for it.
+
+        The order books are created with order_book_create_function, so this must be called after the function is
+        set - e.g. by PaperTradeMarket.
+        """
+        for symbol in self._symbols:
+            if symbol in self._order_books:
+                continue
+            self._symbol_recordings[symbol] = self._recording.load(symbol)
+            self._replay_positions[symbol] = 0
+            self._order_books[symbol] = self.order_book_create_function()
+        return self._order_books
+
+    async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
+        return {
+            symbol: OrderBookTrackerEntry(symbol, self._replay_timestamp or 0.0, order_book)
+            for symbol, order_book in self.order_books.items()
+        }
+
+    @property
+    def first_timestamp(self) -> float:
+        """
+        Timestamp of the earliest recorded message, or NaN if the recording is empty.
+        """
+        self.create_order_books()
+        timestamps: List[float] = [float(recording.timestamp[0])
+                                   for recording in self._symbol_recordings.values()
+                                   if recording.message_count > 0]
+        return min(timestamps) if len(timestamps) > 0 else float("nan")
+
+    @property
+    def last_timestamp(self) -> float:
+        """
+        Timestamp of the latest recorded message, or NaN if the recording is empty.
+        """
+        self.create_order_books()
+        timestamps: List[float] = [float(recording.timestamp[-1])
+                                   for recording in self._symbol_recordings.values()
+                                   if recording.message_count > 0]
+        return max(timestamps) if len(timestamps) > 0 else float("nan")
+
+    @property
+    def exhausted(self) -> bool:
+        self.create_order_books()
+        return all(self._replay_positions[symbol] >= recording.message_count
+                   for symbol, recording in self._symbol_recordings.items())
+
+    @property
+    def replay_stats(self) -> Dict[str, Any]:
+        """
+        Replay throughput. events_per_second is the number of recorded messages replayed per second of wall time spent
+        replaying them, and speedup is the recorded time replayed per second of wall time spent replaying.
+        """
+        recorded_duration: float = (self._replay_timestamp - self._replay_start_timestamp
+                                    if self._replay_start_timestamp is not None else 0.0)
+        return {
+            "messages_replayed": self._messages_replayed,
+            "levels_replayed": self._levels_replayed,
+            "replay_time": self._replay_time,
+            "recorded_duration": recorded_duration,
+            "events_per_second": self._messages_replayed / self._replay_time if self._replay_time > 0 else 0.0,
+            "speedup": recorded_duration / self._replay_time if self._replay_time > 0 else 0.0,
+        }
+
+    def replay_until(self, timestamp: float) -> int:
+        """
+        Applies all recorded messages with timestamps up to and including the given timestamp.
+
+        :return: the number of messages replayed
+        """
+        start_time: float = time.perf_counter()
+        messages_replayed: int = 0
+        for symbol, order_book in self.order_books.items():
+            messages_replayed += self._replay_symbol_until(symbol, order_book, timestamp)
+        self._replay_time += time.perf_counter() - start_time
+
+        if self._replay_start_timestamp is None:
+            self._replay_start_timestamp = min(timestamp, self.first_timestamp)
+        self._replay_timestamp = timestamp
+        self._messages_replayed += messages_replayed
+
+        if not self._exhausted_logged and self.exhausted:
+            self._exhausted_logged = True
+            stats: Dict[str, Any] = self.replay_stats
+            self.logger().info(f"Order book replay finished. {stats['messages_replayed']} messages replayed in "
+                               f"{stats['replay_time']:.3f} seconds ({stats['events_per_second']:.0f} events/s, "
+                               f"{stats['speedup']:.0f}x real time).")
+        return messages_replayed
+
+    def seek(self, timestamp: float) -> int:
+        """
+        Skips to the last snapshot at or before the given timestamp in the recording of every symbol, and replays from
+        there up to the timestamp. Diffs and trades before the snapshot are not replayed.
+
+        :return: the number of messages replayed
+        """
+        self.create_order_books()
+        for symbol, recording in self._symbol_recordings.items():
+            snapshot_index: int = recording.last_snapshot_index(timestamp)
+            if snapshot_index > self._replay_positions[symbol]:
+                self._replay_positions[symbol] = snapshot_index
+        return self.replay_until(timestamp)
+
+    def _replay_symbol_until(self, symbol: str, order_book: OrderBook, timestamp: float) -> int:
+        recording: SymbolRecording = self._symbol_recordings[symbol]
+        start: int = self._replay_positions[symbol]
+        end: int = int(np.searchsorted(recording.timestamp, timestamp, side="right"))
+        if end <= start:
+            return 0
+
+        message_types: np.ndarray = np.asarray(recording.message_type[start:end])
+        index: int = start
+        while index < end:
+            message_type: int = int(message_types[index - start])
+            if message_type == DIFF_MESSAGE_TYPE:
+                # Find the end of the run of diff messages starting here.
+                non_diffs: np.ndarray = np.flatnonzero(message_types[index - start:] != DIFF_MESSAGE_TYPE)
+                run_end: int = index + int(non_diffs[0]) if len(non_diffs) > 0 else end
+                self._apply_diffs(recording, order_book, index, run_end)
+                index = run_end
+            elif message_type == SNAPSHOT_MESSAGE_TYPE:
+                self._apply_snapshot(recording, order_book, index)
+                index += 1
+            elif message_type == TRADE_MESSAGE_TYPE:
+                self._apply_trade(recording, order_book, index)
+                index += 1
+            else:
+                self.logger().warning(f"Unknown message type {message_type} in the {symbol} order book recording.")
+                index += 1
+
+        self._replay_positions[symbol] = end
+        self._levels_replayed += int(recording.levels_end[end - 1]) - recording.levels_start(start)
+        return end - start
+
+    @staticmethod
+    def _levels_array(recording: SymbolRecording, start: int, end: int, update_ids: np.ndarray) -> np.ndarray:
+        retval: np.ndarray = np.empty((end - start, 3), dtype="float64")
+        retval[:, 0] = recording.price[start:end]
+        retval[:, 1] = recording.amount[start:end]
+        retval[:, 2] = update_ids
+        return retval
+
+    def _apply_diffs(self, recording: SymbolRecording, order_book: OrderBook, start: int, end: int):
+        levels_start: int = recording.levels_start(start)
+        levels_end: np.ndarray = np.asarray(recording.levels_end[start:end])
+        bids_end: np.ndarray = np.asarray(recording.bids_end[start:end])
+        update_ids: np.ndarray = np.asarray(recording.update_id[start:end])
+
+        # Split the level rows of the whole run into bids and asks, each row tagged with its message's update ID.
+        message_levels_start: np.ndarray = np.concatenate([[levels_start], levels_end[:-1]])
+        row_count: int = int(levels_end[-1]) - levels_start
+        row_update_ids: np.ndarray = np.repeat(update_ids, levels_end - message_levels_start)
+        is_bid: np.ndarray = (np.arange(levels_start, levels_start + row_count) <
+                              np.repeat(bids_end, levels_end - message_levels_start))
+        levels: np.ndarray = self._levels_array(recording, levels_start, levels_start + row_count, row_update_ids)
+
+        bids_array: np.ndarray = OrderBookTracker._coalesce_diff_arrays([levels[is_bid]])
+        asks_array: np.ndarray = OrderBookTracker._coalesce_diff_arrays([levels[~is_bid]])
+        order_book.apply_numpy_diffs(bids_array, asks_array, int(update_ids[-1]))
+
+    def _apply_snapshot(self, recording: SymbolRecording, order_book: OrderBook, index: int):
+        levels_start: int = recording.levels_start(index)
+        bids_end: int = int(recording.bids_end[index])
+        levels_end: int = int(recording.levels_end[index])
+        update_id: int = int(recording.update_id[index])
+        order_book.apply_numpy_snapshot(self._levels_array(recording, levels_start, bids_end, update_id),
+                                        self._levels_array(recording, bids_end, levels_end, update_id),
+                                        update_id)
+
+    @staticmethod
+    def _apply_trade(recording: SymbolRecording, order_book: OrderBook, index: int):
+        level_index: int = int(recording.bids_end[index])
+        order_book.apply_trade(OrderBookTradeEvent(
+            symbol=recording.symbol,
+            timestamp=float(recording.timestamp[index]),
+            price=float(recording.price[level_index]),
+            amount=float(recording.amount[level_index]),
+            type=TradeType(int(recording.trade_type[index]))
+        ))
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        """
+        Does nothing - replayed diffs are applied to the order books directly on clock ticks, see replay_until().
+        """
+        return
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        """
+        Does nothing - replayed snapshots are applied to the order books directly on clock ticks, see replay_until().
+        """
+        return
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        """
+        Does nothing - replayed trades are applied to the order books directly on clock ticks, see replay_until().
+        """
+        return
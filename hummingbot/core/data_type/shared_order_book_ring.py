@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+
+import multiprocessing
+import numpy as np
+from typing import (
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+
+class TopOfBookFrame(NamedTuple):
+    sequence: int
+    timestamp: float
+    update_id: int
+    # Float64 arrays with the columns [price, amount, update_id], best prices first.
+    bids: np.ndarray
+    asks: np.ndarray
+
+
+class SharedOrderBookRing:
+    """
+    The top `depth` price levels of a fixed set of order books, in shared memory, so that a worker process can publish
+    its order books to the main process without any locks.
+
+    Every symbol has a slot of `ring_size` frames, and a sequence number. The writer of a slot - there must be only one -
+    writes frame number `sequence + 1` (modulo `ring_size`), and only then publishes the new sequence number. A reader
+    copies the frame of the latest sequence number, and then checks that the writer hasn't come round the ring to
+    overwrite that frame while it was being copied.
+
+    The shared memory is inherited by processes started with the ring as an argument, with any start method.
+    """
+    # timestamp, update_id, number of bids, number of asks
+    HEADER_SIZE = 4
+    MAX_READ_ATTEMPTS = 3
+
+    def __init__(self, symbols: List[str], depth: int = 20, ring_size: int = 8):
+        if ring_size < 3:
+            raise ValueError("ring_size must be at least 3.")
+        self._symbols: List[str] = list(symbols)
+        self._slots: Dict[str, int] = {symbol: slot for slot, symbol in enumerate(self._symbols)}
+        self._depth: int = depth
+        self._ring_size: int = ring_size
+        self._frame_size: int = self.HEADER_SIZE + depth * 3 * 2
+        self._raw_sequences = multiprocessing.RawArray("q", len(self._symbols))
+        self._raw_frames = multiprocessing.RawArray("d", len(self._symbols) * ring_size * self._frame_size)
+        self._init_views()
+
+    def _init_views(self):
+        self._sequences: np.ndarray = np.frombuffer(self._raw_sequences, dtype=np.int64)
+        self._frames: np.ndarray = np.frombuffer(self._raw_frames, dtype=np.float64).reshape(
+            (len(self._symbols), self._ring_size, self._frame_size)
+        )
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_sequences"]
+        del state["_frames"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_views()
+
+    @property
+    def symbols(self) -> List[str]:
+        return self._symbols
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def ring_size(self) -> int:
+        return self._ring_size
+
+    def sequence(self, symbol: str) -> int:
+        """
+        Sequence number of the latest frame published for a symbol, or 0 if nothing has been published yet.
+        """
+        return int(self._sequences[self._slots[symbol]])
+
+    def publish(self, symbol: str, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int,
+                timestamp: float) -> int:
+        """
+        Writes the top levels of an order book to the next frame of the symbol's slot, and publishes it.
+
+        :param bids_array: bids with the columns [price, amount, update_id], best prices first
+        :param asks_array: asks with the columns [price, amount, update_id], best prices first
+        :return: sequence number of the new frame
+        """
+        slot: int = self._slots[symbol]
+        sequence: int = int(self._sequences[slot]) + 1
+        frame: np.ndarray = self._frames[slot, sequence % self._ring_size]
+        bid_count: int = min(len(bids_array), self._depth)
+        ask_count: int = min(len(asks_array), self._depth)
+        asks_start: int = self.HEADER_SIZE + self._depth * 3
+
+        frame[0:self.HEADER_SIZE] = (timestamp, update_id, bid_count, ask_count)
+        frame[self.HEADER_SIZE:self.HEADER_SIZE + bid_count * 3] = bids_array[:bid_count].ravel()
+        frame[asks_start:asks_start + ask_count * 3] = asks_array[:ask_count].ravel()
+        self._sequences[slot] = sequence
+        return sequence
+
+    def read(self, symbol: str, last_sequence: int = 0) -> Optional[TopOfBookFrame]:
+        """
+        Copies the latest frame of a symbol, if it's newer than last_sequence.
+
+        :return: the frame, or None if there's no newer frame - or the writer kept overwriting it while it was being
+                 copied, in which case the caller should try again later
+        """
+        slot: int = self._slots[symbol]
+        for _ in range(self.MAX_READ_ATTEMPTS):
+            sequence: int = int(self._sequences[slot])
+            if sequence == last_sequence:
+                return None
+            frame: np.ndarray = self._frames[slot, sequence % self._ring_size].copy()
+            # The writer is writing frame number (latest sequence + 1). As long as that isn't this frame's number
+            # modulo ring_size, the copy is consistent.
+            if int(self._sequences[slot]) - sequence < self._ring_size - 1:
+                bid_count: int = int(frame[2])
+                ask_count: int = int(frame[3])
+                asks_start: int = self.HEADER_SIZE + self._depth * 3
+                return TopOfBookFrame(
+                    sequence,
+                    float(frame[0]),
+                    int(frame[1]),
+                    frame[self.HEADER_SIZE:self.HEADER_SIZE + bid_count * 3].reshape((bid_count, 3)),
+                    frame[asks_start:asks_start + ask_count * 3].reshape((ask_count, 3))
+                )
+        return None
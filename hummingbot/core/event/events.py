@@ -51,6 +51,7 @@ class ERC20WatcherEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    TopOfBookChanged = 902
 
 
 class TradeType(Enum):
@@ -201,6 +202,11 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookTopChangedEvent(NamedTuple):
+    bids_changed: bool
+    asks_changed: bool
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -12,16 +12,25 @@ ctypedef unordered_set[PyRef].iterator EventListenersIterator
 ctypedef unordered_map[int64_t, EventListenersCollection] Events
 ctypedef unordered_map[int64_t, EventListenersCollection].iterator EventsIterator
 ctypedef pair[int64_t, EventListenersCollection] EventsPair
+ctypedef unordered_map[int64_t, int64_t] EventCounts
+ctypedef unordered_map[int64_t, double] EventTimes
 
 
 cdef class PubSub:
     cdef:
         Events _events
+        EventCounts _dispatch_counts
+        EventTimes _listener_times
+        int _dispatch_depth
+        list _pending_listener_changes
+        bint _has_dead_listeners
         object __weakref__
 
     cdef c_log_exception(self, int64_t event_tag, object arg)
     cdef c_add_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_dead_listeners(self, int64_t event_tag)
+    cdef c_remove_all_dead_listeners(self)
+    cdef c_apply_pending_listener_changes(self)
     cdef c_get_listeners(self, int64_t event_tag)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
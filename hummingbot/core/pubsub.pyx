@@ -15,7 +15,12 @@ from libcpp.vector cimport vector
 from enum import Enum
 import logging
 import random
-from typing import List
+from time import perf_counter
+from typing import (
+    Any,
+    Dict,
+    List,
+)
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.event_listener import EventListener
@@ -37,10 +42,19 @@ cdef class PubSub:
     1. c_add_listener():
        Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
        make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    2. c_remove_listener() and c_get_listeners():
+       Every time. This assumes they are called infrequently.
+    3. c_trigger_event():
+       Lazily. c_trigger_event() has to dereference every listener weak reference anyway, so it skips the dead ones it
+       comes across, and only then the dead listeners are removed - after the dispatch is done.
+
+    c_trigger_event() dispatches from the listener set directly, without copying it. Listeners are allowed to add or
+    remove listeners while an event is being dispatched - those changes are deferred until the outermost dispatch is
+    done. So, like before, a listener removed during a dispatch may still receive the event being dispatched, and a
+    listener added during a dispatch only receives events triggered after it.
+
+    The number of events dispatched and the cumulative time spent in listeners, for every event tag, are available
+    from dispatch_stats for profiling. Time spent in nested dispatches is counted under both event tags.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -54,6 +68,11 @@ cdef class PubSub:
 
     def __init__(self):
         self._events = Events()
+        self._dispatch_counts = EventCounts()
+        self._listener_times = EventTimes()
+        self._dispatch_depth = 0
+        self._pending_listener_changes = []
+        self._has_dead_listeners = False
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -67,6 +86,23 @@ cdef class PubSub:
     def trigger_event(self, event_tag: Enum, message: any):
         self.c_trigger_event(event_tag.value, message)
 
+    @property
+    def dispatch_stats(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Number of events dispatched, and cumulative time spent in listeners in seconds, by event tag value.
+        """
+        retval = {}
+        for count_pair in self._dispatch_counts:
+            retval[count_pair.first] = {
+                "dispatch_count": count_pair.second,
+                "listener_time": self._listener_times[count_pair.first]
+            }
+        return retval
+
+    def reset_dispatch_stats(self):
+        self._dispatch_counts.clear()
+        self._listener_times.clear()
+
     cdef c_log_exception(self, int64_t event_tag, object arg):
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
@@ -77,6 +113,11 @@ cdef class PubSub:
             EventListenersCollection *listeners_ptr
             object listener_weakref = PyWeakref_NewRef(listener, None)
             PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
+        if self._dispatch_depth > 0:
+            if self._pending_listener_changes is None:
+                self._pending_listener_changes = []
+            self._pending_listener_changes.append((True, event_tag, listener))
+            return
         if it != self._events.end():
             listeners_ptr = address(deref(it).second)
             deref(listeners_ptr).insert(listener_wrapper)
@@ -94,6 +135,11 @@ cdef class PubSub:
             object listener_weakref = PyWeakref_NewRef(listener, None)
             PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
             EventListenersIterator lit
+        if self._dispatch_depth > 0:
+            if self._pending_listener_changes is None:
+                self._pending_listener_changes = []
+            self._pending_listener_changes.append((False, event_tag, listener))
+            return
         if it == self._events.end():
             return
         listeners_ptr = address(deref(it).second)
@@ -109,7 +155,7 @@ cdef class PubSub:
             object listener_weakref
             EventListenersIterator lit
             vector[EventListenersIterator] lit_to_remove
-        if it == self._events.end():
+        if it == self._events.end() or self._dispatch_depth > 0:
             return
         listeners_ptr = address(deref(it).second)
         lit = deref(listeners_ptr).begin()
@@ -123,6 +169,28 @@ cdef class PubSub:
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
 
+    cdef c_remove_all_dead_listeners(self):
+        cdef:
+            EventsIterator it = self._events.begin()
+            vector[int64_t] event_tags
+            int64_t event_tag
+        while it != self._events.end():
+            event_tags.push_back(deref(it).first)
+            inc(it)
+        for event_tag in event_tags:
+            self.c_remove_dead_listeners(event_tag)
+        self._has_dead_listeners = False
+
+    cdef c_apply_pending_listener_changes(self):
+        cdef:
+            list pending_listener_changes = self._pending_listener_changes
+        self._pending_listener_changes = []
+        for is_add, event_tag, listener in pending_listener_changes:
+            if is_add:
+                self.c_add_listener(event_tag, listener)
+            else:
+                self.c_remove_listener(event_tag, listener)
+
     cdef c_get_listeners(self, int64_t event_tag):
         self.c_remove_dead_listeners(event_tag)
 
@@ -130,7 +198,7 @@ cdef class PubSub:
             EventsIterator it = self._events.find(event_tag)
             EventListenersCollection *listeners_ptr
             object listener_weafref
-            EventListener typed_listener
+            object listener
 
         if it == self._events.end():
             return []
@@ -139,31 +207,49 @@ cdef class PubSub:
         listeners_ptr = address(deref(it).second)
         for pyref in deref(listeners_ptr):
             listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+            listener = <object>PyWeakref_GetObject(listener_weafref)
+            if listener is not None:
+                retval.append(listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
             EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
+            EventListenersCollection *listeners_ptr
             object listener_weafref
+            object listener
             EventListener typed_listener
+            double start_time
         if it == self._events.end():
             return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            try:
-                typed_listener.c_set_event_info(event_tag, self)
-                typed_listener.c_call(arg)
-            except Exception:
-                self.c_log_exception(event_tag, arg)
-            finally:
-                typed_listener.c_set_event_info(0, None)
+        # Listeners may add or remove listeners while the set is being iterated here - those changes are deferred
+        # while _dispatch_depth > 0, so the iterator stays valid. Nested dispatches may happen as well.
+        listeners_ptr = address(deref(it).second)
+        self._dispatch_depth += 1
+        start_time = perf_counter()
+        try:
+            for pyref in deref(listeners_ptr):
+                listener_weafref = <object>pyref.get()
+                listener = <object>PyWeakref_GetObject(listener_weafref)
+                if listener is None:
+                    self._has_dead_listeners = True
+                    continue
+                typed_listener = listener
+                try:
+                    typed_listener.c_set_event_info(event_tag, self)
+                    typed_listener.c_call(arg)
+                except Exception:
+                    self.c_log_exception(event_tag, arg)
+                finally:
+                    typed_listener.c_set_event_info(0, None)
+        finally:
+            self._dispatch_depth -= 1
+            self._listener_times[event_tag] += perf_counter() - start_time
+            self._dispatch_counts[event_tag] += 1
+
+        if self._dispatch_depth < 1:
+            if self._pending_listener_changes:
+                self.c_apply_pending_listener_changes()
+            if self._has_dead_listeners:
+                self.c_remove_all_dead_listeners()
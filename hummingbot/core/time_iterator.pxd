@@ -12,3 +12,4 @@ cdef class TimeIterator(PubSub):
     cdef c_start(self, Clock clock, double timestamp)
     cdef c_stop(self, Clock clock)
     cdef c_tick(self, double timestamp)
+    cdef c_event_tick(self, double timestamp, object key)
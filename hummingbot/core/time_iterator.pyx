@@ -24,6 +24,15 @@ cdef class TimeIterator(PubSub):
     cdef c_tick(self, double timestamp):
         self._current_timestamp = timestamp
 
+    cdef c_event_tick(self, double timestamp, object key):
+        """
+        Out of band tick requested by the iterator itself, via Clock.c_request_event_tick().
+
+        :param timestamp: wall clock timestamp of the event tick
+        :param key: the key given to c_request_event_tick()
+        """
+        self._current_timestamp = timestamp
+
     @property
     def current_timestamp(self) -> float:
         return self._current_timestamp
@@ -3,7 +3,11 @@
 import asyncio
 from async_timeout import timeout
 import logging
+import time
 from typing import (
+    Any,
+    Dict,
+    List,
     Optional,
     Coroutine,
     NamedTuple,
@@ -15,11 +19,97 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
 
+DEFAULT_LANE = "default"
+
+
 class AsyncCallSchedulerItem(NamedTuple):
     future: asyncio.Future
     coroutine: Coroutine
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    enqueue_time: float = 0.0
+
+
+class AsyncCallSchedulerLane:
+    """
+    A named queue of calls, executed by a fixed number of concurrent workers.
+
+    Lowering the concurrency of a running lane retires workers without cancelling any calls: idle workers are woken up by
+    a retirement request queued for them (`None`), and busy workers retire as soon as their current call is done.
+
+    The default lane has a single worker, and so executes calls one at a time - which is how the scheduler has always
+    worked. Named lanes (e.g. one per exchange, or one per Ethereum node) can run several calls concurrently, and can
+    limit how many calls are started per second.
+    """
+    def __init__(self,
+                 name: str,
+                 concurrency: int = 1,
+                 call_interval: float = 0.0,
+                 max_calls_per_second: Optional[float] = None):
+        if concurrency < 1:
+            raise ValueError(f"Lane {name} needs a concurrency of at least 1, got {concurrency}.")
+        self.name: str = name
+        self.concurrency: int = concurrency
+        self.call_interval: float = call_interval
+        self.max_calls_per_second: Optional[float] = max_calls_per_second
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.worker_tasks: List[asyncio.Task] = []
+        self.next_call_time: float = 0.0
+        self.idle_workers: int = 0
+        self.workers_to_retire: int = 0
+        self.queued_retirements: int = 0
+
+        self.in_flight: int = 0
+        self.max_queue_depth: int = 0
+        self.calls_completed: int = 0
+        self.calls_failed: int = 0
+        self.total_queue_wait: float = 0.0
+        self.total_latency: float = 0.0
+        self.max_latency: float = 0.0
+
+    @property
+    def started(self) -> bool:
+        return len(self.worker_tasks) > 0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        calls: int = self.calls_completed + self.calls_failed
+        return {
+            "concurrency": self.concurrency,
+            "queue_depth": self.queue.qsize() - self.queued_retirements,
+            "max_queue_depth": self.max_queue_depth,
+            "in_flight": self.in_flight,
+            "calls_completed": self.calls_completed,
+            "calls_failed": self.calls_failed,
+            "average_queue_wait": self.total_queue_wait / calls if calls > 0 else 0.0,
+            "average_latency": self.total_latency / calls if calls > 0 else 0.0,
+            "max_latency": self.max_latency,
+        }
+
+    def put(self, item: AsyncCallSchedulerItem):
+        self.queue.put_nowait(item)
+        self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+
+    async def wait_for_rate_limit(self):
+        """
+        Reserves the next call slot of the lane, and waits until it comes up.
+        """
+        if self.max_calls_per_second is None or self.max_calls_per_second <= 0:
+            return
+        now: float = time.monotonic()
+        call_time: float = max(now, self.next_call_time)
+        self.next_call_time = call_time + 1.0 / self.max_calls_per_second
+        if call_time > now:
+            await asyncio.sleep(call_time - now)
+
+    def record_call(self, queue_wait: float, latency: float, failed: bool):
+        if failed:
+            self.calls_failed += 1
+        else:
+            self.calls_completed += 1
+        self.total_queue_wait += queue_wait
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
 
 
 class AsyncCallScheduler:
@@ -39,45 +129,142 @@ class AsyncCallScheduler:
         return cls._acs_logger
 
     def __init__(self, call_interval: float = 0.01):
-        self._coro_queue: asyncio.Queue = asyncio.Queue()
-        self._coro_scheduler_task: Optional[asyncio.Task] = None
         self._call_interval: float = call_interval
+        self._lanes: Dict[str, AsyncCallSchedulerLane] = {
+            DEFAULT_LANE: AsyncCallSchedulerLane(DEFAULT_LANE, concurrency=1, call_interval=call_interval)
+        }
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
     @property
     def coro_queue(self) -> asyncio.Queue:
-        return self._coro_queue
+        return self._lanes[DEFAULT_LANE].queue
 
     @property
     def coro_scheduler_task(self) -> Optional[asyncio.Task]:
-        return self._coro_scheduler_task
+        worker_tasks: List[asyncio.Task] = self._lanes[DEFAULT_LANE].worker_tasks
+        return worker_tasks[0] if len(worker_tasks) > 0 else None
 
     @property
     def started(self) -> bool:
-        return self._coro_scheduler_task is not None
+        return self._lanes[DEFAULT_LANE].started
+
+    @property
+    def lanes(self) -> Dict[str, AsyncCallSchedulerLane]:
+        return self._lanes
+
+    @property
+    def lane_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: lane.stats for name, lane in self._lanes.items()}
+
+    def configure_lane(self,
+                       name: str,
+                       concurrency: int = 1,
+                       call_interval: float = 0.0,
+                       max_calls_per_second: Optional[float] = None) -> AsyncCallSchedulerLane:
+        """
+        Creates a named lane, or reconfigures an existing one. Calls scheduled on the lane are executed by up to
+        `concurrency` workers at once, starting at most `max_calls_per_second` calls per second across all of them.
+
+        Reconfiguring a running lane applies the new limits to it in place - calls already in flight or queued on the
+        lane are not cancelled.
+        """
+        lane: Optional[AsyncCallSchedulerLane] = self._lanes.get(name)
+        if lane is None:
+            lane = AsyncCallSchedulerLane(name, concurrency, call_interval, max_calls_per_second)
+            self._lanes[name] = lane
+            return lane
+
+        if (lane.concurrency, lane.call_interval, lane.max_calls_per_second) == \
+                (concurrency, call_interval, max_calls_per_second):
+            return lane
+
+        if concurrency < 1:
+            raise ValueError(f"Lane {name} needs a concurrency of at least 1, got {concurrency}.")
+        lane.concurrency = concurrency
+        lane.call_interval = call_interval
+        lane.max_calls_per_second = max_calls_per_second
+        if lane.started:
+            self._resize_lane(lane)
+        return lane
+
+    def _get_lane(self, name: Optional[str]) -> AsyncCallSchedulerLane:
+        if name is None:
+            name = DEFAULT_LANE
+        if name not in self._lanes:
+            raise ValueError(f"Async call scheduler lane {name} has not been configured.")
+        return self._lanes[name]
+
+    def _start_lane(self, lane: AsyncCallSchedulerLane):
+        self._stop_lane(lane)
+        # Every retirement request still in the queue retires one worker, so start one extra worker for each of them.
+        lane.worker_tasks = [safe_ensure_future(self._coro_scheduler(lane))
+                             for _ in range(lane.concurrency + lane.queued_retirements)]
+
+    def _stop_lane(self, lane: AsyncCallSchedulerLane):
+        for worker_task in lane.worker_tasks:
+            worker_task.cancel()
+        lane.worker_tasks = []
+        lane.workers_to_retire = 0
+
+    def _resize_lane(self, lane: AsyncCallSchedulerLane):
+        lane.worker_tasks = [worker_task for worker_task in lane.worker_tasks if not worker_task.done()]
+        active_workers: int = len(lane.worker_tasks) - lane.workers_to_retire - lane.queued_retirements
+        if active_workers < lane.concurrency:
+            missing_workers: int = lane.concurrency - active_workers
+            kept_workers: int = min(missing_workers, lane.workers_to_retire)
+            lane.workers_to_retire -= kept_workers
+            lane.worker_tasks.extend(safe_ensure_future(self._coro_scheduler(lane))
+                                     for _ in range(missing_workers - kept_workers))
+        elif active_workers > lane.concurrency:
+            excess_workers: int = active_workers - lane.concurrency
+            idle_workers: int = max(0, min(excess_workers, lane.idle_workers - lane.queued_retirements))
+            for _ in range(idle_workers):
+                lane.queue.put_nowait(None)
+            lane.queued_retirements += idle_workers
+            lane.workers_to_retire += excess_workers - idle_workers
 
     def start(self):
-        if self._coro_scheduler_task is not None:
-            self.stop()
-        self._coro_scheduler_task = safe_ensure_future(
-            self._coro_scheduler(
-                self._coro_queue,
-                self._call_interval
-            )
-        )
+        for lane in self._lanes.values():
+            self._start_lane(lane)
 
     def stop(self):
-        if self._coro_scheduler_task is not None:
-            self._coro_scheduler_task.cancel()
-            self._coro_scheduler_task = None
+        for lane in self._lanes.values():
+            self._stop_lane(lane)
 
-    async def _coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
+    async def _coro_scheduler(self, lane: AsyncCallSchedulerLane):
         while True:
+            if lane.workers_to_retire > 0:
+                lane.workers_to_retire -= 1
+                return
             app_warning_msg = "API call error."
+            fut = None
             try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
-                async with timeout(timeout_seconds):
-                    fut.set_result(await coro)
+                lane.idle_workers += 1
+                try:
+                    item: Optional[AsyncCallSchedulerItem] = await lane.queue.get()
+                finally:
+                    lane.idle_workers -= 1
+                if item is None:
+                    lane.queued_retirements -= 1
+                    return
+                fut, coro, timeout_seconds, app_warning_msg, enqueue_time = item
+                if fut.done():
+                    # The caller has given up on the call before it has even started. Don't execute it.
+                    if asyncio.iscoroutine(coro):
+                        coro.close()
+                    continue
+                await lane.wait_for_rate_limit()
+                start_time: float = time.monotonic()
+                lane.in_flight += 1
+                failed: bool = True
+                try:
+                    async with timeout(timeout_seconds):
+                        result = await coro
+                    failed = False
+                finally:
+                    lane.in_flight -= 1
+                    lane.record_call(start_time - enqueue_time, time.monotonic() - start_time, failed)
+                fut.set_result(result)
             except asyncio.CancelledError:
                 try:
                     fut.cancel()
@@ -98,31 +285,45 @@ class AsyncCallScheduler:
                 except Exception:
                     pass
 
-            try:
-                await asyncio.sleep(interval)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Scheduler sleep interrupted.", exc_info=True)
+            if lane.call_interval > 0:
+                try:
+                    await asyncio.sleep(lane.call_interval)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().error("Scheduler sleep interrupted.", exc_info=True)
 
     async def schedule_async_call(self,
                                   coro: Coroutine,
                                   timeout_seconds: float,
-                                  app_warning_msg: str = "API call error.") -> any:
+                                  app_warning_msg: str = "API call error.",
+                                  lane: Optional[str] = None) -> any:
+        scheduler_lane: AsyncCallSchedulerLane = self._get_lane(lane)
         fut: asyncio.Future = self._ev_loop.create_future()
-        self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
-        if self._coro_scheduler_task is None:
-            self.start()
+        scheduler_lane.put(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
+                                                  app_warning_msg=app_warning_msg,
+                                                  enqueue_time=time.monotonic()))
+        if not scheduler_lane.started:
+            self._start_lane(scheduler_lane)
         return await fut
 
+    async def _call_in_executor(self, func: Callable, *args) -> any:
+        return await self._ev_loop.run_in_executor(hummingbot.get_executor(), func, *args)
+
     async def call_async(self,
                          func: Callable, *args,
                          timeout_seconds: float = 5.0,
-                         app_warning_msg: str = "API call error.") -> any:
-        coro: Coroutine = self._ev_loop.run_in_executor(
-            hummingbot.get_executor(),
-            func,
-            *args,
-        )
-        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+                         app_warning_msg: str = "API call error.",
+                         lane: Optional[str] = None) -> any:
+        if lane is None or lane == DEFAULT_LANE:
+            # The default lane submits the call to the executor right away, and only serializes waiting for results.
+            coro: Coroutine = self._ev_loop.run_in_executor(
+                hummingbot.get_executor(),
+                func,
+                *args,
+            )
+        else:
+            # Named lanes only submit the call once a worker picks it up, so their concurrency and rate limits apply
+            # to the calls themselves.
+            coro: Coroutine = self._call_in_executor(func, *args)
+        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg, lane=lane)
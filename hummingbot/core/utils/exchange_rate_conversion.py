@@ -1,11 +1,13 @@
 import asyncio
 import logging
 import math
+import time
 from decimal import Decimal
 from typing import (
     Dict,
+    Iterable,
     List,
-    Optional
+    Optional,
 )
 
 from hummingbot.client.config.global_config_map import global_config_map
@@ -17,6 +19,114 @@ from hummingbot.logger import HummingbotLogger
 
 NaN = float("nan")
 s_decimal_nan = Decimal("nan")
+s_decimal_1 = Decimal(1)
+
+
+class ExchangeRateSnapshot:
+    """
+    Immutable view of the exchange rates, as of one update from the data feeds.
+
+    Strategies can fetch a snapshot once per tick and use it for every price adjustment in that tick, without going
+    through the shared `ExchangeRateConversion` instance or re-constructing the rates as Decimals for every call.
+    """
+    __slots__ = ("_version", "_timestamp", "_conversion_rates", "_float_conversion_rates", "_usd_rates",
+                 "_data_feed_asset_timestamps")
+
+    def __init__(self,
+                 version: int,
+                 timestamp: float,
+                 conversion_rates: Dict[str, Decimal],
+                 usd_rates: Dict[str, float],
+                 data_feed_asset_timestamps: Dict[str, float]):
+        self._version: int = version
+        self._timestamp: float = timestamp
+        self._conversion_rates: Dict[str, Decimal] = conversion_rates
+        self._float_conversion_rates: Dict[str, float] = {k: float(v) for k, v in conversion_rates.items()}
+        self._usd_rates: Dict[str, float] = usd_rates
+        self._data_feed_asset_timestamps: Dict[str, float] = data_feed_asset_timestamps
+
+    @property
+    def version(self) -> int:
+        """
+        Incremented every time the rates change.
+        """
+        return self._version
+
+    @property
+    def timestamp(self) -> float:
+        """
+        When the rates were last refreshed with fresh prices from the data feeds, or 0 if that hasn't happened yet.
+        """
+        return self._timestamp
+
+    @property
+    def age(self) -> float:
+        if self._timestamp <= 0:
+            return math.inf
+        return time.time() - self._timestamp
+
+    @property
+    def conversion_rates(self) -> Dict[str, Decimal]:
+        return self._conversion_rates.copy()
+
+    @property
+    def usd_rates(self) -> Dict[str, float]:
+        return self._usd_rates.copy()
+
+    def requires_conversion(self, asset_name: str) -> bool:
+        return asset_name in self._conversion_rates or asset_name.upper() in self._conversion_rates
+
+    def get_stale_assets(self, asset_names: Iterable[str], max_age: float) -> List[str]:
+        """
+        Returns the assets among `asset_names` that need conversion with a rate from a data feed, if that data feed
+        hasn't delivered fresh prices for the last `max_age` seconds. Rates that are fixed in the config are never
+        stale.
+        """
+        now: float = time.time()
+        return [asset_name for asset_name in asset_names
+                if asset_name.upper() in self._data_feed_asset_timestamps and
+                now - self._data_feed_asset_timestamps[asset_name.upper()] > max_age]
+
+    def get_conversion_rate(self, asset_name: str) -> Decimal:
+        rate: Optional[Decimal] = self._conversion_rates.get(asset_name)
+        if rate is None:
+            rate = self._conversion_rates.get(asset_name.upper(), s_decimal_1)
+        return rate
+
+    def get_float_conversion_rate(self, asset_name: str) -> float:
+        rate: Optional[float] = self._float_conversion_rates.get(asset_name)
+        if rate is None:
+            rate = self._float_conversion_rates.get(asset_name.upper(), 1.0)
+        return rate
+
+    def adjust_token_rate(self, asset_name: str, price: Decimal) -> Decimal:
+        """
+        Same as `ExchangeRateConversion.adjust_token_rate()`, with the rates of this snapshot.
+        """
+        rate: Optional[Decimal] = self._conversion_rates.get(asset_name)
+        if rate is None:
+            rate = self._conversion_rates.get(asset_name.upper())
+        if rate is None:
+            return price if isinstance(price, Decimal) else Decimal(price)
+        return rate * price
+
+    def convert_token_value(self, amount: float, from_currency: str, to_currency: str) -> float:
+        """
+        Same as `ExchangeRateConversion.convert_token_value()` from any source, with the rates of this snapshot.
+        """
+        from_currency = from_currency.upper()
+        to_currency = to_currency.upper()
+        # assume WETH and ETH are equal value
+        if from_currency == "ETH" and to_currency == "WETH" or from_currency == "WETH" and to_currency == "ETH":
+            return amount
+        from_currency_usd_rate = self._usd_rates.get(from_currency, NaN)
+        to_currency_usd_rate = self._usd_rates.get(to_currency, NaN)
+        if math.isnan(from_currency_usd_rate) or math.isnan(to_currency_usd_rate):
+            raise ValueError(f"Unable to convert '{from_currency}' to '{to_currency}'. Aborting.")
+        return amount * from_currency_usd_rate / to_currency_usd_rate
+
+    def convert_token_value_decimal(self, amount: Decimal, from_currency: str, to_currency: str) -> Decimal:
+        return Decimal(repr(self.convert_token_value(float(amount), from_currency, to_currency)))
 
 
 class ExchangeRateConversion:
@@ -35,6 +145,11 @@ class ExchangeRateConversion:
     _ready_notifier: asyncio.Event = asyncio.Event()
     _show_update_exchange_rates_from_data_feeds_errors: bool = True
     _show_wait_till_ready_errors: bool = True
+    _rates_version: int = 0
+    _rates_update_timestamp: float = 0.0
+    # The last update timestamp of each data feed, as of the last time all of its configured rates were read from it.
+    _data_feed_update_timestamps: Dict[str, float] = {}
+    _snapshot: Optional[ExchangeRateSnapshot] = None
 
     @property
     def ready_notifier(self) -> asyncio.Event:
@@ -112,10 +227,65 @@ class ExchangeRateConversion:
             }
             cls._exchange_rate = {k: v["default"]
                                   for k, v in cls._exchange_rate_config["global_config"].items()}
+            # The rates are back to the configured defaults.
+            cls._rates_update_timestamp = 0.0
+            cls._data_feed_update_timestamps = {}
+            cls._update_snapshot()
 
         except Exception:
             cls.logger().error("Error initiating config for exchange rate conversion.", exc_info=True)
 
+    @classmethod
+    def _update_snapshot(cls):
+        conversion_rates: Dict[str, Decimal] = {
+            asset_name: Decimal(str(cls._exchange_rate[asset_name]))
+            for asset_name in cls._exchange_rate_config["conversion_required"].keys()
+            if asset_name in cls._exchange_rate
+        }
+        usd_rates: Dict[str, float] = cls._exchange_rate.copy()
+        for data_feed_rates in cls._all_data_feed_exchange_rate.values():
+            usd_rates.update(data_feed_rates)
+        data_feed_timestamps: Dict[str, float] = {
+            data_feed.name.lower(): cls._data_feed_update_timestamps.get(data_feed.name, 0.0)
+            for data_feed in cls._data_feeds
+        }
+        data_feed_asset_timestamps: Dict[str, float] = {
+            asset_name: data_feed_timestamps[str(config.get("source", "")).lower()]
+            for asset_name, config in cls._exchange_rate_config["conversion_required"].items()
+            if str(config.get("source", "")).lower() in data_feed_timestamps
+        }
+        if (cls._snapshot is None or
+                {k: str(v) for k, v in conversion_rates.items()} !=
+                {k: str(v) for k, v in cls._snapshot.conversion_rates.items()} or
+                usd_rates != cls._snapshot.usd_rates):
+            cls._rates_version += 1
+        cls._snapshot = ExchangeRateSnapshot(cls._rates_version, cls._rates_update_timestamp, conversion_rates,
+                                             usd_rates, data_feed_asset_timestamps)
+
+    def get_snapshot(self) -> ExchangeRateSnapshot:
+        """
+        Returns the conversion rates as of the last update from the data feeds. The same snapshot object is returned
+        until the rates are refreshed.
+        """
+        if not self._started:
+            self.start()
+        if self._snapshot is None:
+            self._update_snapshot()
+        return self._snapshot
+
+    @property
+    def rates_version(self) -> int:
+        return self._rates_version
+
+    @property
+    def rates_age(self) -> float:
+        """
+        Seconds since the rates were last refreshed with fresh prices from the data feeds.
+        """
+        if self._rates_update_timestamp <= 0:
+            return math.inf
+        return time.time() - self._rates_update_timestamp
+
     @property
     def all_exchange_rate(self) -> Dict[str, Dict[str, float]]:
         return self._all_data_feed_exchange_rate.copy()
@@ -161,14 +331,7 @@ class ExchangeRateConversion:
         """
         if price == s_decimal_nan:
             return price
-        asset_name = asset_name.upper()
-        if not self._started:
-            self.start()
-        exchange_rate = self.get_exchange_rate("config")
-        if asset_name in self._exchange_rate_config["conversion_required"] and asset_name in self._exchange_rate:
-            return Decimal(repr(exchange_rate[asset_name])) * price
-        else:
-            return Decimal(price)
+        return self.get_snapshot().adjust_token_rate(asset_name, price)
 
     def convert_token_value_decimal(self,
                                     amount: Decimal,
@@ -207,11 +370,14 @@ class ExchangeRateConversion:
 
     async def update_exchange_rates_from_data_feeds(self):
         has_errors: bool = False
+        has_fresh_data: bool = False
         try:
             for data_feed in self._data_feeds:
                 self._all_data_feed_exchange_rate[data_feed.name] = data_feed.price_dict
             for data_feed in self._data_feeds:
                 source_name = data_feed.name
+                data_feed_timestamp: float = data_feed.last_update_timestamp
+                data_feed_has_errors: bool = False
                 for asset_name, config in self._exchange_rate_config["global_config"].items():
                     asset_name = asset_name.upper()
                     if config["source"].lower() == source_name.lower():
@@ -225,10 +391,20 @@ class ExchangeRateConversion:
                                     app_warning_msg=f"Asset data for {asset_name} not found in {source_name} data feed,"
                                                     f" please check your 'exchange_rate_conversion' configs."
                                 )
-                            has_errors = True
+                            data_feed_has_errors = True
+                # A data feed's rates are only fresh if it has fetched new prices since the last update, and all of
+                # the configured rates were found in them.
+                if data_feed_has_errors:
+                    has_errors = True
+                elif data_feed_timestamp > self._data_feed_update_timestamps.get(source_name, 0.0):
+                    self._data_feed_update_timestamps[source_name] = data_feed_timestamp
+                    has_fresh_data = True
             if has_errors:
                 # only show these errors once
                 self._show_update_exchange_rates_from_data_feeds_errors = False
+            elif has_fresh_data:
+                ExchangeRateConversion._rates_update_timestamp = time.time()
+            self._update_snapshot()
 
         except Exception:
             self.logger().warning(f"Error getting data from {source_name} data feed.", exc_info=True)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+
+import aiohttp
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+
+from hummingbot.logger import HummingbotLogger
+
+
+class HttpHostStats:
+    """
+    Requests made to one host through the shared HTTP client. Latency is measured from sending the request to having
+    received the response headers.
+    """
+    def __init__(self):
+        self._request_count: int = 0
+        self._error_count: int = 0
+        self._last_latency: float = 0.0
+        self._total_latency: float = 0.0
+        self._max_latency: float = 0.0
+
+    @property
+    def request_count(self) -> int:
+        return self._request_count
+
+    @property
+    def error_count(self) -> int:
+        return self._error_count
+
+    @property
+    def last_latency(self) -> float:
+        return self._last_latency
+
+    @property
+    def mean_latency(self) -> float:
+        return self._total_latency / self._request_count if self._request_count > 0 else 0.0
+
+    @property
+    def max_latency(self) -> float:
+        return self._max_latency
+
+    def record_request(self, latency: float, failed: bool):
+        self._request_count += 1
+        self._error_count += 1 if failed else 0
+        self._last_latency = latency
+        self._total_latency += latency
+        self._max_latency = max(self._max_latency, latency)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "request_count": self._request_count,
+            "error_count": self._error_count,
+            "last_latency": self._last_latency,
+            "mean_latency": self.mean_latency,
+            "max_latency": self._max_latency,
+        }
+
+
+class HttpClientRegistry:
+    """
+    Process-wide pool of HTTP connections, shared by the markets, order book data sources and data feeds.
+
+    Creating an aiohttp.ClientSession per request means a new TCP connection, TLS handshake and DNS lookup every time.
+    The shared client keeps connections alive between requests, caches DNS lookups, and limits the number of
+    connections per host. It also counts the requests and their latencies per host.
+
+    The shared client must not be closed by its users - it's closed by close(), when the application exits.
+    """
+    CONNECTION_LIMIT = 100
+    CONNECTION_LIMIT_PER_HOST = 20
+    KEEPALIVE_TIMEOUT = 30.0
+    DNS_CACHE_TTL = 300
+
+    _hcr_logger: Optional[HummingbotLogger] = None
+    _hcr_shared_instance: Optional["HttpClientRegistry"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._hcr_logger is None:
+            cls._hcr_logger = logging.getLogger(__name__)
+        return cls._hcr_logger
+
+    @classmethod
+    def get_instance(cls) -> "HttpClientRegistry":
+        if cls._hcr_shared_instance is None:
+            cls._hcr_shared_instance = HttpClientRegistry()
+        return cls._hcr_shared_instance
+
+    def __init__(self,
+                 connection_limit: int = CONNECTION_LIMIT,
+                 connection_limit_per_host: int = CONNECTION_LIMIT_PER_HOST,
+                 keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+                 dns_cache_ttl: int = DNS_CACHE_TTL):
+        self._connection_limit: int = connection_limit
+        self._connection_limit_per_host: int = connection_limit_per_host
+        self._keepalive_timeout: float = keepalive_timeout
+        self._dns_cache_ttl: int = dns_cache_ttl
+        self._client: Optional[aiohttp.ClientSession] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_stats: Dict[str, HttpHostStats] = {}
+
+    @property
+    def host_stats(self) -> Dict[str, HttpHostStats]:
+        return self._host_stats
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {host: host_stats.to_dict() for host, host_stats in self._host_stats.items()}
+
+    def client(self) -> aiohttp.ClientSession:
+        """
+        The shared client. Must be called from a coroutine, since the client is bound to the running event loop. A new
+        client is created if the last one has been closed, or belongs to another event loop.
+        """
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        if self._client is None or self._client.closed or self._client_loop is not ev_loop:
+            trace_config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(self._on_request_start)
+            trace_config.on_request_end.append(self._on_request_end)
+            trace_config.on_request_exception.append(self._on_request_exception)
+            connector: aiohttp.TCPConnector = aiohttp.TCPConnector(limit=self._connection_limit,
+                                                                   limit_per_host=self._connection_limit_per_host,
+                                                                   keepalive_timeout=self._keepalive_timeout,
+                                                                   ttl_dns_cache=self._dns_cache_ttl)
+            self._client = aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
+            self._client_loop = ev_loop
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+            self._client_loop = None
+
+    def _record_request(self, host: str, latency: float, failed: bool):
+        if host not in self._host_stats:
+            self._host_stats[host] = HttpHostStats()
+        self._host_stats[host].record_request(latency, failed)
+
+    async def _on_request_start(self,
+                                session: aiohttp.ClientSession,
+                                trace_config_ctx: SimpleNamespace,
+                                params: aiohttp.TraceRequestStartParams):
+        trace_config_ctx.start_time = time.perf_counter()
+
+    async def _on_request_end(self,
+                              session: aiohttp.ClientSession,
+                              trace_config_ctx: SimpleNamespace,
+                              params: aiohttp.TraceRequestEndParams):
+        self._record_request(params.url.host,
+                             time.perf_counter() - trace_config_ctx.start_time,
+                             params.response.status >= 400)
+
+    async def _on_request_exception(self,
+                                    session: aiohttp.ClientSession,
+                                    trace_config_ctx: SimpleNamespace,
+                                    params: aiohttp.TraceRequestExceptionParams):
+        self._record_request(params.url.host, time.perf_counter() - trace_config_ctx.start_time, True)
@@ -6,6 +6,7 @@ from typing import (
 )
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 
 
 BINANCE_ENDPOINT = "https://api.binance.com/api/v1/exchangeInfo"
@@ -34,54 +35,54 @@ class TradingPairFetcher:
 
     @staticmethod
     async def fetch_binance_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
-            async with client.get(BINANCE_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
-                if response.status == 200:
-                    try:
-                        data = await response.json()
-                        trading_pair_structs = data.get("symbols")
-                        trading_pairs = list(map(lambda details: details.get("symbol"), trading_pair_structs))
-                        return trading_pairs
-                    except Exception:
-                        pass
-                        # Do nothing if the request fails -- there will be no autocomplete for binance trading pairs
-                return []
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        async with client.get(BINANCE_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
+            if response.status == 200:
+                try:
+                    data = await response.json()
+                    trading_pair_structs = data.get("symbols")
+                    trading_pairs = list(map(lambda details: details.get("symbol"), trading_pair_structs))
+                    return trading_pairs
+                except Exception:
+                    pass
+                    # Do nothing if the request fails -- there will be no autocomplete for binance trading pairs
+            return []
 
     @staticmethod
     async def fetch_ddex_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
-            async with client.get(DDEX_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
-                if response.status == 200:
-                    try:
-                        response = await response.json()
-                        markets = response.get("data").get("markets")
-                        trading_pairs = list(map(lambda details: details.get('id'), markets))
-                        return trading_pairs
-                    except Exception:
-                        pass
-                        # Do nothing if the request fails -- there will be no autocomplete for ddex trading pairs
-                return []
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        async with client.get(DDEX_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
+            if response.status == 200:
+                try:
+                    response = await response.json()
+                    markets = response.get("data").get("markets")
+                    trading_pairs = list(map(lambda details: details.get('id'), markets))
+                    return trading_pairs
+                except Exception:
+                    pass
+                    # Do nothing if the request fails -- there will be no autocomplete for ddex trading pairs
+            return []
 
     @staticmethod
     async def fetch_radar_relay_trading_pairs() -> List[str]:
         trading_pairs = set()
         page_count = 1
         while True:
-            async with aiohttp.ClientSession() as client:
-                async with client.get(f"{RADAR_RELAY_ENDPOINT}?perPage=100&page={page_count}", timeout=API_CALL_TIMEOUT) \
-                        as response:
-                    if response.status == 200:
-                        try:
-                            markets = await response.json()
-                            new_trading_pairs = set(map(lambda details: details.get('id'), markets))
-                            if len(new_trading_pairs) == 0:
-                                break
-                            else:
-                                trading_pairs = trading_pairs.union(new_trading_pairs)
-                            page_count += 1
-                        except Exception:
-                            # Do nothing if the request fails -- there will be no autocomplete for radar trading pairs
+            client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+            async with client.get(f"{RADAR_RELAY_ENDPOINT}?perPage=100&page={page_count}", timeout=API_CALL_TIMEOUT) \
+                    as response:
+                if response.status == 200:
+                    try:
+                        markets = await response.json()
+                        new_trading_pairs = set(map(lambda details: details.get('id'), markets))
+                        if len(new_trading_pairs) == 0:
                             break
+                        else:
+                            trading_pairs = trading_pairs.union(new_trading_pairs)
+                        page_count += 1
+                    except Exception:
+                        # Do nothing if the request fails -- there will be no autocomplete for radar trading pairs
+                        break
         return list(trading_pairs)
 
     @staticmethod
@@ -89,65 +90,65 @@ class TradingPairFetcher:
         trading_pairs = set()
         page_count = 1
         while True:
-            async with aiohttp.ClientSession() as client:
-                async with client.get(f"{BAMBOO_RELAY_ENDPOINT}?perPage=1000&page={page_count}",
-                                      timeout=API_CALL_TIMEOUT) as response:
-                    if response.status == 200:
-                        try:
-                            markets = await response.json()
-                            new_trading_pairs = set(map(lambda details: details.get('id'), markets))
-                            if len(new_trading_pairs) == 0:
-                                break
-                            else:
-                                trading_pairs = trading_pairs.union(new_trading_pairs)
-                            page_count += 1
-                        except Exception:
-                            # Do nothing if the request fails -- there will be no autocomplete for bamboo trading pairs
+            client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+            async with client.get(f"{BAMBOO_RELAY_ENDPOINT}?perPage=1000&page={page_count}",
+                                  timeout=API_CALL_TIMEOUT) as response:
+                if response.status == 200:
+                    try:
+                        markets = await response.json()
+                        new_trading_pairs = set(map(lambda details: details.get('id'), markets))
+                        if len(new_trading_pairs) == 0:
                             break
+                        else:
+                            trading_pairs = trading_pairs.union(new_trading_pairs)
+                        page_count += 1
+                    except Exception:
+                        # Do nothing if the request fails -- there will be no autocomplete for bamboo trading pairs
+                        break
         return list(trading_pairs)
 
     @staticmethod
     async def fetch_coinbase_pro_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
-            async with client.get(COINBASE_PRO_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
-                if response.status == 200:
-                    try:
-                        markets = await response.json()
-                        return list(map(lambda details: details.get('id'), markets))
-                    except Exception:
-                        pass
-                        # Do nothing if the request fails -- there will be no autocomplete for coinbase trading pairs
-                return []
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        async with client.get(COINBASE_PRO_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
+            if response.status == 200:
+                try:
+                    markets = await response.json()
+                    return list(map(lambda details: details.get('id'), markets))
+                except Exception:
+                    pass
+                    # Do nothing if the request fails -- there will be no autocomplete for coinbase trading pairs
+            return []
 
     @staticmethod
     async def fetch_idex_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
-            async with client.get(IDEX_REST_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
-                if response.status == 200:
-                    try:
-                        market: Dict[Any] = await response.json()
-                        return list(market.keys())
-                    except Exception:
-                        pass
-                        # Do nothing if the request fails -- there will be no autocomplete for idex trading pairs
-                return []
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        async with client.get(IDEX_REST_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
+            if response.status == 200:
+                try:
+                    market: Dict[Any] = await response.json()
+                    return list(market.keys())
+                except Exception:
+                    pass
+                    # Do nothing if the request fails -- there will be no autocomplete for idex trading pairs
+            return []
 
     @staticmethod
     async def fetch_huobi_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
-            async with client.get(HUOBI_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
-                if response.status == 200:
-                    try:
-                        all_trading_pairs: Dict[str, any] = await response.json()
-                        valid_trading_pairs: list = []
-                        for item in all_trading_pairs["data"]:
-                            if item["state"] == "online":
-                                valid_trading_pairs.append(item["symbol"])
-                        return valid_trading_pairs
-                    except Exception:
-                        pass
-                        # Do nothing if the request fails -- there will be no autocomplete for huobi trading pairs
-                return []
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        async with client.get(HUOBI_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
+            if response.status == 200:
+                try:
+                    all_trading_pairs: Dict[str, any] = await response.json()
+                    valid_trading_pairs: list = []
+                    for item in all_trading_pairs["data"]:
+                        if item["state"] == "online":
+                            valid_trading_pairs.append(item["symbol"])
+                    return valid_trading_pairs
+                except Exception:
+                    pass
+                    # Do nothing if the request fails -- there will be no autocomplete for huobi trading pairs
+            return []
 
     async def fetch_all(self):
         binance_trading_pairs = await self.fetch_binance_trading_pairs()
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from typing import (
     Dict,
     Optional,
@@ -82,6 +83,7 @@ class CoinCapDataFeed(DataFeedBase):
 
             # CoinCap does not have a separate feed for WETH
             self._price_dict["WETH"] = self._price_dict["ETH"]
+            self._last_update_timestamp = time.time()
             self._ready_event.set()
         except Exception:
             raise
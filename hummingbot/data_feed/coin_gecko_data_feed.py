@@ -1,6 +1,7 @@
 import aiohttp
 import asyncio
 import logging
+import time
 from typing import (
     Dict,
     List,
@@ -103,6 +104,7 @@ class CoinGeckoDataFeed(DataFeedBase):
                 await asyncio.sleep(0.1)
 
             self._price_dict = price_dict
+            self._last_update_timestamp = time.time()
         except Exception:
             raise
 
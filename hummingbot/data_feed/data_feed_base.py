@@ -7,6 +7,7 @@ from typing import (
 )
 
 from hummingbot.core.network_base import NetworkBase, NetworkStatus
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.logger import HummingbotLogger
 
 
@@ -23,6 +24,7 @@ class DataFeedBase(NetworkBase):
         super().__init__()
         self._ready_event = asyncio.Event()
         self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._last_update_timestamp: float = 0.0
 
     @property
     def name(self):
@@ -32,6 +34,13 @@ class DataFeedBase(NetworkBase):
     def price_dict(self) -> Dict[str, float]:
         raise NotImplementedError
 
+    @property
+    def last_update_timestamp(self) -> float:
+        """
+        When the prices were last fetched successfully, or 0 if they haven't been fetched yet.
+        """
+        return self._last_update_timestamp
+
     @property
     def health_check_endpoint(self) -> Dict[str, float]:
         raise NotImplementedError
@@ -41,7 +50,7 @@ class DataFeedBase(NetworkBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            return HttpClientRegistry.get_instance().client()
         return self._shared_client
 
     async def get_ready(self):
@@ -25,6 +25,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry, BambooRelayOrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, BambooRelayOrderBookMessage
 from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.logger import HummingbotLogger
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
 
@@ -69,7 +70,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
         if cls._client is None:
             if not asyncio.get_event_loop().is_running():
                 raise EnvironmentError("Event loop must be running to start HTTP client session.")
-            cls._client = aiohttp.ClientSession()
+            return HttpClientRegistry.get_instance().client()
         return cls._client
 
     @classmethod
@@ -147,42 +148,42 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        retval: Dict[str, OrderBookTrackerEntry] = {}
 
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair, self._api_prefix)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: BambooRelayOrderBookMessage = BambooRelayOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"symbol": trading_pair}
-                    )
+        number_of_pairs: int = len(trading_pairs)
+        for index, trading_pair in enumerate(trading_pairs):
+            try:
+                snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair, self._api_prefix)
+                snapshot_timestamp: float = time.time()
+                snapshot_msg: BambooRelayOrderBookMessage = BambooRelayOrderBook.snapshot_message_from_exchange(
+                    snapshot,
+                    snapshot_timestamp,
+                    metadata={"symbol": trading_pair}
+                )
 
-                    bamboo_relay_order_book: OrderBook = self.order_book_create_function()
-                    bamboo_relay_active_order_tracker: BambooRelayActiveOrderTracker = BambooRelayActiveOrderTracker()
-                    bids, asks = bamboo_relay_active_order_tracker.convert_snapshot_message_to_order_book_row(
-                        snapshot_msg)
-                    bamboo_relay_order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
+                bamboo_relay_order_book: OrderBook = self.order_book_create_function()
+                bamboo_relay_active_order_tracker: BambooRelayActiveOrderTracker = BambooRelayActiveOrderTracker()
+                bids, asks = bamboo_relay_active_order_tracker.convert_snapshot_message_to_order_book_row(
+                    snapshot_msg)
+                bamboo_relay_order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
 
-                    retval[trading_pair] = BambooRelayOrderBookTrackerEntry(
-                        trading_pair,
-                        snapshot_timestamp,
-                        bamboo_relay_order_book,
-                        bamboo_relay_active_order_tracker
-                    )
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
+                retval[trading_pair] = BambooRelayOrderBookTrackerEntry(
+                    trading_pair,
+                    snapshot_timestamp,
+                    bamboo_relay_order_book,
+                    bamboo_relay_active_order_tracker
+                )
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index+1}/{number_of_pairs} completed.")
 
-                    await asyncio.sleep(0.9)
+                await asyncio.sleep(0.9)
 
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-                    await asyncio.sleep(5.0)
-            return retval
+            except Exception:
+                self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
+                await asyncio.sleep(5.0)
+        return retval
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
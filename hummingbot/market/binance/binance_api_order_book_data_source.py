@@ -6,39 +6,42 @@ import logging
 import pandas as pd
 from typing import (
     Any,
-    AsyncIterable,
+    Callable,
     Dict,
     List,
     Optional
 )
 import re
 import time
-import ujson
-import websockets
-from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import (
+    CompactOrderBookMessage,
+    OrderBookMessage
+)
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.binance.binance_order_book import BinanceOrderBook
+from hummingbot.market.binance.binance_websocket_manager import BinanceWebSocketManager
+from hummingbot.market.binance.binance_rate_limiter import (
+    BinanceRateLimiter,
+    PRIORITY_BACKGROUND,
+    PRIORITY_ORDER_BOOK,
+)
 
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
 
 SNAPSHOT_REST_URL = "https://api.binance.com/api/v1/depth"
-DIFF_STREAM_URL = "wss://stream.binance.com:9443/ws"
 TICKER_PRICE_CHANGE_URL = "https://api.binance.com/api/v1/ticker/24hr"
 EXCHANGE_INFO_URL = "https://api.binance.com/api/v1/exchangeInfo"
 
 
 class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
-    MESSAGE_TIMEOUT = 30.0
-    PING_TIMEOUT = 10.0
-
     _baobds_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -47,9 +50,18 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             cls._baobds_logger = logging.getLogger(__name__)
         return cls._baobds_logger
 
-    def __init__(self, symbols: Optional[List[str]] = None):
+    def __init__(self,
+                 symbols: Optional[List[str]] = None,
+                 snapshot_refresh_interval: float = 3600.0,
+                 max_streams_per_connection: int = 100):
         super().__init__()
         self._symbols: Optional[List[str]] = symbols
+        self._snapshot_refresh_interval: float = snapshot_refresh_interval
+        # Depth diffs and trades for every trading pair share the same sharded combined stream connections.
+        self._websocket_manager: BinanceWebSocketManager = BinanceWebSocketManager(
+            ["depth", "trade"],
+            max_streams_per_connection=max_streams_per_connection
+        )
         self._order_book_create_function = lambda: OrderBook()
 
     @classmethod
@@ -58,15 +70,16 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Returned data frame should have symbol as index and include usd volume, baseAsset and quoteAsset
         """
-        async with aiohttp.ClientSession() as client:
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
 
-            market_response, exchange_response = await safe_gather(
-                client.get(TICKER_PRICE_CHANGE_URL),
-                client.get(EXCHANGE_INFO_URL)
-            )
-            market_response: aiohttp.ClientResponse = market_response
-            exchange_response: aiohttp.ClientResponse = exchange_response
+        market_response, exchange_response = await safe_gather(
+            client.get(TICKER_PRICE_CHANGE_URL),
+            client.get(EXCHANGE_INFO_URL)
+        )
+        market_response: aiohttp.ClientResponse = market_response
+        exchange_response: aiohttp.ClientResponse = exchange_response
 
+        try:
             if market_response.status != 200:
                 raise IOError(f"Error fetching Binance markets information. "
                               f"HTTP status is {market_response.status}.")
@@ -76,31 +89,34 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
             market_data = await market_response.json()
             exchange_data = await exchange_response.json()
+        finally:
+            market_response.release()
+            exchange_response.release()
 
-            trading_pairs: Dict[str, Any] = {item["symbol"]: {k: item[k] for k in ["baseAsset", "quoteAsset"]}
-                                             for item in exchange_data["symbols"]
-                                             if item["status"] == "TRADING"}
+        trading_pairs: Dict[str, Any] = {item["symbol"]: {k: item[k] for k in ["baseAsset", "quoteAsset"]}
+                                         for item in exchange_data["symbols"]
+                                         if item["status"] == "TRADING"}
 
-            market_data: List[Dict[str, Any]] = [{**item, **trading_pairs[item["symbol"]]}
-                                                 for item in market_data
-                                                 if item["symbol"] in trading_pairs]
+        market_data: List[Dict[str, Any]] = [{**item, **trading_pairs[item["symbol"]]}
+                                             for item in market_data
+                                             if item["symbol"] in trading_pairs]
 
-            # Build the data frame.
-            all_markets: pd.DataFrame = pd.DataFrame.from_records(data=market_data, index="symbol")
-            btc_price: float = float(all_markets.loc["BTCUSDT"].lastPrice)
-            eth_price: float = float(all_markets.loc["ETHUSDT"].lastPrice)
-            usd_volume: float = [
-                (
-                    quoteVolume * btc_price if symbol.endswith("BTC") else
-                    quoteVolume * eth_price if symbol.endswith("ETH") else
-                    quoteVolume
-                )
-                for symbol, quoteVolume in zip(all_markets.index,
-                                               all_markets.quoteVolume.astype("float"))]
-            all_markets.loc[:, "USDVolume"] = usd_volume
-            all_markets.loc[:, "volume"] = all_markets.quoteVolume
+        # Build the data frame.
+        all_markets: pd.DataFrame = pd.DataFrame.from_records(data=market_data, index="symbol")
+        btc_price: float = float(all_markets.loc["BTCUSDT"].lastPrice)
+        eth_price: float = float(all_markets.loc["ETHUSDT"].lastPrice)
+        usd_volume: float = [
+            (
+                quoteVolume * btc_price if symbol.endswith("BTC") else
+                quoteVolume * eth_price if symbol.endswith("ETH") else
+                quoteVolume
+            )
+            for symbol, quoteVolume in zip(all_markets.index,
+                                           all_markets.quoteVolume.astype("float"))]
+        all_markets.loc[:, "USDVolume"] = usd_volume
+        all_markets.loc[:, "volume"] = all_markets.quoteVolume
 
-            return all_markets.sort_values("USDVolume", ascending=False)
+        return all_markets.sort_values("USDVolume", ascending=False)
 
     async def get_trading_pairs(self) -> List[str]:
         if not self._symbols:
@@ -117,10 +133,30 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return self._symbols
 
     @staticmethod
-    async def get_snapshot(client: aiohttp.ClientSession, trading_pair: str, limit: int = 1000) -> Dict[str, Any]:
+    def get_snapshot_weight(limit: int = 1000) -> int:
+        """
+        Request weight of a depth snapshot on Binance, which depends on how many levels are requested.
+        """
+        if 0 < limit <= 100:
+            return 1
+        elif 0 < limit <= 500:
+            return 5
+        elif 0 < limit <= 1000:
+            return 10
+        return 50
+
+    @staticmethod
+    async def get_snapshot(client: aiohttp.ClientSession,
+                           trading_pair: str,
+                           limit: int = 1000,
+                           priority: int = PRIORITY_ORDER_BOOK) -> Dict[str, Any]:
+        rate_limiter: BinanceRateLimiter = BinanceRateLimiter.get_instance()
+        await rate_limiter.acquire(BinanceAPIOrderBookDataSource.get_snapshot_weight(limit), priority=priority)
         params: Dict = {"limit": str(limit), "symbol": trading_pair} if limit != 0 else {"symbol": trading_pair}
         async with client.get(SNAPSHOT_REST_URL, params=params) as response:
             response: aiohttp.ClientResponse = response
+            if "X-MBX-USED-WEIGHT" in response.headers:
+                rate_limiter.observe_used_weight(float(response.headers["X-MBX-USED-WEIGHT"]))
             if response.status != 200:
                 raise IOError(f"Error fetching Binance market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
@@ -132,124 +168,109 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
             return data
 
+    async def _get_tracking_pair(self,
+                                 client: aiohttp.ClientSession,
+                                 trading_pair: str,
+                                 priority: int) -> Optional[OrderBookTrackerEntry]:
+        try:
+            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000, priority=priority)
+            snapshot_timestamp: float = time.time()
+            snapshot_msg: CompactOrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
+                snapshot,
+                snapshot_timestamp,
+                metadata={"symbol": trading_pair}
+            )
+            order_book: OrderBook = self.order_book_create_function()
+            order_book.apply_numpy_snapshot(snapshot_msg.bids_array,
+                                            snapshot_msg.asks_array,
+                                            snapshot_msg.update_id)
+            return OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
+            return None
+
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        start_time: float = time.time()
+        configured_pairs: bool = bool(self._symbols)
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        retval: Dict[str, OrderBookTrackerEntry] = {}
 
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"symbol": trading_pair}
-                    )
-                    order_book: OrderBook = self.order_book_create_function()
-                    order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-                    retval[trading_pair] = OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
-                    # Each 1000 limit snapshot costs 10 requests and Binance rate limit is 20 requests per second.
-                    await asyncio.sleep(1.0)
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-                    await asyncio.sleep(5)
-            return retval
+        # Snapshots are fetched concurrently, the shared rate limiter keeps them within Binance's request weight
+        # budget. All snapshots of one call share a priority: snapshots of explicitly configured pairs outrank
+        # background requests in the limiter, while fetching all of the exchange's markets runs as a background
+        # request itself. There's no ordering among the snapshots of one call.
+        priority: int = PRIORITY_ORDER_BOOK if configured_pairs else PRIORITY_BACKGROUND
+        number_of_pairs: int = len(trading_pairs)
+        for next_entry in asyncio.as_completed([self._get_tracking_pair(client, trading_pair, priority)
+                                                for trading_pair in trading_pairs]):
+            entry: Optional[OrderBookTrackerEntry] = await next_entry
+            if entry is None:
+                continue
+            retval[entry.symbol] = entry
+            self.logger().info(f"Initialized order book for {entry.symbol}. "
+                               f"{len(retval)}/{number_of_pairs} completed.")
 
-    async def _inner_messages(self,
-                              ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
-        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
-        try:
-            while True:
-                try:
-                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    yield msg
-                except asyncio.TimeoutError:
-                    try:
-                        pong_waiter = await ws.ping()
-                        await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
-                    except asyncio.TimeoutError:
-                        raise
-        except asyncio.TimeoutError:
-            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
-            return
-        except ConnectionClosed:
-            return
-        finally:
-            await ws.close()
+        self.logger().info(f"Initialized {len(retval)}/{number_of_pairs} order books in "
+                           f"{time.time() - start_time:.2f} seconds.")
+        return retval
 
-    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+    @property
+    def websocket_manager(self) -> BinanceWebSocketManager:
+        return self._websocket_manager
+
+    async def _listen_for_channel(self, channel: str, callback: Callable[[Dict[str, Any]], None]):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                ws_path: str = "/".join([f"{trading_pair.lower()}@trade" for trading_pair in trading_pairs])
-                stream_url: str = f"{DIFF_STREAM_URL}/{ws_path}"
-
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg)
-                        output.put_nowait(trade_msg)
+                await self._websocket_manager.listen(channel, callback, trading_pairs)
             except asyncio.CancelledError:
                 raise
             except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
+                self.logger().error("Unexpected error with WebSocket connections. Retrying after 5 seconds...",
                                     exc_info=True)
-                await asyncio.sleep(30.0)
+                await asyncio.sleep(5.0)
 
-    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                trading_pairs: List[str] = await self.get_trading_pairs()
-                ws_path: str = "/".join([f"{trading_pair.lower()}@depth" for trading_pair in trading_pairs])
-                stream_url: str = f"{DIFF_STREAM_URL}/{ws_path}"
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._listen_for_channel(
+            "trade",
+            lambda msg: output.put_nowait(BinanceOrderBook.trade_message_from_exchange(msg))
+        )
 
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
-                            msg, time.time())
-                        output.put_nowait(order_book_message)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._listen_for_channel(
+            "depth",
+            lambda msg: output.put_nowait(BinanceOrderBook.diff_message_from_exchange(msg, time.time()))
+        )
 
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_timestamp: float = time.time()
-                            snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                metadata={"symbol": trading_pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                            # Be careful not to go above Binance's API rate limits.
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().error("Unexpected error.", exc_info=True)
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
+                client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+                for trading_pair in trading_pairs:
+                    try:
+                        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair,
+                                                                           priority=PRIORITY_BACKGROUND)
+                        snapshot_timestamp: float = time.time()
+                        snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
+                            snapshot,
+                            snapshot_timestamp,
+                            metadata={"symbol": trading_pair}
+                        )
+                        output.put_nowait(snapshot_msg)
+                        self.logger().debug(f"Saved order book snapshot for {trading_pair}")
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        self.logger().error("Unexpected error.", exc_info=True)
+                        await asyncio.sleep(5.0)
+                now: float = time.time()
+                next_refresh: float = (now // self._snapshot_refresh_interval + 1) * self._snapshot_refresh_interval
+                await asyncio.sleep(next_refresh - now)
             except asyncio.CancelledError:
                 raise
             except Exception:
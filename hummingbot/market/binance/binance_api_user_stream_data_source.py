@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 
 import asyncio
-import aiohttp
 import logging
 from typing import (
     AsyncIterable,
@@ -12,11 +11,11 @@ import ujson
 import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from binance.client import Client as BinanceClient
 from hummingbot.logger import HummingbotLogger
-
-BINANCE_API_ENDPOINT = "https://api.binance.com/api/v1/"
-BINANCE_USER_STREAM_ENDPOINT = "userDataStream"
+from hummingbot.market.binance.binance_rest_client import (
+    BinanceAPIError,
+    BinanceRESTClient,
+)
 
 
 class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
@@ -32,32 +31,22 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
             cls._bausds_logger = logging.getLogger(__name__)
         return cls._bausds_logger
 
-    def __init__(self, binance_client: BinanceClient):
-        self._binance_client: BinanceClient = binance_client
+    def __init__(self, binance_client: BinanceRESTClient):
+        self._binance_client: BinanceRESTClient = binance_client
         self._current_listen_key = None
         self._listen_for_user_stream_task = None
         super().__init__()
 
-    async def get_listen_key(self):
-        async with aiohttp.ClientSession() as client:
-            async with client.post(f"{BINANCE_API_ENDPOINT}{BINANCE_USER_STREAM_ENDPOINT}",
-                                   headers={"X-MBX-APIKEY": self._binance_client.API_KEY}) as response:
-                response: aiohttp.ClientResponse = response
-                if response.status != 200:
-                    raise IOError(f"Error fetching Binance user stream listen key. HTTP status is {response.status}.")
-                data: Dict[str, str] = await response.json()
-                return data["listenKey"]
+    async def get_listen_key(self) -> str:
+        return await self._binance_client.stream_get_listen_key()
 
     async def ping_listen_key(self, listen_key: str) -> bool:
-        async with aiohttp.ClientSession() as client:
-            async with client.put(f"{BINANCE_API_ENDPOINT}{BINANCE_USER_STREAM_ENDPOINT}",
-                                  headers={"X-MBX-APIKEY": self._binance_client.API_KEY},
-                                  params={"listenKey": listen_key}) as response:
-                data: [str, any] = await response.json()
-                if "code" in data:
-                    self.logger().warning(f"Failed to refresh the listen key {listen_key}: {data}")
-                    return False
-                return True
+        try:
+            await self._binance_client.stream_keepalive(listen_key)
+        except BinanceAPIError as e:
+            self.logger().warning(f"Failed to refresh the listen key {listen_key}: {e}")
+            return False
+        return True
 
     async def _inner_messages(self, ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
         try:
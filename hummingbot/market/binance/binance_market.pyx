@@ -9,7 +9,6 @@ import asyncio
 from async_timeout import timeout
 from binance.client import Client as BinanceClient
 from binance import client as binance_client_module
-from binance.exceptions import BinanceAPIException
 from decimal import Decimal
 from functools import partial
 import logging
@@ -29,10 +28,12 @@ import conf
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.multi_process_order_book_tracker import MultiProcessOrderBookTracker
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
 )
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.market.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
@@ -58,6 +59,10 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.data_type.order_book_tracker import OrderBookTrackerDataSourceType
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.market.binance.binance_order_book_tracker import BinanceOrderBookTracker
+from hummingbot.market.binance.binance_rest_client import (
+    BinanceAPIError,
+    BinanceRESTClient,
+)
 from hummingbot.market.binance.binance_user_stream_tracker import BinanceUserStreamTracker
 from hummingbot.market.binance.binance_time import BinanceTime
 from hummingbot.market.binance.binance_in_flight_order import BinanceInFlightOrder
@@ -158,16 +163,28 @@ cdef class BinanceMarket(MarketBase):
                  user_stream_tracker_data_source_type: UserStreamTrackerDataSourceType =
                  UserStreamTrackerDataSourceType.EXCHANGE_API,
                  symbols: Optional[List[str]] = None,
-                 trading_required: bool = True):
+                 trading_required: bool = True,
+                 order_book_tracker_process: bool = False):
 
         self.monkey_patch_binance_time()
         super().__init__()
         self._trading_required = trading_required
-        self._order_book_tracker = BinanceOrderBookTracker(data_source_type=order_book_tracker_data_source_type,
-                                                           symbols=symbols)
+        if order_book_tracker_process:
+            # Decode and apply the order book messages in a worker process, to keep them off the main event loop.
+            self._order_book_tracker = MultiProcessOrderBookTracker(
+                partial(BinanceOrderBookTracker, data_source_type=order_book_tracker_data_source_type, symbols=symbols),
+                symbols=symbols,
+                exchange_name="binance"
+            )
+        else:
+            self._order_book_tracker = BinanceOrderBookTracker(
+                data_source_type=order_book_tracker_data_source_type,
+                symbols=symbols
+            )
         self._binance_client = BinanceClient(binance_api_key, binance_api_secret)
+        self._binance_rest_client = BinanceRESTClient(binance_api_key, binance_api_secret)
         self._user_stream_tracker = BinanceUserStreamTracker(
-            data_source_type=user_stream_tracker_data_source_type, binance_client=self._binance_client)
+            data_source_type=user_stream_tracker_data_source_type, binance_client=self._binance_rest_client)
         self._ev_loop = asyncio.get_event_loop()
         self._poll_notifier = asyncio.Event()
         self._last_timestamp = 0
@@ -208,6 +225,10 @@ cdef class BinanceMarket(MarketBase):
     def binance_client(self) -> BinanceClient:
         return self._binance_client
 
+    @property
+    def binance_rest_client(self) -> BinanceRESTClient:
+        return self._binance_rest_client
+
     @property
     def withdraw_rules(self) -> Dict[str, WithdrawRule]:
         return self._withdraw_rules
@@ -261,17 +282,23 @@ cdef class BinanceMarket(MarketBase):
             *args,
             app_warning_msg: str = "Binance API call failed. Check API key and network connection.",
             **kwargs) -> Dict[str, any]:
-        return await self._async_scheduler.call_async(partial(func, *args, **kwargs),
-                                                      timeout_seconds=self.API_CALL_TIMEOUT,
-                                                      app_warning_msg=app_warning_msg)
+        # `func` is a BinanceRESTClient method, which takes the request weight from the shared BinanceRateLimiter.
+        try:
+            return await asyncio.wait_for(func(*args, **kwargs), timeout=self.API_CALL_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            app_warning_msg += f" [[Got exception: {str(e)}]]"
+            self.logger().debug(app_warning_msg, exc_info=True, app_warning_msg=app_warning_msg)
+            raise
 
     async def query_url(self, url) -> any:
-        async with aiohttp.ClientSession() as client:
-            async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
-                if response.status != 200:
-                    raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
-                data = await response.json()
-                return data
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
+            if response.status != 200:
+                raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
+            data = await response.json()
+            return data
 
     async def _update_balances(self):
         cdef:
@@ -282,7 +309,7 @@ cdef class BinanceMarket(MarketBase):
             set remote_asset_names = set()
             set asset_names_to_remove
 
-        account_info = await self.query_api(self._binance_client.get_account)
+        account_info = await self.query_api(self._binance_rest_client.get_account)
         balances = account_info["balances"]
         for balance_entry in balances:
             asset_name = balance_entry["asset"]
@@ -303,7 +330,7 @@ cdef class BinanceMarket(MarketBase):
 
         if current_timestamp - self._last_update_trade_fees_timestamp > 60.0 * 60.0 or len(self._trade_fees) < 1:
             try:
-                res = await self.query_api(self._binance_client.get_trade_fee)
+                res = await self.query_api(self._binance_rest_client.get_trade_fee)
                 for fee in res["tradeFee"]:
                     self._trade_fees[fee["symbol"]] = (Decimal(fee["maker"]), Decimal(fee["taker"]))
                 self._last_update_trade_fees_timestamp = current_timestamp
@@ -358,7 +385,7 @@ cdef class BinanceMarket(MarketBase):
             int64_t last_tick = <int64_t>(self._last_timestamp / 60.0)
             int64_t current_tick = <int64_t>(self._current_timestamp / 60.0)
         if current_tick > last_tick or len(self._trading_rules) < 1:
-            exchange_info = await self.query_api(self._binance_client.get_exchange_info)
+            exchange_info = await self.query_api(self._binance_rest_client.get_exchange_info)
             trading_rules_list = self._format_trading_rules(exchange_info)
             self._trading_rules.clear()
             for trading_rule in trading_rules_list:
@@ -433,7 +460,7 @@ cdef class BinanceMarket(MarketBase):
                 trading_pairs_to_order_map[o.symbol][o.exchange_order_id] = o
 
             trading_pairs = list(trading_pairs_to_order_map.keys())
-            tasks = [self.query_api(self._binance_client.get_my_trades, symbol=trading_pair)
+            tasks = [self.query_api(self._binance_rest_client.get_my_trades, symbol=trading_pair)
                      for trading_pair in trading_pairs]
             results = await safe_gather(*tasks, return_exceptions=True)
             for trades, trading_pair in zip(results, trading_pairs):
@@ -480,7 +507,7 @@ cdef class BinanceMarket(MarketBase):
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
-            tasks = [self.query_api(self._binance_client.get_order,
+            tasks = [self.query_api(self._binance_rest_client.get_order,
                                     symbol=o.symbol, origClientOrderId=o.client_order_id)
                      for o in tracked_orders]
             results = await safe_gather(*tasks, return_exceptions=True)
@@ -768,7 +795,7 @@ cdef class BinanceMarket(MarketBase):
         """
         :return: The current server time in milliseconds since UNIX epoch.
         """
-        result = await self.query_api(self._binance_client.get_server_time)
+        result = await self.query_api(self._binance_rest_client.get_server_time)
         return result["serverTime"]
 
     async def get_deposit_info(self, asset: str) -> DepositInfo:
@@ -777,7 +804,7 @@ cdef class BinanceMarket(MarketBase):
             str err_msg
             str deposit_address
 
-        deposit_reply = await self.query_api(self._binance_client.get_deposit_address, asset=asset)
+        deposit_reply = await self.query_api(self._binance_rest_client.get_deposit_address, asset=asset)
         if deposit_reply.get("success") is not True:
             err_msg = deposit_reply.get("msg") or str(deposit_reply)
             self.logger().network(f"Could not get deposit address for {asset}: {err_msg}",
@@ -790,7 +817,7 @@ cdef class BinanceMarket(MarketBase):
     async def execute_withdraw(self, tracking_id: str, to_address: str, currency: str, amount: Decimal):
         decimal_amount = str(f"{amount:.12g}")
         try:
-            withdraw_result = await self.query_api(self._binance_client.withdraw,
+            withdraw_result = await self.query_api(self._binance_rest_client.withdraw,
                                                    asset=currency, address=to_address, amount=decimal_amount)
         except asyncio.CancelledError:
             raise
@@ -840,6 +867,8 @@ cdef class BinanceMarket(MarketBase):
     def _stop_network(self):
         if self._order_tracker_task is not None:
             self._order_tracker_task.cancel()
+        if isinstance(self._order_book_tracker, MultiProcessOrderBookTracker):
+            self._order_book_tracker.stop()
         if self._status_polling_task is not None:
             self._status_polling_task.cancel()
         if self._user_stream_tracker_task is not None:
@@ -856,7 +885,7 @@ cdef class BinanceMarket(MarketBase):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            await self.query_api(self._binance_client.ping)
+            await self.query_api(self._binance_rest_client.ping)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -910,7 +939,7 @@ cdef class BinanceMarket(MarketBase):
                     decimal_amount,
                     order_type
                 )
-                order_result = await self.query_api(self._binance_client.order_limit_buy,
+                order_result = await self.query_api(self._binance_rest_client.order_limit_buy,
                                                     symbol=symbol,
                                                     quantity=order_decimal_amount,
                                                     price=order_decimal_price,
@@ -925,7 +954,7 @@ cdef class BinanceMarket(MarketBase):
                     decimal_amount,
                     order_type
                 )
-                order_result = await self.query_api(self._binance_client.order_market_buy,
+                order_result = await self.query_api(self._binance_rest_client.order_market_buy,
                                                     symbol=symbol,
                                                     quantity=order_decimal_amount,
                                                     newClientOrderId=order_id)
@@ -1003,7 +1032,7 @@ cdef class BinanceMarket(MarketBase):
                     decimal_amount,
                     order_type
                 )
-                order_result = await self.query_api(self._binance_client.order_limit_sell,
+                order_result = await self.query_api(self._binance_rest_client.order_limit_sell,
                                                     symbol=symbol,
                                                     quantity=order_decimal_amount,
                                                     price=order_decimal_price,
@@ -1018,7 +1047,7 @@ cdef class BinanceMarket(MarketBase):
                     decimal_amount,
                     order_type
                 )
-                order_result = await self.query_api(self._binance_client.order_market_sell,
+                order_result = await self.query_api(self._binance_rest_client.order_market_sell,
                                                     symbol=symbol,
                                                     quantity=order_decimal_amount,
                                                     newClientOrderId=order_id)
@@ -1066,10 +1095,10 @@ cdef class BinanceMarket(MarketBase):
 
     async def execute_cancel(self, symbol: str, order_id: str):
         try:
-            cancel_result = await self.query_api(self._binance_client.cancel_order,
+            cancel_result = await self.query_api(self._binance_rest_client.cancel_order,
                                                  symbol=symbol,
                                                  origClientOrderId=order_id)
-        except BinanceAPIException as e:
+        except BinanceAPIError as e:
             if "Unknown order sent" in e.message or e.code == 2011:
                 # The order was never there to begin with. So cancelling it is a no-op but semantically successful.
                 self.logger().debug(f"The order {order_id} does not exist on Binance. No cancellation needed.")
@@ -1102,7 +1131,7 @@ cdef class BinanceMarket(MarketBase):
             async with timeout(timeout_seconds):
                 cancellation_results = await safe_gather(*tasks, return_exceptions=True)
                 for cr in cancellation_results:
-                    if isinstance(cr, BinanceAPIException):
+                    if isinstance(cr, BinanceAPIError):
                         continue
                     if isinstance(cr, dict) and "origClientOrderId" in cr:
                         client_order_id = cr.get("origClientOrderId")
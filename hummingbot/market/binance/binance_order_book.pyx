@@ -13,6 +13,7 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book_message import (
+    CompactOrderBookMessage,
     OrderBookMessage,
     OrderBookMessageType
 )
@@ -35,7 +36,7 @@ cdef class BinanceOrderBook(OrderBook):
                                        metadata: Optional[Dict] = None) -> OrderBookMessage:
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        return CompactOrderBookMessage(OrderBookMessageType.SNAPSHOT, {
             "symbol": msg["symbol"],
             "update_id": msg["lastUpdateId"],
             "bids": msg["bids"],
@@ -49,8 +50,9 @@ cdef class BinanceOrderBook(OrderBook):
                                    metadata: Optional[Dict] = None) -> OrderBookMessage:
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.DIFF, {
+        return CompactOrderBookMessage(OrderBookMessageType.DIFF, {
             "symbol": msg["s"],
+            "first_update_id": msg.get("U", -1),
             "update_id": msg["u"],
             "bids": msg["b"],
             "asks": msg["a"]
@@ -61,7 +63,7 @@ cdef class BinanceOrderBook(OrderBook):
         msg = record["json"] if type(record["json"])==dict else ujson.loads(record["json"])
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        return CompactOrderBookMessage(OrderBookMessageType.SNAPSHOT, {
             "symbol": msg["symbol"],
             "update_id": msg["lastUpdateId"],
             "bids": msg["bids"],
@@ -73,8 +75,9 @@ cdef class BinanceOrderBook(OrderBook):
         msg = ujson.loads(record["json"]) # Binance json in DB is TEXT
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.DIFF, {
+        return CompactOrderBookMessage(OrderBookMessageType.DIFF, {
             "symbol": msg["s"],
+            "first_update_id": msg.get("U", -1),
             "update_id": msg["u"],
             "bids": msg["b"],
             "asks": msg["a"]
@@ -85,7 +88,7 @@ cdef class BinanceOrderBook(OrderBook):
         msg = ujson.loads(record.value.decode("utf-8"))
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        return CompactOrderBookMessage(OrderBookMessageType.SNAPSHOT, {
             "symbol": msg["symbol"],
             "update_id": msg["lastUpdateId"],
             "bids": msg["bids"],
@@ -97,8 +100,9 @@ cdef class BinanceOrderBook(OrderBook):
         msg = ujson.loads(record.value.decode("utf-8"))
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.DIFF, {
+        return CompactOrderBookMessage(OrderBookMessageType.DIFF, {
             "symbol": msg["s"],
+            "first_update_id": msg.get("U", -1),
             "update_id": msg["u"],
             "bids": msg["b"],
             "asks": msg["a"],
@@ -137,6 +141,9 @@ cdef class BinanceOrderBook(OrderBook):
     @classmethod
     def from_snapshot(cls, msg: OrderBookMessage) -> "OrderBook":
         retval = BinanceOrderBook()
-        retval.apply_snapshot(msg.bids, msg.asks, msg.update_id)
+        if isinstance(msg, CompactOrderBookMessage):
+            retval.apply_numpy_snapshot(msg.bids_array, msg.asks_array, msg.update_id)
+        else:
+            retval.apply_snapshot(msg.bids, msg.asks, msg.update_id)
         return retval
 
@@ -1,10 +1,12 @@
 #!/usr/bin/env python
 
+import aiohttp
 import asyncio
 from collections import deque, defaultdict
 import logging
 import time
 from typing import (
+    Any,
     Deque,
     Dict,
     List,
@@ -18,12 +20,24 @@ from hummingbot.core.data_type.order_book_tracker import (
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.remote_api_order_book_data_source import RemoteAPIOrderBookDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.market.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
+from hummingbot.market.binance.binance_order_book import BinanceOrderBook
+from hummingbot.market.binance.binance_rate_limiter import PRIORITY_ORDER_BOOK
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
 
 
 class BinanceOrderBookTracker(OrderBookTracker):
+    # Gaps in the diff stream are caught and fixed with a snapshot of the affected pair only, so the periodic snapshots
+    # of every pair are only a backstop.
+    SNAPSHOT_REFRESH_INTERVAL = 6 * 3600.0
+    RESYNC_BUFFER_SIZE = 1000
+    RESYNC_RETRY_DELAY = 1.0
+
     _bobt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -45,13 +59,24 @@ class BinanceOrderBookTracker(OrderBookTracker):
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
         self._symbols: Optional[List[str]] = symbols
 
+        # Diff sequence tracking. An order book is stale while it has a resync buffer.
+        self._last_update_ids: Dict[str, int] = {}
+        self._resync_buffers: Dict[str, Deque[OrderBookMessage]] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._sequence_gap_counts: Dict[str, int] = defaultdict(int)
+        self._resync_request_counts: Dict[str, int] = defaultdict(int)
+        self._resync_counts: Dict[str, int] = defaultdict(int)
+
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
         if not self._data_source:
             if self._data_source_type is OrderBookTrackerDataSourceType.REMOTE_API:
                 self._data_source = RemoteAPIOrderBookDataSource()
             elif self._data_source_type is OrderBookTrackerDataSourceType.EXCHANGE_API:
-                self._data_source = BinanceAPIOrderBookDataSource(symbols=self._symbols)
+                self._data_source = BinanceAPIOrderBookDataSource(
+                    symbols=self._symbols,
+                    snapshot_refresh_interval=self.SNAPSHOT_REFRESH_INTERVAL
+                )
             else:
                 raise ValueError(f"data_source_type {self._data_source_type} is not supported.")
         return self._data_source
@@ -60,6 +85,32 @@ class BinanceOrderBookTracker(OrderBookTracker):
     def exchange_name(self) -> str:
         return "binance"
 
+    @property
+    def sequence_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per trading pair diff sequence statistics: the number of gaps detected in the diff stream, the number of
+        snapshots requested and applied to resync the order book, and whether the order book is currently stale.
+        """
+        return {
+            symbol: {
+                "gaps": self._sequence_gap_counts[symbol],
+                "resync_requests": self._resync_request_counts[symbol],
+                "resyncs": self._resync_counts[symbol],
+                "stale": symbol in self._resync_buffers,
+                "buffered_diffs": len(self._resync_buffers.get(symbol, ())),
+            }
+            for symbol in self._order_books.keys()
+        }
+
+    def is_stale(self, symbol: str) -> bool:
+        return symbol in self._resync_buffers
+
+    def stop(self):
+        for resync_task in self._resync_tasks.values():
+            resync_task.cancel()
+        self._resync_tasks.clear()
+        super().stop()
+
     async def start(self):
         await super().start()
         self._order_book_trade_listener_task = safe_ensure_future(
@@ -93,6 +144,7 @@ class BinanceOrderBookTracker(OrderBookTracker):
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
+                self._record_message(ob_message)
                 symbol: str = ob_message.symbol
 
                 if symbol not in self._tracking_message_queues:
@@ -132,9 +184,139 @@ class BinanceOrderBookTracker(OrderBookTracker):
                 )
                 await asyncio.sleep(5.0)
 
+    async def _fetch_resync_snapshot(self, symbol: str, delay: float = 0.0):
+        """
+        Fetches a snapshot for a stale order book, ahead of the periodic snapshots, and sends it to the order book's
+        tracking queue.
+        """
+        if delay > 0:
+            await asyncio.sleep(delay)
+        while True:
+            try:
+                client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+                snapshot: Dict[str, Any] = await BinanceAPIOrderBookDataSource.get_snapshot(
+                    client, symbol, 1000, priority=PRIORITY_ORDER_BOOK
+                )
+                snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
+                    snapshot,
+                    time.time(),
+                    metadata={"symbol": symbol}
+                )
+                self._record_message(snapshot_msg)
+                message_queue: Optional[asyncio.Queue] = self._tracking_message_queues.get(symbol)
+                if message_queue is not None:
+                    message_queue.put_nowait(snapshot_msg)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error fetching order book snapshot for {symbol}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error fetching order book snapshot for {symbol}. "
+                                    f"Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+
+    def _request_resync(self, symbol: str, delay: float = 0.0):
+        resync_task: Optional[asyncio.Task] = self._resync_tasks.get(symbol)
+        if resync_task is not None and not resync_task.done():
+            return
+        self._resync_request_counts[symbol] += 1
+        self._resync_tasks[symbol] = safe_ensure_future(self._fetch_resync_snapshot(symbol, delay))
+
+    def _resync_from_snapshot(self,
+                              symbol: str,
+                              order_book: OrderBook,
+                              snapshot: OrderBookMessage,
+                              past_diffs_window: Deque[OrderBookMessage]) -> int:
+        """
+        Restores a stale order book from a snapshot and the diffs buffered since the gap. If the buffered diffs don't
+        follow on from the snapshot, the order book stays stale and a newer snapshot is requested.
+
+        :return: the number of buffered diffs replayed
+        """
+        resync_buffer: Deque[OrderBookMessage] = self._resync_buffers[symbol]
+        while len(resync_buffer) > 0 and resync_buffer[0].update_id <= snapshot.update_id:
+            resync_buffer.popleft()
+
+        last_update_id: int = snapshot.update_id
+        for diff_message in resync_buffer:
+            if diff_message.first_update_id > last_update_id + 1:
+                self.logger().debug("Snapshot for %s at update ID %d can't be joined to the buffered diffs. "
+                                    "Requesting a newer snapshot.", symbol, snapshot.update_id)
+                self._request_resync(symbol, delay=self.RESYNC_RETRY_DELAY)
+                return 0
+            last_update_id = diff_message.update_id
+
+        replay_diffs: List[OrderBookMessage] = list(resync_buffer)
+        order_book.restore_from_snapshot_and_diffs(snapshot, replay_diffs)
+        past_diffs_window.clear()
+        past_diffs_window.extend(replay_diffs[-self.PAST_DIFF_WINDOW_SIZE:])
+        del self._resync_buffers[symbol]
+        self._last_update_ids[symbol] = last_update_id
+        self._resync_counts[symbol] += 1
+        self.logger().info(f"Resynced order book for {symbol} at update ID {last_update_id}, "
+                           f"replaying {len(replay_diffs)} buffered diffs.")
+        return len(replay_diffs)
+
+    def _apply_message_batch(self,
+                             symbol: str,
+                             order_book: OrderBook,
+                             messages: List[OrderBookMessage],
+                             past_diffs_window: Deque[OrderBookMessage]) -> int:
+        """
+        Checks that the diffs for an order book follow on from each other before applying them. A Binance diff covers
+        the update IDs from its first_update_id to its update_id, so it must start no later than one past the last
+        applied update ID.
+
+        On a gap, the order book is marked stale and a snapshot is requested for it. Diffs are buffered until the
+        snapshot arrives, and then replayed on top of it.
+        """
+        contiguous_messages: List[OrderBookMessage] = []
+        diff_messages_applied: int = 0
+        last_update_id: int = self._last_update_ids.get(symbol, order_book.snapshot_uid)
+
+        for message in messages:
+            if symbol in self._resync_buffers:
+                if message.type is OrderBookMessageType.DIFF:
+                    self._resync_buffers[symbol].append(message)
+                elif message.type is OrderBookMessageType.SNAPSHOT:
+                    diff_messages_applied += self._resync_from_snapshot(symbol, order_book, message,
+                                                                        past_diffs_window)
+                    last_update_id = self._last_update_ids[symbol]
+                continue
+
+            if message.type is OrderBookMessageType.DIFF:
+                if message.update_id <= last_update_id:
+                    continue
+                if message.first_update_id > last_update_id + 1:
+                    diff_messages_applied += super()._apply_message_batch(symbol, order_book, contiguous_messages,
+                                                                          past_diffs_window)
+                    contiguous_messages = []
+                    self._last_update_ids[symbol] = last_update_id
+                    self._sequence_gap_counts[symbol] += 1
+                    self.logger().info(f"Gap in order book diffs for {symbol} - expected update ID "
+                                       f"{last_update_id + 1}, got {message.first_update_id}. Resyncing order book.")
+                    self._resync_buffers[symbol] = deque([message], maxlen=self.RESYNC_BUFFER_SIZE)
+                    self._request_resync(symbol)
+                    continue
+                last_update_id = message.update_id
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                last_update_id = max(last_update_id, message.update_id)
+            contiguous_messages.append(message)
+
+        diff_messages_applied += super()._apply_message_batch(symbol, order_book, contiguous_messages,
+                                                              past_diffs_window)
+        if symbol not in self._resync_buffers:
+            self._last_update_ids[symbol] = last_update_id
+        return diff_messages_applied
+
     async def _track_single_book(self, symbol: str):
         past_diffs_window: Deque[OrderBookMessage] = deque()
         self._past_diffs_windows[symbol] = past_diffs_window
+        self._last_update_ids.pop(symbol, None)
+        self._resync_buffers.pop(symbol, None)
 
         message_queue: asyncio.Queue = self._tracking_message_queues[symbol]
         order_book: OrderBook = self._order_books[symbol]
@@ -143,33 +325,19 @@ class BinanceOrderBookTracker(OrderBookTracker):
 
         while True:
             try:
-                message: OrderBookMessage = None
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[symbol]
 
                 # Process saved messages first if there are any
-                if len(saved_messages) > 0:
-                    message = saved_messages.popleft()
-                else:
-                    message = await message_queue.get()
+                messages: List[OrderBookMessage] = await self._next_message_batch(message_queue, saved_messages)
+                diff_messages_accepted += self._apply_message_batch(symbol, order_book, messages, past_diffs_window)
 
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug("Processed %d order book diffs for %s.",
-                                            diff_messages_accepted, symbol)
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
-                    self.logger().debug("Processed order book snapshot for %s.", symbol)
+                # Output some statistics periodically.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                    self.logger().debug("Processed %d order book diffs for %s.",
+                                        diff_messages_accepted, symbol)
+                    diff_messages_accepted = 0
+                last_message_timestamp = now
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.logger import HummingbotLogger
+
+# Lower values are served first. Requests of the same priority are served in the order they were made.
+PRIORITY_TRADING = 0
+PRIORITY_ORDER_BOOK = 1
+PRIORITY_BACKGROUND = 2
+
+
+class BinanceRateLimiter:
+    """
+    Weight based token bucket, shared by everything in the process that calls Binance's REST API.
+
+    Binance limits the total request weight per IP to 1200 per minute. Tokens are refilled continuously at
+    `refill_rate` weight per second, up to `capacity`. The defaults are chosen so that a full burst plus one minute
+    of refills stays within the 1200 limit, leaving the exchange no reason to ban the IP.
+    """
+    WEIGHT_LIMIT_PER_MINUTE = 1200
+    DEFAULT_CAPACITY = 300.0
+    DEFAULT_REFILL_RATE = 15.0
+
+    _brl_logger: Optional[HummingbotLogger] = None
+    _brl_shared_instance: Optional["BinanceRateLimiter"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._brl_logger is None:
+            cls._brl_logger = logging.getLogger(__name__)
+        return cls._brl_logger
+
+    @classmethod
+    def get_instance(cls) -> "BinanceRateLimiter":
+        if cls._brl_shared_instance is None:
+            cls._brl_shared_instance = BinanceRateLimiter()
+        return cls._brl_shared_instance
+
+    def __init__(self, capacity: float = DEFAULT_CAPACITY, refill_rate: float = DEFAULT_REFILL_RATE):
+        self._capacity: float = capacity
+        self._refill_rate: float = refill_rate
+        self._tokens: float = capacity
+        self._last_refill_time: float = time.monotonic()
+        self._waiters: List[Tuple[int, int, float, asyncio.Future]] = []
+        self._sequence: Iterator[int] = itertools.count()
+        self._dispatch_timer: Optional[asyncio.TimerHandle] = None
+
+        self._requests_granted: int = 0
+        self._weight_granted: float = 0
+        self._requests_delayed: int = 0
+        self._total_wait_time: float = 0
+
+    @property
+    def capacity(self) -> float:
+        return self._capacity
+
+    @property
+    def refill_rate(self) -> float:
+        return self._refill_rate
+
+    @property
+    def available_weight(self) -> float:
+        self._refill()
+        return self._tokens
+
+    @property
+    def pending_requests(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter[3].done())
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests_granted": self._requests_granted,
+            "weight_granted": self._weight_granted,
+            "requests_delayed": self._requests_delayed,
+            "average_wait_time": (self._total_wait_time / self._requests_delayed
+                                  if self._requests_delayed > 0 else 0.0),
+            "pending_requests": self.pending_requests,
+            "available_weight": self.available_weight,
+        }
+
+    def _refill(self):
+        now: float = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill_time) * self._refill_rate)
+        self._last_refill_time = now
+
+    def _grant(self, weight: float):
+        self._tokens -= weight
+        self._requests_granted += 1
+        self._weight_granted += weight
+
+    def _on_dispatch_timer(self):
+        self._dispatch_timer = None
+        self._dispatch()
+
+    def _dispatch(self):
+        """
+        Grants weight to waiting requests in priority order, for as long as there are enough tokens. If the request at
+        the head of the queue cannot be served yet, a timer is set for when enough tokens will have been refilled.
+        Requests are never served out of order, so a heavy request cannot be starved by lighter ones.
+        """
+        self._refill()
+        while len(self._waiters) > 0:
+            _, _, weight, future = self._waiters[0]
+            if future.done():
+                # The waiting request has been cancelled.
+                heapq.heappop(self._waiters)
+                continue
+            # A request heavier than the whole bucket is let through once the bucket is full.
+            required_weight: float = min(weight, self._capacity)
+            if self._tokens < required_weight:
+                if self._dispatch_timer is None:
+                    delay: float = (required_weight - self._tokens) / self._refill_rate
+                    self._dispatch_timer = asyncio.get_event_loop().call_later(delay, self._on_dispatch_timer)
+                return
+            heapq.heappop(self._waiters)
+            self._grant(weight)
+            future.set_result(None)
+
+    async def acquire(self, weight: float = 1, priority: int = PRIORITY_TRADING):
+        """
+        Waits until `weight` can be spent without exceeding the rate limit, and spends it.
+        """
+        self._refill()
+        if len(self._waiters) == 0 and self._tokens >= min(weight, self._capacity):
+            self._grant(weight)
+            return
+
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), weight, future))
+        self._requests_delayed += 1
+        start_time: float = time.monotonic()
+        self._dispatch()
+        try:
+            await future
+        finally:
+            self._total_wait_time += time.monotonic() - start_time
+            if future.cancelled():
+                self._dispatch()
+
+    def observe_used_weight(self, used_weight: float):
+        """
+        Synchronizes the bucket with the used weight reported by Binance (the X-MBX-USED-WEIGHT header), which also
+        counts requests made by other processes on the same IP.
+
+        The bucket is usually smaller than the exchange's limit, so the weight left under the limit is scaled to the
+        bucket's capacity - e.g. with half of the limit used, at most half of the bucket is available.
+        """
+        self._refill()
+        self._tokens = min(self._tokens,
+                           self._capacity * (self.WEIGHT_LIMIT_PER_MINUTE - used_weight) / self.WEIGHT_LIMIT_PER_MINUTE)
@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+
+import aiohttp
+import hashlib
+import hmac
+import logging
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlencode
+from yarl import URL
+
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
+from hummingbot.logger import HummingbotLogger
+from hummingbot.market.binance.binance_rate_limiter import (
+    BinanceRateLimiter,
+    PRIORITY_TRADING,
+)
+from hummingbot.market.binance.binance_time import BinanceTime
+
+BINANCE_API_URL = "https://api.binance.com"
+
+# Upper bounds of the request latency histogram buckets, in seconds. The last bucket counts anything slower.
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# Endpoints that place or cancel orders. Their latencies are the order round trip times.
+ORDER_ENDPOINTS = ("POST /api/v3/order", "DELETE /api/v3/order")
+
+
+class BinanceAPIError(Exception):
+    """
+    An error response from the Binance REST API. `code` and `message` are Binance's error code and message, as with
+    python-binance's BinanceAPIException.
+    """
+    def __init__(self, status: int, code: int, message: str):
+        super().__init__(f"APIError(code={code}): {message}")
+        self.status: int = status
+        self.code: int = code
+        self.message: str = message
+
+
+class BinanceRequestLatencyStats:
+    """
+    How long the requests to one endpoint took, from sending the request to having read the response.
+    """
+    def __init__(self):
+        self._request_count: int = 0
+        self._error_count: int = 0
+        self._total_latency: float = 0.0
+        self._max_latency: float = 0.0
+        self._histogram: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    @property
+    def request_count(self) -> int:
+        return self._request_count
+
+    @property
+    def error_count(self) -> int:
+        return self._error_count
+
+    @property
+    def mean_latency(self) -> float:
+        return self._total_latency / self._request_count if self._request_count > 0 else 0.0
+
+    @property
+    def max_latency(self) -> float:
+        return self._max_latency
+
+    @property
+    def histogram(self) -> List[int]:
+        """
+        Number of requests in each LATENCY_BUCKETS bucket, plus the requests slower than the last bucket.
+        """
+        return self._histogram.copy()
+
+    def record_request(self, latency: float, failed: bool):
+        bucket: int = 0
+        self._request_count += 1
+        self._error_count += 1 if failed else 0
+        self._total_latency += latency
+        self._max_latency = max(self._max_latency, latency)
+        while bucket < len(LATENCY_BUCKETS) and latency > LATENCY_BUCKETS[bucket]:
+            bucket += 1
+        self._histogram[bucket] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "request_count": self._request_count,
+            "error_count": self._error_count,
+            "mean_latency": self.mean_latency,
+            "max_latency": self._max_latency,
+            "histogram": self.histogram,
+        }
+
+
+class BinanceRESTClient:
+    """
+    Asynchronous client for the parts of the Binance REST API used by BinanceMarket.
+
+    Requests go over the process-wide keep-alive connection pool of HttpClientRegistry, instead of through
+    python-binance's synchronous client in executor threads. Signed requests are timestamped with the server-adjusted
+    BinanceTime, and signed with an HMAC that is keyed once, up front.
+
+    The request weight of every call is taken from the shared BinanceRateLimiter before the request is sent, and the
+    limiter is synchronized with the used weight reported in the response headers.
+
+    The methods are named after, and take the same arguments as, their python-binance counterparts.
+    """
+    API_VERSION = "v1"
+    PRIVATE_API_VERSION = "v3"
+    WITHDRAW_API_VERSION = "v3"
+    RECV_WINDOW = 5000
+
+    _brc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._brc_logger is None:
+            cls._brc_logger = logging.getLogger(__name__)
+        return cls._brc_logger
+
+    def __init__(self,
+                 api_key: str,
+                 api_secret: str,
+                 api_url: str = BINANCE_API_URL,
+                 rate_limiter: Optional[BinanceRateLimiter] = None,
+                 priority: int = PRIORITY_TRADING):
+        self._api_key: str = api_key
+        self._api_url: str = api_url
+        self._rate_limiter: BinanceRateLimiter = rate_limiter or BinanceRateLimiter.get_instance()
+        self._priority: int = priority
+        # Keyed once. Every signature is computed on a copy, which skips hashing the key again.
+        self._hmac = hmac.new((api_secret or "").encode("utf8"), digestmod=hashlib.sha256)
+        self._latency_stats: Dict[str, BinanceRequestLatencyStats] = {}
+        self._last_used_weight: Optional[float] = None
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
+    @property
+    def latency_stats(self) -> Dict[str, BinanceRequestLatencyStats]:
+        """
+        Latency stats by endpoint, e.g. "POST /api/v3/order".
+        """
+        return self._latency_stats
+
+    @property
+    def order_latency_stats(self) -> Dict[str, BinanceRequestLatencyStats]:
+        return {endpoint: self._latency_stats[endpoint]
+                for endpoint in ORDER_ENDPOINTS if endpoint in self._latency_stats}
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "last_used_weight": self._last_used_weight,
+            "endpoints": {endpoint: stats.to_dict() for endpoint, stats in self._latency_stats.items()},
+        }
+
+    def sign(self, query_string: str) -> str:
+        signature = self._hmac.copy()
+        signature.update(query_string.encode("utf8"))
+        return signature.hexdigest()
+
+    def _record_request(self, endpoint: str, latency: float, failed: bool):
+        if endpoint not in self._latency_stats:
+            self._latency_stats[endpoint] = BinanceRequestLatencyStats()
+        self._latency_stats[endpoint].record_request(latency, failed)
+
+    async def _request(self,
+                       method: str,
+                       path: str,
+                       params: Optional[Dict[str, Any]] = None,
+                       signed: bool = False,
+                       api_key_required: bool = False,
+                       weight: int = 1) -> Any:
+        params_list: List[Tuple[str, Any]] = [(key, value) for key, value in (params or {}).items()
+                                              if value is not None]
+        if signed:
+            params_list.append(("timestamp", int(BinanceTime.get_instance().time() * 1e3)))
+            params_list.append(("recvWindow", self.RECV_WINDOW))
+        query_string: str = urlencode(params_list)
+        if signed:
+            query_string = f"{query_string}&signature={self.sign(query_string)}"
+        url: URL = URL(f"{self._api_url}{path}?{query_string}" if query_string else f"{self._api_url}{path}",
+                       encoded=True)
+        headers: Dict[str, str] = {"X-MBX-APIKEY": self._api_key} if signed or api_key_required else {}
+
+        await self._rate_limiter.acquire(weight, priority=self._priority)
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        endpoint: str = f"{method} {path}"
+        start_time: float = time.perf_counter()
+        failed: bool = True
+        try:
+            async with client.request(method, url, headers=headers) as response:
+                response: aiohttp.ClientResponse = response
+                if "X-MBX-USED-WEIGHT" in response.headers:
+                    self._last_used_weight = float(response.headers["X-MBX-USED-WEIGHT"])
+                    self._rate_limiter.observe_used_weight(self._last_used_weight)
+                try:
+                    data: Any = await response.json(content_type=None)
+                except ValueError:
+                    raise BinanceAPIError(response.status, 0, f"Invalid response: {await response.text()}")
+                if response.status != 200 or (isinstance(data, dict) and "code" in data and "msg" in data):
+                    if isinstance(data, dict):
+                        raise BinanceAPIError(response.status, data.get("code", 0), data.get("msg", str(data)))
+                    raise BinanceAPIError(response.status, 0, str(data))
+                failed = False
+                return data
+        finally:
+            self._record_request(endpoint, time.perf_counter() - start_time, failed)
+
+    async def _request_withdraw_api(self, method: str, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        data: Dict[str, Any] = await self._request(method, f"/wapi/{self.WITHDRAW_API_VERSION}/{path}",
+                                                   params, signed=True)
+        if data.get("success") is not True:
+            raise BinanceAPIError(200, 0, data.get("msg") or str(data))
+        return data
+
+    async def ping(self) -> Dict[str, Any]:
+        return await self._request("GET", f"/api/{self.API_VERSION}/ping")
+
+    async def get_server_time(self) -> Dict[str, Any]:
+        return await self._request("GET", f"/api/{self.API_VERSION}/time")
+
+    async def get_exchange_info(self) -> Dict[str, Any]:
+        return await self._request("GET", f"/api/{self.API_VERSION}/exchangeInfo")
+
+    async def get_account(self) -> Dict[str, Any]:
+        return await self._request("GET", f"/api/{self.PRIVATE_API_VERSION}/account", signed=True, weight=5)
+
+    async def get_my_trades(self, **params) -> List[Dict[str, Any]]:
+        return await self._request("GET", f"/api/{self.PRIVATE_API_VERSION}/myTrades", params, signed=True,
+                                   weight=5)
+
+    async def get_order(self, **params) -> Dict[str, Any]:
+        return await self._request("GET", f"/api/{self.PRIVATE_API_VERSION}/order", params, signed=True)
+
+    async def create_order(self, **params) -> Dict[str, Any]:
+        return await self._request("POST", f"/api/{self.PRIVATE_API_VERSION}/order", params, signed=True)
+
+    async def order_limit_buy(self, **params) -> Dict[str, Any]:
+        return await self.create_order(side="BUY", type="LIMIT", timeInForce="GTC", **params)
+
+    async def order_limit_sell(self, **params) -> Dict[str, Any]:
+        return await self.create_order(side="SELL", type="LIMIT", timeInForce="GTC", **params)
+
+    async def order_market_buy(self, **params) -> Dict[str, Any]:
+        return await self.create_order(side="BUY", type="MARKET", **params)
+
+    async def order_market_sell(self, **params) -> Dict[str, Any]:
+        return await self.create_order(side="SELL", type="MARKET", **params)
+
+    async def cancel_order(self, **params) -> Dict[str, Any]:
+        return await self._request("DELETE", f"/api/{self.PRIVATE_API_VERSION}/order", params, signed=True)
+
+    async def get_trade_fee(self, **params) -> Dict[str, Any]:
+        return await self._request_withdraw_api("GET", "tradeFee.html", params)
+
+    async def get_deposit_address(self, **params) -> Dict[str, Any]:
+        return await self._request("GET", f"/wapi/{self.WITHDRAW_API_VERSION}/depositAddress.html", params,
+                                   signed=True)
+
+    async def withdraw(self, **params) -> Dict[str, Any]:
+        # The withdrawal name defaults to the asset, as with python-binance.
+        if "asset" in params and "name" not in params:
+            params["name"] = params["asset"]
+        return await self._request_withdraw_api("POST", "withdraw.html", params)
+
+    async def stream_get_listen_key(self) -> str:
+        data: Dict[str, Any] = await self._request("POST", f"/api/{self.API_VERSION}/userDataStream",
+                                                   api_key_required=True)
+        return data["listenKey"]
+
+    async def stream_keepalive(self, listen_key: str) -> Dict[str, Any]:
+        return await self._request("PUT", f"/api/{self.API_VERSION}/userDataStream", {"listenKey": listen_key},
+                                   api_key_required=True)
@@ -16,7 +16,7 @@ from hummingbot.core.utils.async_utils import (
     safe_gather,
 )
 from hummingbot.market.binance.binance_api_user_stream_data_source import BinanceAPIUserStreamDataSource
-from binance.client import Client as BinanceClient
+from hummingbot.market.binance.binance_rest_client import BinanceRESTClient
 
 
 class BinanceUserStreamTracker(UserStreamTracker):
@@ -30,9 +30,9 @@ class BinanceUserStreamTracker(UserStreamTracker):
 
     def __init__(self,
                  data_source_type: UserStreamTrackerDataSourceType = UserStreamTrackerDataSourceType.EXCHANGE_API,
-                 binance_client: Optional[BinanceClient] = None):
+                 binance_client: Optional[BinanceRESTClient] = None):
         super().__init__(data_source_type=data_source_type)
-        self._binance_client: BinanceClient = binance_client
+        self._binance_client: BinanceRESTClient = binance_client
         self._ev_loop: asyncio.events.AbstractEventLoop = asyncio.get_event_loop()
         self._data_source: Optional[UserStreamTrackerDataSource] = None
         self._user_stream_tracking_task: Optional[asyncio.Task] = None
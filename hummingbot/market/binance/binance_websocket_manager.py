@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import random
+import time
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+import ujson
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+COMBINED_STREAM_URL = "wss://stream.binance.com:9443/stream"
+
+
+class BinanceWebSocketShard:
+    """
+    One combined stream connection, carrying the streams of a subset of the trading pairs.
+    """
+    RATE_WINDOW = 10.0
+
+    def __init__(self, shard_id: int, streams: List[str]):
+        self.shard_id: int = shard_id
+        self.streams: List[str] = streams
+        self.task: Optional[asyncio.Task] = None
+        self.connected: bool = False
+        self.connect_count: int = 0
+        self.failure_count: int = 0
+        self.message_count: int = 0
+        self.last_message_timestamp: float = 0.0
+        self.last_lag: float = 0.0
+        self.max_lag: float = 0.0
+
+        self._window_start: float = time.time()
+        self._window_message_count: int = 0
+        self._window_lag_sum: float = 0.0
+        self._messages_per_second: float = 0.0
+        self._average_lag: float = 0.0
+
+    def record_message(self, now: float, event_timestamp: Optional[float]):
+        self.message_count += 1
+        self.last_message_timestamp = now
+        self._window_message_count += 1
+        if event_timestamp is not None:
+            self.last_lag = now - event_timestamp
+            self.max_lag = max(self.max_lag, self.last_lag)
+            self._window_lag_sum += self.last_lag
+
+        if now - self._window_start >= self.RATE_WINDOW:
+            self._messages_per_second = self._window_message_count / (now - self._window_start)
+            self._average_lag = self._window_lag_sum / self._window_message_count
+            self._window_start = now
+            self._window_message_count = 0
+            self._window_lag_sum = 0.0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        # The message rate of the last full window, or 0 if the shard has gone quiet since.
+        quiet: bool = time.time() - self._window_start >= 2 * self.RATE_WINDOW
+        return {
+            "shard_id": self.shard_id,
+            "streams": len(self.streams),
+            "connected": self.connected,
+            "reconnects": max(0, self.connect_count - 1),
+            "message_count": self.message_count,
+            "messages_per_second": 0.0 if quiet else self._messages_per_second,
+            "last_lag": self.last_lag,
+            "average_lag": self._average_lag,
+            "max_lag": self.max_lag,
+            "last_message_timestamp": self.last_message_timestamp,
+        }
+
+
+class BinanceWebSocketManager:
+    """
+    Multiplexes Binance market data channels (e.g. depth and trade) over combined stream connections.
+
+    The streams of all trading pairs are split into shards of at most `max_streams_per_connection` streams, with every
+    channel of a trading pair on the same shard. Each shard has its own connection, which is reconnected on its own,
+    with a short jittered backoff, when it drops - so one dropped connection doesn't interrupt the other trading pairs.
+    """
+    MESSAGE_TIMEOUT = 30.0
+    PING_TIMEOUT = 10.0
+    MIN_RECONNECT_DELAY = 0.5
+    MAX_RECONNECT_DELAY = 30.0
+
+    _bwsm_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._bwsm_logger is None:
+            cls._bwsm_logger = logging.getLogger(__name__)
+        return cls._bwsm_logger
+
+    def __init__(self,
+                 channels: List[str],
+                 max_streams_per_connection: int = 100,
+                 stream_url: str = COMBINED_STREAM_URL):
+        self._channels: List[str] = channels
+        self._max_streams_per_connection: int = max_streams_per_connection
+        self._stream_url: str = stream_url
+        self._listeners: Dict[str, Callable[[Dict[str, Any]], None]] = {}
+        self._shards: List[BinanceWebSocketShard] = []
+        self._stopped: Optional[asyncio.Event] = None
+
+    @property
+    def started(self) -> bool:
+        return len(self._shards) > 0
+
+    @property
+    def shards(self) -> List[BinanceWebSocketShard]:
+        return self._shards
+
+    @property
+    def stats(self) -> List[Dict[str, Any]]:
+        return [shard.stats for shard in self._shards]
+
+    def shard_streams(self, trading_pairs: List[str]) -> List[List[str]]:
+        pairs_per_shard: int = max(1, self._max_streams_per_connection // len(self._channels))
+        return [
+            [f"{trading_pair.lower()}@{channel}"
+             for trading_pair in trading_pairs[i:i + pairs_per_shard]
+             for channel in self._channels]
+            for i in range(0, len(trading_pairs), pairs_per_shard)
+        ]
+
+    def start(self, trading_pairs: List[str]):
+        if self.started:
+            return
+        self._stopped = asyncio.Event()
+        for shard_id, streams in enumerate(self.shard_streams(trading_pairs)):
+            shard: BinanceWebSocketShard = BinanceWebSocketShard(shard_id, streams)
+            shard.task = safe_ensure_future(self._shard_loop(shard))
+            self._shards.append(shard)
+        self.logger().debug(f"Listening to {len(trading_pairs)} trading pairs over {len(self._shards)} connections.")
+
+    def stop(self):
+        for shard in self._shards:
+            if shard.task is not None:
+                shard.task.cancel()
+        self._shards = []
+        if self._stopped is not None:
+            self._stopped.set()
+            self._stopped = None
+
+    async def listen(self,
+                     channel: str,
+                     callback: Callable[[Dict[str, Any]], None],
+                     trading_pairs: List[str]):
+        """
+        Calls `callback` with the payload of every message on `channel`, until cancelled. The connections are opened by
+        the first listener, and closed once the last listener has been cancelled.
+        """
+        if channel not in self._channels:
+            raise ValueError(f"Channel {channel} is not one of the manager's channels {self._channels}.")
+        self._listeners[channel] = callback
+        try:
+            self.start(trading_pairs)
+            stopped: asyncio.Event = self._stopped
+            await stopped.wait()
+        finally:
+            if self._listeners.get(channel) is callback:
+                del self._listeners[channel]
+            if len(self._listeners) < 1:
+                self.stop()
+
+    def _dispatch(self, shard: BinanceWebSocketShard, raw_msg: str):
+        # A malformed message, or an error in a listener, must not tear down the connection of the whole shard.
+        try:
+            msg: Dict[str, Any] = ujson.loads(raw_msg)
+            data: Optional[Dict[str, Any]] = msg.get("data")
+            if data is None:
+                return
+            event_time: Optional[int] = data.get("E")
+            shard.record_message(time.time(), event_time * 1e-3 if event_time is not None else None)
+
+            channel: str = msg["stream"].split("@", 1)[-1]
+            callback: Optional[Callable[[Dict[str, Any]], None]] = self._listeners.get(channel)
+            if callback is not None:
+                callback(data)
+        except Exception:
+            self.logger().error(f"Unexpected error processing message of shard {shard.shard_id}: {raw_msg[:200]}",
+                                exc_info=True)
+
+    async def _inner_messages(self, ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
+        # Terminate the recv() loop as soon as the next message timed out, so the shard loop can reconnect.
+        try:
+            while True:
+                try:
+                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
+                    yield msg
+                except asyncio.TimeoutError:
+                    pong_waiter = await ws.ping()
+                    await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger().debug("WebSocket ping timed out. Going to reconnect...")
+            return
+        except ConnectionClosed:
+            return
+        finally:
+            await ws.close()
+
+    def _reconnect_delay(self, failure_count: int) -> float:
+        delay: float = min(self.MAX_RECONNECT_DELAY, self.MIN_RECONNECT_DELAY * 2 ** (failure_count - 1))
+        # Jitter keeps the shards that dropped together from reconnecting in lockstep.
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _shard_loop(self, shard: BinanceWebSocketShard):
+        stream_url: str = f"{self._stream_url}?streams={'/'.join(shard.streams)}"
+        while True:
+            message_count: int = shard.message_count
+            try:
+                async with websockets.connect(stream_url) as ws:
+                    shard.connected = True
+                    shard.connect_count += 1
+                    async for raw_msg in self._inner_messages(ws):
+                        self._dispatch(shard, raw_msg)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error with WebSocket connection of shard {shard.shard_id}.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error with Binance market data WebSocket connection. Reconnecting."
+                )
+            finally:
+                shard.connected = False
+
+            # A connection that delivered messages resets the backoff.
+            shard.failure_count = 1 if shard.message_count > message_count else shard.failure_count + 1
+            await asyncio.sleep(self._reconnect_delay(shard.failure_count))
@@ -19,6 +19,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry, BittrexOrderBookTrackerEntry
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.bittrex.bittrex_active_order_tracker import BittrexActiveOrderTracker
 from hummingbot.market.bittrex.bittrex_order_book import BittrexOrderBook
@@ -65,16 +66,18 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         summary_path_url = f"{BITTREX_REST_URL}{BITTREX_MARKET_SUMMARY_PATH}"
         ticker_path_url = f"{BITTREX_REST_URL}{BITTREX_TICKER_PATH}"
 
-        async with aiohttp.ClientSession() as client:
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
 
-            market_response, ticker_response, summary_response = await safe_gather(
-                client.get(market_path_url), client.get(ticker_path_url), client.get(summary_path_url)
-            )
+        market_response, ticker_response, summary_response = await safe_gather(
+            client.get(market_path_url), client.get(ticker_path_url), client.get(summary_path_url)
+        )
 
-            market_response: aiohttp.ClientResponse = market_response
-            ticker_response: aiohttp.ClientResponse = ticker_response
-            summary_response: aiohttp.ClientResponse = summary_response
+        market_response: aiohttp.ClientResponse = market_response
+        ticker_response: aiohttp.ClientResponse = ticker_response
+        summary_response: aiohttp.ClientResponse = summary_response
 
+        # Return the connections to the shared client's pool, also when the bodies aren't read.
+        try:
             if market_response.status != 200:
                 raise IOError(
                     f"Error fetching active Bittrex markets information. " f"HTTP status is {market_response.status}."
@@ -91,46 +94,49 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             market_data, ticker_data, summary_data = await safe_gather(
                 market_response.json(), ticker_response.json(), summary_response.json()
             )
-
-            ticker_data: Dict[str, Any] = {item["symbol"]: item for item in ticker_data}
-            summary_data: Dict[str, Any] = {item["symbol"]: item for item in summary_data}
-
-            market_data: List[Dict[str, Any]] = [
-                {**item, **ticker_data[item["symbol"]], **summary_data[item["symbol"]]}
-                for item in market_data
-                if item["symbol"] in ticker_data and item["symbol"] in summary_data
-            ]
-
-            all_markets: pd.DataFrame = pd.DataFrame.from_records(data=market_data, index="symbol")
-            all_markets.rename(
-                {"baseCurrencySymbol": "baseAsset", "quoteCurrencySymbol": "quoteAsset"}, axis="columns", inplace=True
+        finally:
+            market_response.release()
+            ticker_response.release()
+            summary_response.release()
+
+        ticker_data: Dict[str, Any] = {item["symbol"]: item for item in ticker_data}
+        summary_data: Dict[str, Any] = {item["symbol"]: item for item in summary_data}
+
+        market_data: List[Dict[str, Any]] = [
+            {**item, **ticker_data[item["symbol"]], **summary_data[item["symbol"]]}
+            for item in market_data
+            if item["symbol"] in ticker_data and item["symbol"] in summary_data
+        ]
+
+        all_markets: pd.DataFrame = pd.DataFrame.from_records(data=market_data, index="symbol")
+        all_markets.rename(
+            {"baseCurrencySymbol": "baseAsset", "quoteCurrencySymbol": "quoteAsset"}, axis="columns", inplace=True
+        )
+
+        btc_usd_price: float = float(all_markets.loc["BTC-USD"].lastTradeRate)
+        eth_usd_price: float = float(all_markets.loc["ETH-USD"].lastTradeRate)
+
+        usd_volume: List[float] = [
+            (
+                volume * quote_price if symbol.endswith(("USD", "USDT")) else
+                volume * quote_price * btc_usd_price if symbol.endswith("BTC") else
+                volume * quote_price * eth_usd_price if symbol.endswith("ETH") else
+                volume
             )
+            for symbol, volume, quote_price in zip(all_markets.index,
+                                                   all_markets.volume.astype("float"),
+                                                   all_markets.lastTradeRate.astype("float"))
+        ]
+        old_symbols: List[str] = [
+            (
+                f"{quoteAsset}-{baseAsset}"
+            )
+            for baseAsset, quoteAsset in zip(all_markets.baseAsset, all_markets.quoteAsset)
+        ]
 
-            btc_usd_price: float = float(all_markets.loc["BTC-USD"].lastTradeRate)
-            eth_usd_price: float = float(all_markets.loc["ETH-USD"].lastTradeRate)
-
-            usd_volume: List[float] = [
-                (
-                    volume * quote_price if symbol.endswith(("USD", "USDT")) else
-                    volume * quote_price * btc_usd_price if symbol.endswith("BTC") else
-                    volume * quote_price * eth_usd_price if symbol.endswith("ETH") else
-                    volume
-                )
-                for symbol, volume, quote_price in zip(all_markets.index,
-                                                       all_markets.volume.astype("float"),
-                                                       all_markets.lastTradeRate.astype("float"))
-            ]
-            old_symbols: List[str] = [
-                (
-                    f"{quoteAsset}-{baseAsset}"
-                )
-                for baseAsset, quoteAsset in zip(all_markets.baseAsset, all_markets.quoteAsset)
-            ]
-
-            all_markets.loc[:, "USDVolume"] = usd_volume
-            all_markets.loc[:, "old_symbol"] = old_symbols
-            await client.close()
-            return all_markets.sort_values("USDVolume", ascending=False)
+        all_markets.loc[:, "USDVolume"] = usd_volume
+        all_markets.loc[:, "old_symbol"] = old_symbols
+        return all_markets.sort_values("USDVolume", ascending=False)
 
     @property
     def order_book_class(self) -> BittrexOrderBook:
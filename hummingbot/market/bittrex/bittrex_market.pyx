@@ -25,6 +25,7 @@ from hummingbot.core.event.events import (
     MarketOrderFailureEvent, SellOrderCreatedEvent, BuyOrderCreatedEvent)
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.bittrex.bittrex_api_order_book_data_source import BittrexAPIOrderBookDataSource
 from hummingbot.market.bittrex.bittrex_auth import BittrexAuth
@@ -1014,7 +1015,7 @@ cdef class BittrexMarket(MarketBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            return HttpClientRegistry.get_instance().client()
         return self._shared_client
 
     async def _api_request(self,
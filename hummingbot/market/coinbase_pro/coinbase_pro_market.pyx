@@ -40,6 +40,7 @@ from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
 )
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.coinbase_pro.coinbase_pro_auth import CoinbaseProAuth
 from hummingbot.market.coinbase_pro.coinbase_pro_order_book_tracker import CoinbaseProOrderBookTracker
@@ -322,7 +323,7 @@ cdef class CoinbaseProMarket(MarketBase):
         :returns: Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            return HttpClientRegistry.get_instance().client()
         return self._shared_client
 
     async def _api_request(self,
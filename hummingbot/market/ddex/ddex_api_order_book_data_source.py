@@ -19,6 +19,7 @@ from websockets.exceptions import ConnectionClosed
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.market.ddex.ddex_active_order_tracker import DDEXActiveOrderTracker
 from hummingbot.market.ddex.ddex_order_book import DDEXOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -62,14 +63,15 @@ class DDEXAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Returned data frame should have symbol as index and include usd volume, baseAsset and quoteAsset
         """
-        async with aiohttp.ClientSession() as client:
-            market_response, ticker_response = await safe_gather(
-                client.get(MARKETS_URL),
-                client.get(TICKERS_URL)
-            )
-            market_response: aiohttp.ClientResponse = market_response
-            ticker_response: aiohttp.ClientResponse = ticker_response
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        market_response, ticker_response = await safe_gather(
+            client.get(MARKETS_URL),
+            client.get(TICKERS_URL)
+        )
+        market_response: aiohttp.ClientResponse = market_response
+        ticker_response: aiohttp.ClientResponse = ticker_response
 
+        try:
             if market_response.status != 200:
                 raise IOError(f"Error fetching active DDEX markets. HTTP status is {market_response.status}.")
             if ticker_response.status != 200:
@@ -77,32 +79,35 @@ class DDEXAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
             ticker_data = await ticker_response.json()
             market_data = await market_response.json()
+        finally:
+            market_response.release()
+            ticker_response.release()
 
-            attr_name_map = {"baseToken": "baseAsset", "quoteToken": "quoteAsset"}
+        attr_name_map = {"baseToken": "baseAsset", "quoteToken": "quoteAsset"}
 
-            market_data: Dict[str, any] = {
-                item["id"]: {attr_name_map[k]: item[k] for k in ["baseToken", "quoteToken"]}
-                for item in market_data["data"]["markets"]}
+        market_data: Dict[str, any] = {
+            item["id"]: {attr_name_map[k]: item[k] for k in ["baseToken", "quoteToken"]}
+            for item in market_data["data"]["markets"]}
 
-            ticker_data: List[Dict[str, any]] = [{**ticker_item, **market_data[ticker_item["marketId"]]}
-                                                 for ticker_item in ticker_data["data"]["tickers"]
-                                                 if ticker_item["marketId"] in market_data]
+        ticker_data: List[Dict[str, any]] = [{**ticker_item, **market_data[ticker_item["marketId"]]}
+                                             for ticker_item in ticker_data["data"]["tickers"]
+                                             if ticker_item["marketId"] in market_data]
 
-            all_markets: pd.DataFrame = pd.DataFrame.from_records(data=ticker_data,
-                                                                  index="marketId")
+        all_markets: pd.DataFrame = pd.DataFrame.from_records(data=ticker_data,
+                                                              index="marketId")
 
-            dai_to_eth_price: float = float(all_markets.loc["DAI-WETH"].price)
-            weth_to_usd_price: float = float(all_markets.loc["WETH-TUSD"].price)
-            usd_volume: float = [
-                (
-                    quoteVolume * dai_to_eth_price * weth_to_usd_price if symbol.endswith("DAI") else
-                    quoteVolume * weth_to_usd_price if symbol.endswith("WETH") else
-                    quoteVolume
-                )
-                for symbol, quoteVolume in zip(all_markets.index,
-                                               all_markets.volume.astype("float"))]
-            all_markets["USDVolume"] = usd_volume
-            return all_markets.sort_values("USDVolume", ascending=False)
+        dai_to_eth_price: float = float(all_markets.loc["DAI-WETH"].price)
+        weth_to_usd_price: float = float(all_markets.loc["WETH-TUSD"].price)
+        usd_volume: float = [
+            (
+                quoteVolume * dai_to_eth_price * weth_to_usd_price if symbol.endswith("DAI") else
+                quoteVolume * weth_to_usd_price if symbol.endswith("WETH") else
+                quoteVolume
+            )
+            for symbol, quoteVolume in zip(all_markets.index,
+                                           all_markets.volume.astype("float"))]
+        all_markets["USDVolume"] = usd_volume
+        return all_markets.sort_values("USDVolume", ascending=False)
 
     @property
     def order_book_class(self) -> DDEXOrderBook:
@@ -143,47 +148,47 @@ class DDEXAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, DDEXOrderBookTrackerEntry] = {}
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair, 3)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: DDEXOrderBookMessage = DDEXOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        {"marketId": trading_pair}
-                    )
-                    ddex_order_book: OrderBook = self.order_book_create_function()
-                    ddex_active_order_tracker: DDEXActiveOrderTracker = DDEXActiveOrderTracker()
-                    bids, asks = ddex_active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
-                    ddex_order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        retval: Dict[str, DDEXOrderBookTrackerEntry] = {}
+        number_of_pairs: int = len(trading_pairs)
+        for index, trading_pair in enumerate(trading_pairs):
+            try:
+                snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair, 3)
+                snapshot_timestamp: float = time.time()
+                snapshot_msg: DDEXOrderBookMessage = DDEXOrderBook.snapshot_message_from_exchange(
+                    snapshot,
+                    snapshot_timestamp,
+                    {"marketId": trading_pair}
+                )
+                ddex_order_book: OrderBook = self.order_book_create_function()
+                ddex_active_order_tracker: DDEXActiveOrderTracker = DDEXActiveOrderTracker()
+                bids, asks = ddex_active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
+                ddex_order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
 
-                    retval[trading_pair] = DDEXOrderBookTrackerEntry(
-                        trading_pair,
-                        snapshot_timestamp,
-                        ddex_order_book,
-                        ddex_active_order_tracker
-                    )
+                retval[trading_pair] = DDEXOrderBookTrackerEntry(
+                    trading_pair,
+                    snapshot_timestamp,
+                    ddex_order_book,
+                    ddex_active_order_tracker
+                )
 
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
-                    await asyncio.sleep(1.3)
-                except IOError:
-                    self.logger().network(
-                        f"Error getting snapshot for {trading_pair}.",
-                        exc_info=True,
-                        app_warning_msg=f"Error getting snapshot for {trading_pair}. Check network connection."
-                    )
-                    await asyncio.sleep(5.0)
-                except Exception:
-                    self.logger().error(f"Error initializing order book for {trading_pair}.", exc_info=True)
-                    await asyncio.sleep(5.0)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index+1}/{number_of_pairs} completed.")
+                await asyncio.sleep(1.3)
+            except IOError:
+                self.logger().network(
+                    f"Error getting snapshot for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Error getting snapshot for {trading_pair}. Check network connection."
+                )
+                await asyncio.sleep(5.0)
+            except Exception:
+                self.logger().error(f"Error initializing order book for {trading_pair}.", exc_info=True)
+                await asyncio.sleep(5.0)
 
-            self._get_tracking_pair_done_event.set()
-            return retval
+        self._get_tracking_pair_done_event.set()
+        return retval
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -249,35 +254,35 @@ class DDEXAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_timestamp: float = time.time()
-                            snapshot_msg: DDEXOrderBookMessage = DDEXOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                {"marketId": trading_pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair} at {snapshot_timestamp}")
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except IOError:
-                            self.logger().network(
-                                f"Error getting snapshot for {trading_pair}.",
-                                exc_info=True,
-                                app_warning_msg=f"Error getting snapshot for {trading_pair}. Check network connection."
-                            )
-                            await asyncio.sleep(5.0)
-                        except Exception:
-                            self.logger().error(f"Error processing snapshot for {trading_pair}.", exc_info=True)
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
+                client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+                for trading_pair in trading_pairs:
+                    try:
+                        snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
+                        snapshot_timestamp: float = time.time()
+                        snapshot_msg: DDEXOrderBookMessage = DDEXOrderBook.snapshot_message_from_exchange(
+                            snapshot,
+                            snapshot_timestamp,
+                            {"marketId": trading_pair}
+                        )
+                        output.put_nowait(snapshot_msg)
+                        self.logger().debug(f"Saved order book snapshot for {trading_pair} at {snapshot_timestamp}")
+                        await asyncio.sleep(5.0)
+                    except asyncio.CancelledError:
+                        raise
+                    except IOError:
+                        self.logger().network(
+                            f"Error getting snapshot for {trading_pair}.",
+                            exc_info=True,
+                            app_warning_msg=f"Error getting snapshot for {trading_pair}. Check network connection."
+                        )
+                        await asyncio.sleep(5.0)
+                    except Exception:
+                        self.logger().error(f"Error processing snapshot for {trading_pair}.", exc_info=True)
+                        await asyncio.sleep(5.0)
+                this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
+                next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
+                delta: float = next_hour.timestamp() - time.time()
+                await asyncio.sleep(delta)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -43,6 +43,7 @@ from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
 )
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.market.market_base cimport MarketBase
 from hummingbot.market.ddex.ddex_order_book_tracker import DDEXOrderBookTracker
 from hummingbot.market.ddex.ddex_in_flight_order cimport DDEXInFlightOrder
@@ -484,7 +485,7 @@ cdef class DDEXMarket(MarketBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            return HttpClientRegistry.get_instance().client()
         return self._shared_client
 
     async def _api_request(self,
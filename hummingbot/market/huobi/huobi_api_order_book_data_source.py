@@ -23,6 +23,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.huobi.huobi_order_book import HuobiOrderBook
 
@@ -55,15 +56,16 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Returned data frame should have symbol as index and include usd volume, baseAsset and quoteAsset
         """
-        async with aiohttp.ClientSession() as client:
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
 
-            market_response, exchange_response = await safe_gather(
-                client.get(HUOBI_TICKER_URL),
-                client.get(HUOBI_SYMBOLS_URL)
-            )
-            market_response: aiohttp.ClientResponse = market_response
-            exchange_response: aiohttp.ClientResponse = exchange_response
+        market_response, exchange_response = await safe_gather(
+            client.get(HUOBI_TICKER_URL),
+            client.get(HUOBI_SYMBOLS_URL)
+        )
+        market_response: aiohttp.ClientResponse = market_response
+        exchange_response: aiohttp.ClientResponse = exchange_response
 
+        try:
             if market_response.status != 200:
                 raise IOError(f"Error fetching Huobi markets information. "
                               f"HTTP status is {market_response.status}.")
@@ -73,27 +75,30 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
             market_data = await market_response.json()
             exchange_data = await exchange_response.json()
+        finally:
+            market_response.release()
+            exchange_response.release()
 
-            attr_name_map = {"base-currency": "baseAsset", "quote-currency": "quoteAsset"}
+        attr_name_map = {"base-currency": "baseAsset", "quote-currency": "quoteAsset"}
 
-            trading_pairs: Dict[str, Any] = {
-                item["symbol"]: {attr_name_map[k]: item[k] for k in ["base-currency", "quote-currency"]}
-                for item in exchange_data["data"]
-                if item["state"] == "online"
-            }
+        trading_pairs: Dict[str, Any] = {
+            item["symbol"]: {attr_name_map[k]: item[k] for k in ["base-currency", "quote-currency"]}
+            for item in exchange_data["data"]
+            if item["state"] == "online"
+        }
 
-            market_data: List[Dict[str, Any]] = [
-                {**item, **trading_pairs[item["symbol"]]}
-                for item in market_data["data"]
-                if item["symbol"] in trading_pairs
-            ]
+        market_data: List[Dict[str, Any]] = [
+            {**item, **trading_pairs[item["symbol"]]}
+            for item in market_data["data"]
+            if item["symbol"] in trading_pairs
+        ]
 
-            # Build the data frame.
-            all_markets: pd.DataFrame = pd.DataFrame.from_records(data=market_data, index="symbol")
-            all_markets.loc[:, "USDVolume"] = all_markets.amount
-            all_markets.loc[:, "volume"] = all_markets.vol
+        # Build the data frame.
+        all_markets: pd.DataFrame = pd.DataFrame.from_records(data=market_data, index="symbol")
+        all_markets.loc[:, "USDVolume"] = all_markets.amount
+        all_markets.loc[:, "volume"] = all_markets.vol
 
-            return all_markets.sort_values("USDVolume", ascending=False)
+        return all_markets.sort_values("USDVolume", ascending=False)
 
     async def get_trading_pairs(self) -> List[str]:
         if not self._symbols:
@@ -124,29 +129,29 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        retval: Dict[str, OrderBookTrackerEntry] = {}
 
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                    snapshot_msg: OrderBookMessage = HuobiOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        metadata={"symbol": trading_pair}
-                    )
-                    order_book: OrderBook = self.order_book_create_function()
-                    order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-                    retval[trading_pair] = OrderBookTrackerEntry(trading_pair, snapshot_msg.timestamp, order_book)
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index + 1}/{number_of_pairs} completed.")
-                    # Huobi rate limit is 100 https requests per 10 seconds
-                    await asyncio.sleep(0.4)
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-                    await asyncio.sleep(5)
-            return retval
+        number_of_pairs: int = len(trading_pairs)
+        for index, trading_pair in enumerate(trading_pairs):
+            try:
+                snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
+                snapshot_msg: OrderBookMessage = HuobiOrderBook.snapshot_message_from_exchange(
+                    snapshot,
+                    metadata={"symbol": trading_pair}
+                )
+                order_book: OrderBook = self.order_book_create_function()
+                order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+                retval[trading_pair] = OrderBookTrackerEntry(trading_pair, snapshot_msg.timestamp, order_book)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index + 1}/{number_of_pairs} completed.")
+                # Huobi rate limit is 100 https requests per 10 seconds
+                await asyncio.sleep(0.4)
+            except Exception:
+                self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
+                await asyncio.sleep(5)
+        return retval
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -246,26 +251,26 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_message: OrderBookMessage = HuobiOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                metadata={"symbol": trading_pair}
-                            )
-                            output.put_nowait(snapshot_message)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().error("Unexpected error.", exc_info=True)
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
+                client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+                for trading_pair in trading_pairs:
+                    try:
+                        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
+                        snapshot_message: OrderBookMessage = HuobiOrderBook.snapshot_message_from_exchange(
+                            snapshot,
+                            metadata={"symbol": trading_pair}
+                        )
+                        output.put_nowait(snapshot_message)
+                        self.logger().debug(f"Saved order book snapshot for {trading_pair}")
+                        await asyncio.sleep(5.0)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        self.logger().error("Unexpected error.", exc_info=True)
+                        await asyncio.sleep(5.0)
+                this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
+                next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
+                delta: float = next_hour.timestamp() - time.time()
+                await asyncio.sleep(delta)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -5,6 +5,7 @@ from async_timeout import timeout
 import conf
 from datetime import datetime
 from decimal import Decimal
+from functools import partial
 from libc.stdint cimport int64_t
 import logging
 import pandas as pd
@@ -25,6 +26,7 @@ import hummingbot
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.multi_process_order_book_tracker import MultiProcessOrderBookTracker
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTrackerDataSourceType
 from hummingbot.core.data_type.transaction_tracker import TransactionTracker
@@ -49,6 +51,7 @@ from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
 )
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.huobi.huobi_api_order_book_data_source import HuobiAPIOrderBookDataSource
 from hummingbot.market.huobi.huobi_auth import HuobiAuth
@@ -107,7 +110,8 @@ cdef class HuobiMarket(MarketBase):
                  order_book_tracker_data_source_type: OrderBookTrackerDataSourceType =
                  OrderBookTrackerDataSourceType.EXCHANGE_API,
                  symbols: Optional[List[str]] = None,
-                 trading_required: bool = True):
+                 trading_required: bool = True,
+                 order_book_tracker_process: bool = False):
 
         super().__init__()
         self._account_id = ""
@@ -118,10 +122,18 @@ cdef class HuobiMarket(MarketBase):
         self._in_flight_orders = {}
         self._last_poll_timestamp = 0
         self._last_timestamp = 0
-        self._order_book_tracker = HuobiOrderBookTracker(
-            data_source_type=order_book_tracker_data_source_type,
-            symbols=symbols
-        )
+        if order_book_tracker_process:
+            # Decode and apply the order book messages in a worker process, to keep them off the main event loop.
+            self._order_book_tracker = MultiProcessOrderBookTracker(
+                partial(HuobiOrderBookTracker, data_source_type=order_book_tracker_data_source_type, symbols=symbols),
+                symbols=symbols,
+                exchange_name="huobi"
+            )
+        else:
+            self._order_book_tracker = HuobiOrderBookTracker(
+                data_source_type=order_book_tracker_data_source_type,
+                symbols=symbols
+            )
         self._order_tracker_task = None
         self._poll_notifier = asyncio.Event()
         self._poll_interval = poll_interval
@@ -212,6 +224,8 @@ cdef class HuobiMarket(MarketBase):
         if self._order_tracker_task is not None:
             self._order_tracker_task.cancel()
             self._order_tracker_task = None
+        if isinstance(self._order_book_tracker, MultiProcessOrderBookTracker):
+            self._order_book_tracker.stop()
         if self._status_polling_task is not None:
             self._status_polling_task.cancel()
             self._status_polling_task = None
@@ -244,7 +258,7 @@ cdef class HuobiMarket(MarketBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            return HttpClientRegistry.get_instance().client()
         return self._shared_client
 
     async def _api_request(self,
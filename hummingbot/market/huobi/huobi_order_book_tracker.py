@@ -92,6 +92,7 @@ class HuobiOrderBookTracker(OrderBookTracker):
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
+                self._record_message(ob_message)
                 symbol: str = ob_message.symbol
 
                 if symbol not in self._tracking_message_queues:
@@ -136,11 +137,14 @@ class HuobiOrderBookTracker(OrderBookTracker):
 
         while True:
             try:
-                message: OrderBookMessage = await message_queue.get()
+                messages: List[OrderBookMessage] = await self._next_message_batch(message_queue)
+                # Huobi websocket messages contain the entire order book state, so only the latest one in a batch
+                # needs to be applied.
+                message: OrderBookMessage = messages[-1]
                 if message.type is OrderBookMessageType.DIFF:
                     # Huobi websocket messages contain the entire order book state so they should be treated as snapshots
                     order_book.apply_snapshot(message.bids, message.asks, message.update_id)
-                    diff_messages_accepted += 1
+                    diff_messages_accepted += len(messages)
 
                     # Output some statistics periodically.
                     now: float = time.time()
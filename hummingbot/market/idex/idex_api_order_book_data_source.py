@@ -19,6 +19,7 @@ from websockets.exceptions import ConnectionClosed
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.market.idex.idex_active_order_tracker import IDEXActiveOrderTracker
 from hummingbot.market.idex.idex_order_book import IDEXOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -59,13 +60,13 @@ class IDEXAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Returns all token information
         """
-        async with aiohttp.ClientSession() as client:
-            async with client.get(f"{IDEX_REST_URL}/returnCurrencies") as response:
-                response: aiohttp.ClientResponse = response
-                if response.status != 200:
-                    raise IOError(f"Error fetching token info. HTTP status is {response.status}.")
-                data: Dict[str, Dict[str, Any]] = await response.json()
-                return data
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        async with client.get(f"{IDEX_REST_URL}/returnCurrencies") as response:
+            response: aiohttp.ClientResponse = response
+            if response.status != 200:
+                raise IOError(f"Error fetching token info. HTTP status is {response.status}.")
+            data: Dict[str, Dict[str, Any]] = await response.json()
+            return data
 
     @classmethod
     @async_ttl_cache(ttl=60 * 30, maxsize=1)
@@ -73,52 +74,52 @@ class IDEXAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Returned data frame should have symbol as index and include usd volume, baseAsset and quoteAsset
         """
-        async with aiohttp.ClientSession() as client:
-            async with client.get(f"{IDEX_REST_URL}/return24Volume") as response:
-                response: aiohttp.ClientResponse = response
-                if response.status != 200:
-                    raise IOError(f"Error fetching active ddex markets. HTTP status is {response.status}.")
-                parsed_response: Dict[str, Dict[str, str]] = await response.json()
-                data: List[Dict[str, Any]] = []
-                for trading_pair, volume_data in parsed_response.items():
-                    # filter out all non trading pair data. IDEX format is "TUSD_ETH"
-                    if "_" in trading_pair:
-                        quote_asset, base_asset = trading_pair.split("_")
-                        data.append({
-                            "market": trading_pair,
-                            "volumeData": volume_data,
-                            "baseAsset": base_asset,
-                            "quoteAsset": quote_asset
-                        })
-                all_markets: pd.DataFrame = pd.DataFrame.from_records(data=data, index="market")
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        async with client.get(f"{IDEX_REST_URL}/return24Volume") as response:
+            response: aiohttp.ClientResponse = response
+            if response.status != 200:
+                raise IOError(f"Error fetching active ddex markets. HTTP status is {response.status}.")
+            parsed_response: Dict[str, Dict[str, str]] = await response.json()
+            data: List[Dict[str, Any]] = []
+            for trading_pair, volume_data in parsed_response.items():
+                # filter out all non trading pair data. IDEX format is "TUSD_ETH"
+                if "_" in trading_pair:
+                    quote_asset, base_asset = trading_pair.split("_")
+                    data.append({
+                        "market": trading_pair,
+                        "volumeData": volume_data,
+                        "baseAsset": base_asset,
+                        "quoteAsset": quote_asset
+                    })
+            all_markets: pd.DataFrame = pd.DataFrame.from_records(data=data, index="market")
 
-                tusd_eth_volume_in_tusd: float = float(all_markets.loc["TUSD_ETH"].volumeData["TUSD"])
-                tusd_eth_volume_in_eth: float = float(all_markets.loc["TUSD_ETH"].volumeData["ETH"])
-                usd_eth_price: float = tusd_eth_volume_in_tusd / tusd_eth_volume_in_eth if tusd_eth_volume_in_eth > 0 else 0
-                tusd_wbtc_volume_in_tusd: float = float(all_markets.loc["TUSD_WBTC"].volumeData["TUSD"])
-                tusd_wbtc_volume_in_wbtc: float = float(all_markets.loc["TUSD_WBTC"].volumeData["WBTC"])
-                usd_wtbc_price: float = tusd_wbtc_volume_in_tusd / tusd_wbtc_volume_in_wbtc if tusd_wbtc_volume_in_wbtc > 0 else 0
-                tusd_eurs_volume_in_tusd: float = float(all_markets.loc["TUSD_EURS"].volumeData["TUSD"])
-                tusd_eurs_volume_in_eurs: float = float(all_markets.loc["TUSD_EURS"].volumeData["EURS"])
-                usd_eurs_price: float = tusd_eurs_volume_in_tusd / tusd_eurs_volume_in_eurs if tusd_eurs_volume_in_eurs > 0 else 0
+            tusd_eth_volume_in_tusd: float = float(all_markets.loc["TUSD_ETH"].volumeData["TUSD"])
+            tusd_eth_volume_in_eth: float = float(all_markets.loc["TUSD_ETH"].volumeData["ETH"])
+            usd_eth_price: float = tusd_eth_volume_in_tusd / tusd_eth_volume_in_eth if tusd_eth_volume_in_eth > 0 else 0
+            tusd_wbtc_volume_in_tusd: float = float(all_markets.loc["TUSD_WBTC"].volumeData["TUSD"])
+            tusd_wbtc_volume_in_wbtc: float = float(all_markets.loc["TUSD_WBTC"].volumeData["WBTC"])
+            usd_wtbc_price: float = tusd_wbtc_volume_in_tusd / tusd_wbtc_volume_in_wbtc if tusd_wbtc_volume_in_wbtc > 0 else 0
+            tusd_eurs_volume_in_tusd: float = float(all_markets.loc["TUSD_EURS"].volumeData["TUSD"])
+            tusd_eurs_volume_in_eurs: float = float(all_markets.loc["TUSD_EURS"].volumeData["EURS"])
+            usd_eurs_price: float = tusd_eurs_volume_in_tusd / tusd_eurs_volume_in_eurs if tusd_eurs_volume_in_eurs > 0 else 0
 
-                usd_volume: List[float] = []
-                for row in all_markets.itertuples():
-                    product_name: str = row.Index
-                    quote_asset: str = product_name.split("_")[0]
-                    quote_volume: float = float(row.volumeData[quote_asset])
-                    if quote_asset in ["TUSD", "USDC", "DAI"]:
-                        usd_volume.append(quote_volume)
-                    elif quote_asset == "ETH":
-                        usd_volume.append(quote_volume * usd_eth_price)
-                    elif quote_asset == "WBTC":
-                        usd_volume.append(quote_volume * usd_wtbc_price)
-                    elif quote_asset == "EURS":
-                        usd_volume.append(quote_volume * usd_eurs_price)
-                    else:
-                        raise ValueError(f"Unable to convert volume to USD for market - {product_name}.")
-                all_markets["USDVolume"] = usd_volume
-                return all_markets.sort_values("USDVolume", ascending=False)
+            usd_volume: List[float] = []
+            for row in all_markets.itertuples():
+                product_name: str = row.Index
+                quote_asset: str = product_name.split("_")[0]
+                quote_volume: float = float(row.volumeData[quote_asset])
+                if quote_asset in ["TUSD", "USDC", "DAI"]:
+                    usd_volume.append(quote_volume)
+                elif quote_asset == "ETH":
+                    usd_volume.append(quote_volume * usd_eth_price)
+                elif quote_asset == "WBTC":
+                    usd_volume.append(quote_volume * usd_wtbc_price)
+                elif quote_asset == "EURS":
+                    usd_volume.append(quote_volume * usd_eurs_price)
+                else:
+                    raise ValueError(f"Unable to convert volume to USD for market - {product_name}.")
+            all_markets["USDVolume"] = usd_volume
+            return all_markets.sort_values("USDVolume", ascending=False)
 
     async def get_trading_pairs(self) -> List[str]:
         if self._symbols is None:
@@ -158,44 +159,44 @@ class IDEXAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, IDEXOrderBookTrackerEntry] = {}
-            number_of_pairs: int = len(trading_pairs)
-            token_info: Dict[str, Dict[str, Any]] = await self.get_all_token_info()
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
-                    snapshot_msg: IDEXOrderBookMessage = IDEXOrderBook.snapshot_message_from_exchange(
-                        msg=snapshot,
-                        timestamp=None,
-                        metadata={"market": trading_pair}
-                    )
-                    quote_asset_symbol, base_asset_symbol = trading_pair.split("_")
-                    base_asset: Dict[str, Any] = token_info[base_asset_symbol]
-                    quote_asset: Dict[str, Any] = token_info[quote_asset_symbol]
-                    idex_active_order_tracker: IDEXActiveOrderTracker = IDEXActiveOrderTracker(base_asset=base_asset,
-                                                                                               quote_asset=quote_asset)
-                    bids, asks = idex_active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
-                    snapshot_timestamp: float = idex_active_order_tracker.latest_snapshot_timestamp
-                    idex_order_book: OrderBook = self.order_book_create_function()
-                    idex_order_book.apply_snapshot(bids, asks, snapshot_timestamp)
-                    retval[trading_pair] = IDEXOrderBookTrackerEntry(
-                        trading_pair,
-                        snapshot_timestamp,
-                        idex_order_book,
-                        idex_active_order_tracker
-                    )
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        retval: Dict[str, IDEXOrderBookTrackerEntry] = {}
+        number_of_pairs: int = len(trading_pairs)
+        token_info: Dict[str, Dict[str, Any]] = await self.get_all_token_info()
+        for index, trading_pair in enumerate(trading_pairs):
+            try:
+                snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
+                snapshot_msg: IDEXOrderBookMessage = IDEXOrderBook.snapshot_message_from_exchange(
+                    msg=snapshot,
+                    timestamp=None,
+                    metadata={"market": trading_pair}
+                )
+                quote_asset_symbol, base_asset_symbol = trading_pair.split("_")
+                base_asset: Dict[str, Any] = token_info[base_asset_symbol]
+                quote_asset: Dict[str, Any] = token_info[quote_asset_symbol]
+                idex_active_order_tracker: IDEXActiveOrderTracker = IDEXActiveOrderTracker(base_asset=base_asset,
+                                                                                           quote_asset=quote_asset)
+                bids, asks = idex_active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
+                snapshot_timestamp: float = idex_active_order_tracker.latest_snapshot_timestamp
+                idex_order_book: OrderBook = self.order_book_create_function()
+                idex_order_book.apply_snapshot(bids, asks, snapshot_timestamp)
+                retval[trading_pair] = IDEXOrderBookTrackerEntry(
+                    trading_pair,
+                    snapshot_timestamp,
+                    idex_order_book,
+                    idex_active_order_tracker
+                )
 
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
-                    await asyncio.sleep(1.0)
-                except Exception:
-                    self.logger().error(f"Error initializing order book for {trading_pair}.", exc_info=True)
-                    await asyncio.sleep(5)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index+1}/{number_of_pairs} completed.")
+                await asyncio.sleep(1.0)
+            except Exception:
+                self.logger().error(f"Error initializing order book for {trading_pair}.", exc_info=True)
+                await asyncio.sleep(5)
 
-            self._get_tracking_pair_done_event.set()
-            return retval
+        self._get_tracking_pair_done_event.set()
+        return retval
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -306,32 +307,32 @@ class IDEXAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_timestamp: float = time.time()
-                            snapshot_msg: IDEXOrderBookMessage = IDEXOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                {"market": trading_pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair} at {snapshot_timestamp}")
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().network(
-                                f"Error getting snapshot for {trading_pair}.",
-                                exc_info=True,
-                                app_warning_msg=f"Error getting snapshot for {trading_pair}. Check network connection."
-                            )
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
+                client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+                for trading_pair in trading_pairs:
+                    try:
+                        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
+                        snapshot_timestamp: float = time.time()
+                        snapshot_msg: IDEXOrderBookMessage = IDEXOrderBook.snapshot_message_from_exchange(
+                            snapshot,
+                            snapshot_timestamp,
+                            {"market": trading_pair}
+                        )
+                        output.put_nowait(snapshot_msg)
+                        self.logger().debug(f"Saved order book snapshot for {trading_pair} at {snapshot_timestamp}")
+                        await asyncio.sleep(5.0)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        self.logger().network(
+                            f"Error getting snapshot for {trading_pair}.",
+                            exc_info=True,
+                            app_warning_msg=f"Error getting snapshot for {trading_pair}. Check network connection."
+                        )
+                        await asyncio.sleep(5.0)
+                this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
+                next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
+                delta: float = next_hour.timestamp() - time.time()
+                await asyncio.sleep(delta)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 
 import asyncio
+from collections import deque
+import logging
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import (
     Session,
     Query
@@ -8,6 +11,9 @@ from sqlalchemy.orm import (
 import time
 import threading
 from typing import (
+    Any,
+    Callable,
+    Deque,
     Dict,
     List,
     Optional,
@@ -28,6 +34,7 @@ from hummingbot.core.event.events import (
     TradeFee,
     TradeType)
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.logger import HummingbotLogger
 from hummingbot.market.market_base import MarketBase
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
@@ -36,17 +43,38 @@ from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 
 
+# A pending database write. It's executed on the writer thread, with the session of the batch it's written in.
+DatabaseWrite = Callable[[Session], None]
+
+
 class MarketsRecorder:
+    """
+    Records orders, order status changes, trade fills and market states to the trade database.
+
+    Market events are recorded write-behind: the event listeners only capture the records to be written, and a
+    background thread writes everything that has accumulated in a single transaction every `flush_interval` seconds.
+    Market states are saved at most once per flush interval per market, no matter how many events changed them.
+    Queries flush any pending writes first, and stop() flushes everything before returning.
+    """
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
 
+    _mr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mr_logger is None:
+            cls._mr_logger = logging.getLogger(__name__)
+        return cls._mr_logger
+
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[MarketBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 flush_interval: float = 1.0):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -55,6 +83,21 @@ class MarketsRecorder:
         self._markets: List[MarketBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._flush_interval: float = flush_interval
+
+        # Write-behind state. The pending writes are appended to on the main thread, and consumed by the writer thread.
+        self._pending_writes: Deque[DatabaseWrite] = deque()
+        self._write_lock: threading.Lock = threading.Lock()
+        self._writer_wakeup: threading.Event = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_stopping: bool = False
+        self._dirty_markets: Dict[str, MarketBase] = {}
+        self._save_market_states_handle: Optional[asyncio.TimerHandle] = None
+
+        self._batches_written: int = 0
+        self._records_written: int = 0
+        self._market_state_saves_requested: int = 0
+        self._market_state_saves_written: int = 0
 
         self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
         self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
@@ -94,17 +137,145 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def flush_interval(self) -> float:
+        return self._flush_interval
+
+    @property
+    def pending_writes(self) -> int:
+        return len(self._pending_writes)
+
+    @property
+    def write_stats(self) -> Dict[str, Any]:
+        return {
+            "pending_writes": len(self._pending_writes),
+            "batches_written": self._batches_written,
+            "records_written": self._records_written,
+            "market_state_saves_requested": self._market_state_saves_requested,
+            "market_state_saves_written": self._market_state_saves_written,
+        }
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
+        if self._writer_thread is None:
+            self._writer_stopping = False
+            self._writer_thread = threading.Thread(target=self._writer_loop,
+                                                   name="MarketsRecorderWriter",
+                                                   daemon=True)
+            self._writer_thread.start()
 
     def stop(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
 
+        # Make sure everything recorded so far is in the database before returning.
+        self.flush()
+        if self._writer_thread is not None:
+            self._writer_stopping = True
+            self._writer_wakeup.set()
+            self._writer_thread.join()
+            self._writer_thread = None
+
+    def flush(self):
+        """
+        Writes all pending records to the database, on the calling thread. Market states are serialized before that,
+        so this must be called from the main thread.
+        """
+        self._save_dirty_market_states()
+        self._write_pending()
+        # The shared session may still hold objects loaded before the writes above.
+        self.session.expire_all()
+
+    def _writer_loop(self):
+        while not self._writer_stopping:
+            self._writer_wakeup.wait(self._flush_interval)
+            self._writer_wakeup.clear()
+            self._write_pending()
+
+    def _write_pending(self):
+        with self._write_lock:
+            if len(self._pending_writes) == 0:
+                return
+            writes: List[DatabaseWrite] = []
+            while len(self._pending_writes) > 0:
+                writes.append(self._pending_writes.popleft())
+
+            try:
+                with self._sql.begin() as session:
+                    for write in writes:
+                        write(session)
+                self._batches_written += 1
+                self._records_written += len(writes)
+            except SQLAlchemyError:
+                # Don't let one bad record take the rest of the batch down with it. Retry every write on its own.
+                self.logger().warning("Error writing a batch of %d records to the trade database. "
+                                      "Retrying them one by one.", len(writes), exc_info=True)
+                for write in writes:
+                    try:
+                        with self._sql.begin() as session:
+                            write(session)
+                        self._records_written += 1
+                    except SQLAlchemyError:
+                        self.logger().error("Error writing a record to the trade database.", exc_info=True)
+
+    def _enqueue_write(self, write: DatabaseWrite, market: MarketBase):
+        self._pending_writes.append(write)
+        self._mark_market_states_dirty(market)
+
+    def _mark_market_states_dirty(self, market: MarketBase):
+        self._market_state_saves_requested += 1
+        self._dirty_markets[market.display_name] = market
+        if self._save_market_states_handle is None:
+            self._save_market_states_handle = self._ev_loop.call_later(self._flush_interval,
+                                                                       self._save_dirty_market_states)
+
+    def _save_dirty_market_states(self):
+        """
+        Snapshots the tracking states of every market that has changed since the last save, and queues them for writing.
+        Tracking states must be read on the main thread, the writer thread only gets the serialized copies.
+        """
+        if self._save_market_states_handle is not None:
+            self._save_market_states_handle.cancel()
+            self._save_market_states_handle = None
+        if len(self._dirty_markets) == 0:
+            return
+
+        timestamp: int = self.db_timestamp
+        for market_name, market in self._dirty_markets.items():
+            self._pending_writes.append(self._market_states_write(self._config_file_path,
+                                                                  market_name,
+                                                                  timestamp,
+                                                                  market.tracking_states))
+        self._market_state_saves_written += len(self._dirty_markets)
+        self._dirty_markets.clear()
+        self._writer_wakeup.set()
+
+    @staticmethod
+    def _market_states_write(config_file_path: str,
+                             market_name: str,
+                             timestamp: int,
+                             saved_state: Dict[str, Any]) -> DatabaseWrite:
+        def write(session: Session):
+            market_states: Optional[MarketState] = (session
+                                                    .query(MarketState)
+                                                    .filter(MarketState.config_file_path == config_file_path,
+                                                            MarketState.market == market_name)
+                                                    .one_or_none())
+            if market_states is not None:
+                market_states.saved_state = saved_state
+                market_states.timestamp = timestamp
+            else:
+                session.add(MarketState(config_file_path=config_file_path,
+                                        market=market_name,
+                                        timestamp=timestamp,
+                                        saved_state=saved_state))
+        return write
+
     def get_orders_for_config_and_market(self, config_file_path: str, market: MarketBase) -> List[Order]:
+        self.flush()
         session: Session = self.session
         query: Query = (session
                         .query(Order)
@@ -114,6 +285,7 @@ class MarketsRecorder:
         return query.all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self.flush()
         session: Session = self.session
         query: Query = (session
                         .query(TradeFill)
@@ -149,6 +321,7 @@ class MarketsRecorder:
             market.restore_tracking_states(market_states.saved_state)
 
     def get_market_states(self, config_file_path: str, market: MarketBase) -> Optional[MarketState]:
+        self.flush()
         session: Session = self.session
         query: Query = (session
                         .query(MarketState)
@@ -165,31 +338,33 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_create_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = market.split_symbol(evt.symbol)
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         trade_type: TradeType = TradeType.BUY if type(evt) == BuyOrderCreatedEvent else TradeType.SELL
-        order_record: Order = Order(id=evt.order_id,
-                                    config_file_path=self._config_file_path,
-                                    strategy=self._strategy_name,
-                                    market=market.display_name,
-                                    symbol=evt.symbol,
-                                    base_asset=base_asset,
-                                    quote_asset=quote_asset,
-                                    creation_timestamp=timestamp,
-                                    order_type=evt.type.name,
-                                    amount=float(evt.amount),
-                                    price=float(evt.price),
-                                    last_status=event_type.name,
-                                    last_update_timestamp=timestamp)
-        order_status: OrderStatus = OrderStatus(order=order_record,
-                                                timestamp=timestamp,
-                                                status=event_type.name)
-        session.add(order_record)
-        session.add(order_status)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+        order_values: Dict[str, Any] = dict(id=evt.order_id,
+                                            config_file_path=self._config_file_path,
+                                            strategy=self._strategy_name,
+                                            market=market.display_name,
+                                            symbol=evt.symbol,
+                                            base_asset=base_asset,
+                                            quote_asset=quote_asset,
+                                            creation_timestamp=timestamp,
+                                            order_type=evt.type.name,
+                                            amount=float(evt.amount),
+                                            price=float(evt.price),
+                                            last_status=event_type.name,
+                                            last_update_timestamp=timestamp)
+
+        def write(session: Session):
+            order_record: Order = Order(**order_values)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+
+        self._enqueue_write(write, market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -199,24 +374,11 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = market.split_symbol(evt.symbol)
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-
-        # Try to find the order record, and update it if necessary.
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-
-        # Order status and trade fill record should be added even if the order record is not found, because it's
-        # possible for fill event to come in before the order created event for market orders.
-        order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                timestamp=timestamp,
-                                                status=event_type.name)
-        trade_fill_record: TradeFill = TradeFill(config_file_path=self.config_file_path,
+        trade_fill_values: Dict[str, Any] = dict(config_file_path=self.config_file_path,
                                                  strategy=self.strategy_name,
                                                  market=market.display_name,
                                                  symbol=evt.symbol,
@@ -230,10 +392,23 @@ class MarketsRecorder:
                                                  amount=float(evt.amount),
                                                  trade_fee=TradeFee.to_json(evt.trade_fee),
                                                  exchange_trade_id=evt.exchange_trade_id)
-        session.add(order_status)
-        session.add(trade_fill_record)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_status)
+            session.add(TradeFill(**trade_fill_values))
+
+        self._enqueue_write(write, market)
 
     def _update_order_status(self,
                              event_tag: int,
@@ -247,23 +422,21 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._update_order_status, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
 
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-            order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                    timestamp=timestamp,
-                                                    status=event_type.name)
-            session.add(order_status)
-            self.save_market_states(self._config_file_path, market, no_commit=True)
-            session.commit()
-        else:
-            session.rollback()
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+
+        self._enqueue_write(write, market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -40,11 +40,15 @@ cdef class PaperTradeMarket(MarketBase):
         LimitOrderExpirationSet _limit_order_expiration_set
         object _order_tracker_task
         object _target_market
+        dict _on_hold_balances
+        dict _limit_order_fill_states
+        dict _crossed_amounts_taken
 
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
     cdef c_process_market_orders(self)
     cdef c_set_balance(self, str currency, object amount)
+    cdef c_update_on_hold_balance(self, str currency, object delta)
     cdef object c_get_fee(self,
                           str base_asset,
                           str quote_asset,
@@ -60,21 +64,34 @@ cdef class PaperTradeMarket(MarketBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleSymbolLimitOrdersIterator orders_it)
+                               SingleSymbolLimitOrdersIterator orders_it,
+                               object fill_amount=*)
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleSymbolLimitOrdersIterator orders_it)
+                                   SingleSymbolLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleSymbolLimitOrdersIterator orders_it)
+                                   SingleSymbolLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
+    cdef object c_get_fill_amount(self, str symbol, object remaining_amount, double available_amount)
     cdef c_process_crossed_limit_orders_for_symbol(self,
                                                    bint is_buy,
                                                    LimitOrders *limit_orders_map_ptr,
                                                    LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
+    cdef object c_match_trade_at_order_price(self,
+                                             OrderBook order_book,
+                                             bint is_bid,
+                                             str symbol,
+                                             str order_id,
+                                             double order_price,
+                                             object order_quantity,
+                                             double trade_amount,
+                                             double trade_amount_filled)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
                                                str trading_pair_str,
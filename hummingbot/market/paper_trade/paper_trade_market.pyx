@@ -41,6 +41,7 @@ from hummingbot.core.data_type.composite_order_book cimport CompositeOrderBook
 from hummingbot.core.data_type.limit_order cimport c_create_limit_order_from_cpp_limit_order
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.event.events import (
     MarketEvent,
@@ -137,6 +138,32 @@ cdef class QueuedOrder:
                 f"{self.amount})")
 
 
+cdef class LimitOrderFillState:
+    """
+    Fill progress of a resting paper limit order. queue_ahead is the amount that was resting at the order's price
+    level when the order was placed, and hasn't been traded or cancelled since - trades at the order's price have to
+    go through it before they can fill the order.
+    """
+    cdef:
+        object _filled_amount
+        double _queue_ahead
+
+    def __init__(self, queue_ahead: float):
+        self._filled_amount = s_decimal_0
+        self._queue_ahead = queue_ahead
+
+    @property
+    def filled_amount(self) -> Decimal:
+        return self._filled_amount
+
+    @property
+    def queue_ahead(self) -> float:
+        return self._queue_ahead
+
+    def __repr__(self) -> str:
+        return f"LimitOrderFillState({self._filled_amount}, {self._queue_ahead})"
+
+
 cdef class OrderBookTradeListener(EventListener):
     cdef:
         MarketBase _market
@@ -183,6 +210,9 @@ cdef class PaperTradeMarket(MarketBase):
         order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         self._account_balances = {}
         self._account_available_balances = {}
+        self._on_hold_balances = {}
+        self._limit_order_fill_states = {}
+        self._crossed_amounts_taken = {}
         self._paper_trade_market_initialized = False
         self._trading_pairs = {}
         self._config = config
@@ -281,22 +311,18 @@ cdef class PaperTradeMarket(MarketBase):
 
         return retval
 
+    @property
+    def limit_order_fill_states(self) -> Dict[str, LimitOrderFillState]:
+        return self._limit_order_fill_states
+
     @property
     def on_hold_balances(self) -> Dict[str, Decimal]:
-        _on_hold_balances = defaultdict(Decimal)
-        for limit_order in self.limit_orders:
-            if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
-            else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
-        return _on_hold_balances
+        return defaultdict(Decimal, self._on_hold_balances)
 
     @property
     def available_balances(self) -> Dict[str, Decimal]:
-        _available_balances = self._account_balances.copy()
-        for trading_pair_str, balance in _available_balances.items():
-            _available_balances[trading_pair_str] -= self.on_hold_balances[trading_pair_str]
-        return _available_balances
+        return {currency: balance - self._on_hold_balances.get(currency, s_decimal_0)
+                for currency, balance in self._account_balances.items()}
 
     # </editor-fold>
 
@@ -374,6 +400,10 @@ cdef class PaperTradeMarket(MarketBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            self._limit_order_fill_states[order_id] = LimitOrderFillState(
+                self.c_get_order_book(trading_pair_str).c_get_amount_at_price(True, float(quantized_price))
+            )
+            self.c_update_on_hold_balance(quote_asset, quantized_amount * quantized_price)
         self.c_trigger_event(self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
                              BuyOrderCreatedEvent(
                                  self._current_timestamp,
@@ -429,6 +459,10 @@ cdef class PaperTradeMarket(MarketBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            self._limit_order_fill_states[order_id] = LimitOrderFillState(
+                self.c_get_order_book(trading_pair_str).c_get_amount_at_price(False, float(quantized_price))
+            )
+            self.c_update_on_hold_balance(base_asset, quantized_amount)
         self.c_trigger_event(self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
                              SellOrderCreatedEvent(
                                  self._current_timestamp,
@@ -569,7 +603,21 @@ cdef class PaperTradeMarket(MarketBase):
                               const SingleSymbolLimitOrdersIterator orders_it):
         cdef:
             SingleSymbolLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
+            LimitOrderFillState fill_state
+            object remaining_amount
         try:
+            # Release the balance still held by the order, whether it's been filled or cancelled.
+            fill_state = self._limit_order_fill_states.pop(cpp_limit_order_ptr.getClientOrderID().decode("utf8"), None)
+            remaining_amount = <object> cpp_limit_order_ptr.getQuantity()
+            if fill_state is not None:
+                remaining_amount -= fill_state._filled_amount
+            if cpp_limit_order_ptr.getIsBuy():
+                self.c_update_on_hold_balance(cpp_limit_order_ptr.getQuoteCurrency().decode("utf8"),
+                                              -(remaining_amount * <object> cpp_limit_order_ptr.getPrice()))
+            else:
+                self.c_update_on_hold_balance(cpp_limit_order_ptr.getBaseCurrency().decode("utf8"),
+                                              -remaining_amount)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -578,20 +626,41 @@ cdef class PaperTradeMarket(MarketBase):
             self.logger().error("Error deleting limit order.", exc_info=True)
             return False
 
+    cdef c_update_on_hold_balance(self, str currency, object delta):
+        cdef:
+            object on_hold_balance = self._on_hold_balances.get(currency, s_decimal_0) + delta
+        if on_hold_balance == s_decimal_0:
+            self._on_hold_balances.pop(currency, None)
+        else:
+            self._on_hold_balances[currency] = on_hold_balance
+
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleSymbolLimitOrdersIterator orders_it):
+                                   SingleSymbolLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str symbol = cpp_limit_order_ptr.getSymbol().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            LimitOrderFillState fill_state = self._limit_order_fill_states.get(order_id)
+            object order_price = <object> cpp_limit_order_ptr.getPrice()
+            object order_quantity = <object> cpp_limit_order_ptr.getQuantity()
+            object remaining_amount = order_quantity
             object quote_asset_balance = self.c_get_balance(quote_asset)
-            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
-                                        <object> cpp_limit_order_ptr.getQuantity()
-            object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
+            object quote_asset_traded
+            object base_asset_traded
+
+        if fill_state is not None:
+            remaining_amount -= fill_state._filled_amount
+        if fill_amount is None or fill_amount > remaining_amount:
+            fill_amount = remaining_amount
+        if fill_amount <= s_decimal_0:
+            return
+        quote_asset_traded = order_price * fill_amount
+        base_asset_traded = fill_amount
 
         # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
         if quote_asset_balance < quote_asset_traded:
@@ -605,8 +674,11 @@ cdef class PaperTradeMarket(MarketBase):
         # Adjust the market balances according to the trade done.
         self.c_set_balance(quote_asset, self.c_get_balance(quote_asset) - quote_asset_traded)
         self.c_set_balance(base_asset, self.c_get_balance(base_asset) + base_asset_traded)
+        self.c_update_on_hold_balance(quote_asset, -quote_asset_traded)
+        if fill_state is not None:
+            fill_state._filled_amount += fill_amount
 
-        # Emit the trade and order completed events.
+        # Emit the trade event, and the order completed event if the order has been filled completely.
         config = self._config
         self.c_trigger_event(
             self.ORDER_FILLED_EVENT_TAG,
@@ -616,10 +688,12 @@ cdef class PaperTradeMarket(MarketBase):
                 symbol,
                 TradeType.BUY,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                order_price,
+                fill_amount,
                 TradeFee(s_decimal_0)
             ))
+        if fill_amount < remaining_amount:
+            return
 
         self.c_trigger_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
@@ -629,8 +703,8 @@ cdef class PaperTradeMarket(MarketBase):
                 base_asset,
                 quote_asset,
                 base_asset if config.buy_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
+                order_quantity,
+                order_price * order_quantity,
                 s_decimal_0,
                 OrderType.LIMIT
             ))
@@ -639,17 +713,30 @@ cdef class PaperTradeMarket(MarketBase):
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleSymbolLimitOrdersIterator orders_it):
+                                   SingleSymbolLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getSymbol().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            LimitOrderFillState fill_state = self._limit_order_fill_states.get(order_id)
+            object order_price = <object> cpp_limit_order_ptr.getPrice()
+            object order_quantity = <object> cpp_limit_order_ptr.getQuantity()
+            object remaining_amount = order_quantity
             object base_asset_balance = self.c_get_balance(base_asset)
-            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
-                                        <object> cpp_limit_order_ptr.getQuantity()
-            object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
+            object quote_asset_traded
+            object base_asset_traded
+
+        if fill_state is not None:
+            remaining_amount -= fill_state._filled_amount
+        if fill_amount is None or fill_amount > remaining_amount:
+            fill_amount = remaining_amount
+        if fill_amount <= s_decimal_0:
+            return
+        quote_asset_traded = order_price * fill_amount
+        base_asset_traded = fill_amount
 
         # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
         if base_asset_balance < base_asset_traded:
@@ -662,8 +749,11 @@ cdef class PaperTradeMarket(MarketBase):
         # Adjust the market balances according to the trade done.
         self.c_set_balance(quote_asset, self.c_get_balance(quote_asset) + quote_asset_traded)
         self.c_set_balance(base_asset, self.c_get_balance(base_asset) - base_asset_traded)
+        self.c_update_on_hold_balance(base_asset, -base_asset_traded)
+        if fill_state is not None:
+            fill_state._filled_amount += fill_amount
 
-        # Emit the trade and order completed events.
+        # Emit the trade event, and the order completed event if the order has been filled completely.
         config = self._config
         self.c_trigger_event(
             self.ORDER_FILLED_EVENT_TAG,
@@ -673,10 +763,12 @@ cdef class PaperTradeMarket(MarketBase):
                 trading_pair_str,
                 TradeType.SELL,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                order_price,
+                fill_amount,
                 TradeFee(s_decimal_0)
             ))
+        if fill_amount < remaining_amount:
+            return
 
         self.c_trigger_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
@@ -686,8 +778,8 @@ cdef class PaperTradeMarket(MarketBase):
                 base_asset,
                 quote_asset,
                 base_asset if config.sell_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
+                order_quantity,
+                order_price * order_quantity,
                 s_decimal_0,
                 OrderType.LIMIT
             ))
@@ -697,15 +789,32 @@ cdef class PaperTradeMarket(MarketBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleSymbolLimitOrdersIterator orders_it):
+                               SingleSymbolLimitOrdersIterator orders_it,
+                               object fill_amount=None):
+        """
+        Fills a limit order, by fill_amount or completely if fill_amount is None.
+        """
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
+    cdef object c_get_fill_amount(self, str symbol, object remaining_amount, double available_amount):
+        """
+        How much of a limit order's remaining amount can be filled by the given amount of opposite trading volume.
+        """
+        cdef:
+            object fill_amount
+        if available_amount <= 0:
+            return s_decimal_0
+        fill_amount = Decimal(repr(available_amount))
+        if fill_amount >= remaining_amount:
+            return remaining_amount
+        return min(self.c_quantize_order_amount(symbol, fill_amount), remaining_amount)
+
     cdef c_process_crossed_limit_orders_for_symbol(self,
                                                    bint is_buy,
                                                    LimitOrders *limit_orders_map_ptr,
@@ -714,37 +823,76 @@ cdef class PaperTradeMarket(MarketBase):
         Trigger limit orders when the opposite side of the order book has crossed the limit order's price.
         This implies someone was ready to fill the limit order, if that limit order was on the market.
 
+        The limit orders are filled up to the opposite side's volume within their prices. Since the order book itself
+        isn't changed by paper trades, the volume taken by crossed limit orders is remembered - and only volume added
+        to the order book since then can fill more. The taken volume is reset once the order book stops crossing.
+
         :param is_buy: are the limit orders on the bid side?
         :param limit_orders_map_ptr: pointer to the limit orders map
         :param map_it_ptr: limit orders map iterator, which implies the symbol being processed
         """
         cdef:
             str symbol = deref(deref(map_it_ptr)).first.decode("utf8")
+            tuple crossed_key = (symbol, is_buy)
             object opposite_order_book_price = self.c_get_price(symbol, is_buy)
+            OrderBook order_book = self.c_get_order_book(symbol)
+            OrderBookQueryResult crossed_volume_result
+            double crossed_amount_taken = self._crossed_amounts_taken.get(crossed_key, 0.0)
             SingleSymbolLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
             SingleSymbolLimitOrdersIterator orders_it = orders_collection_ptr.begin()
             SingleSymbolLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleSymbolLimitOrdersIterator] process_order_its
+            list fill_amounts = []
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            LimitOrderFillState fill_state
+            object remaining_amount
+            object fill_amount
+            size_t i
 
-        if is_buy:
-            while orders_rit != orders_collection_ptr.rend():
+        while True:
+            if is_buy:
+                if orders_rit == orders_collection_ptr.rend():
+                    break
                 cpp_limit_order_ptr = address(deref(orders_rit))
                 if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleSymbolLimitOrdersIterator]>orders_rit))
+                orders_it = getIteratorFromReverseIterator(
+                    <reverse_iterator[SingleSymbolLimitOrdersIterator]>orders_rit)
                 inc(orders_rit)
-        else:
-            while orders_it != orders_collection_ptr.end():
+            else:
+                if orders_it == orders_collection_ptr.end():
+                    break
                 cpp_limit_order_ptr = address(deref(orders_it))
                 if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(orders_it)
+
+            # The opposite side's volume up to this order's price, less what's been taken by better priced orders.
+            crossed_volume_result = order_book.c_get_volume_for_price(is_buy,
+                                                                      float(<object>cpp_limit_order_ptr.getPrice()))
+            if len(fill_amounts) < 1:
+                crossed_amount_taken = min(crossed_amount_taken, crossed_volume_result.result_volume)
+            fill_state = self._limit_order_fill_states.get(cpp_limit_order_ptr.getClientOrderID().decode("utf8"))
+            remaining_amount = <object>cpp_limit_order_ptr.getQuantity()
+            if fill_state is not None:
+                remaining_amount -= fill_state._filled_amount
+            fill_amount = self.c_get_fill_amount(symbol,
+                                                 remaining_amount,
+                                                 crossed_volume_result.result_volume - crossed_amount_taken)
+            crossed_amount_taken += float(fill_amount)
+            process_order_its.push_back(orders_it)
+            fill_amounts.append(fill_amount)
+            if not is_buy:
                 inc(orders_it)
 
-        for orders_it in process_order_its:
-            self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+        if len(fill_amounts) < 1:
+            self._crossed_amounts_taken.pop(crossed_key, None)
+            return
+        self._crossed_amounts_taken[crossed_key] = crossed_amount_taken
+
+        for i in range(process_order_its.size()):
+            if fill_amounts[i] > s_decimal_0:
+                self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, process_order_its[i],
+                                           fill_amounts[i])
 
     cdef c_process_crossed_limit_orders(self):
         cdef:
@@ -769,13 +917,19 @@ cdef class PaperTradeMarket(MarketBase):
         """
         Trigger limit orders when incoming market orders have crossed the limit order's price.
 
+        Limit orders priced better than the trade have been swept by it. They're filled from the best price onwards,
+        each up to what's left of the trade. A trade at a limit order's price goes to the volume queued ahead of the
+        order first - see LimitOrderFillState - and only what's left of it fills the order, possibly partially.
+
         :param order_book_trade_event: trade event from order book
         """
         cdef:
-            string cpp_trading_pair = order_book_trade_event.symbol.encode("utf8")
+            str symbol = order_book_trade_event.symbol
+            string cpp_trading_pair = symbol.encode("utf8")
             bint is_maker_buy = order_book_trade_event.type is TradeType.SELL
-            object trade_price = order_book_trade_event.price
-            object trade_quantity = order_book_trade_event.amount
+            double trade_price = float(order_book_trade_event.price)
+            double trade_amount = float(order_book_trade_event.amount)
+            double trade_amount_filled = 0
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
@@ -784,37 +938,112 @@ cdef class PaperTradeMarket(MarketBase):
             SingleSymbolLimitOrdersIterator orders_it
             SingleSymbolLimitOrdersRIterator orders_rit
             vector[SingleSymbolLimitOrdersIterator] process_order_its
+            list fill_amounts = []
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            OrderBook order_book
+            LimitOrderFillState fill_state
+            object remaining_amount
+            object fill_amount
+            double order_price
+            size_t i
 
         if map_it == limit_orders_map_ptr.end():
             return
 
+        order_book = self.c_get_order_book(symbol)
         orders_collection_ptr = address(deref(map_it).second)
-        if is_maker_buy:
-            orders_rit = orders_collection_ptr.rbegin()
-            while orders_rit != orders_collection_ptr.rend():
+        orders_it = orders_collection_ptr.begin()
+        orders_rit = orders_collection_ptr.rbegin()
+        while trade_amount_filled < trade_amount:
+            if is_maker_buy:
+                if orders_rit == orders_collection_ptr.rend():
+                    break
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                order_price = float(<object>cpp_limit_order_ptr.getPrice())
+                if order_price < trade_price:
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleSymbolLimitOrdersIterator]>orders_rit))
+                orders_it = getIteratorFromReverseIterator(
+                    <reverse_iterator[SingleSymbolLimitOrdersIterator]>orders_rit)
                 inc(orders_rit)
-        else:
-            orders_it = orders_collection_ptr.begin()
-            while orders_it != orders_collection_ptr.end():
+            else:
+                if orders_it == orders_collection_ptr.end():
+                    break
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                order_price = float(<object>cpp_limit_order_ptr.getPrice())
+                if order_price > trade_price:
                     break
-                process_order_its.push_back(orders_it)
+
+            process_order_its.push_back(orders_it)
+            if order_price != trade_price:
+                fill_state = self._limit_order_fill_states.get(cpp_limit_order_ptr.getClientOrderID().decode("utf8"))
+                remaining_amount = <object>cpp_limit_order_ptr.getQuantity()
+                if fill_state is not None:
+                    remaining_amount -= fill_state._filled_amount
+                fill_amount = self.c_get_fill_amount(symbol, remaining_amount, trade_amount - trade_amount_filled)
+                trade_amount_filled += float(fill_amount)
+                fill_amounts.append(fill_amount)
+            else:
+                fill_amount = self.c_match_trade_at_order_price(
+                    order_book,
+                    is_maker_buy,
+                    symbol,
+                    cpp_limit_order_ptr.getClientOrderID().decode("utf8"),
+                    order_price,
+                    <object>cpp_limit_order_ptr.getQuantity(),
+                    trade_amount,
+                    trade_amount_filled
+                )
+                trade_amount_filled += float(fill_amount)
+                fill_amounts.append(fill_amount)
+            if not is_maker_buy:
                 inc(orders_it)
 
-        for orders_it in process_order_its:
-            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+        for i in range(process_order_its.size()):
+            if fill_amounts[i] > s_decimal_0:
+                self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), process_order_its[i],
+                                           fill_amounts[i])
+
+    cdef object c_match_trade_at_order_price(self,
+                                             OrderBook order_book,
+                                             bint is_bid,
+                                             str symbol,
+                                             str order_id,
+                                             double order_price,
+                                             object order_quantity,
+                                             double trade_amount,
+                                             double trade_amount_filled):
+        """
+        Matches a trade printed at a limit order's price against the order's queue position.
+
+        :param trade_amount: amount of the trade
+        :param trade_amount_filled: amount of the trade that has already filled other limit orders at the same price
+        :return: fill amount for the order
+        """
+        cdef:
+            LimitOrderFillState fill_state = self._limit_order_fill_states.get(order_id)
+            double queue_amount_traded
+
+        if fill_state is None:
+            return s_decimal_0
+
+        # Volume queued ahead of the order can only shrink - through trades or cancels. The order book may or may not
+        # reflect this trade already, so give it the benefit of the doubt.
+        fill_state._queue_ahead = min(fill_state._queue_ahead,
+                                      order_book.c_get_amount_at_price(is_bid, order_price) + trade_amount)
+        queue_amount_traded = min(fill_state._queue_ahead, trade_amount)
+        fill_state._queue_ahead -= queue_amount_traded
+
+        return self.c_get_fill_amount(symbol,
+                                      order_quantity - fill_state._filled_amount,
+                                      trade_amount - queue_amount_traded - trade_amount_filled)
 
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
-        return self.available_balances.get(currency.upper(), s_decimal_0)
+        currency = currency.upper()
+        if currency not in self._account_balances:
+            return s_decimal_0
+        return self._account_balances[currency] - self._on_hold_balances.get(currency, s_decimal_0)
 
     async def get_active_exchange_markets(self) -> pd.DataFrame:
         return await self._order_book_tracker.data_source.get_active_exchange_markets()
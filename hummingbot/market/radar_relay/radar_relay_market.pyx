@@ -44,6 +44,7 @@ from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
 )
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.market_base cimport MarketBase
 from hummingbot.market.market_base import (
@@ -547,28 +548,28 @@ cdef class RadarRelayMarket(MarketBase):
                            url: str,
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as client:
-            async with client.request(http_method,
-                                      url=url,
-                                      timeout=self.API_CALL_TIMEOUT,
-                                      data=data,
-                                      headers=headers) as response:
-                try:
-                    if response.status == 201:
-                        return response
-                    elif response.status == 200:
-                        response_json = await response.json()
-                        return response_json
-                    else:
-                        raise IOError
-                except Exception:
-                    if response.status == 502:
-                        raise IOError(f"Error fetching data from {url}. "
-                                      f"HTTP status is {response.status} - Server Error: Bad Gateway.")
-                    else:
-                        response_text = await response.text()
-                        raise IOError(f"Error fetching data from {url}. "
-                                      f"HTTP status is {response.status} - {response_text}.")
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        async with client.request(http_method,
+                                  url=url,
+                                  timeout=self.API_CALL_TIMEOUT,
+                                  data=data,
+                                  headers=headers) as response:
+            try:
+                if response.status == 201:
+                    return response
+                elif response.status == 200:
+                    response_json = await response.json()
+                    return response_json
+                else:
+                    raise IOError
+            except Exception:
+                if response.status == 502:
+                    raise IOError(f"Error fetching data from {url}. "
+                                  f"HTTP status is {response.status} - Server Error: Bad Gateway.")
+                else:
+                    response_text = await response.text()
+                    raise IOError(f"Error fetching data from {url}. "
+                                  f"HTTP status is {response.status} - {response_text}.")
 
     async def request_signed_market_orders(self, symbol: str, trade_type: TradeType, amount: str) -> Dict[str, Any]:
         if trade_type is TradeType.BUY:
@@ -23,6 +23,7 @@ cdef class ArbitrageStrategy(StrategyBase):
         object _exchange_rate_conversion
         int _failed_order_tolerance
         bint _cool_off_logged
+        bint _stale_exchange_rate_logged
         int _failed_market_order_count
         int _last_failed_market_order_timestamp
 
@@ -30,6 +31,9 @@ cdef class ArbitrageStrategy(StrategyBase):
     cdef c_process_market_pair(self, object market_pair)
     cdef c_process_market_pair_inner(self, object buy_market_symbol_pair, object sell_market_symbol_pair)
     cdef tuple c_find_best_profitable_amount(self, object buy_market_symbol_pair, object sell_market_symbol_pair)
+    cdef tuple c_find_best_profitable_amount_stepwise(self,
+                                                      object buy_market_symbol_pair,
+                                                      object sell_market_symbol_pair)
     cdef bint c_ready_for_new_orders(self, list market_symbol_pairs)
 
 cdef list c_find_profitable_arbitrage_orders(object min_profitability,
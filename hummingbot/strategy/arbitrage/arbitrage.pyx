@@ -19,6 +19,10 @@ from hummingbot.strategy import market_trading_pair_tuple
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.arbitrage.arbitrage_market_pair import ArbitrageMarketPair
+from hummingbot.strategy.arbitrage.arbitrage_depth_search import (
+    find_arbitrage_steps,
+    find_best_profitable_amount as find_best_profitable_amount_in_steps,
+)
 from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
 
 NaN = float("nan")
@@ -36,6 +40,8 @@ cdef class ArbitrageStrategy(StrategyBase):
     OPTION_LOG_ALL = 0xfffffffffffffff
     MARKET_ORDER_MAX_TRACKING_TIME = 60.0 * 10
     FAILED_ORDER_COOL_OFF_TIME = 60.0 * 30
+    # Number of order book levels the profitability search starts with. It looks deeper if they're all profitable.
+    ARBITRAGE_SEARCH_DEPTH = 50
 
     @classmethod
     def logger(cls):
@@ -73,6 +79,7 @@ cdef class ArbitrageStrategy(StrategyBase):
         self._last_trade_timestamps = {}
         self._failed_order_tolerance = failed_order_tolerance
         self._cool_off_logged = False
+        self._stale_exchange_rate_logged = False
 
         self._failed_market_order_count = 0
         self._last_failed_market_order_timestamp = 0
@@ -129,6 +136,7 @@ cdef class ArbitrageStrategy(StrategyBase):
                 lines.extend(["", "  No pending market orders."])
 
             warning_lines.extend(self.balance_warning([market_pair.first, market_pair.second]))
+            warning_lines.extend(self.exchange_rate_warning([market_pair.first, market_pair.second]))
 
         if len(warning_lines) > 0:
             lines.extend(["", "  *** WARNINGS ***"] + warning_lines)
@@ -248,13 +256,14 @@ cdef class ArbitrageStrategy(StrategyBase):
         :return: (double, double) that indicates profitability of arbitraging on each side
         """
         cdef:
-            object market_1_bid_price = ExchangeRateConversion.get_instance().adjust_token_rate(
+            object exchange_rate_snapshot = self.c_get_exchange_rate_snapshot()
+            object market_1_bid_price = exchange_rate_snapshot.adjust_token_rate(
                 market_pair.first.quote_asset, market_pair.first.get_price(False))
-            object market_1_ask_price = ExchangeRateConversion.get_instance().adjust_token_rate(
+            object market_1_ask_price = exchange_rate_snapshot.adjust_token_rate(
                 market_pair.first.quote_asset, market_pair.first.get_price(True))
-            object market_2_bid_price = ExchangeRateConversion.get_instance().adjust_token_rate(
+            object market_2_bid_price = exchange_rate_snapshot.adjust_token_rate(
                 market_pair.second.quote_asset, market_pair.second.get_price(False))
-            object market_2_ask_price = ExchangeRateConversion.get_instance().adjust_token_rate(
+            object market_2_ask_price = exchange_rate_snapshot.adjust_token_rate(
                 market_pair.second.quote_asset, market_pair.second.get_price(True))
         profitability_buy_2_sell_1 = market_1_bid_price / market_2_ask_price - 1
         profitability_buy_1_sell_2 = market_2_bid_price / market_1_ask_price - 1
@@ -268,6 +277,8 @@ cdef class ArbitrageStrategy(StrategyBase):
          1. There's an in-flight market order that's still being resolved.
          2. We're still within the cool-off period from the last trade, which means the exchange balances may be not
             accurate temporarily.
+         3. The exchange rates needed to compare the markets' prices haven't been updated by the data feeds for more
+            than EXCHANGE_RATE_MAX_AGE seconds.
 
         If none of the above conditions are matched, then we're ready for new orders.
 
@@ -277,6 +288,7 @@ cdef class ArbitrageStrategy(StrategyBase):
         cdef:
             double time_left
             dict tracked_taker_orders = self._sb_order_tracker.c_get_taker_orders()
+            list stale_assets
 
         ready_ts_from_failed_order = self._last_failed_market_order_timestamp + \
             self._failed_market_order_count * self.FAILED_ORDER_COOL_OFF_TIME
@@ -312,6 +324,23 @@ cdef class ArbitrageStrategy(StrategyBase):
                     self._cool_off_logged = True
                 return False
 
+        stale_assets = self.c_get_exchange_rate_snapshot().get_stale_assets(
+            [market_trading_pair_tuple.quote_asset for market_trading_pair_tuple in market_trading_pair_tuples],
+            self.EXCHANGE_RATE_MAX_AGE
+        )
+        if len(stale_assets) > 0:
+            if not self._stale_exchange_rate_logged:
+                self.log_with_clock(
+                    logging.WARNING,
+                    f"Exchange rates for {', '.join(stale_assets)} are out of date. "
+                    f"Resuming once they are updated by the data feeds."
+                )
+                self._stale_exchange_rate_logged = True
+            return False
+        elif self._stale_exchange_rate_logged:
+            self.log_with_clock(logging.INFO, f"Exchange rates are up to date again.")
+            self._stale_exchange_rate_logged = False
+
         if self._cool_off_logged:
             self.log_with_clock(
                 logging.INFO,
@@ -402,6 +431,101 @@ cdef class ArbitrageStrategy(StrategyBase):
         markets and the profitability ratio. This function accounts for trading fees required by both markets before
         arriving at the optimal order size and profitability ratio.
 
+        The search runs over float arrays of the top order book levels, only the results are converted to Decimal for
+        quantization. If step by step profitability logging is enabled, the step by step search is used instead.
+
+        :param buy_market_trading_pair_tuple: symbol pair for buy side
+        :param sell_market_trading_pair_tuple: symbol pair for sell side
+        :return: (order size, profitability ratio)
+        :rtype: Tuple[Decimal, Decimal]
+        """
+        cdef:
+            int depth = self.ARBITRAGE_SEARCH_DEPTH
+            double min_profitability = float(self._min_profitability)
+            double bid_rate
+            double ask_rate
+            double best_amount
+            double best_profitability
+            object buy_fee
+            object sell_fee
+            MarketBase buy_market = buy_market_trading_pair_tuple.market
+            MarketBase sell_market = sell_market_trading_pair_tuple.market
+            OrderBook buy_order_book = buy_market_trading_pair_tuple.order_book
+            OrderBook sell_order_book = sell_market_trading_pair_tuple.order_book
+            object exchange_rate_snapshot
+
+        if self._logging_options & (self.OPTION_LOG_PROFITABILITY_STEP | self.OPTION_LOG_INSUFFICIENT_ASSET):
+            return self.c_find_best_profitable_amount_stepwise(buy_market_trading_pair_tuple,
+                                                               sell_market_trading_pair_tuple)
+
+        exchange_rate_snapshot = self.c_get_exchange_rate_snapshot()
+        bid_rate = exchange_rate_snapshot.get_float_conversion_rate(sell_market_trading_pair_tuple.quote_asset)
+        ask_rate = exchange_rate_snapshot.get_float_conversion_rate(buy_market_trading_pair_tuple.quote_asset)
+
+        while True:
+            bids, _ = sell_order_book.get_numpy_snapshot(depth)
+            _, asks = buy_order_book.get_numpy_snapshot(depth)
+            steps = find_arbitrage_steps(bids, asks, bid_rate, ask_rate, min_profitability)
+            # Look deeper into the order books if every level fetched so far is still profitable.
+            if not steps.depth_exhausted or (len(bids) < depth and len(asks) < depth):
+                break
+            depth *= 4
+
+        if len(steps.amounts) == 0:
+            return s_decimal_0, s_decimal_0
+
+        # None of the markets' fees depend on the order amount or price, so they are only calculated once.
+        buy_fee = buy_market.c_get_fee(
+            buy_market_trading_pair_tuple.base_asset,
+            buy_market_trading_pair_tuple.quote_asset,
+            OrderType.MARKET,
+            TradeType.BUY,
+            Decimal(repr(float(steps.amounts[0]))),
+            Decimal(repr(float(steps.ask_prices[0])))
+        )
+        sell_fee = sell_market.c_get_fee(
+            sell_market_trading_pair_tuple.base_asset,
+            sell_market_trading_pair_tuple.quote_asset,
+            OrderType.MARKET,
+            TradeType.SELL,
+            Decimal(repr(float(steps.amounts[0]))),
+            Decimal(repr(float(steps.bid_prices[0])))
+        )
+        best_amount, best_profitability = find_best_profitable_amount_in_steps(
+            steps,
+            min_profitability,
+            float(buy_fee.percent),
+            float(sell_fee.percent),
+            float(self.c_sum_flat_fees(buy_market_trading_pair_tuple.quote_asset, buy_fee.flat_fees)),
+            float(self.c_sum_flat_fees(sell_market_trading_pair_tuple.quote_asset, sell_fee.flat_fees)),
+            float(buy_market.c_get_available_balance(buy_market_trading_pair_tuple.quote_asset)),
+            float(sell_market.c_get_available_balance(sell_market_trading_pair_tuple.base_asset))
+        )
+
+        if self._logging_options & self.OPTION_LOG_FULL_PROFITABILITY_STEP:
+            self.log_with_clock(
+                logging.DEBUG,
+                "\n" + pd.DataFrame(
+                    data={
+                        "raw_profitability": steps.bid_prices_adjusted / steps.ask_prices_adjusted,
+                        "bid_price_adjusted": steps.bid_prices_adjusted,
+                        "ask_price_adjusted": steps.ask_prices_adjusted,
+                        "bid_price": steps.bid_prices,
+                        "ask_price": steps.ask_prices,
+                        "step_amount": steps.amounts
+                    }
+                ).to_string()
+            )
+
+        return Decimal(repr(best_amount)), Decimal(repr(best_profitability))
+
+    cdef tuple c_find_best_profitable_amount_stepwise(self,
+                                                      object buy_market_trading_pair_tuple,
+                                                      object sell_market_trading_pair_tuple):
+        """
+        Step by step version of c_find_best_profitable_amount(), which walks both order books level by level with
+        Decimal arithmetic. It's used when the profitability of every step needs to be logged.
+
         :param buy_market_trading_pair_tuple: symbol pair for buy side
         :param sell_market_trading_pair_tuple: symbol pair for sell side
         :return: (order size, profitability ratio)
@@ -526,6 +650,11 @@ cdef class ArbitrageStrategy(StrategyBase):
     def find_best_profitable_amount(self, buy_market: MarketTradingPairTuple, sell_market: MarketTradingPairTuple):
         return self.c_find_best_profitable_amount(buy_market, sell_market)
 
+    def find_best_profitable_amount_stepwise(self,
+                                             buy_market: MarketTradingPairTuple,
+                                             sell_market: MarketTradingPairTuple):
+        return self.c_find_best_profitable_amount_stepwise(buy_market, sell_market)
+
     def ready_for_new_orders(self, market_pair):
         return self.c_ready_for_new_orders(market_pair)
     # ---------------------------------------------------------------
@@ -560,6 +689,7 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
         object current_ask_price_adjusted
         str sell_market_quote_asset = sell_market_trading_pair_tuple.quote_asset
         str buy_market_quote_asset = buy_market_trading_pair_tuple.quote_asset
+        object exchange_rate_snapshot = ExchangeRateConversion.get_instance().get_snapshot()
 
     profitable_orders = []
     bid_it = sell_market_trading_pair_tuple.order_book_bid_entries()
@@ -592,9 +722,9 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
                 break
 
             # adjust price based on the quote token rates
-            current_bid_price_adjusted = ExchangeRateConversion.get_instance().adjust_token_rate(
+            current_bid_price_adjusted = exchange_rate_snapshot.adjust_token_rate(
                 sell_market_quote_asset, current_bid.price)
-            current_ask_price_adjusted = ExchangeRateConversion.get_instance().adjust_token_rate(
+            current_ask_price_adjusted = exchange_rate_snapshot.adjust_token_rate(
                 buy_market_quote_asset, current_ask.price)
             # arbitrage not possible
             if current_bid_price_adjusted < current_ask_price_adjusted:
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+import numpy as np
+from typing import (
+    NamedTuple,
+    Tuple,
+)
+
+# Cumulative amounts closer than this (relative to the larger one) are treated as the same step boundary, so float
+# rounding in the cumulative sums doesn't produce dust steps.
+STEP_BOUNDARY_TOLERANCE = 1e-12
+
+
+class ArbitrageSteps(NamedTuple):
+    """
+    The matched steps between the bids of the sell market and the asks of the buy market, in float arrays. This is the
+    vectorized equivalent of the list returned by `c_find_profitable_arbitrage_orders()`.
+    """
+    bid_prices_adjusted: np.ndarray
+    ask_prices_adjusted: np.ndarray
+    bid_prices: np.ndarray
+    ask_prices: np.ndarray
+    amounts: np.ndarray
+    # True if every step that could be matched from the given levels is profitable, i.e. deeper levels in the order
+    # books may still be profitable.
+    depth_exhausted: bool
+
+
+def find_arbitrage_steps(bids: np.ndarray,
+                         asks: np.ndarray,
+                         bid_rate: float,
+                         ask_rate: float,
+                         min_profitability: float) -> ArbitrageSteps:
+    """
+    Matches the bids of the sell market against the asks of the buy market, and returns the steps for which the
+    rate adjusted bid price is not below the adjusted ask price.
+
+    :param bids: bid levels of the sell market, best first. The first two columns are price and amount.
+    :param asks: ask levels of the buy market, best first. The first two columns are price and amount.
+    :param bid_rate: exchange rate multiplier of the sell market's quote asset
+    :param ask_rate: exchange rate multiplier of the buy market's quote asset
+    :param min_profitability: negative values stop matching at steps below that profitability, for debugging
+    """
+    empty: np.ndarray = np.zeros(0, dtype="float64")
+    if len(bids) == 0 or len(asks) == 0:
+        return ArbitrageSteps(empty, empty, empty, empty, empty, False)
+
+    cumulative_bid_amounts: np.ndarray = np.cumsum(bids[:, 1])
+    cumulative_ask_amounts: np.ndarray = np.cumsum(asks[:, 1])
+    max_amount: float = min(cumulative_bid_amounts[-1], cumulative_ask_amounts[-1])
+
+    # Every step ends where either a bid level or an ask level is used up.
+    boundaries: np.ndarray = np.union1d(cumulative_bid_amounts, cumulative_ask_amounts)
+    boundaries = boundaries[boundaries <= max_amount * (1 + STEP_BOUNDARY_TOLERANCE)]
+    if len(boundaries) > 1:
+        keep: np.ndarray = np.ones(len(boundaries), dtype=bool)
+        keep[1:] = np.diff(boundaries) > boundaries[1:] * STEP_BOUNDARY_TOLERANCE
+        boundaries = boundaries[keep]
+    boundaries = boundaries[boundaries > 0]
+
+    bid_indices: np.ndarray = np.minimum(
+        np.searchsorted(cumulative_bid_amounts, boundaries * (1 - STEP_BOUNDARY_TOLERANCE), side="left"),
+        len(bids) - 1
+    )
+    ask_indices: np.ndarray = np.minimum(
+        np.searchsorted(cumulative_ask_amounts, boundaries * (1 - STEP_BOUNDARY_TOLERANCE), side="left"),
+        len(asks) - 1
+    )
+    bid_prices: np.ndarray = bids[bid_indices, 0]
+    ask_prices: np.ndarray = asks[ask_indices, 0]
+    bid_prices_adjusted: np.ndarray = bid_prices * bid_rate
+    ask_prices_adjusted: np.ndarray = ask_prices * ask_rate
+    amounts: np.ndarray = np.diff(boundaries, prepend=0.0)
+
+    unprofitable: np.ndarray = bid_prices_adjusted < ask_prices_adjusted
+    if min_profitability < 0:
+        # Allow negative profitability for debugging.
+        unprofitable |= bid_prices_adjusted / ask_prices_adjusted < (1 + min_profitability)
+    num_steps: int = int(np.argmax(unprofitable)) if unprofitable.any() else len(amounts)
+
+    return ArbitrageSteps(bid_prices_adjusted[:num_steps],
+                          ask_prices_adjusted[:num_steps],
+                          bid_prices[:num_steps],
+                          ask_prices[:num_steps],
+                          amounts[:num_steps],
+                          num_steps == len(amounts))
+
+
+def find_best_profitable_amount(steps: ArbitrageSteps,
+                                min_profitability: float,
+                                buy_fee_percent: float,
+                                sell_fee_percent: float,
+                                buy_flat_fees: float,
+                                sell_flat_fees: float,
+                                buy_market_quote_balance: float,
+                                sell_market_base_balance: float) -> Tuple[float, float]:
+    """
+    Vectorized equivalent of the step walk in `ArbitrageStrategy.c_find_best_profitable_amount()`. Fees are given
+    once per market - none of the markets' fees depend on the order amount or price.
+
+    :return: (order size, profitability ratio)
+    """
+    if len(steps.amounts) == 0:
+        return 0.0, 0.0
+
+    cumulative_amounts: np.ndarray = np.cumsum(steps.amounts)
+    net_sell_proceeds: np.ndarray = (np.cumsum(steps.bid_prices_adjusted * steps.amounts) * (1 - sell_fee_percent) -
+                                     sell_flat_fees)
+    net_buy_costs: np.ndarray = (np.cumsum(steps.ask_prices_adjusted * steps.amounts) * (1 + buy_fee_percent) +
+                                 buy_flat_fees)
+    profitability: np.ndarray = net_sell_proceeds / net_buy_costs
+    min_ratio: float = 1 + min_profitability
+
+    insufficient_balance: np.ndarray = ((buy_market_quote_balance < net_buy_costs) |
+                                        (sell_market_base_balance < cumulative_amounts))
+    last_step: int = int(np.argmax(insufficient_balance)) if insufficient_balance.any() else len(cumulative_amounts)
+
+    if last_step < len(cumulative_amounts) and profitability[last_step] >= min_ratio:
+        # Still profitable when the balance runs out - buy and sell as much as the balances allow.
+        buy_market_adjusted_order_size: float = float((buy_market_quote_balance / steps.ask_prices[last_step] -
+                                                       buy_flat_fees) / (1 + buy_fee_percent))
+        return (float(min(sell_market_base_balance, buy_market_adjusted_order_size)),
+                float(profitability[last_step]))
+
+    # Otherwise, the largest profitable amount before the balance runs out.
+    profitable_steps: np.ndarray = np.nonzero(profitability[:last_step] > min_ratio)[0]
+    if len(profitable_steps) == 0:
+        return 0.0, 0.0
+    best_step: int = int(profitable_steps[-1])
+    return float(cumulative_amounts[best_step]), float(profitability[best_step])
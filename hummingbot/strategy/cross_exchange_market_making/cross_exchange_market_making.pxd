@@ -6,6 +6,15 @@ from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.strategy.strategy_base cimport StrategyBase
 from .order_id_market_pair_tracker cimport OrderIDMarketPairTracker
 
+cdef class TakerPriceCurve:
+    cdef:
+        public OrderBook order_book
+        public int64_t order_book_version
+        public dict prices
+        public object exchange_rate_snapshot
+        public dict converted_prices
+
+
 cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
     cdef:
         set _maker_markets
@@ -32,6 +41,9 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         int64_t _logging_options
         object _exchange_rate_conversion
         OrderIDMarketPairTracker _market_pair_tracker
+        dict _taker_price_curves
+        int64_t _taker_price_cache_hits
+        int64_t _taker_price_cache_misses
 
     cdef c_process_market_pair(self,
                                object market_pair,
@@ -65,6 +77,11 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                                            object market_pair,
                                            LimitOrder active_order)
 
+    cdef object c_get_taker_price(self,
+                                  object market_pair,
+                                  bint is_buy,
+                                  object size,
+                                  bint convert_quote=*)
     cdef tuple c_get_top_bid_ask(self,
                                  object market_pair)
     cdef tuple c_get_top_bid_ask_from_price_samples(self,
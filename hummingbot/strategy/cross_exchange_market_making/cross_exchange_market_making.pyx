@@ -1,7 +1,4 @@
-from collections import (
-    defaultdict,
-    deque
-)
+from collections import deque
 from decimal import Decimal
 import logging
 from math import (
@@ -10,6 +7,7 @@ from math import (
 )
 from numpy import isnan
 from typing import (
+    Dict,
     List,
     Tuple,
     Optional
@@ -24,6 +22,7 @@ from hummingbot.market.market_base import (
     MarketBase,
     OrderType
 )
+from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.strategy.strategy_base cimport StrategyBase
 from hummingbot.strategy.strategy_base import StrategyBase
@@ -38,6 +37,19 @@ s_decimal_nan = Decimal("nan")
 s_logger = None
 
 
+cdef class TakerPriceCurve:
+    """
+    Hedging prices on one side of a taker order book, by order size. The prices are only valid for the order book
+    version they were calculated at.
+    """
+    def __init__(self, OrderBook order_book):
+        self.order_book = order_book
+        self.order_book_version = order_book._version
+        self.prices = {}
+        self.exchange_rate_snapshot = None
+        self.converted_prices = {}
+
+
 cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
     OPTION_LOG_NULL_ORDER_SIZE = 1 << 0
     OPTION_LOG_REMOVING_ORDER = 1 << 1
@@ -132,6 +144,9 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         self._exchange_rate_conversion = ExchangeRateConversion.get_instance()
         self._market_pair_tracker = OrderIDMarketPairTracker()
         self._adjust_orders_enabled = adjust_order_enabled
+        self._taker_price_curves = {}
+        self._taker_price_cache_hits = 0
+        self._taker_price_cache_misses = 0
 
         cdef:
             list all_markets = list(self._maker_markets | self._taker_markets)
@@ -166,6 +181,20 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
     def exchange_rate_conversion(self) -> ExchangeRateConversion:
         return self._exchange_rate_conversion
 
+    @property
+    def taker_price_cache_stats(self) -> Dict[str, float]:
+        cdef:
+            int64_t total = self._taker_price_cache_hits + self._taker_price_cache_misses
+        return {
+            "hits": self._taker_price_cache_hits,
+            "misses": self._taker_price_cache_misses,
+            "hit_rate": self._taker_price_cache_hits / total if total > 0 else 0.0
+        }
+
+    def reset_taker_price_cache_stats(self):
+        self._taker_price_cache_hits = 0
+        self._taker_price_cache_misses = 0
+
     def format_status(self) -> str:
         cdef:
             list lines = []
@@ -204,6 +233,11 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                 lines.extend(["", "  No active maker orders."])
 
             warning_lines.extend(self.balance_warning([market_pair.maker, market_pair.taker]))
+            warning_lines.extend(self.exchange_rate_warning([market_pair.maker, market_pair.taker]))
+
+        cache_stats = self.taker_price_cache_stats
+        lines.extend(["", f"  Taker price cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                          f"({cache_stats['hit_rate']:.1%} hit rate)"])
 
         if len(warning_lines) > 0:
             lines.extend(["", "  *** WARNINGS ***"] + warning_lines)
@@ -259,7 +293,6 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
             int64_t last_tick = <int64_t>(self._last_timestamp // self._status_report_interval)
             bint should_report_warnings = ((current_tick > last_tick) and
                                            (self._logging_options & self.OPTION_LOG_STATUS_REPORT))
-            list active_maker_orders = self.active_maker_orders
             LimitOrder limit_order
 
         try:
@@ -284,26 +317,37 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                     self.logger().warning(f"WARNING: Some markets are not connected or are down at the moment. Market "
                                           f"making may be dangerous when markets or networks are unstable.")
 
-            # Calculate a mapping from market pair to list of active limit orders on the market.
-            market_pair_to_active_orders = defaultdict(list)
-
-            for maker_market, limit_order in active_maker_orders:
-                market_pair = self._market_pairs.get((maker_market, limit_order.symbol))
-                if market_pair is None:
-                    self.log_with_clock(logging.WARNING,
-                                        f"The in-flight maker order in for the symbol '{limit_order.symbol}' "
-                                        f"does not correspond to any whitelisted market pairs. Skipping.")
-                    continue
-
-                if not self._sb_order_tracker.c_has_in_flight_cancel(limit_order.client_order_id):
-                    market_pair_to_active_orders[market_pair].append(limit_order)
+            # The order tracker keeps the active limit orders indexed by maker market pair, without the orders that
+            # are being cancelled.
+            market_pair_to_active_orders = self._sb_order_tracker.market_pair_to_active_orders
 
             # Process each market pair independently.
             for market_pair in self._market_pairs.values():
-                self.c_process_market_pair(market_pair, market_pair_to_active_orders[market_pair])
+                self.c_process_market_pair(market_pair, market_pair_to_active_orders.get(market_pair.maker, []))
         finally:
             self._last_timestamp = timestamp
 
+    cdef list c_get_order_book_triggers(self):
+        cdef:
+            list retval = []
+        for market_pair in self._market_pairs.values():
+            retval.append((market_pair.maker.order_book, market_pair))
+            retval.append((market_pair.taker.order_book, market_pair))
+        return retval
+
+    cdef c_process_order_book_trigger(self, object market_pair):
+        """
+        Event tick entry point, when the top of the maker or taker order book of a market pair has changed.
+
+        :param market_pair: cross exchange market pair
+        """
+        if not self._all_markets_ready:
+            return
+        self.c_process_market_pair(
+            market_pair,
+            self._sb_order_tracker.c_get_market_pair_to_active_orders().get(market_pair.maker, [])
+        )
+
     cdef c_process_market_pair(self, object market_pair, list active_orders):
         """
         For market pair being managed by this strategy object, do the following:
@@ -704,9 +748,8 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
 
             user_order = self.c_get_adjusted_limit_order_size(market_pair)
 
-            try:
-                taker_price = taker_market.c_get_vwap_for_volume(taker_trading_pair, False, user_order).result_price
-            except ZeroDivisionError:
+            taker_price = self.c_get_taker_price(market_pair, False, user_order, False)
+            if taker_price is None:
                 top_ask_price = market_pair.taker.get_price(True)
                 taker_price = top_ask_price
 
@@ -724,9 +767,8 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
 
             user_order = self.c_get_adjusted_limit_order_size(market_pair)
 
-            try:
-                taker_price = taker_market.c_get_vwap_for_volume(taker_trading_pair, True, user_order).result_price
-            except ZeroDivisionError:
+            taker_price = self.c_get_taker_price(market_pair, True, user_order, False)
+            if taker_price is None:
                 top_bid_price = taker_market.c_get_price(taker_trading_pair, True)
                 taker_price = top_bid_price
 
@@ -771,17 +813,11 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                 )
                 price_above_bid = (ceil(top_bid_price / price_quantum) + 1) * price_quantum
 
-            try:
-                taker_price = taker_market.c_get_vwap_for_volume(taker_trading_pair, False, size).result_price
-            except ZeroDivisionError:
+            # The taker price is converted to maker's quote asset if the quote assets are not the same
+            taker_price = self.c_get_taker_price(market_pair, False, size)
+            if taker_price is None:
                 return s_decimal_nan
 
-            # If quote assets are not same, convert them from taker's quote asset to maker's quote asset
-            if market_pair.maker.quote_asset != market_pair.taker.quote_asset:
-                taker_price *= self._exchange_rate_conversion.convert_token_value_decimal(1,
-                                                                                          market_pair.taker.quote_asset,
-                                                                                          market_pair.maker.quote_asset)
-
             # you are buying on the maker market and selling on the taker market
             maker_price = taker_price / (1 + self._min_profitability)
 
@@ -809,16 +845,11 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                 )
                 next_price_below_top_ask = (floor(top_ask_price / price_quantum) - 1) * price_quantum
 
-            try:
-                taker_price = taker_market.c_get_vwap_for_volume(taker_trading_pair, True, size).result_price
-            except ZeroDivisionError:
+            # The taker price is converted to maker's quote asset if the quote assets are not the same
+            taker_price = self.c_get_taker_price(market_pair, True, size)
+            if taker_price is None:
                 return s_decimal_nan
 
-            if market_pair.maker.quote_asset != market_pair.taker.quote_asset:
-                taker_price *= self._exchange_rate_conversion.convert_token_value_decimal(1,
-                                                                                          market_pair.taker.quote_asset,
-                                                                                          market_pair.maker.quote_asset)
-
             # You are buying on the taker market and selling on the maker market
             maker_price = taker_price * (1 + self._min_profitability)
 
@@ -859,36 +890,67 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         :param size: The size of the maker order.
         :return: a Decimal which is the hedging price
         """
-        cdef:
-            str taker_trading_pair = market_pair.taker.trading_pair
-            MarketBase taker_market = market_pair.taker.market
-        # Calculate the next price from the top, and the order size limit.
-        if is_bid:
-            try:
-                taker_price = taker_market.c_get_vwap_for_volume(taker_trading_pair, False, size).result_price
-            except ZeroDivisionError:
-                return None
+        # A maker bid is hedged by selling on the taker market, and a maker ask by buying on it. The taker price is
+        # converted to maker's quote asset if the quote assets are not the same.
+        return self.c_get_taker_price(market_pair, not is_bid, size)
+
+    cdef object c_get_taker_price(self, object market_pair, bint is_buy, object size, bint convert_quote=True):
+        """
+        Get the VWAP for trading a given size on the taker market, from a cache of taker price curves.
 
-            # If quote assets are not same, convert them from taker's quote asset to maker's quote asset
-            if market_pair.maker.quote_asset != market_pair.taker.quote_asset:
-                taker_price *= self._exchange_rate_conversion.convert_token_value_decimal(1,
-                                                                                          market_pair.taker.quote_asset,
-                                                                                          market_pair.maker.quote_asset)
+        The curves are only rebuilt after the taker order book has changed, so repeated queries for the same size and
+        side within a tick, or across ticks when the order book hasn't changed, don't have to go through the order book
+        again. Converted prices are also kept for as long as the exchange rate snapshot stays the same.
 
-            return taker_price
+        :param market_pair: cross exchange market pair
+        :param is_buy: whether the trade on the taker market is a buy or a sell
+        :param size: size of the taker trade
+        :param convert_quote: whether to convert the price from taker's quote asset to maker's quote asset
+        :return: a Decimal which is the taker price, or None if the taker order book can't fill the size
+        """
+        cdef:
+            object taker_market_info = market_pair.taker
+            MarketBase taker_market = taker_market_info.market
+            OrderBook taker_order_book = taker_market.c_get_order_book(taker_market_info.trading_pair)
+            tuple curve_key = (taker_market_info, is_buy)
+            TakerPriceCurve curve = self._taker_price_curves.get(curve_key)
+            object exchange_rate_snapshot
+            object taker_price
+
+        if (curve is None or
+                curve.order_book is not taker_order_book or
+                curve.order_book_version != taker_order_book._version):
+            curve = TakerPriceCurve(taker_order_book)
+            self._taker_price_curves[curve_key] = curve
+
+        if size in curve.prices:
+            self._taker_price_cache_hits += 1
+            taker_price = curve.prices[size]
         else:
+            self._taker_price_cache_misses += 1
             try:
-                taker_price = taker_market.c_get_vwap_for_volume(taker_trading_pair, True, size).result_price
+                taker_price = taker_market.c_get_vwap_for_volume(taker_market_info.trading_pair,
+                                                                 is_buy,
+                                                                 size).result_price
             except ZeroDivisionError:
-                return None
-
-            if market_pair.maker.quote_asset != market_pair.taker.quote_asset:
-                taker_price *= self._exchange_rate_conversion.convert_token_value_decimal(1,
-                                                                                          market_pair.taker.quote_asset,
-                                                                                          market_pair.maker.quote_asset)
+                taker_price = None
+            curve.prices[size] = taker_price
 
+        if (taker_price is None or
+                not convert_quote or
+                market_pair.maker.quote_asset == taker_market_info.quote_asset):
             return taker_price
 
+        exchange_rate_snapshot = self.c_get_exchange_rate_snapshot()
+        if curve.exchange_rate_snapshot is not exchange_rate_snapshot:
+            curve.exchange_rate_snapshot = exchange_rate_snapshot
+            curve.converted_prices = {}
+        if size not in curve.converted_prices:
+            curve.converted_prices[size] = taker_price * exchange_rate_snapshot.convert_token_value_decimal(
+                1, taker_market_info.quote_asset, market_pair.maker.quote_asset
+            )
+        return curve.converted_prices[size]
+
     cdef tuple c_get_suggested_price_samples(self, object market_pair):
         """
         Get the queues of order book price samples for a market pair.
@@ -1097,7 +1159,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                         True,
                         bid_size
                     )
-                    effective_hedging_price_adjusted = self._exchange_rate_conversion.adjust_token_rate(
+                    effective_hedging_price_adjusted = self.c_get_exchange_rate_snapshot().adjust_token_rate(
                         market_pair.taker.quote_asset, effective_hedging_price
                     )
                     if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
@@ -1143,7 +1205,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                         False,
                         ask_size
                     )
-                    effective_hedging_price_adjusted = self._exchange_rate_conversion.adjust_token_rate(
+                    effective_hedging_price_adjusted = self.c_get_exchange_rate_snapshot().adjust_token_rate(
                         market_pair.maker.quote_asset, effective_hedging_price
                     )
                     if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
@@ -13,6 +13,13 @@ cdef class OrderTracker(TimeIterator):
         dict _shadow_order_id_to_market_pair
         object _shadow_gc_requests
         object _in_flight_cancels
+        bint _exclude_in_flight_cancels
+        dict _active_maker_orders
+        set _changed_market_pairs
+        dict _market_pair_to_active_orders
+        list _active_maker_orders_list
+        list _active_bids_list
+        list _active_asks_list
 
     cdef dict c_get_maker_orders(self)
     cdef dict c_get_taker_orders(self)
@@ -30,3 +37,8 @@ cdef class OrderTracker(TimeIterator):
     cdef c_start_tracking_market_order(self, object market_pair, str order_id, bint is_buy, object quantity)
     cdef c_stop_tracking_market_order(self, object market_pair, str order_id)
     cdef c_check_and_cleanup_shadow_records(self)
+    cdef c_expire_in_flight_cancels(self)
+    cdef c_add_active_order(self, object market_pair, LimitOrder limit_order)
+    cdef c_remove_active_order(self, object market_pair, str order_id)
+    cdef dict c_get_market_pair_to_active_orders(self)
+    cdef list c_get_active_maker_orders(self)
@@ -2,6 +2,8 @@ from collections import (
     deque,
     OrderedDict
 )
+from decimal import Decimal
+from math import isnan
 import pandas as pd
 from typing import (
     Dict,
@@ -35,46 +37,57 @@ cdef class OrderTracker(TimeIterator):
         self._shadow_gc_requests = deque()
         self._in_flight_cancels = OrderedDict()
 
+        # Whether orders with in flight cancels are left out of the active orders.
+        self._exclude_in_flight_cancels = True
+
+        # Incremental index of the active maker orders, and the order lists derived from it. The lists are only
+        # rebuilt after the orders under them have changed.
+        self._active_maker_orders = {}
+        self._changed_market_pairs = set()
+        self._market_pair_to_active_orders = {}
+        self._active_maker_orders_list = None
+        self._active_bids_list = None
+        self._active_asks_list = None
+
     @property
     def active_maker_orders(self) -> List[Tuple[MarketBase, LimitOrder]]:
-        maker_orders = []
-        for market_pair, orders_map in self._tracked_maker_orders.items():
-            for limit_order in orders_map.values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
-                    continue
-                maker_orders.append((market_pair.market, limit_order))
-        return maker_orders
+        """
+        The returned list is cached between order changes, and must not be modified by the caller.
+        """
+        return self.c_get_active_maker_orders()
 
     @property
     def shadow_maker_orders(self) -> List[Tuple[MarketBase, LimitOrder]]:
         maker_orders = []
         for market_pair, orders_map in self._shadow_tracked_maker_orders.items():
             for limit_order in orders_map.values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
+                if self._exclude_in_flight_cancels and self.c_has_in_flight_cancel(limit_order.client_order_id):
                     continue
                 maker_orders.append((market_pair.market, limit_order))
         return maker_orders
 
     @property
     def market_pair_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
-        market_pair_to_orders = {}
-        market_pairs = self._tracked_maker_orders.keys()
-        for market_pair in market_pairs:
-            maker_orders = []
-            for limit_order in self._tracked_maker_orders[market_pair].values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
-                    continue
-                maker_orders.append(limit_order)
-            market_pair_to_orders[market_pair] = maker_orders
-        return market_pair_to_orders
+        """
+        The returned order lists are cached between order changes, and must not be modified by the caller.
+        """
+        return dict(self.c_get_market_pair_to_active_orders())
 
     @property
     def active_bids(self) -> List[Tuple[MarketBase, LimitOrder]]:
-        return [(market, limit_order) for market, limit_order in self.active_maker_orders if limit_order.is_buy]
+        if self._active_bids_list is None:
+            self._active_bids_list = [(market, limit_order)
+                                      for market, limit_order in self.c_get_active_maker_orders()
+                                      if limit_order.is_buy]
+        return self._active_bids_list
 
     @property
     def active_asks(self) -> List[Tuple[MarketBase, LimitOrder]]:
-        return [(market, limit_order) for market, limit_order in self.active_maker_orders if not limit_order.is_buy]
+        if self._active_asks_list is None:
+            self._active_asks_list = [(market, limit_order)
+                                      for market, limit_order in self.c_get_active_maker_orders()
+                                      if not limit_order.is_buy]
+        return self._active_asks_list
 
     @property
     def tracked_taker_orders(self) -> List[Tuple[MarketBase, MarketOrder]]:
@@ -95,8 +108,19 @@ cdef class OrderTracker(TimeIterator):
     def in_flight_cancels(self) -> Dict[str, float]:
         return self._in_flight_cancels
 
+    def start_tracking_limit_order(self, market_pair: MarketTradingPairTuple, order_id: str, is_buy: bool,
+                                   price: Decimal, quantity: Decimal):
+        self.c_start_tracking_limit_order(market_pair, order_id, is_buy, price, quantity)
+
+    def stop_tracking_limit_order(self, market_pair: MarketTradingPairTuple, order_id: str):
+        self.c_stop_tracking_limit_order(market_pair, order_id)
+
+    def check_and_track_cancel(self, order_id: str) -> bool:
+        return self.c_check_and_track_cancel(order_id)
+
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
+        self.c_expire_in_flight_cancels()
         self.c_check_and_cleanup_shadow_records()
 
     cdef dict c_get_maker_orders(self):
@@ -116,23 +140,93 @@ cdef class OrderTracker(TimeIterator):
         :param order_id: the order id to be cancelled
         :return: True if there's no existing in flight cancel for the order id, False otherwise.
         """
-        cdef:
-            list keys_to_delete = []
-
         # Maintain the cancel expiry time invariant.
-        for k, cancel_timestamp in self._in_flight_cancels.items():
-            if cancel_timestamp < self._current_timestamp - self.CANCEL_EXPIRY_DURATION:
-                keys_to_delete.append(k)
-        for k in keys_to_delete:
-            del self._in_flight_cancels[k]
+        self.c_expire_in_flight_cancels()
 
-        if order_id in self.in_flight_cancels:
+        if order_id in self._in_flight_cancels:
             return False
 
         # Track the cancel.
         self._in_flight_cancels[order_id] = self._current_timestamp
+        if self._exclude_in_flight_cancels and self.c_has_in_flight_cancel(order_id):
+            market_pair = self._order_id_to_market_pair.get(order_id)
+            if market_pair is not None:
+                self.c_remove_active_order(market_pair, order_id)
         return True
 
+    cdef c_expire_in_flight_cancels(self):
+        """
+        Removes the expired in flight cancels, and puts the orders under them back into the active orders.
+
+        In flight cancels are kept in the order they were made, so only the oldest ones need to be checked.
+        """
+        cdef:
+            double expiry_timestamp = self._current_timestamp - self.CANCEL_EXPIRY_DURATION
+            str order_id
+            double cancel_timestamp
+            object market_pair
+            LimitOrder limit_order
+
+        if isnan(self._current_timestamp):
+            return
+        while len(self._in_flight_cancels) > 0:
+            order_id = next(iter(self._in_flight_cancels))
+            cancel_timestamp = self._in_flight_cancels[order_id]
+            if cancel_timestamp > expiry_timestamp:
+                break
+            del self._in_flight_cancels[order_id]
+            if self._exclude_in_flight_cancels:
+                market_pair = self._order_id_to_market_pair.get(order_id)
+                limit_order = self.c_get_limit_order(market_pair, order_id)
+                if limit_order is not None:
+                    self.c_add_active_order(market_pair, limit_order)
+
+    cdef c_add_active_order(self, object market_pair, LimitOrder limit_order):
+        if market_pair not in self._active_maker_orders:
+            self._active_maker_orders[market_pair] = {}
+        self._active_maker_orders[market_pair][limit_order.client_order_id] = limit_order
+        self._changed_market_pairs.add(market_pair)
+
+    cdef c_remove_active_order(self, object market_pair, str order_id):
+        cdef:
+            dict orders_map = self._active_maker_orders.get(market_pair)
+
+        if orders_map is None or order_id not in orders_map:
+            return
+        del orders_map[order_id]
+        if len(orders_map) < 1:
+            del self._active_maker_orders[market_pair]
+        self._changed_market_pairs.add(market_pair)
+
+    cdef dict c_get_market_pair_to_active_orders(self):
+        cdef:
+            dict orders_map
+
+        if len(self._changed_market_pairs) > 0:
+            # Rebuild the lists of the changed market pairs only. The old lists are replaced rather than modified,
+            # so lists handed out earlier stay valid while the caller goes through them.
+            for market_pair in self._changed_market_pairs:
+                orders_map = self._active_maker_orders.get(market_pair)
+                if orders_map is None:
+                    self._market_pair_to_active_orders.pop(market_pair, None)
+                else:
+                    self._market_pair_to_active_orders[market_pair] = list(orders_map.values())
+            self._changed_market_pairs.clear()
+            self._active_maker_orders_list = None
+            self._active_bids_list = None
+            self._active_asks_list = None
+        return self._market_pair_to_active_orders
+
+    cdef list c_get_active_maker_orders(self):
+        cdef:
+            dict market_pair_to_active_orders = self.c_get_market_pair_to_active_orders()
+
+        if self._active_maker_orders_list is None:
+            self._active_maker_orders_list = [(market_pair.market, limit_order)
+                                              for market_pair, limit_orders in market_pair_to_active_orders.items()
+                                              for limit_order in limit_orders]
+        return self._active_maker_orders_list
+
     cdef object c_get_market_pair_from_order_id(self, str order_id):
         return self._order_id_to_market_pair.get(order_id)
 
@@ -170,12 +264,15 @@ cdef class OrderTracker(TimeIterator):
         self._shadow_tracked_maker_orders[market_pair][order_id] = limit_order
         self._order_id_to_market_pair[order_id] = market_pair
         self._shadow_order_id_to_market_pair[order_id] = market_pair
+        if not (self._exclude_in_flight_cancels and self.c_has_in_flight_cancel(order_id)):
+            self.c_add_active_order(market_pair, limit_order)
 
     cdef c_stop_tracking_limit_order(self, object market_pair, str order_id):
         if market_pair in self._tracked_maker_orders and order_id in self._tracked_maker_orders[market_pair]:
             del self._tracked_maker_orders[market_pair][order_id]
             if len(self._tracked_maker_orders[market_pair]) < 1:
                 del self._tracked_maker_orders[market_pair]
+            self.c_remove_active_order(market_pair, order_id)
             self._shadow_gc_requests.append((
                 self._current_timestamp + self.SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION,
                 market_pair,
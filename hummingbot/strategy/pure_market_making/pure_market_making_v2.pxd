@@ -32,6 +32,7 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
         OrderPricingDelegate _pricing_delegate
         OrderSizingDelegate _sizing_delegate
 
+    cdef c_process_market_info(self, object market_info, list active_orders)
     cdef object c_get_orders_proposal_for_market_info(self,
                                                       object market_info,
                                                       list active_maker_orders)
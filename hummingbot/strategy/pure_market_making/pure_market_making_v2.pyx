@@ -281,25 +281,33 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
             market_info_to_active_orders = self.market_info_to_active_orders
 
             for market_info in self._market_infos.values():
-                self._sb_delegate_lock = True
-                orders_proposal = None
-                try:
-                    orders_proposal = self.c_get_orders_proposal_for_market_info(
-                        market_info,
-                        market_info_to_active_orders.get(market_info, [])
-                    )
-                except Exception:
-                    self.logger().error("Unknown error while generating order proposals.", exc_info=True)
-                finally:
-                    self._sb_delegate_lock = False
-                filtered_proposal = self._filter_delegate.c_filter_orders_proposal(self,
-                                                                                   market_info,
-                                                                                   market_info_to_active_orders.get(market_info, []),
-                                                                                   orders_proposal)
-                self.c_execute_orders_proposal(market_info, filtered_proposal)
+                self.c_process_market_info(market_info, market_info_to_active_orders.get(market_info, []))
         finally:
             self._last_timestamp = timestamp
 
+    cdef list c_get_order_book_triggers(self):
+        return [(market_info.order_book, market_info) for market_info in self._market_infos.values()]
+
+    cdef c_process_order_book_trigger(self, object market_info):
+        if not self._all_markets_ready:
+            return
+        self.c_process_market_info(market_info, self.market_info_to_active_orders.get(market_info, []))
+
+    cdef c_process_market_info(self, object market_info, list active_orders):
+        self._sb_delegate_lock = True
+        orders_proposal = None
+        try:
+            orders_proposal = self.c_get_orders_proposal_for_market_info(market_info, active_orders)
+        except Exception:
+            self.logger().error("Unknown error while generating order proposals.", exc_info=True)
+        finally:
+            self._sb_delegate_lock = False
+        filtered_proposal = self._filter_delegate.c_filter_orders_proposal(self,
+                                                                           market_info,
+                                                                           active_orders,
+                                                                           orders_proposal)
+        self.c_execute_orders_proposal(market_info, filtered_proposal)
+
     # Compare the market price with the top bid and top ask price
     cdef object c_get_penny_jumped_pricing_proposal(self,
                                                     object market_info,
@@ -19,8 +19,18 @@ cdef class StrategyBase(TimeIterator):
         double _sb_limit_order_min_expiration
         bint _sb_delegate_lock
         OrderTracker _sb_order_tracker
+        object _sb_exchange_rate_snapshot
+        bint _sb_order_book_triggers_enabled
+        double _sb_order_book_trigger_interval
+        int _sb_order_book_trigger_levels
+        list _sb_order_book_trigger_listeners
 
     cdef c_add_markets(self, list markets)
+    cdef list c_get_order_book_triggers(self)
+    cdef c_add_order_book_triggers(self)
+    cdef c_remove_order_book_triggers(self)
+    cdef c_did_change_order_book_top(self, object key)
+    cdef c_process_order_book_trigger(self, object key)
     cdef c_remove_markets(self, list markets)
     cdef c_did_create_buy_order(self, object order_created_event)
     cdef c_did_create_sell_order(self, object order_created_event)
@@ -48,6 +58,7 @@ cdef class StrategyBase(TimeIterator):
     cdef c_stop_tracking_limit_order(self, object market_pair, str order_id)
     cdef c_start_tracking_market_order(self, object market_pair, str order_id, bint is_buy, object quantity)
     cdef c_stop_tracking_market_order(self, object market_pair, str order_id)
+    cdef object c_get_exchange_rate_snapshot(self)
     cdef object c_sum_flat_fees(self,
                                 str quote_currency,
                                 list flat_fees)
@@ -5,6 +5,7 @@ from typing import (
     List)
 
 from hummingbot.core.clock cimport Clock
+from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.event.events import MarketEvent
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.network_iterator import NetworkStatus
@@ -77,6 +78,18 @@ cdef class BuyOrderCreatedListener(BaseStrategyEventListener):
 cdef class SellOrderCreatedListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
         self._owner.c_did_create_sell_order(arg)
+
+
+cdef class OrderBookTopChangedListener(BaseStrategyEventListener):
+    cdef:
+        object _key
+
+    def __init__(self, StrategyBase owner, object key):
+        super().__init__(owner)
+        self._key = key
+
+    cdef c_call(self, object arg):
+        self._owner.c_did_change_order_book_top(self._key)
 # </editor-fold>
 
 
@@ -89,6 +102,8 @@ cdef class StrategyBase(TimeIterator):
     ORDER_FAILURE_EVENT_TAG = MarketEvent.OrderFailure.value
     BUY_ORDER_CREATED_EVENT_TAG = MarketEvent.BuyOrderCreated.value
     SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
+    # Exchange rates from the data feeds that are older than this are considered stale.
+    EXCHANGE_RATE_MAX_AGE = 300.0
 
     @classmethod
     def logger(cls) -> logging.Logger:
@@ -110,6 +125,12 @@ cdef class StrategyBase(TimeIterator):
         self._sb_delegate_lock = False
 
         self._sb_order_tracker = OrderTracker()
+        self._sb_exchange_rate_snapshot = None
+
+        self._sb_order_book_triggers_enabled = False
+        self._sb_order_book_trigger_interval = 0.1
+        self._sb_order_book_trigger_levels = 1
+        self._sb_order_book_trigger_listeners = None
 
     @property
     def active_markets(self) -> List[MarketBase]:
@@ -123,6 +144,26 @@ cdef class StrategyBase(TimeIterator):
     def limit_order_min_expiration(self, double value):
         self._sb_limit_order_min_expiration = value
 
+    def enable_order_book_triggers(self, min_interval: float = 0.1, top_levels: int = 1):
+        """
+        Makes the strategy react to order book changes between clock ticks. Whenever the top levels of an order book
+        used by the strategy change, the clock runs an event tick that only processes the affected market pair - no
+        sooner than min_interval seconds after the last event tick for the same market pair.
+
+        Regular clock ticks keep processing all market pairs, since strategies rely on them for timed actions like
+        order refreshes. Strategies that don't implement c_get_order_book_triggers() are unaffected.
+
+        :param min_interval: minimum interval between event ticks for the same market pair, in seconds
+        :param top_levels: number of price levels on each side of the order books to watch for changes
+        """
+        self._sb_order_book_triggers_enabled = True
+        self._sb_order_book_trigger_interval = min_interval
+        self._sb_order_book_trigger_levels = top_levels
+
+    def disable_order_book_triggers(self):
+        self._sb_order_book_triggers_enabled = False
+        self.c_remove_order_book_triggers()
+
     def format_status(self):
         raise NotImplementedError
 
@@ -161,13 +202,14 @@ cdef class StrategyBase(TimeIterator):
             object ask_price_adjusted
             list markets_data = []
             list markets_columns = ["Market", "Symbol", "Bid Price", "Ask Price", "Adjusted Bid", "Adjusted Ask"]
+            object exchange_rate_snapshot = self.c_get_exchange_rate_snapshot()
         try:
             for market_trading_pair_tuple in market_trading_pair_tuples:
                 market, trading_pair, base_asset, quote_asset = market_trading_pair_tuple
                 bid_price = market.get_price(trading_pair, False)
                 ask_price = market.get_price(trading_pair, True)
-                bid_price_adjusted = ExchangeRateConversion.get_instance().adjust_token_rate(quote_asset, bid_price)
-                ask_price_adjusted = ExchangeRateConversion.get_instance().adjust_token_rate(quote_asset, ask_price)
+                bid_price_adjusted = exchange_rate_snapshot.adjust_token_rate(quote_asset, bid_price)
+                ask_price_adjusted = exchange_rate_snapshot.adjust_token_rate(quote_asset, ask_price)
                 markets_data.append([
                     market.display_name,
                     trading_pair,
@@ -192,6 +234,7 @@ cdef class StrategyBase(TimeIterator):
             double quote_asset_conversion_rate
             list assets_data = []
             list assets_columns = ["Market", "Asset", "Total Balance", "Available Balance", "Conversion Rate"]
+            object exchange_rate_snapshot = self.c_get_exchange_rate_snapshot()
         try:
             for market_trading_pair_tuple in market_trading_pair_tuples:
                 market, trading_pair, base_asset, quote_asset = market_trading_pair_tuple
@@ -199,8 +242,8 @@ cdef class StrategyBase(TimeIterator):
                 quote_balance = float(market.get_balance(quote_asset))
                 available_base_balance = float(market.get_available_balance(base_asset))
                 available_quote_balance = float(market.get_available_balance(quote_asset))
-                base_asset_conversion_rate = ExchangeRateConversion.get_instance().adjust_token_rate(base_asset, Decimal(1))
-                quote_asset_conversion_rate = ExchangeRateConversion.get_instance().adjust_token_rate(quote_asset, Decimal(1))
+                base_asset_conversion_rate = exchange_rate_snapshot.get_float_conversion_rate(base_asset)
+                quote_asset_conversion_rate = exchange_rate_snapshot.get_float_conversion_rate(quote_asset)
                 assets_data.extend([
                     [market.display_name, base_asset, base_balance, available_base_balance, base_asset_conversion_rate],
                     [market.display_name, quote_asset, quote_balance, available_quote_balance, quote_asset_conversion_rate]
@@ -243,6 +286,29 @@ cdef class StrategyBase(TimeIterator):
             ])
         return warning_lines
 
+    def exchange_rate_warning(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> List[str]:
+        cdef:
+            list warning_lines = []
+            list stale_assets
+            object exchange_rate_snapshot = self.c_get_exchange_rate_snapshot()
+        stale_assets = exchange_rate_snapshot.get_stale_assets(
+            sorted({asset
+                    for market_trading_pair_tuple in market_trading_pair_tuples
+                    for asset in (market_trading_pair_tuple.base_asset, market_trading_pair_tuple.quote_asset)}),
+            self.EXCHANGE_RATE_MAX_AGE
+        )
+        if len(stale_assets) > 0:
+            if exchange_rate_snapshot.timestamp > 0:
+                update_status = f"have not been updated for {exchange_rate_snapshot.age:.0f} seconds"
+            else:
+                update_status = "have not been updated from the data feeds yet"
+            warning_lines.extend([
+                f"  Exchange rates for {', '.join(stale_assets)} {update_status}. Rate adjusted prices may be "
+                f"inaccurate.",
+                ""
+            ])
+        return warning_lines
+
     cdef c_start(self, Clock clock, double timestamp):
         TimeIterator.c_start(self, clock, timestamp)
         self._sb_order_tracker.c_start(clock, timestamp)
@@ -250,12 +316,77 @@ cdef class StrategyBase(TimeIterator):
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         self._sb_order_tracker.c_tick(timestamp)
+        # Fetch a fresh snapshot of the exchange rates on first use in this tick.
+        self._sb_exchange_rate_snapshot = None
+        # Order books may only become available after the markets are ready, so keep trying until they are.
+        if self._sb_order_book_triggers_enabled and self._sb_order_book_trigger_listeners is None:
+            self.c_add_order_book_triggers()
+
+    cdef c_event_tick(self, double timestamp, object key):
+        TimeIterator.c_event_tick(self, timestamp, key)
+        self.c_process_order_book_trigger(key)
 
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
         self._sb_order_tracker.c_stop(clock)
+        self.c_remove_order_book_triggers()
         self.c_remove_markets(list(self._sb_markets))
 
+    cdef list c_get_order_book_triggers(self):
+        """
+        Order books whose changes should trigger event ticks, for enable_order_book_triggers().
+
+        :return: list of (order book, key) tuples. The key is passed to c_process_order_book_trigger().
+        """
+        return []
+
+    cdef c_add_order_book_triggers(self):
+        cdef:
+            OrderBook order_book
+            list triggers
+            list listeners = []
+        try:
+            triggers = self.c_get_order_book_triggers()
+        except (KeyError, ValueError):
+            # The order books aren't available until the markets are ready - try again on the next tick.
+            return
+        except Exception:
+            self.logger().error("Unexpected error while adding order book triggers. Order book triggers are disabled.",
+                                exc_info=True)
+            self._sb_order_book_triggers_enabled = False
+            return
+        for order_book, key in triggers:
+            listener = OrderBookTopChangedListener(self, key)
+            order_book.c_add_listener(OrderBook.ORDER_BOOK_TOP_CHANGED_EVENT_TAG, listener)
+            if order_book.top_levels_watched < self._sb_order_book_trigger_levels:
+                order_book.top_levels_watched = self._sb_order_book_trigger_levels
+            listeners.append((order_book, listener))
+        self._sb_order_book_trigger_listeners = listeners
+
+    cdef c_remove_order_book_triggers(self):
+        cdef:
+            OrderBook order_book
+        if self._sb_order_book_trigger_listeners is None:
+            return
+        for order_book, listener in self._sb_order_book_trigger_listeners:
+            order_book.c_remove_listener(OrderBook.ORDER_BOOK_TOP_CHANGED_EVENT_TAG, listener)
+            # Stop watching the top levels, unless another strategy still listens to the order book.
+            if len(order_book.c_get_listeners(OrderBook.ORDER_BOOK_TOP_CHANGED_EVENT_TAG)) < 1:
+                order_book.top_levels_watched = 0
+        self._sb_order_book_trigger_listeners = None
+
+    cdef c_did_change_order_book_top(self, object key):
+        if self._clock is not None:
+            self._clock.c_request_event_tick(self, key, self._sb_order_book_trigger_interval)
+
+    cdef c_process_order_book_trigger(self, object key):
+        """
+        Processes a single market pair on an event tick.
+
+        :param key: the key given with the order book by c_get_order_book_triggers()
+        """
+        pass
+
     cdef c_add_markets(self, list markets):
         cdef:
             MarketBase typed_market
@@ -290,6 +421,17 @@ cdef class StrategyBase(TimeIterator):
             typed_market.c_remove_listener(self.SELL_ORDER_COMPLETED_EVENT_TAG, self._sb_complete_sell_order_listener)
             self._sb_markets.remove(typed_market)
 
+    cdef object c_get_exchange_rate_snapshot(self):
+        """
+        Returns the exchange rates to use for the current tick. Every price adjustment within a tick is made with the
+        same rates, even if the data feeds update them in the meantime.
+
+        :return: ExchangeRateSnapshot
+        """
+        if self._sb_exchange_rate_snapshot is None:
+            self._sb_exchange_rate_snapshot = ExchangeRateConversion.get_instance().get_snapshot()
+        return self._sb_exchange_rate_snapshot
+
     cdef object c_sum_flat_fees(self, str quote_asset, list flat_fees):
 
         """
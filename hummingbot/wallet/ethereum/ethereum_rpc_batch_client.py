@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+
+import aiohttp
+import logging
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
+from hummingbot.logger import HummingbotLogger
+
+# Function selector of the ERC20 balanceOf(address) call.
+ERC20_BALANCE_OF_SELECTOR = "0x70a08231"
+
+
+class EthereumRPCError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(f"JSON-RPC error {code}: {message}")
+        self.code: int = code
+        self.message: str = message
+
+
+class EthereumRPCBatchClient:
+    """
+    Sends Ethereum JSON-RPC calls to a node in batches, so that polling many values (e.g. the balances of every
+    tracked token) takes one HTTP round trip instead of one per value.
+
+    Calls are given as (method, params) tuples. The results come back in the same order as the calls.
+    """
+    MAX_BATCH_SIZE = 100
+
+    _erbc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._erbc_logger is None:
+            cls._erbc_logger = logging.getLogger(__name__)
+        return cls._erbc_logger
+
+    def __init__(self, jsonrpc_url: str, shared_client: Optional[aiohttp.ClientSession] = None):
+        self._jsonrpc_url: str = jsonrpc_url
+        self._shared_client: Optional[aiohttp.ClientSession] = shared_client
+        self._next_request_id: int = 1
+
+        self._poll_count: int = 0
+        self._http_request_count: int = 0
+        self._call_count: int = 0
+        self._error_count: int = 0
+        self._last_latency: float = 0.0
+        self._total_latency: float = 0.0
+        self._max_latency: float = 0.0
+
+    @property
+    def jsonrpc_url(self) -> str:
+        return self._jsonrpc_url
+
+    @property
+    def shared_client(self) -> Optional[aiohttp.ClientSession]:
+        return self._shared_client
+
+    @shared_client.setter
+    def shared_client(self, client: aiohttp.ClientSession):
+        self._shared_client = client
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "poll_count": self._poll_count,
+            "http_request_count": self._http_request_count,
+            "call_count": self._call_count,
+            "error_count": self._error_count,
+            "last_latency": self._last_latency,
+            "average_latency": self._total_latency / self._poll_count if self._poll_count > 0 else 0.0,
+            "max_latency": self._max_latency,
+        }
+
+    async def _http_client(self) -> aiohttp.ClientSession:
+        if self._shared_client is None:
+            return HttpClientRegistry.get_instance().client()
+        return self._shared_client
+
+    async def close(self):
+        if self._shared_client is not None:
+            await self._shared_client.close()
+            self._shared_client = None
+
+    async def _send_batch(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        client: aiohttp.ClientSession = await self._http_client()
+        first_request_id: int = self._next_request_id
+        self._next_request_id += len(calls)
+        payload: List[Dict[str, Any]] = [
+            {"jsonrpc": "2.0", "id": first_request_id + i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+
+        self._http_request_count += 1
+        async with client.post(self._jsonrpc_url, json=payload) as response:
+            if response.status != 200:
+                raise IOError(f"Error sending JSON-RPC batch to {self._jsonrpc_url}. "
+                              f"HTTP status is {response.status}.")
+            response_data: Any = await response.json(content_type=None)
+
+        # A node that can't parse the batch as a whole answers with a single error object.
+        if isinstance(response_data, dict):
+            error: Dict[str, Any] = response_data.get("error") or {}
+            raise EthereumRPCError(error.get("code", 0), error.get("message", str(response_data)))
+
+        # Responses in a batch can come back in any order, so they're matched to the calls by request id.
+        responses: Dict[int, Dict[str, Any]] = {item.get("id"): item for item in response_data}
+        results: List[Any] = []
+        for request_id in range(first_request_id, first_request_id + len(calls)):
+            item: Optional[Dict[str, Any]] = responses.get(request_id)
+            if item is None:
+                results.append(EthereumRPCError(0, f"No response for JSON-RPC request {request_id}."))
+            elif item.get("error") is not None:
+                results.append(EthereumRPCError(item["error"].get("code", 0), item["error"].get("message", "")))
+            else:
+                results.append(item.get("result"))
+        return results
+
+    async def batch_call(self,
+                         calls: List[Tuple[str, List[Any]]],
+                         return_exceptions: bool = False) -> List[Any]:
+        """
+        Sends a list of JSON-RPC calls to the node, in as few HTTP requests as possible.
+
+        :param calls: list of (method, params) tuples
+        :param return_exceptions: if True, failed calls are returned as EthereumRPCError objects in the results.
+                                  Otherwise, the first failed call raises its error.
+        :return: the results of the calls, in the same order as the calls
+        """
+        if len(calls) < 1:
+            return []
+
+        start_time: float = time.perf_counter()
+        try:
+            batches: List[List[Any]] = await safe_gather(*[
+                self._send_batch(calls[i:i + self.MAX_BATCH_SIZE])
+                for i in range(0, len(calls), self.MAX_BATCH_SIZE)
+            ])
+        finally:
+            latency: float = time.perf_counter() - start_time
+            self._poll_count += 1
+            self._call_count += len(calls)
+            self._last_latency = latency
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+
+        results: List[Any] = [result for batch in batches for result in batch]
+        errors: List[EthereumRPCError] = [result for result in results if isinstance(result, EthereumRPCError)]
+        self._error_count += len(errors)
+        if len(errors) > 0 and not return_exceptions:
+            raise errors[0]
+
+        self.logger().debug(f"Sent {len(calls)} JSON-RPC calls in {len(batches)} batches. "
+                            f"Latency = {latency:.3f}s.")
+        return results
+
+    async def call(self, method: str, params: List[Any]) -> Any:
+        return (await self.batch_call([(method, params)]))[0]
+
+    @staticmethod
+    def hex_to_int(hex_value: str) -> int:
+        if hex_value is None or hex_value in ("0x", ""):
+            raise ValueError(f"Invalid hex quantity {hex_value!r} in JSON-RPC result.")
+        return int(hex_value, 16)
+
+    @staticmethod
+    def erc20_balance_of_call(token_address: str, account_address: str,
+                              block_identifier: str = "latest") -> Tuple[str, List[Any]]:
+        """
+        :return: the eth_call for reading an account's balance from an ERC20 token contract
+        """
+        encoded_address: str = account_address.lower().replace("0x", "").rjust(64, "0")
+        return "eth_call", [{"to": token_address, "data": ERC20_BALANCE_OF_SELECTOR + encoded_address},
+                            block_identifier]
+
+    @staticmethod
+    def eth_balance_call(account_address: str, block_identifier: str = "latest") -> Tuple[str, List[Any]]:
+        return "eth_getBalance", [account_address, block_identifier]
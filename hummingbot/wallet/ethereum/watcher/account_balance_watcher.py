@@ -3,10 +3,11 @@
 import asyncio
 import logging
 from typing import (
+    Any,
     List,
     Dict,
     Optional,
-    Coroutine
+    Tuple
 )
 from decimal import Decimal
 
@@ -16,12 +17,10 @@ from web3.datastructures import AttributeDict
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
+from hummingbot.wallet.ethereum.ethereum_rpc_batch_client import EthereumRPCBatchClient
 from hummingbot.core.event.events import NewBlocksWatcherEvent
 from hummingbot.core.event.event_forwarder import EventForwarder
-from hummingbot.core.utils.async_utils import (
-    safe_ensure_future,
-    safe_gather,
-)
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from .base_watcher import BaseWatcher
 from .new_blocks_watcher import NewBlocksWatcher
 
@@ -29,6 +28,8 @@ s_decimal_0 = Decimal(0)
 
 
 class AccountBalanceWatcher(BaseWatcher):
+    BALANCE_POLL_TIMEOUT = 10.0
+
     _abw_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -42,7 +43,8 @@ class AccountBalanceWatcher(BaseWatcher):
                  blocks_watcher: NewBlocksWatcher,
                  account_address: str,
                  erc20_addresses: List[str],
-                 erc20_abis: List[any]):
+                 erc20_abis: List[any],
+                 rpc_batch_client: Optional[EthereumRPCBatchClient] = None):
         super().__init__(w3)
         self._blocks_watcher: NewBlocksWatcher = blocks_watcher
         self._account_address: str = account_address
@@ -56,6 +58,14 @@ class AccountBalanceWatcher(BaseWatcher):
         self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
         self._raw_account_balances: Dict[str, int] = {}
 
+        # Balances are polled with one JSON-RPC batch per new block. A batch client that isn't given by the caller is
+        # owned, and closed, by the watcher.
+        self._owns_rpc_batch_client: bool = rpc_batch_client is None
+        self._rpc_batch_client: EthereumRPCBatchClient = (
+            rpc_batch_client if rpc_batch_client is not None
+            else EthereumRPCBatchClient(w3.provider.endpoint_uri)
+        )
+
     async def start_network(self):
         account_address: str = self._account_address
         w3: Web3 = self._w3
@@ -96,11 +106,17 @@ class AccountBalanceWatcher(BaseWatcher):
 
     async def stop_network(self):
         self._blocks_watcher.remove_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
+        if self._owns_rpc_batch_client:
+            await self._rpc_batch_client.close()
 
     @property
     def address(self) -> str:
         return self._account_address
 
+    @property
+    def rpc_batch_client(self) -> EthereumRPCBatchClient:
+        return self._rpc_batch_client
+
     def get_raw_balances(self) -> Dict[str, int]:
         return self._raw_account_balances.copy()
 
@@ -132,19 +148,32 @@ class AccountBalanceWatcher(BaseWatcher):
 
     async def update_balances(self):
         asset_symbols: List[str] = []
-        asset_update_tasks: List[Coroutine] = []
+        balance_calls: List[Tuple[str, List[Any]]] = []
 
         for asset_name, contract in self._erc20_contracts.items():
             asset_symbols.append(asset_name)
-            asset_update_tasks.append(self.call_async(contract.functions.balanceOf(self._account_address).call))
+            balance_calls.append(EthereumRPCBatchClient.erc20_balance_of_call(contract.address,
+                                                                              self._account_address))
 
         asset_symbols.append("ETH")
-        asset_update_tasks.append(self.call_async(self._w3.eth.getBalance, self._account_address))
+        balance_calls.append(EthereumRPCBatchClient.eth_balance_call(self._account_address))
 
         try:
-            asset_raw_balances: List[int] = await safe_gather(*asset_update_tasks)
-            for asset_name, raw_balance in zip(asset_symbols, asset_raw_balances):
-                self._raw_account_balances[asset_name] = raw_balance
+            # All the balances are fetched in one round trip to the node.
+            results: List[Any] = await self.schedule_async_call(
+                self._rpc_batch_client.batch_call(balance_calls, return_exceptions=True),
+                self.BALANCE_POLL_TIMEOUT
+            )
+            for asset_name, result in zip(asset_symbols, results):
+                try:
+                    if isinstance(result, Exception):
+                        raise result
+                    self._raw_account_balances[asset_name] = EthereumRPCBatchClient.hex_to_int(result)
+                except Exception as e:
+                    # One failed balance shouldn't hold back the updates of the others.
+                    self.logger().debug(f"Error fetching {asset_name} balance: {e}")
+            self.logger().debug(f"Polled {len(balance_calls)} account balances in "
+                                f"{self._rpc_batch_client.stats['last_latency']:.3f}s.")
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -10,6 +10,10 @@ from web3 import Web3
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.pubsub import PubSub
 
+# Ethereum node calls are made on their own lane of the shared scheduler, so they can run concurrently.
+ETHEREUM_RPC_LANE = "ethereum_rpc"
+ETHEREUM_RPC_CONCURRENCY = 8
+
 
 class BaseWatcher(PubSub):
     def __init__(self, w3: Web3):
@@ -17,13 +21,21 @@ class BaseWatcher(PubSub):
         self._w3: Web3 = w3
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
+    @staticmethod
+    def async_scheduler() -> AsyncCallScheduler:
+        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
+        async_scheduler.configure_lane(ETHEREUM_RPC_LANE, concurrency=ETHEREUM_RPC_CONCURRENCY)
+        return async_scheduler
+
     @staticmethod
     async def schedule_async_call(coro: Coroutine, timeout_seconds: float, **kwargs) -> any:
-        return await AsyncCallScheduler.shared_instance().schedule_async_call(coro, timeout_seconds, **kwargs)
+        kwargs.setdefault("lane", ETHEREUM_RPC_LANE)
+        return await BaseWatcher.async_scheduler().schedule_async_call(coro, timeout_seconds, **kwargs)
 
     @staticmethod
     async def call_async(func: Callable, *args, **kwargs):
-        return await AsyncCallScheduler.shared_instance().call_async(func, *args, **kwargs)
+        kwargs.setdefault("lane", ETHEREUM_RPC_LANE)
+        return await BaseWatcher.async_scheduler().call_async(func, *args, **kwargs)
 
     async def start_network(self):
         raise NotImplementedError
@@ -4,7 +4,6 @@ from decimal import Decimal
 from eth_account import Account
 from eth_account.local import LocalAccount
 from eth_account.messages import defunct_hash_message
-from hexbytes import HexBytes
 import logging
 import math
 import time
@@ -13,7 +12,6 @@ from typing import (
     List,
     Dict,
     Optional,
-    Set,
     Coroutine
 )
 from web3 import Web3
@@ -50,7 +48,9 @@ from hummingbot.wallet.ethereum.watcher import (
     IncomingEthWatcher,
     WethWatcher,
 )
+from hummingbot.wallet.ethereum.watcher.base_watcher import BaseWatcher
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
+from hummingbot.wallet.ethereum.ethereum_rpc_batch_client import EthereumRPCBatchClient
 from hummingbot.logger import HummingbotLogger
 
 s_decimal_0 = Decimal(0)
@@ -59,6 +59,7 @@ s_decimal_0 = Decimal(0)
 class Web3WalletBackend(PubSub):
     DEFAULT_GAS_PRICE = 1e9  # 1 gwei = 1e9 wei
     TRANSACTION_RECEIPT_POLLING_TICK = 10.0
+    TRANSACTION_RECEIPT_POLL_TIMEOUT = 10.0
 
     _w3wb_logger: Optional[HummingbotLogger] = None
 
@@ -77,6 +78,7 @@ class Web3WalletBackend(PubSub):
 
         # Initialize Web3, accounts and contracts.
         self._w3: Web3 = Web3(Web3.HTTPProvider(jsonrpc_url))
+        self._rpc_batch_client: EthereumRPCBatchClient = EthereumRPCBatchClient(jsonrpc_url)
         self._chain: EthereumChain = chain
         self._account: LocalAccount = Account.privateKeyToAccount(private_key)
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
@@ -158,6 +160,13 @@ class Web3WalletBackend(PubSub):
     def chain(self) -> EthereumChain:
         return self._chain
 
+    @property
+    def rpc_batch_stats(self) -> Dict[str, Any]:
+        """
+        Request counts and per-poll latencies of the batched JSON-RPC calls made for balance and receipt polling.
+        """
+        return self._rpc_batch_client.stats
+
     @property
     def erc20_tokens(self) -> Dict[str, ERC20Token]:
         return self._erc20_tokens.copy()
@@ -223,7 +232,8 @@ class Web3WalletBackend(PubSub):
                 self._new_blocks_watcher,
                 self._account.address,
                 [erc20_token.address for erc20_token in self._erc20_tokens.values()],
-                [token.abi for token in self._erc20_tokens.values()]
+                [token.abi for token in self._erc20_tokens.values()],
+                rpc_batch_client=self._rpc_batch_client
             )
             self._erc20_events_watcher = ERC20EventsWatcher(
                 self._w3,
@@ -307,6 +317,7 @@ class Web3WalletBackend(PubSub):
         if self._check_transaction_receipts_task is not None:
             self._check_transaction_receipts_task.cancel()
             self._check_transaction_receipts_task = None
+        await self._rpc_batch_client.close()
 
     async def check_network(self) -> NetworkStatus:
         # Assume connected if received new blocks in last 2 minutes
@@ -360,22 +371,36 @@ class Web3WalletBackend(PubSub):
         """
         Look for failed transactions, and emit transaction fail event if any are found.
         """
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
-        tasks = [async_scheduler.call_async(self._w3.eth.getTransactionReceipt, tx_hash)
-                 for tx_hash in self._pending_tx_dict.keys()]
-        transaction_receipts: List[AttributeDict] = [tr for tr in await safe_gather(*tasks)
-                                                     if (tr is not None and tr.get("blockHash") is not None)]
-        block_hash_set: Set[HexBytes] = set(tr.blockHash for tr in transaction_receipts)
-        fetch_block_tasks = [async_scheduler.call_async(self._w3.eth.getBlock, block_hash)
-                             for block_hash in block_hash_set]
-        blocks: Dict[HexBytes, AttributeDict] = dict((block.hash, block)
-                                                     for block
-                                                     in await safe_gather(*fetch_block_tasks)
-                                                     if block is not None)
+        # The receipts of all pending transactions, and then the blocks they're in, are each fetched in one round trip
+        # to the node.
+        tx_hashes: List[str] = list(self._pending_tx_dict.keys())
+        if len(tx_hashes) < 1:
+            return
+        receipt_results: List[Any] = await BaseWatcher.schedule_async_call(
+            self._rpc_batch_client.batch_call([("eth_getTransactionReceipt", [tx_hash]) for tx_hash in tx_hashes],
+                                              return_exceptions=True),
+            self.TRANSACTION_RECEIPT_POLL_TIMEOUT
+        )
+        transaction_receipts: List[AttributeDict] = [
+            self._parse_transaction_receipt(tx_hash, result)
+            for tx_hash, result in zip(tx_hashes, receipt_results)
+            if isinstance(result, dict) and result.get("blockHash") is not None
+        ]
+        block_hashes: List[str] = list(set(tr.blockHash for tr in transaction_receipts))
+        block_results: List[Any] = await BaseWatcher.schedule_async_call(
+            self._rpc_batch_client.batch_call([("eth_getBlockByHash", [block_hash, False])
+                                               for block_hash in block_hashes],
+                                              return_exceptions=True),
+            self.TRANSACTION_RECEIPT_POLL_TIMEOUT
+        )
+        blocks: Dict[str, AttributeDict] = {}
+        for block_hash, result in zip(block_hashes, block_results):
+            if isinstance(result, dict):
+                blocks[block_hash] = AttributeDict({"hash": block_hash, "timestamp": int(result["timestamp"], 16)})
 
         for receipt in transaction_receipts:
             # Emit gas used event.
-            tx_hash: str = receipt.transactionHash.hex()
+            tx_hash: str = receipt.transactionHash
             gas_price_wei: int = self._pending_tx_dict[tx_hash]
             gas_used: int = receipt.gasUsed
             gas_eth_amount_raw: int = gas_price_wei * gas_used
@@ -400,6 +425,18 @@ class Web3WalletBackend(PubSub):
                 # Stop tracking the transaction.
                 self._stop_tx_tracking(tx_hash)
 
+    @staticmethod
+    def _parse_transaction_receipt(tx_hash: str, raw_receipt: Dict[str, Any]) -> AttributeDict:
+        """
+        Converts the fields used from a raw JSON-RPC transaction receipt.
+        """
+        return AttributeDict({
+            "transactionHash": tx_hash,
+            "blockHash": raw_receipt["blockHash"],
+            "gasUsed": int(raw_receipt["gasUsed"], 16),
+            "status": int(raw_receipt.get("status") or "0x1", 16),
+        })
+
     async def outgoing_eth_transactions_loop(self):
         async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
         while True:
@@ -15,6 +15,7 @@ from hummingbot.wallet.ethereum.zero_ex.zero_ex_transaction_encoder import (
     SignedZeroExTransaction,
     get_transaction_hash_hex
 )
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils import (
     convert_order_to_tuple,
@@ -392,14 +393,14 @@ class ZeroExCoordinator:
         return result
     
     async def _post_request(self, url, data, timeout=10):
-        async with aiohttp.ClientSession() as client:
-            async with client.request('POST',
-                                      url=url,
-                                      timeout=timeout,
-                                      json=data,
-                                      headers={'Content-Type': 'application/json; charset=utf-8'}) as response:
-                await response.json()
-                return response
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+        async with client.request('POST',
+                                  url=url,
+                                  timeout=timeout,
+                                  json=data,
+                                  headers={'Content-Type': 'application/json; charset=utf-8'}) as response:
+            await response.json()
+            return response
 
     async def _submit_coordinator_transaction(
         self,
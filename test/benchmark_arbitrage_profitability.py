@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import numpy as np
+import time
+from typing import (
+    Callable,
+    List,
+    Tuple,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import ClientOrderBookRow
+from hummingbot.strategy.arbitrage.arbitrage_depth_search import (
+    find_arbitrage_steps,
+    find_best_profitable_amount,
+)
+
+NUM_LEVELS: int = 1000
+NUM_ITERATIONS: int = 200
+MIN_PROFITABILITY: Decimal = Decimal("0.003")
+FEE_PERCENT: Decimal = Decimal("0.001")
+
+
+def make_order_book(best_bid: float, best_ask: float, num_levels: int = NUM_LEVELS) -> OrderBook:
+    tick: float = 0.01
+    bids: np.ndarray = np.column_stack([best_bid - tick * np.arange(num_levels),
+                                        np.random.uniform(0.1, 2.0, num_levels),
+                                        np.ones(num_levels)]).astype("float64")
+    asks: np.ndarray = np.column_stack([best_ask + tick * np.arange(num_levels),
+                                        np.random.uniform(0.1, 2.0, num_levels),
+                                        np.ones(num_levels)]).astype("float64")
+    order_book: OrderBook = OrderBook()
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def decimal_step_walk(sell_order_book: OrderBook, buy_order_book: OrderBook) -> Tuple[Decimal, Decimal]:
+    # The pre-vectorized implementation: match the books level by level into Decimal steps, then walk the steps with
+    # Decimal fee and profitability math.
+    steps: List[Tuple[Decimal, Decimal, Decimal]] = []
+    bids: List[ClientOrderBookRow] = [ClientOrderBookRow(Decimal(repr(row.price)), Decimal(repr(row.amount)),
+                                                         row.update_id)
+                                      for row in sell_order_book.bid_entries()]
+    asks: List[ClientOrderBookRow] = [ClientOrderBookRow(Decimal(repr(row.price)), Decimal(repr(row.amount)),
+                                                         row.update_id)
+                                      for row in buy_order_book.ask_entries()]
+    bid_index, ask_index = 0, 0
+    bid_leftover, ask_leftover = bids[0].amount, asks[0].amount
+    while bid_index < len(bids) and ask_index < len(asks):
+        bid_price, ask_price = bids[bid_index].price, asks[ask_index].price
+        if bid_price < ask_price:
+            break
+        amount: Decimal = min(bid_leftover, ask_leftover)
+        steps.append((bid_price, ask_price, amount))
+        bid_leftover -= amount
+        ask_leftover -= amount
+        if bid_leftover == 0:
+            bid_index += 1
+            bid_leftover = bids[bid_index].amount if bid_index < len(bids) else Decimal(0)
+        if ask_leftover == 0:
+            ask_index += 1
+            ask_leftover = asks[ask_index].amount if ask_index < len(asks) else Decimal(0)
+
+    total_bid_value: Decimal = Decimal(0)
+    total_ask_value: Decimal = Decimal(0)
+    total_amount: Decimal = Decimal(0)
+    best_amount: Decimal = Decimal(0)
+    best_profitability: Decimal = Decimal(0)
+    for bid_price, ask_price, amount in steps:
+        total_bid_value += bid_price * amount
+        total_ask_value += ask_price * amount
+        total_amount += amount
+        profitability: Decimal = (total_bid_value * (1 - FEE_PERCENT)) / (total_ask_value * (1 + FEE_PERCENT))
+        if profitability > 1 + MIN_PROFITABILITY:
+            best_amount = total_amount
+            best_profitability = profitability
+    return best_amount, best_profitability
+
+
+def vectorized_search(sell_order_book: OrderBook, buy_order_book: OrderBook) -> Tuple[float, float]:
+    bids, _ = sell_order_book.get_numpy_snapshot()
+    _, asks = buy_order_book.get_numpy_snapshot()
+    steps = find_arbitrage_steps(bids, asks, 1.0, 1.0, float(MIN_PROFITABILITY))
+    return find_best_profitable_amount(steps, float(MIN_PROFITABILITY), float(FEE_PERCENT), float(FEE_PERCENT),
+                                       0.0, 0.0, 1e12, 1e12)
+
+
+def timeit(description: str, func: Callable[[], None]) -> float:
+    start: float = time.perf_counter()
+    for _ in range(NUM_ITERATIONS):
+        func()
+    elapsed: float = time.perf_counter() - start
+    per_call_us: float = elapsed / NUM_ITERATIONS * 1e6
+    print(f"  {description:<45} {per_call_us:>10.2f} us/iteration")
+    return elapsed
+
+
+def main():
+    # The books cross over roughly half of their depth.
+    sell_order_book: OrderBook = make_order_book(105.0, 105.01)
+    buy_order_book: OrderBook = make_order_book(94.99, 95.0)
+    print(f"Arbitrage order size search, {NUM_LEVELS} levels per side, {NUM_ITERATIONS} iterations:")
+    print(f"  Decimal step walk result: {decimal_step_walk(sell_order_book, buy_order_book)}")
+    print(f"  vectorized search result: {vectorized_search(sell_order_book, buy_order_book)}")
+
+    decimal_time: float = timeit(
+        "Decimal step walk",
+        lambda: decimal_step_walk(sell_order_book, buy_order_book)
+    )
+    vectorized_time: float = timeit(
+        "vectorized find_arbitrage_steps()",
+        lambda: vectorized_search(sell_order_book, buy_order_book)
+    )
+
+    print(f"Speedup, vectorized vs. Decimal: {decimal_time / vectorized_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
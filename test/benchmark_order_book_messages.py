@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import random
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    CoinbaseProOrderBookMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.market.binance.binance_order_book import BinanceOrderBook
+from hummingbot.market.coinbase_pro.coinbase_pro_active_order_tracker import CoinbaseProActiveOrderTracker
+from hummingbot.market.coinbase_pro.coinbase_pro_order_book import CoinbaseProOrderBook
+
+NUM_MESSAGES: int = 20000
+LEVELS_PER_DIFF: int = 20
+
+# The order book tracker and diff router look up the update ID and symbol of each message a few times.
+UPDATE_ID_ACCESSES_PER_MESSAGE: int = 4
+
+
+class LegacyCoinbaseProOrderBookMessage(OrderBookMessage):
+    """
+    Coinbase Pro message that re-parses its sequence number on every access, as it used to.
+    """
+    @property
+    def update_id(self) -> int:
+        return int(self.content["sequence"])
+
+    @property
+    def symbol(self) -> str:
+        return self.content["product_id"]
+
+
+def make_binance_diffs() -> List[Dict[str, Any]]:
+    retval: List[Dict[str, Any]] = []
+    for i in range(NUM_MESSAGES):
+        retval.append({
+            "e": "depthUpdate",
+            "E": 1500000000000 + i,
+            "s": "ETHBTC",
+            "U": i * 10,
+            "u": i * 10 + 9,
+            "b": [[f"{0.02 - random.randint(1, 500) * 1e-6:.8f}", f"{random.uniform(0, 10):.8f}"]
+                  for _ in range(LEVELS_PER_DIFF)],
+            "a": [[f"{0.02 + random.randint(1, 500) * 1e-6:.8f}", f"{random.uniform(0, 10):.8f}"]
+                  for _ in range(LEVELS_PER_DIFF)],
+        })
+    return retval
+
+
+def make_coinbase_pro_diffs() -> List[Dict[str, Any]]:
+    retval: List[Dict[str, Any]] = []
+    for i in range(NUM_MESSAGES):
+        side: str = random.choice(["buy", "sell"])
+        price: float = 200.0 - random.randint(1, 500) * 0.01 if side == "buy" else 200.0 + random.randint(1, 500) * 0.01
+        retval.append({
+            "type": "open",
+            "time": "2019-10-21T12:00:00.000000Z",
+            "product_id": "ETH-USD",
+            "sequence": str(1000000 + i),
+            "order_id": f"order-{i}",
+            "price": f"{price:.2f}",
+            "remaining_size": f"{random.uniform(0, 10):.8f}",
+            "side": side,
+        })
+    return retval
+
+
+def timeit(description: str, func: Callable[[], None]) -> float:
+    start: float = time.perf_counter()
+    func()
+    elapsed: float = time.perf_counter() - start
+    print(f"  {description:<50} {elapsed / NUM_MESSAGES * 1e6:>8.2f} us/message")
+    return elapsed
+
+
+def main():
+    binance_diffs: List[Dict[str, Any]] = make_binance_diffs()
+
+    def binance_legacy():
+        order_book: OrderBook = OrderBook()
+        for msg in binance_diffs:
+            message: OrderBookMessage = OrderBookMessage(OrderBookMessageType.DIFF, {
+                "symbol": msg["s"],
+                "update_id": msg["u"],
+                "bids": msg["b"],
+                "asks": msg["a"]
+            }, timestamp=msg["E"] * 1e-3)
+            for _ in range(UPDATE_ID_ACCESSES_PER_MESSAGE):
+                _ = message.update_id, message.symbol
+            order_book.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def binance_compact():
+        order_book: OrderBook = OrderBook()
+        for msg in binance_diffs:
+            message = BinanceOrderBook.diff_message_from_exchange(msg, msg["E"] * 1e-3)
+            for _ in range(UPDATE_ID_ACCESSES_PER_MESSAGE):
+                _ = message.update_id, message.symbol
+            order_book.apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
+
+    print(f"Binance diffs, {LEVELS_PER_DIFF} bids and {LEVELS_PER_DIFF} asks each, construction + application:")
+    legacy_time: float = timeit("OrderBookMessage + apply_diffs()", binance_legacy)
+    compact_time: float = timeit("CompactOrderBookMessage + apply_numpy_diffs()", binance_compact)
+    print(f"  Speedup: {legacy_time / compact_time:.1f}x")
+
+    coinbase_pro_diffs: List[Dict[str, Any]] = make_coinbase_pro_diffs()
+
+    def coinbase_pro(message_class: type):
+        order_book: OrderBook = OrderBook()
+        active_order_tracker: CoinbaseProActiveOrderTracker = CoinbaseProActiveOrderTracker()
+        for msg in coinbase_pro_diffs:
+            message = message_class(OrderBookMessageType.DIFF, msg, timestamp=1571659200.0)
+            for _ in range(UPDATE_ID_ACCESSES_PER_MESSAGE):
+                _ = message.update_id, message.symbol
+            bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
+            order_book.apply_diffs(bids, asks, message.update_id)
+
+    print("Coinbase Pro open order diffs, construction + application:")
+    legacy_time = timeit("sequence parsed on every access", lambda: coinbase_pro(LegacyCoinbaseProOrderBookMessage))
+    compact_time = timeit("sequence parsed once (CoinbaseProOrderBookMessage)",
+                          lambda: coinbase_pro(CoinbaseProOrderBookMessage))
+    print(f"  Speedup: {legacy_time / compact_time:.1f}x")
+
+    # Make sure the exchange factory produces the same message type the benchmark above measures.
+    assert isinstance(CoinbaseProOrderBook.diff_message_from_exchange(dict(coinbase_pro_diffs[0]), 1571659200.0),
+                      CoinbaseProOrderBookMessage)
+
+
+if __name__ == "__main__":
+    main()
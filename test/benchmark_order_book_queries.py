@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import math
+import numpy as np
+import time
+from typing import (
+    Callable,
+    List,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+
+NUM_LEVELS: int = 1000
+NUM_ITERATIONS: int = 2000
+QUERY_VOLUMES: List[float] = [1.0, 10.0, 50.0, 100.0, 250.0, 500.0]
+
+
+def make_deep_order_book(num_levels: int = NUM_LEVELS) -> OrderBook:
+    mid_price: float = 100.0
+    tick: float = 0.01
+    amounts: np.ndarray = np.random.uniform(0.1, 2.0, num_levels)
+    bids: np.ndarray = np.column_stack([mid_price - tick * np.arange(1, num_levels + 1),
+                                        amounts,
+                                        np.ones(num_levels)]).astype("float64")
+    asks: np.ndarray = np.column_stack([mid_price + tick * np.arange(1, num_levels + 1),
+                                        amounts[::-1],
+                                        np.ones(num_levels)]).astype("float64")
+    order_book: OrderBook = OrderBook()
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def generator_vwap_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    # The pre-native implementation: walk the book through the OrderBookRow generators.
+    total_cost: float = 0
+    total_volume: float = 0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        if total_volume + row.amount >= volume:
+            total_cost += (volume - total_volume) * row.price
+            return total_cost / volume
+        total_cost += row.amount * row.price
+        total_volume += row.amount
+    return math.nan
+
+
+def timeit(description: str, func: Callable[[], None]) -> float:
+    start: float = time.perf_counter()
+    for _ in range(NUM_ITERATIONS):
+        func()
+    elapsed: float = time.perf_counter() - start
+    per_call_us: float = elapsed / NUM_ITERATIONS * 1e6
+    print(f"  {description:<45} {per_call_us:>10.2f} us/iteration")
+    return elapsed
+
+
+def main():
+    order_book: OrderBook = make_deep_order_book()
+    print(f"Order book depth queries, {NUM_LEVELS} levels per side, "
+          f"{len(QUERY_VOLUMES)} volumes per iteration, {NUM_ITERATIONS} iterations:")
+
+    generator_time: float = timeit(
+        "generator walk (OrderBookRow per level)",
+        lambda: [generator_vwap_for_volume(order_book, True, v) for v in QUERY_VOLUMES]
+    )
+    native_time: float = timeit(
+        "native get_vwap_for_volume()",
+        lambda: [order_book.get_vwap_for_volume(True, v) for v in QUERY_VOLUMES]
+    )
+    batched_time: float = timeit(
+        "batched get_vwap_for_volumes()",
+        lambda: order_book.get_vwap_for_volumes(True, QUERY_VOLUMES)
+    )
+
+    print(f"Speedup, native vs. generator:  {generator_time / native_time:.1f}x")
+    print(f"Speedup, batched vs. generator: {generator_time / batched_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
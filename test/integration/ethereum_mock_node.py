@@ -0,0 +1,87 @@
+from aiohttp import web
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple
+)
+
+
+class EthereumMockNode:
+    """
+    A stand-in Ethereum node, serving the JSON-RPC methods used for balance and receipt polling from in-memory state.
+    It answers both single calls and batches, and counts the HTTP requests and calls it receives.
+    """
+    MOCK_BLOCK_NUMBER = 8000000
+    BALANCE_OF_SELECTOR = "0x70a08231"
+
+    def __init__(self):
+        self.eth_balances: Dict[str, int] = {}
+        self.token_balances: Dict[Tuple[str, str], int] = {}
+        self.transaction_receipts: Dict[str, Dict[str, Any]] = {}
+        self.blocks: Dict[str, Dict[str, Any]] = {}
+        self.http_request_count: int = 0
+        self.rpc_call_count: int = 0
+
+    def set_eth_balance(self, account_address: str, raw_balance: int):
+        self.eth_balances[account_address.lower()] = raw_balance
+
+    def set_token_balance(self, token_address: str, account_address: str, raw_balance: int):
+        self.token_balances[(token_address.lower(), account_address.lower())] = raw_balance
+
+    def add_transaction_receipt(self, tx_hash: str, block_hash: str, block_timestamp: int, gas_used: int,
+                                status: int = 1):
+        self.transaction_receipts[tx_hash] = {
+            "transactionHash": tx_hash,
+            "blockHash": block_hash,
+            "blockNumber": hex(self.MOCK_BLOCK_NUMBER),
+            "gasUsed": hex(gas_used),
+            "status": hex(status),
+        }
+        self.blocks[block_hash] = {
+            "hash": block_hash,
+            "number": hex(self.MOCK_BLOCK_NUMBER),
+            "timestamp": hex(block_timestamp),
+        }
+
+    def eth_blockNumber(self) -> str:
+        return hex(self.MOCK_BLOCK_NUMBER)
+
+    def eth_getBalance(self, account_address: str, _: str) -> str:
+        return hex(self.eth_balances.get(account_address.lower(), 0))
+
+    def eth_call(self, transaction: Dict[str, str], _: str) -> str:
+        data: str = transaction["data"]
+        if not data.startswith(self.BALANCE_OF_SELECTOR):
+            raise ValueError(f"Unsupported contract call {data[:10]}.")
+        account_address: str = "0x" + data[len(self.BALANCE_OF_SELECTOR):][-40:]
+        raw_balance: int = self.token_balances.get((transaction["to"].lower(), account_address.lower()), 0)
+        return "0x" + hex(raw_balance)[2:].rjust(64, "0")
+
+    def eth_getTransactionReceipt(self, tx_hash: str) -> Dict[str, Any]:
+        return self.transaction_receipts.get(tx_hash)
+
+    def eth_getBlockByHash(self, block_hash: str, _: bool) -> Dict[str, Any]:
+        return self.blocks.get(block_hash)
+
+    def handle_call(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        self.rpc_call_count += 1
+        response: Dict[str, Any] = {"jsonrpc": "2.0", "id": call.get("id")}
+        method = getattr(self, call.get("method", ""), None)
+        if method is None or not call["method"].startswith("eth_"):
+            response["error"] = {"code": -32601, "message": "Method not found"}
+            return response
+        try:
+            response["result"] = method(*call.get("params", []))
+        except Exception as e:
+            response["error"] = {"code": -32000, "message": str(e)}
+        return response
+
+    async def post_jsonrpc(self, request: web.Request) -> web.Response:
+        self.http_request_count += 1
+        payload: Any = await request.json()
+        if isinstance(payload, list):
+            # Answer batches in reverse order, since nodes are free to reorder the responses of a batch.
+            responses: List[Dict[str, Any]] = [self.handle_call(call) for call in payload]
+            return web.json_response(list(reversed(responses)))
+        return web.json_response(self.handle_call(payload))
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from aiohttp import web
+from aiohttp.test_utils import (
+    AioHTTPTestCase,
+    unittest_run_loop
+)
+from typing import (
+    Any,
+    List
+)
+import unittest
+
+from hummingbot.wallet.ethereum.ethereum_rpc_batch_client import (
+    EthereumRPCBatchClient,
+    EthereumRPCError
+)
+from test.integration.ethereum_mock_node import EthereumMockNode
+
+ACCOUNT_ADDRESS = "0x5409ED021D9299bf6814279A6A1411A7e866A631"
+TOKEN_ADDRESSES = [f"0x{i:040x}" for i in range(1, 31)]
+
+
+class EthereumRPCBatchClientUnitTest(AioHTTPTestCase):
+    async def get_application(self):
+        app = web.Application()
+        self.mock_node = EthereumMockNode()
+        app.router.add_post("/", self.mock_node.post_jsonrpc)
+        return app
+
+    @property
+    def rpc_client(self) -> EthereumRPCBatchClient:
+        if getattr(self, "_rpc_client", None) is None:
+            self._rpc_client: EthereumRPCBatchClient = EthereumRPCBatchClient(str(self.client.make_url("/")))
+        return self._rpc_client
+
+    async def tearDownAsync(self):
+        if getattr(self, "_rpc_client", None) is not None:
+            await self._rpc_client.close()
+
+    @unittest_run_loop
+    async def test_balance_poll(self):
+        self.mock_node.set_eth_balance(ACCOUNT_ADDRESS, 10 ** 18)
+        for i, token_address in enumerate(TOKEN_ADDRESSES):
+            self.mock_node.set_token_balance(token_address, ACCOUNT_ADDRESS, i * 1000)
+
+        calls = [EthereumRPCBatchClient.erc20_balance_of_call(token_address, ACCOUNT_ADDRESS)
+                 for token_address in TOKEN_ADDRESSES]
+        calls.append(EthereumRPCBatchClient.eth_balance_call(ACCOUNT_ADDRESS))
+        results: List[Any] = await self.rpc_client.batch_call(calls)
+
+        # The balances of 30 tokens and ETH take a single round trip, and come back in the order of the calls.
+        self.assertEqual(1, self.mock_node.http_request_count)
+        self.assertEqual(31, self.mock_node.rpc_call_count)
+        self.assertEqual([i * 1000 for i in range(30)] + [10 ** 18],
+                         [EthereumRPCBatchClient.hex_to_int(result) for result in results])
+
+        stats = self.rpc_client.stats
+        self.assertEqual(1, stats["poll_count"])
+        self.assertEqual(31, stats["call_count"])
+        self.assertGreater(stats["last_latency"], 0)
+        self.assertEqual(stats["last_latency"], stats["max_latency"])
+
+    @unittest_run_loop
+    async def test_large_batch(self):
+        calls = [EthereumRPCBatchClient.eth_balance_call(f"0x{i:040x}")
+                 for i in range(EthereumRPCBatchClient.MAX_BATCH_SIZE + 1)]
+        results: List[Any] = await self.rpc_client.batch_call(calls)
+        self.assertEqual(2, self.mock_node.http_request_count)
+        self.assertEqual(["0x0"] * len(calls), results)
+
+    @unittest_run_loop
+    async def test_receipt_poll(self):
+        block_hash: str = "0x" + "ab" * 32
+        self.mock_node.add_transaction_receipt("0x" + "01" * 32, block_hash, 1570000000, 21000)
+        results: List[Any] = await self.rpc_client.batch_call([
+            ("eth_getTransactionReceipt", ["0x" + "01" * 32]),
+            ("eth_getTransactionReceipt", ["0x" + "02" * 32]),
+        ])
+        self.assertEqual(block_hash, results[0]["blockHash"])
+        self.assertIsNone(results[1])
+
+        block: Any = await self.rpc_client.call("eth_getBlockByHash", [block_hash, False])
+        self.assertEqual(1570000000, EthereumRPCBatchClient.hex_to_int(block["timestamp"]))
+
+    @unittest_run_loop
+    async def test_call_errors(self):
+        calls = [EthereumRPCBatchClient.eth_balance_call(ACCOUNT_ADDRESS), ("eth_unknownMethod", [])]
+        with self.assertRaises(EthereumRPCError):
+            await self.rpc_client.batch_call(calls)
+
+        # Failed calls don't hold back the results of the other calls in the batch.
+        results: List[Any] = await self.rpc_client.batch_call(calls, return_exceptions=True)
+        self.assertEqual("0x0", results[0])
+        self.assertIsInstance(results[1], EthereumRPCError)
+        self.assertEqual(-32601, results[1].code)
+        self.assertEqual(2, self.rpc_client.stats["error_count"])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
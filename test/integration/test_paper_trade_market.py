@@ -321,7 +321,7 @@ class PaperTradeMarketTest(unittest.TestCase):
             await asyncio.sleep(1)
             trade_event1 = OrderBookTradeEvent(
                 symbol="ETHUSDT", timestamp=time.time(), type=TradeType.SELL, price=best_bid_price + 1,
-                amount=1.0)
+                amount=base_quantity)
             self.market.order_books['ETHUSDT'].apply_trade(trade_event1)
 
         safe_ensure_future(delay_trigger_event1())
@@ -438,6 +438,102 @@ class PaperTradeMarketTest(unittest.TestCase):
         self.assertAlmostEqual(self.market.get_available_balance(trading_pair.base_asset),
                                starting_base_balance - base_quantity)
 
+    def test_limit_order_queue_position_fill(self):
+        """
+        Test trades at a limit order's price going to the volume queued ahead of the order first, and partially filling
+        the order after that
+        """
+        trading_pair = TradingPair("ETHUSDT", "ETH", "USDT")
+        base_quantity = 100.0
+        starting_base_balance = 200
+        starting_quote_balance = 100000
+        self.market.set_balance(trading_pair.base_asset, starting_base_balance)
+        self.market.set_balance(trading_pair.quote_asset, starting_quote_balance)
+
+        order_book = self.market.order_books[trading_pair.trading_pair]
+        best_bid_price = order_book.get_price(True)
+        client_order_id = self.market.buy(trading_pair.trading_pair, base_quantity, OrderType.LIMIT, best_bid_price)
+        fill_state = self.market.limit_order_fill_states[client_order_id]
+        # The order joins the back of the queue at the best bid.
+        self.assertGreater(fill_state.queue_ahead, 0)
+        queue_ahead = fill_state.queue_ahead
+
+        # A trade that doesn't get through the queue doesn't fill the order.
+        order_book.apply_trade(OrderBookTradeEvent(
+            symbol=trading_pair.trading_pair, timestamp=time.time(), type=TradeType.SELL, price=best_bid_price,
+            amount=queue_ahead / 2))
+        self.assertEqual(0, len(TestUtils.get_match_events(self.market_logger.event_log, OrderFilledEvent, {
+            "order_id": client_order_id
+        })))
+
+        order_book.apply_trade(OrderBookTradeEvent(
+            symbol=trading_pair.trading_pair, timestamp=time.time(), type=TradeType.SELL, price=best_bid_price,
+            amount=queue_ahead / 2 + 1.0))
+        matched_order_fill_events = TestUtils.get_match_events(self.market_logger.event_log, OrderFilledEvent, {
+            "trade_type": TradeType.BUY,
+            "order_id": client_order_id
+        })
+        # Market should fill the order partially, with what's left of the trade after the queue ahead.
+        self.assertEqual(1, len(matched_order_fill_events))
+        filled_amount = float(fill_state.filled_amount)
+        self.assertGreaterEqual(filled_amount, 1.0)
+        self.assertLess(filled_amount, base_quantity)
+        self.assertEqual(0, fill_state.queue_ahead)
+        self.assertEqual(1, len([o for o in self.market.limit_orders if o.client_order_id == client_order_id]))
+
+        # Market should only hold balance for the unfilled amount.
+        self.assertAlmostEqual(float(self.market.on_hold_balances[trading_pair.quote_asset]),
+                               (base_quantity - filled_amount) * best_bid_price)
+        self.assertAlmostEqual(float(self.market.get_balance(trading_pair.base_asset)),
+                               starting_base_balance + filled_amount)
+
+        self.market.cancel(trading_pair.trading_pair, client_order_id)
+        self.assertNotIn(client_order_id, self.market.limit_order_fill_states)
+        self.assertAlmostEqual(float(self.market.on_hold_balances[trading_pair.quote_asset]), 0)
+
+    def test_limit_order_trade_through_price_fill(self):
+        """
+        Test trades through a limit order's price filling the order only up to the trade's amount
+        """
+        trading_pair = TradingPair("ETHUSDT", "ETH", "USDT")
+        base_quantity = 100.0
+        trade_amount = 1.0
+        starting_base_balance = 200
+        starting_quote_balance = 100000
+        self.market.set_balance(trading_pair.base_asset, starting_base_balance)
+        self.market.set_balance(trading_pair.quote_asset, starting_quote_balance)
+
+        order_book = self.market.order_books[trading_pair.trading_pair]
+        best_bid_price = order_book.get_price(True)
+        better_order_id = self.market.buy(trading_pair.trading_pair, base_quantity, OrderType.LIMIT,
+                                          best_bid_price + 2)
+        worse_order_id = self.market.buy(trading_pair.trading_pair, base_quantity, OrderType.LIMIT,
+                                         best_bid_price + 1)
+
+        # A small trade below both orders' prices.
+        order_book.apply_trade(OrderBookTradeEvent(
+            symbol=trading_pair.trading_pair, timestamp=time.time(), type=TradeType.SELL, price=best_bid_price,
+            amount=trade_amount))
+
+        # The best priced order is filled with the whole trade, and nothing is left for the other order.
+        matched_order_fill_events = TestUtils.get_match_events(self.market_logger.event_log, OrderFilledEvent, {
+            "trade_type": TradeType.BUY,
+            "order_id": better_order_id
+        })
+        self.assertEqual(1, len(matched_order_fill_events))
+        self.assertAlmostEqual(trade_amount, float(matched_order_fill_events[0].amount))
+        self.assertAlmostEqual(trade_amount, float(self.market.limit_order_fill_states[better_order_id].filled_amount))
+        self.assertEqual(0, len(TestUtils.get_match_events(self.market_logger.event_log, OrderFilledEvent, {
+            "order_id": worse_order_id
+        })))
+        self.assertEqual(2, len([o for o in self.market.limit_orders if o.is_buy]))
+        self.assertAlmostEqual(float(self.market.get_balance(trading_pair.base_asset)),
+                               starting_base_balance + trade_amount)
+
+        self.market.cancel(trading_pair.trading_pair, better_order_id)
+        self.market.cancel(trading_pair.trading_pair, worse_order_id)
+        self.assertAlmostEqual(float(self.market.on_hold_balances[trading_pair.quote_asset]), 0)
+
     def test_order_cancellation(self):
         trading_pair = TradingPair("ETHUSDT", "ETH", "USDT")
         base_quantity = 2.0
@@ -455,6 +551,13 @@ class PaperTradeMarketTest(unittest.TestCase):
         self.assertEqual(2, len(self.market.limit_orders))
         self.market.cancel(trading_pair.trading_pair, ask_client_order_id)
 
+        # Market should release the balance held by the canceled order
+        self.assertAlmostEqual(float(self.market.on_hold_balances[trading_pair.base_asset]), 0)
+        self.assertAlmostEqual(float(self.market.get_available_balance(trading_pair.base_asset)),
+                               starting_base_balance)
+        self.assertAlmostEqual(float(self.market.on_hold_balances[trading_pair.quote_asset]),
+                               base_quantity * best_bid_price)
+
         matched_limit_orders = TestUtils.get_match_limit_orders(self.market.limit_orders, {
             "client_order_id": ask_client_order_id,
             "symbol": trading_pair.trading_pair,
@@ -495,8 +598,36 @@ class PaperTradeMarketTest(unittest.TestCase):
 
         # Market should remove all canceled orders
         self.assertEqual(0, len(self.market.limit_orders))
+        self.assertEqual(0, len(self.market.on_hold_balances))
 
         matched_order_cancel_events = TestUtils.get_match_events(
             self.market_logger.event_log, OrderCancelledEvent, {})
         # Market should emit cancel event
         self.assertEqual(2, len(matched_order_cancel_events))
+
+    def test_on_hold_balances_for_order_grid(self):
+        trading_pair = TradingPair("ETHUSDT", "ETH", "USDT")
+        asyncio.get_event_loop().run_until_complete(self.market.cancel_all(0))
+        self.market.set_balance(trading_pair.base_asset, 200)
+        self.market.set_balance(trading_pair.quote_asset, 200000)
+        best_bid_price = self.market.order_books[trading_pair.trading_pair].get_price(True)
+        best_ask_price = self.market.order_books[trading_pair.trading_pair].get_price(False)
+        for i in range(1, 26):
+            self.market.buy(trading_pair.trading_pair, 0.1 * i, OrderType.LIMIT, best_bid_price * (1 - 0.001 * i))
+            self.market.sell(trading_pair.trading_pair, 0.1 * i, OrderType.LIMIT, best_ask_price * (1 + 0.001 * i))
+        limit_orders: List[LimitOrder] = self.market.limit_orders
+        self.assertEqual(50, len(limit_orders))
+
+        # Market should hold the total of all the resting orders
+        expected_quote_on_hold = sum(o.quantity * o.price for o in limit_orders if o.is_buy)
+        expected_base_on_hold = sum(o.quantity for o in limit_orders if not o.is_buy)
+        self.assertEqual(expected_quote_on_hold, self.market.on_hold_balances[trading_pair.quote_asset])
+        self.assertEqual(expected_base_on_hold, self.market.on_hold_balances[trading_pair.base_asset])
+        self.assertEqual(200000 - expected_quote_on_hold,
+                         self.market.get_available_balance(trading_pair.quote_asset))
+        self.assertEqual(200 - expected_base_on_hold, self.market.get_available_balance(trading_pair.base_asset))
+
+        asyncio.get_event_loop().run_until_complete(self.market.cancel_all(0))
+        self.assertEqual(0, len(self.market.on_hold_balances))
+        self.assertEqual(200000, self.market.get_available_balance(trading_pair.quote_asset))
+        self.assertEqual(200, self.market.get_available_balance(trading_pair.base_asset))
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import numpy as np
+import unittest
+from typing import (
+    List,
+    Tuple,
+)
+
+from hummingbot.strategy.arbitrage.arbitrage_depth_search import (
+    ArbitrageSteps,
+    find_arbitrage_steps,
+    find_best_profitable_amount,
+)
+
+
+def make_levels(best_price: float, tick: float, num_levels: int, seed: int) -> np.ndarray:
+    random_state: np.random.RandomState = np.random.RandomState(seed)
+    return np.column_stack([best_price + tick * np.arange(num_levels),
+                            random_state.randint(1, 20, num_levels) * 0.25,
+                            np.ones(num_levels)]).astype("float64")
+
+
+def reference_best_profitable_amount(steps: List[Tuple[float, float, float]],
+                                     min_profitability: Decimal,
+                                     fee_percent: Decimal,
+                                     flat_fees: Decimal,
+                                     quote_balance: Decimal,
+                                     base_balance: Decimal) -> Tuple[Decimal, Decimal]:
+    # Transcription of the step walk in ArbitrageStrategy.c_find_best_profitable_amount_stepwise().
+    total_bid_value_adjusted: Decimal = Decimal(0)
+    total_ask_value_adjusted: Decimal = Decimal(0)
+    total_previous_step_base_amount: Decimal = Decimal(0)
+    best_amount: Decimal = Decimal(0)
+    best_profitability: Decimal = Decimal(0)
+    for bid_price, ask_price, amount in steps:
+        bid_price, ask_price, amount = (Decimal(repr(float(bid_price))), Decimal(repr(float(ask_price))),
+                                        Decimal(repr(float(amount))))
+        total_bid_value_adjusted += bid_price * amount
+        total_ask_value_adjusted += ask_price * amount
+        net_sell_proceeds: Decimal = total_bid_value_adjusted * (1 - fee_percent) - flat_fees
+        net_buy_costs: Decimal = total_ask_value_adjusted * (1 + fee_percent) + flat_fees
+        profitability: Decimal = net_sell_proceeds / net_buy_costs
+        if profitability > (1 + min_profitability):
+            best_amount = total_previous_step_base_amount + amount
+            best_profitability = profitability
+        if quote_balance < net_buy_costs or base_balance < (total_previous_step_base_amount + amount):
+            if profitability < (1 + min_profitability):
+                break
+            best_amount = min(base_balance, ((quote_balance / ask_price - flat_fees) / (1 + fee_percent)))
+            best_profitability = profitability
+            break
+        total_previous_step_base_amount += amount
+    return best_amount, best_profitability
+
+
+def reference_steps(bids: np.ndarray, asks: np.ndarray) -> List[Tuple[float, float, float]]:
+    steps: List[Tuple[float, float, float]] = []
+    bid_index, ask_index = 0, 0
+    bid_left, ask_left = bids[0, 1], asks[0, 1]
+    while bids[bid_index, 0] >= asks[ask_index, 0]:
+        amount: float = min(bid_left, ask_left)
+        steps.append((bids[bid_index, 0], asks[ask_index, 0], amount))
+        bid_left -= amount
+        ask_left -= amount
+        if bid_left == 0:
+            bid_index += 1
+            if bid_index == len(bids):
+                break
+            bid_left = bids[bid_index, 1]
+        if ask_left == 0:
+            ask_index += 1
+            if ask_index == len(asks):
+                break
+            ask_left = asks[ask_index, 1]
+    return steps
+
+
+class ArbitrageDepthSearchUnitTest(unittest.TestCase):
+    def test_steps_match_reference(self):
+        for seed in range(10):
+            bids: np.ndarray = make_levels(101.0, -0.1, 40, seed)
+            asks: np.ndarray = make_levels(99.0, 0.1, 40, seed + 100)
+            steps: ArbitrageSteps = find_arbitrage_steps(bids, asks, 1.0, 1.0, 0.0)
+            expected: List[Tuple[float, float, float]] = reference_steps(bids, asks)
+            self.assertEqual(len(expected), len(steps.amounts))
+            self.assertFalse(steps.depth_exhausted)
+            actual_steps = zip(steps.bid_prices, steps.ask_prices, steps.amounts)
+            for (bid_price, ask_price, amount), actual in zip(expected, actual_steps):
+                self.assertEqual((bid_price, ask_price), tuple(actual[:2]))
+                self.assertAlmostEqual(amount, actual[2])
+
+    def test_depth_exhausted(self):
+        bids: np.ndarray = make_levels(110.0, -0.1, 5, 1)
+        asks: np.ndarray = make_levels(90.0, 0.1, 5, 2)
+        self.assertTrue(find_arbitrage_steps(bids, asks, 1.0, 1.0, 0.0).depth_exhausted)
+
+    def test_balance_limited_amount(self):
+        bids: np.ndarray = np.array([[101.0, 10.0, 1]], dtype="float64")
+        asks: np.ndarray = np.array([[100.0, 10.0, 1]], dtype="float64")
+        steps: ArbitrageSteps = find_arbitrage_steps(bids, asks, 1.0, 1.0, 0.0)
+        amount, profitability = find_best_profitable_amount(steps, 0.0, 0.0, 0.0, 0.0, 0.0, 500.0, 100.0)
+        self.assertAlmostEqual(5.0, amount)
+        self.assertAlmostEqual(1.01, profitability)
+        amount, _ = find_best_profitable_amount(steps, 0.0, 0.0, 0.0, 0.0, 0.0, 5000.0, 3.0)
+        self.assertAlmostEqual(3.0, amount)
+        self.assertEqual((0.0, 0.0), find_best_profitable_amount(steps, 0.02, 0.0, 0.0, 0.0, 0.0, 5000.0, 100.0))
+
+    def test_best_amount_matches_stepwise_search(self):
+        for seed in range(10):
+            bids: np.ndarray = make_levels(101.0, -0.1, 200, seed)
+            asks: np.ndarray = make_levels(99.0, 0.1, 200, seed + 100)
+            steps: ArbitrageSteps = find_arbitrage_steps(bids, asks, 1.0, 1.0, 0.003)
+            for quote_balance, base_balance in [(100000, 1000), (500, 1000), (100000, 2)]:
+                expected_amount, expected_profitability = reference_best_profitable_amount(
+                    reference_steps(bids, asks), Decimal("0.003"), Decimal("0.001"), Decimal("0.05"),
+                    Decimal(quote_balance), Decimal(base_balance)
+                )
+                amount, profitability = find_best_profitable_amount(steps, 0.003, 0.001, 0.001, 0.05, 0.05,
+                                                                    quote_balance, base_balance)
+                self.assertGreater(amount, 0)
+                self.assertAlmostEqual(float(expected_amount), amount, places=6)
+                self.assertAlmostEqual(float(expected_profitability), profitability, places=9)
+
+
+if __name__ == "__main__":
+    unittest.main()
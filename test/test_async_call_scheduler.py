@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallScheduler,
+    DEFAULT_LANE,
+)
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+
+class AsyncCallSchedulerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0)
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+    @staticmethod
+    def blocking_call(value: int) -> int:
+        time.sleep(0.1)
+        return value
+
+    def test_default_lane_is_serialized(self):
+        async def sleep_and_return(value: int) -> int:
+            await asyncio.sleep(0.05)
+            return value
+
+        start_time: float = time.monotonic()
+        results: List[int] = self.ev_loop.run_until_complete(asyncio.gather(*[
+            self.scheduler.schedule_async_call(sleep_and_return(i), 1.0) for i in range(4)
+        ]))
+        self.assertEqual([0, 1, 2, 3], results)
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.2)
+        self.assertEqual(4, self.scheduler.lane_stats[DEFAULT_LANE]["calls_completed"])
+
+    def test_concurrent_lane(self):
+        self.scheduler.configure_lane("exchange", concurrency=8)
+        start_time: float = time.monotonic()
+        results: List[int] = self.ev_loop.run_until_complete(asyncio.gather(*[
+            self.scheduler.call_async(self.blocking_call, i, timeout_seconds=1.0, lane="exchange") for i in range(8)
+        ]))
+        self.assertEqual(list(range(8)), results)
+        self.assertLess(time.monotonic() - start_time, 0.5)
+
+        stats = self.scheduler.lane_stats["exchange"]
+        self.assertEqual(8, stats["calls_completed"])
+        self.assertEqual(0, stats["in_flight"])
+        self.assertEqual(0, stats["queue_depth"])
+        self.assertGreaterEqual(stats["average_latency"], 0.1)
+
+    def test_lane_rate_limit(self):
+        self.scheduler.configure_lane("node", concurrency=4, max_calls_per_second=20)
+
+        async def now() -> float:
+            return time.monotonic()
+
+        start_times: List[float] = self.ev_loop.run_until_complete(asyncio.gather(*[
+            self.scheduler.schedule_async_call(now(), 1.0, lane="node") for _ in range(5)
+        ]))
+        self.assertGreaterEqual(max(start_times) - min(start_times), 0.19)
+
+    def test_failures_and_timeouts(self):
+        self.scheduler.configure_lane("exchange", concurrency=2)
+
+        async def fail():
+            raise ValueError("Failed.")
+
+        with self.assertRaises(ValueError):
+            self.ev_loop.run_until_complete(self.scheduler.schedule_async_call(fail(), 1.0, lane="exchange"))
+        with self.assertRaises(asyncio.TimeoutError):
+            self.ev_loop.run_until_complete(self.scheduler.schedule_async_call(asyncio.sleep(1.0), 0.05,
+                                                                               lane="exchange"))
+        self.assertEqual(2, self.scheduler.lane_stats["exchange"]["calls_failed"])
+
+    def test_reconfigure_running_lane(self):
+        self.scheduler.configure_lane("exchange", concurrency=1)
+
+        async def sleep_and_return(value: int) -> int:
+            await asyncio.sleep(0.1)
+            return value
+
+        async def run():
+            in_flight_call = safe_ensure_future(self.scheduler.schedule_async_call(sleep_and_return(-1), 1.0,
+                                                                                   lane="exchange"))
+            await asyncio.sleep(0.01)
+
+            # Growing the lane doesn't cancel the call in flight, and the new workers pick up calls right away.
+            self.scheduler.configure_lane("exchange", concurrency=4)
+            start_time: float = time.monotonic()
+            results: List[int] = await asyncio.gather(*[
+                self.scheduler.schedule_async_call(sleep_and_return(i), 1.0, lane="exchange") for i in range(3)
+            ])
+            self.assertEqual([0, 1, 2], results)
+            self.assertLess(time.monotonic() - start_time, 0.2)
+            self.assertEqual(-1, await in_flight_call)
+            self.assertEqual(4, len(self.scheduler.lanes["exchange"].worker_tasks))
+
+            # Shrinking the lane doesn't cancel the calls in flight either, and serializes the calls after them.
+            in_flight_calls = [
+                safe_ensure_future(self.scheduler.schedule_async_call(sleep_and_return(i), 1.0, lane="exchange"))
+                for i in range(2)
+            ]
+            await asyncio.sleep(0.01)
+            self.scheduler.configure_lane("exchange", concurrency=1)
+            start_time = time.monotonic()
+            results = await asyncio.gather(*in_flight_calls, *[
+                self.scheduler.schedule_async_call(sleep_and_return(i), 1.0, lane="exchange") for i in range(2, 4)
+            ])
+            self.assertEqual([0, 1, 2, 3], results)
+            self.assertGreaterEqual(time.monotonic() - start_time, 0.25)
+            self.assertEqual(1, len([t for t in self.scheduler.lanes["exchange"].worker_tasks if not t.done()]))
+            self.assertEqual(0, self.scheduler.lane_stats["exchange"]["queue_depth"])
+
+        self.ev_loop.run_until_complete(run())
+
+    def test_unknown_lane(self):
+        async def noop():
+            pass
+
+        coro = noop()
+        with self.assertRaises(ValueError):
+            self.ev_loop.run_until_complete(self.scheduler.schedule_async_call(coro, 1.0, lane="unknown"))
+        coro.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
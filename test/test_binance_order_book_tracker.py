@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from collections import deque
+import time
+import unittest
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    List,
+)
+from unittest.mock import patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.market.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
+from hummingbot.market.binance.binance_order_book import BinanceOrderBook
+from hummingbot.market.binance.binance_order_book_tracker import BinanceOrderBookTracker
+from hummingbot.market.binance.binance_rate_limiter import PRIORITY_ORDER_BOOK
+
+
+class BinanceOrderBookSequenceUnitTest(unittest.TestCase):
+    symbol: str = "ETHUSDT"
+
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.order_book_tracker: BinanceOrderBookTracker = BinanceOrderBookTracker(symbols=[self.symbol])
+        self.order_book: OrderBook = BinanceOrderBook()
+        self.order_book.restore_from_snapshot_and_diffs(BinanceOrderBook.snapshot_message_from_exchange({
+            "lastUpdateId": 100,
+            "bids": [["199.0", "1.0"]],
+            "asks": [["201.0", "1.0"]]
+        }, time.time(), metadata={"symbol": self.symbol}), [])
+        self.message_queue: asyncio.Queue = asyncio.Queue()
+        self.past_diffs_window: Deque[OrderBookMessage] = deque()
+        self.order_book_tracker._order_books[self.symbol] = self.order_book
+        self.order_book_tracker._tracking_message_queues[self.symbol] = self.message_queue
+        self.snapshot_requests: List[int] = []
+
+    def tearDown(self):
+        self.order_book_tracker.stop()
+
+    def diff_message(self, first_update_id: int, update_id: int, bid_price: float) -> OrderBookMessage:
+        return BinanceOrderBook.diff_message_from_exchange({
+            "e": "depthUpdate",
+            "s": self.symbol,
+            "U": first_update_id,
+            "u": update_id,
+            "b": [[str(bid_price), "2.0"]],
+            "a": []
+        }, time.time())
+
+    def apply_messages(self, messages: List[OrderBookMessage]) -> int:
+        return self.order_book_tracker._apply_message_batch(
+            self.symbol, self.order_book, messages, self.past_diffs_window
+        )
+
+    def mock_get_snapshot(self, snapshot_update_id: int):
+        async def get_snapshot(client, trading_pair: str, limit: int = 1000, priority: int = 0) -> Dict[str, Any]:
+            self.snapshot_requests.append(priority)
+            return {
+                "lastUpdateId": snapshot_update_id,
+                "bids": [["150.0", "3.0"]],
+                "asks": [["250.0", "3.0"]]
+            }
+        return patch.object(BinanceAPIOrderBookDataSource, "get_snapshot", side_effect=get_snapshot)
+
+    def run_resync(self) -> List[OrderBookMessage]:
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.order_book_tracker._resync_tasks[self.symbol], 5.0))
+        messages: List[OrderBookMessage] = []
+        while not self.message_queue.empty():
+            messages.append(self.message_queue.get_nowait())
+        return messages
+
+    def test_contiguous_diffs(self):
+        with self.mock_get_snapshot(0):
+            # Diffs already covered by the snapshot are skipped, and the first diff may straddle the snapshot.
+            applied: int = self.apply_messages([self.diff_message(90, 95, 190.0),
+                                                self.diff_message(96, 103, 191.0),
+                                                self.diff_message(104, 110, 192.0)])
+        self.assertEqual(2, applied)
+        self.assertEqual(110, self.order_book.last_diff_uid)
+        self.assertEqual({"gaps": 0, "resync_requests": 0, "resyncs": 0, "stale": False, "buffered_diffs": 0},
+                         self.order_book_tracker.sequence_stats[self.symbol])
+        self.assertEqual([], self.snapshot_requests)
+
+    def test_gap_resync(self):
+        with self.mock_get_snapshot(115):
+            self.apply_messages([self.diff_message(101, 105, 190.0)])
+            # Update IDs 106 - 109 are missing.
+            self.assertEqual(0, self.apply_messages([self.diff_message(110, 112, 191.0),
+                                                     self.diff_message(113, 116, 192.0)]))
+            self.assertTrue(self.order_book_tracker.is_stale(self.symbol))
+            self.assertEqual(105, self.order_book.last_diff_uid)
+
+            # Further gaps while the order book is stale don't send more snapshot requests.
+            self.apply_messages([self.diff_message(117, 120, 193.0), self.diff_message(125, 126, 194.0)])
+            stats: Dict[str, Any] = self.order_book_tracker.sequence_stats[self.symbol]
+            self.assertEqual(1, stats["gaps"])
+            self.assertEqual(1, stats["resync_requests"])
+            self.assertEqual(4, stats["buffered_diffs"])
+
+            snapshot_messages: List[OrderBookMessage] = self.run_resync()
+        self.assertEqual(1, len(snapshot_messages))
+        self.assertEqual([PRIORITY_ORDER_BOOK], self.snapshot_requests)
+
+        # The snapshot can't be joined to the buffered diffs across the second gap, so a newer one is requested.
+        self.assertEqual(0, self.apply_messages(snapshot_messages))
+        self.assertTrue(self.order_book_tracker.is_stale(self.symbol))
+        self.assertEqual(2, self.order_book_tracker.sequence_stats[self.symbol]["resync_requests"])
+
+        with self.mock_get_snapshot(124):
+            snapshot_messages = self.run_resync()
+        self.assertEqual(1, self.apply_messages(snapshot_messages))
+        self.assertFalse(self.order_book_tracker.is_stale(self.symbol))
+        self.assertEqual(124, self.order_book.snapshot_uid)
+        self.assertEqual(126, self.order_book.last_diff_uid)
+        bid_prices: List[float] = [row.price for row in self.order_book.bid_entries()]
+        self.assertEqual([194.0, 150.0], bid_prices)
+
+        # Diffs carry on from the replayed diffs.
+        self.assertEqual(1, self.apply_messages([self.diff_message(127, 128, 195.0)]))
+        stats = self.order_book_tracker.sequence_stats[self.symbol]
+        self.assertEqual({"gaps": 1, "resync_requests": 2, "resyncs": 1, "stale": False, "buffered_diffs": 0}, stats)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
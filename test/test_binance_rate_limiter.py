@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+import unittest
+from typing import List
+
+from hummingbot.market.binance.binance_rate_limiter import (
+    BinanceRateLimiter,
+    PRIORITY_BACKGROUND,
+    PRIORITY_ORDER_BOOK,
+    PRIORITY_TRADING,
+)
+
+
+class BinanceRateLimiterUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def test_burst_within_capacity(self):
+        rate_limiter: BinanceRateLimiter = BinanceRateLimiter(capacity=50, refill_rate=10)
+        start_time: float = time.monotonic()
+        self.ev_loop.run_until_complete(asyncio.gather(*[rate_limiter.acquire(10) for _ in range(5)]))
+        self.assertLess(time.monotonic() - start_time, 0.1)
+        self.assertEqual(5, rate_limiter.stats["requests_granted"])
+        self.assertEqual(0, rate_limiter.stats["requests_delayed"])
+        self.assertLess(rate_limiter.available_weight, 1)
+
+    def test_refill_rate(self):
+        rate_limiter: BinanceRateLimiter = BinanceRateLimiter(capacity=10, refill_rate=100)
+        start_time: float = time.monotonic()
+        # 10 weight is available straight away, the other 20 needs 0.2 seconds of refills.
+        self.ev_loop.run_until_complete(asyncio.gather(*[rate_limiter.acquire(10) for _ in range(3)]))
+        elapsed: float = time.monotonic() - start_time
+        self.assertGreaterEqual(elapsed, 0.18)
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(2, rate_limiter.stats["requests_delayed"])
+
+    def test_priority_order(self):
+        rate_limiter: BinanceRateLimiter = BinanceRateLimiter(capacity=10, refill_rate=200)
+        served: List[str] = []
+
+        async def request(name: str, priority: int):
+            await rate_limiter.acquire(10, priority=priority)
+            served.append(name)
+
+        async def run():
+            # Empty the bucket, so every following request has to wait.
+            await rate_limiter.acquire(10)
+            await asyncio.gather(request("background", PRIORITY_BACKGROUND),
+                                 request("order_book_1", PRIORITY_ORDER_BOOK),
+                                 request("trading", PRIORITY_TRADING),
+                                 request("order_book_2", PRIORITY_ORDER_BOOK))
+
+        self.ev_loop.run_until_complete(run())
+        self.assertEqual(["trading", "order_book_1", "order_book_2", "background"], served)
+
+    def test_cancelled_request(self):
+        rate_limiter: BinanceRateLimiter = BinanceRateLimiter(capacity=10, refill_rate=100)
+
+        async def run():
+            await rate_limiter.acquire(10)
+            cancelled_request: asyncio.Task = asyncio.ensure_future(rate_limiter.acquire(10))
+            waiting_request: asyncio.Task = asyncio.ensure_future(rate_limiter.acquire(10))
+            await asyncio.sleep(0.01)
+            cancelled_request.cancel()
+            await asyncio.wait_for(waiting_request, timeout=1.0)
+
+        self.ev_loop.run_until_complete(run())
+        self.assertEqual(2, rate_limiter.stats["requests_granted"])
+        self.assertEqual(0, rate_limiter.pending_requests)
+
+    def test_observe_used_weight(self):
+        rate_limiter: BinanceRateLimiter = BinanceRateLimiter()
+        rate_limiter.observe_used_weight(BinanceRateLimiter.WEIGHT_LIMIT_PER_MINUTE - 20)
+        self.assertLessEqual(rate_limiter.available_weight, 21)
+
+    def test_observe_half_used_weight(self):
+        rate_limiter: BinanceRateLimiter = BinanceRateLimiter(capacity=300, refill_rate=0.001)
+        rate_limiter.observe_used_weight(BinanceRateLimiter.WEIGHT_LIMIT_PER_MINUTE / 2)
+        # Half of the exchange's limit is used, so only half of the bucket is left.
+        self.assertAlmostEqual(150, rate_limiter.available_weight, delta=1)
+        # Lower used weight reports don't add weight to the bucket.
+        rate_limiter.observe_used_weight(0)
+        self.assertAlmostEqual(150, rate_limiter.available_weight, delta=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
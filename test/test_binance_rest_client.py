@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from aiohttp import web
+import asyncio
+import hashlib
+import hmac
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
+from hummingbot.market.binance.binance_rate_limiter import BinanceRateLimiter
+from hummingbot.market.binance.binance_rest_client import (
+    BinanceAPIError,
+    BinanceRESTClient,
+    LATENCY_BUCKETS,
+)
+
+API_KEY = "test_api_key"
+API_SECRET = "test_api_secret"
+
+
+class BinanceRESTClientUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.requests: List[Dict[str, Any]] = []
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self.handle_request)
+        self.runner: web.AppRunner = web.AppRunner(app)
+        self.ev_loop.run_until_complete(self.runner.setup())
+        site: web.TCPSite = web.TCPSite(self.runner, "localhost", 0)
+        self.ev_loop.run_until_complete(site.start())
+        port: int = self.runner.addresses[0][1]
+        self.rate_limiter: BinanceRateLimiter = BinanceRateLimiter(capacity=1200.0)
+        self.rest_client: BinanceRESTClient = BinanceRESTClient(API_KEY, API_SECRET,
+                                                                api_url=f"http://localhost:{port}",
+                                                                rate_limiter=self.rate_limiter)
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(HttpClientRegistry.get_instance().close())
+        self.ev_loop.run_until_complete(self.runner.cleanup())
+
+    async def handle_request(self, request: web.Request) -> web.Response:
+        query_string: str = request.query_string
+        signed: bool = "signature=" in query_string
+        if signed:
+            payload, signature = query_string.rsplit("&signature=", 1)
+            expected: str = hmac.new(API_SECRET.encode("utf8"), payload.encode("utf8"), hashlib.sha256).hexdigest()
+            if signature != expected or request.headers.get("X-MBX-APIKEY") != API_KEY:
+                return web.json_response({"code": -1022, "msg": "Signature for this request is not valid."},
+                                         status=400)
+        self.requests.append({"method": request.method, "path": request.path, "query": dict(request.query)})
+        headers: Dict[str, str] = {"X-MBX-USED-WEIGHT": str(len(self.requests) * 100)}
+
+        if request.path == "/api/v3/order" and request.method == "POST":
+            return web.json_response({"symbol": request.query["symbol"], "orderId": 1,
+                                      "clientOrderId": request.query["newClientOrderId"]}, headers=headers)
+        if request.path == "/api/v3/order" and request.method == "DELETE":
+            return web.json_response({"code": -2011, "msg": "Unknown order sent."}, status=400, headers=headers)
+        if request.path == "/api/v1/userDataStream":
+            return web.json_response({"listenKey": "test_listen_key"}, headers=headers)
+        return web.json_response({}, headers=headers)
+
+    def test_signed_orders(self):
+        self.ev_loop.run_until_complete(self._test_signed_orders())
+
+    async def _test_signed_orders(self):
+        order: Dict[str, Any] = await self.rest_client.order_limit_buy(symbol="ETHUSDT", quantity="0.5",
+                                                                       price="180.01", newClientOrderId="buy-1")
+        self.assertEqual("buy-1", order["clientOrderId"])
+        query: Dict[str, str] = self.requests[0]["query"]
+        self.assertEqual(("BUY", "LIMIT", "GTC", "0.5", "180.01"),
+                         (query["side"], query["type"], query["timeInForce"], query["quantity"], query["price"]))
+        self.assertIn("timestamp", query)
+
+        with self.assertRaises(BinanceAPIError) as context:
+            await self.rest_client.cancel_order(symbol="ETHUSDT", origClientOrderId="buy-1")
+        self.assertEqual((400, -2011, "Unknown order sent."),
+                         (context.exception.status, context.exception.code, context.exception.message))
+
+        # Both order round trips are in the stats, and the failed cancel is counted as an error.
+        order_stats = self.rest_client.order_latency_stats
+        self.assertEqual(["POST /api/v3/order", "DELETE /api/v3/order"], list(order_stats.keys()))
+        self.assertEqual([1, 1], [stats.request_count for stats in order_stats.values()])
+        self.assertEqual([0, 1], [stats.error_count for stats in order_stats.values()])
+        self.assertEqual(len(LATENCY_BUCKETS) + 1, len(order_stats["POST /api/v3/order"].histogram))
+        self.assertEqual(1, sum(order_stats["POST /api/v3/order"].histogram))
+
+    def test_weight_accounting(self):
+        self.ev_loop.run_until_complete(self._test_weight_accounting())
+
+    async def _test_weight_accounting(self):
+        await self.rest_client.get_account()
+        await self.rest_client.get_exchange_info()
+        self.assertEqual(6, self.rate_limiter.stats["weight_granted"])
+        # The bucket follows the used weight reported by the exchange.
+        self.assertEqual(200.0, self.rest_client.stats["last_used_weight"])
+        self.assertAlmostEqual(BinanceRateLimiter.WEIGHT_LIMIT_PER_MINUTE - 200.0, self.rate_limiter.available_weight,
+                               delta=5.0)
+
+    def test_listen_key(self):
+        self.ev_loop.run_until_complete(self._test_listen_key())
+
+    async def _test_listen_key(self):
+        self.assertEqual("test_listen_key", await self.rest_client.stream_get_listen_key())
+        await self.rest_client.stream_keepalive("test_listen_key")
+        self.assertEqual([("POST", {}), ("PUT", {"listenKey": "test_listen_key"})],
+                         [(request["method"], request["query"]) for request in self.requests])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from collections import defaultdict
+import logging
+import time
+import unittest
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+from urllib.parse import (
+    parse_qs,
+    urlparse,
+)
+import ujson
+import websockets
+
+from hummingbot.market.binance.binance_websocket_manager import (
+    BinanceWebSocketManager,
+    BinanceWebSocketShard,
+)
+
+TRADING_PAIRS = [f"PAIR{i}USDT" for i in range(5)]
+
+
+class BinanceWebSocketManagerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.connections: Dict[str, int] = defaultdict(int)
+        self.messages: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+    async def handle_connection(self, ws, path: Optional[str] = None):
+        path = path if path is not None else ws.request.path
+        streams: List[str] = parse_qs(urlparse(path).query)["streams"][0].split("/")
+        self.connections[streams[0]] += 1
+        for stream in streams:
+            symbol, channel = stream.split("@")
+            await ws.send(ujson.dumps({
+                "stream": stream,
+                "data": {"e": channel, "E": int((time.time() - 0.05) * 1e3), "s": symbol.upper()}
+            }))
+        # The first shard's connection drops straight after its first messages.
+        if streams[0] == "pair0usdt@depth" and self.connections[streams[0]] == 1:
+            return
+        await ws.wait_closed()
+
+    async def wait_for_messages(self, expected_count: int):
+        while sum(len(messages) for messages in self.messages.values()) < expected_count:
+            await asyncio.sleep(0.05)
+
+    def test_shard_streams(self):
+        manager: BinanceWebSocketManager = BinanceWebSocketManager(["depth", "trade"], max_streams_per_connection=4)
+        self.assertEqual([
+            ["pair0usdt@depth", "pair0usdt@trade", "pair1usdt@depth", "pair1usdt@trade"],
+            ["pair2usdt@depth", "pair2usdt@trade", "pair3usdt@depth", "pair3usdt@trade"],
+            ["pair4usdt@depth", "pair4usdt@trade"],
+        ], manager.shard_streams(TRADING_PAIRS))
+
+    def test_dispatch_errors(self):
+        manager: BinanceWebSocketManager = BinanceWebSocketManager(["depth", "trade"])
+        shard: BinanceWebSocketShard = BinanceWebSocketShard(0, ["pair0usdt@depth", "pair0usdt@trade"])
+
+        def failing_listener(msg: Dict[str, Any]):
+            raise ValueError("Listener error.")
+
+        manager._listeners["depth"] = failing_listener
+        manager._listeners["trade"] = self.messages["trade"].append
+        logging.disable(logging.ERROR)
+        try:
+            for raw_msg in ["not json",
+                            ujson.dumps({"data": {"E": 1}}),
+                            ujson.dumps({"stream": "pair0usdt@depth", "data": {"E": 1, "s": "PAIR0USDT"}}),
+                            ujson.dumps({"stream": "pair0usdt@trade", "data": {"E": 1, "s": "PAIR0USDT"}})]:
+                manager._dispatch(shard, raw_msg)
+        finally:
+            logging.disable(logging.NOTSET)
+        # The messages after the failed ones are still dispatched.
+        self.assertEqual([{"E": 1, "s": "PAIR0USDT"}], self.messages["trade"])
+
+    def test_sharded_streams(self):
+        async def run():
+            server = await websockets.serve(self.handle_connection, "localhost", 0)
+            port: int = list(server.sockets)[0].getsockname()[1]
+            manager: BinanceWebSocketManager = BinanceWebSocketManager(
+                ["depth", "trade"],
+                max_streams_per_connection=4,
+                stream_url=f"ws://localhost:{port}/stream"
+            )
+            listeners: List[asyncio.Task] = [
+                asyncio.ensure_future(manager.listen(channel, self.messages[channel].append, TRADING_PAIRS))
+                for channel in ["depth", "trade"]
+            ]
+            try:
+                # The first shard sends its 4 messages twice, since it reconnects once.
+                await asyncio.wait_for(self.wait_for_messages(14), timeout=5.0)
+                self.assertEqual(3, len(manager.shards))
+                stats: List[Dict[str, Any]] = manager.stats
+                self.assertEqual([1, 0, 0], [shard_stats["reconnects"] for shard_stats in stats])
+                self.assertEqual([8, 4, 2], [shard_stats["message_count"] for shard_stats in stats])
+                self.assertTrue(all(shard_stats["connected"] for shard_stats in stats))
+                self.assertTrue(all(shard_stats["last_lag"] >= 0.04 for shard_stats in stats))
+            finally:
+                for listener in listeners:
+                    listener.cancel()
+                await asyncio.gather(*listeners, return_exceptions=True)
+                server.close()
+                await server.wait_closed()
+            # The connections are closed along with the last listener.
+            self.assertFalse(manager.started)
+
+        self.ev_loop.run_until_complete(run())
+        self.assertEqual(7, len(self.messages["depth"]))
+        self.assertEqual({f"PAIR{i}USDT" for i in range(5)}, {msg["s"] for msg in self.messages["trade"]})
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from aiohttp import web
+import aiohttp
+import asyncio
+import pandas as pd
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
+from hummingbot.market.bittrex.bittrex_api_order_book_data_source import BittrexAPIOrderBookDataSource
+
+MARKETS: List[Dict[str, Any]] = [
+    {"symbol": "BTC-USD", "baseCurrencySymbol": "BTC", "quoteCurrencySymbol": "USD"},
+    {"symbol": "ETH-USD", "baseCurrencySymbol": "ETH", "quoteCurrencySymbol": "USD"},
+    {"symbol": "ETH-BTC", "baseCurrencySymbol": "ETH", "quoteCurrencySymbol": "BTC"},
+]
+TICKERS: List[Dict[str, Any]] = [
+    {"symbol": "BTC-USD", "lastTradeRate": "10000.0"},
+    {"symbol": "ETH-USD", "lastTradeRate": "200.0"},
+    {"symbol": "ETH-BTC", "lastTradeRate": "0.02"},
+]
+SUMMARIES: List[Dict[str, Any]] = [
+    {"symbol": "BTC-USD", "volume": "10.0"},
+    {"symbol": "ETH-USD", "volume": "100.0"},
+    {"symbol": "ETH-BTC", "volume": "1000.0"},
+]
+
+
+class BittrexAPIOrderBookDataSourceUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        app = web.Application()
+        app.router.add_get("/v3/markets", lambda request: web.json_response(MARKETS))
+        app.router.add_get("/v3/markets/tickers", lambda request: web.json_response(TICKERS))
+        app.router.add_get("/v3/markets/summaries", lambda request: web.json_response(SUMMARIES))
+        self.runner: web.AppRunner = web.AppRunner(app)
+        self.ev_loop.run_until_complete(self.runner.setup())
+        site: web.TCPSite = web.TCPSite(self.runner, "localhost", 0)
+        self.ev_loop.run_until_complete(site.start())
+        self.rest_url: str = f"http://localhost:{self.runner.addresses[0][1]}/v3"
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(HttpClientRegistry.get_instance().close())
+        self.ev_loop.run_until_complete(self.runner.cleanup())
+
+    def test_active_exchange_markets_keep_shared_client_open(self):
+        async def run():
+            client: aiohttp.ClientSession = HttpClientRegistry.get_instance().client()
+            with patch("hummingbot.market.bittrex.bittrex_api_order_book_data_source.BITTREX_REST_URL",
+                       self.rest_url):
+                all_markets: pd.DataFrame = await BittrexAPIOrderBookDataSource.get_active_exchange_markets()
+            self.assertEqual(["ETH-BTC", "BTC-USD", "ETH-USD"], all_markets.index.tolist())
+            self.assertEqual(["BTC-ETH", "USD-BTC", "USD-ETH"], all_markets.old_symbol.tolist())
+
+            # The shared client is still open for everyone else.
+            self.assertIs(client, HttpClientRegistry.get_instance().client())
+            self.assertFalse(client.closed)
+
+        self.ev_loop.run_until_complete(run())
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
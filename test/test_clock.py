@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+import unittest
+from typing import (
+    Any,
+    Dict,
+)
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+    IteratorTickStats,
+)
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class SleepingTimeIterator(PyTimeIterator):
+    def __init__(self, sleep_time: float):
+        super().__init__()
+        self.sleep_time = sleep_time
+
+    def tick(self, timestamp: float):
+        time.sleep(self.sleep_time)
+
+
+class ClockUnitTest(unittest.TestCase):
+    def test_backtest_tick_stats(self):
+        fast_iterator: SleepingTimeIterator = SleepingTimeIterator(0.0)
+        slow_iterator: SleepingTimeIterator = SleepingTimeIterator(0.02)
+        clock: Clock = Clock(ClockMode.BACKTEST, 0.01, 1000.0, 1005.0)
+        clock.add_iterator(fast_iterator)
+        clock.add_iterator(slow_iterator)
+        clock.backtest_til(1000.05)
+
+        stats: Dict[str, Any] = clock.tick_stats
+        self.assertEqual(5, stats["tick_count"])
+        # Every tick takes longer than the tick size, because of the slow iterator.
+        self.assertEqual(5, stats["overrun_tick_count"])
+        self.assertEqual(0, stats["missed_tick_count"])
+        self.assertGreaterEqual(stats["max_tick_work_time"], 0.02)
+
+        slow_stats: IteratorTickStats = clock.iterator_tick_stats[slow_iterator]
+        self.assertEqual(5, slow_stats.tick_count)
+        self.assertGreaterEqual(slow_stats.mean_tick_time, 0.02)
+        self.assertEqual([0, 0, 5, 0, 0], slow_stats.histogram)
+        fast_stats: IteratorTickStats = clock.iterator_tick_stats[fast_iterator]
+        self.assertEqual(5, fast_stats.histogram[0])
+
+        self.assertIn("SleepingTimeIterator", clock.format_tick_stats())
+
+        # Removed iterators are dropped from the stats.
+        clock.remove_iterator(slow_iterator)
+        self.assertEqual([fast_iterator], list(clock.iterator_tick_stats.keys()))
+        clock.reset_tick_stats()
+        self.assertEqual(0, clock.tick_stats["tick_count"])
+        self.assertEqual({}, clock.iterator_tick_stats)
+
+    def test_realtime_tick_stats(self):
+        iterator: SleepingTimeIterator = SleepingTimeIterator(0.0)
+        clock: Clock = Clock(ClockMode.REALTIME, 0.1)
+        clock.add_iterator(iterator)
+        with clock:
+            asyncio.get_event_loop().run_until_complete(clock.run_til(time.time() + 0.35))
+
+        stats: Dict[str, Any] = clock.tick_stats
+        self.assertGreaterEqual(stats["tick_count"], 3)
+        self.assertEqual(0, stats["overrun_tick_count"])
+        # The clock can't start working on a tick before it's due.
+        self.assertGreaterEqual(stats["max_tick_drift"], 0)
+        self.assertLess(stats["mean_tick_drift"], 0.1)
+        self.assertEqual(stats["tick_count"], clock.iterator_tick_stats[iterator].tick_count)
+
+    def test_event_ticks(self):
+        iterator: SleepingTimeIterator = SleepingTimeIterator(0.0)
+        clock: Clock = Clock(ClockMode.REALTIME, 1.0)
+        clock.add_iterator(iterator)
+        ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+        async def request_event_ticks():
+            # The first request runs right away, and the next ones are coalesced and delayed by the min interval.
+            for _ in range(3):
+                clock.request_event_tick(iterator, "key", 0.2)
+            await asyncio.sleep(0.1)
+            self.assertEqual(1, clock.tick_stats["event_tick_count"])
+            clock.request_event_tick(iterator, "key", 0.2)
+            clock.request_event_tick(iterator, "key", 0.2)
+            await asyncio.sleep(0.05)
+            self.assertEqual(1, clock.tick_stats["event_tick_count"])
+            await asyncio.sleep(0.2)
+            self.assertEqual(2, clock.tick_stats["event_tick_count"])
+            self.assertGreater(iterator.current_timestamp, 0)
+
+        with clock:
+            ev_loop.run_until_complete(request_event_ticks())
+
+        stats: Dict[str, Any] = clock.tick_stats
+        self.assertEqual(3, stats["coalesced_event_tick_count"])
+        self.assertEqual(2, clock.iterator_tick_stats[iterator].tick_count)
+
+        # Event ticks aren't run outside of the clock context.
+        clock.request_event_tick(iterator, "key", 0.0)
+        ev_loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertEqual(2, clock.tick_stats["event_tick_count"])
+
+    def test_remove_iterator_with_pending_event_tick(self):
+        iterator: SleepingTimeIterator = SleepingTimeIterator(0.0)
+        clock: Clock = Clock(ClockMode.REALTIME, 1.0)
+        clock.add_iterator(iterator)
+
+        async def request_event_ticks():
+            clock.request_event_tick(iterator, "key", 0.2)
+            await asyncio.sleep(0.05)
+            # The second request is delayed by the min interval, and dropped when the iterator is removed.
+            clock.request_event_tick(iterator, "key", 0.2)
+            clock.remove_iterator(iterator)
+            await asyncio.sleep(0.25)
+
+        with clock:
+            asyncio.get_event_loop().run_until_complete(request_event_ticks())
+        self.assertEqual(1, clock.tick_stats["event_tick_count"])
+        self.assertEqual({}, clock.iterator_tick_stats)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
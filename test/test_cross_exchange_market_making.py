@@ -480,6 +480,20 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertEqual((Decimal("0.99452"), Decimal("3")), (bid_price, bid_size))
         self.assertEqual((Decimal("1.0056"), Decimal("3")), (ask_price, ask_size))
 
+    def test_taker_price_cache(self):
+        self.strategy.reset_taker_price_cache_stats()
+        hedging_price: Decimal = self.strategy.get_effective_hedging_price(self.market_pair, True, Decimal("3"))
+        self.assertEqual(hedging_price,
+                         self.strategy.get_effective_hedging_price(self.market_pair, True, Decimal("3")))
+        self.assertEqual({"hits": 1, "misses": 1, "hit_rate": 0.5}, self.strategy.taker_price_cache_stats)
+
+        # The cached prices are dropped once the taker order book has changed.
+        self.simulate_order_book_widening(self.taker_data.order_book, 0.99, 1.01)
+        self.assertLess(self.strategy.get_effective_hedging_price(self.market_pair, True, Decimal("3")),
+                        hedging_price)
+        self.assertEqual(2, self.strategy.taker_price_cache_stats["misses"])
+        self.assertIn("Taker price cache: 1 hits, 2 misses", self.strategy.format_status())
+
     def test_empty_maker_orderbook(self):
         self.clock.remove_iterator(self.strategy)
         self.clock.remove_iterator(self.maker_market)
@@ -10,6 +10,7 @@ import asyncio
 import time
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
 
@@ -34,6 +35,7 @@ class MockDataFeed1(DataFeedBase):
     def __init__(self):
         super().__init__()
         self.mock_price_dict = {"COIN_ALPHA": 1, "CAT": 2}
+        self._last_update_timestamp = time.time()
 
     def get_price(self, symbol):
         return self.mock_price_dict.get(symbol.upper())
@@ -61,6 +63,7 @@ class MockDataFeed2(DataFeedBase):
     def __init__(self):
         super().__init__()
         self.mock_price_dict = {"COIN_ALPHA": 1, "CAT": 5}
+        self._last_update_timestamp = time.time()
 
     @property
     def price_dict(self):
@@ -118,6 +121,62 @@ class ExchangeRateConverterUnitTest(unittest.TestCase):
         exchaneg_rate = ExchangeRateConversion.get_instance().exchange_rate
         self.assertEqual(exchaneg_rate, {'CAT': 5, 'COIN_ALPHA': 1})
 
+    def test_snapshot(self):
+        snapshot = ExchangeRateConversion.get_instance().get_snapshot()
+        self.assertIs(snapshot, ExchangeRateConversion.get_instance().get_snapshot())
+        self.assertEqual(snapshot.adjust_token_rate("cat", Decimal(10)), Decimal(50))
+        self.assertEqual(snapshot.adjust_token_rate("COIN_ALPHA", Decimal(10)), Decimal(10))
+        self.assertEqual(snapshot.get_float_conversion_rate("CAT"), 5.0)
+        self.assertEqual(snapshot.convert_token_value(10, "coin_alpha", "cat"), 2.0)
+        self.assertLess(snapshot.age, 5.0)
+
+        # The rates are unchanged, so the version should stay the same.
+        async_run(ExchangeRateConversion.get_instance().update_exchange_rates_from_data_feeds())
+        self.assertEqual(snapshot.version, ExchangeRateConversion.get_instance().get_snapshot().version)
+
+        MockDataFeed2.get_instance().mock_price_dict["CAT"] = 4
+        try:
+            async_run(ExchangeRateConversion.get_instance().update_exchange_rates_from_data_feeds())
+            new_snapshot = ExchangeRateConversion.get_instance().get_snapshot()
+            self.assertGreater(new_snapshot.version, snapshot.version)
+            self.assertEqual(new_snapshot.adjust_token_rate("cat", Decimal(10)), Decimal(40))
+            self.assertEqual(snapshot.adjust_token_rate("cat", Decimal(10)), Decimal(50))
+        finally:
+            MockDataFeed2.get_instance().mock_price_dict["CAT"] = 5
+
+    def test_stale_assets(self):
+        snapshot = ExchangeRateConversion.get_instance().get_snapshot()
+        self.assertEqual(snapshot.get_stale_assets(["cat", "coin_alpha"], 60.0), [])
+        # Only the rates that need conversion with a rate from a data feed can be stale.
+        self.assertEqual(snapshot.get_stale_assets(["cat", "coin_alpha"], -1.0), ["cat"])
+
+    def test_failing_data_feed(self):
+        snapshot = ExchangeRateConversion.get_instance().get_snapshot()
+        data_feed = MockDataFeed2.get_instance()
+        last_update_timestamp = data_feed.last_update_timestamp
+        # The missing price is expected here, don't log it.
+        ExchangeRateConversion._show_update_exchange_rates_from_data_feeds_errors = False
+        del data_feed.mock_price_dict["CAT"]
+        data_feed._last_update_timestamp = time.time()
+        try:
+            # The data feed has updated, but without the CAT price - so the rates are not refreshed.
+            async_run(ExchangeRateConversion.get_instance().update_exchange_rates_from_data_feeds())
+            failed_snapshot = ExchangeRateConversion.get_instance().get_snapshot()
+            self.assertEqual(snapshot.timestamp, failed_snapshot.timestamp)
+            self.assertEqual(failed_snapshot.get_float_conversion_rate("CAT"), 5.0)
+
+            # The snapshot ages until the data feed recovers, and the CAT rate goes stale.
+            with patch("hummingbot.core.utils.exchange_rate_conversion.time") as mock_time:
+                mock_time.time.return_value = time.time() + 120.0
+                self.assertGreaterEqual(failed_snapshot.age, 120.0)
+                self.assertEqual(failed_snapshot.get_stale_assets(["cat", "coin_alpha"], 60.0), ["cat"])
+        finally:
+            data_feed.mock_price_dict["CAT"] = 5
+            data_feed._last_update_timestamp = last_update_timestamp
+
+        async_run(ExchangeRateConversion.get_instance().update_exchange_rates_from_data_feeds())
+        self.assertEqual(ExchangeRateConversion.get_instance().get_snapshot().get_stale_assets(["cat"], 60.0), [])
+
 
 def main():
     unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from aiohttp import web
+import aiohttp
+import asyncio
+from typing import (
+    Any,
+    List,
+    Tuple,
+)
+import unittest
+
+from hummingbot.core.utils.http_client_registry import (
+    HttpClientRegistry,
+    HttpHostStats,
+)
+
+
+class HttpClientRegistryUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.peers: List[Tuple[str, int]] = []
+        app = web.Application()
+        app.router.add_get("/ok", self.handle_ok)
+        self.runner: web.AppRunner = web.AppRunner(app)
+        self.ev_loop.run_until_complete(self.runner.setup())
+        site: web.TCPSite = web.TCPSite(self.runner, "localhost", 0)
+        self.ev_loop.run_until_complete(site.start())
+        self.base_url: str = f"http://localhost:{self.runner.addresses[0][1]}"
+        self.registry: HttpClientRegistry = HttpClientRegistry(connection_limit_per_host=2)
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(self.registry.close())
+        self.ev_loop.run_until_complete(self.runner.cleanup())
+
+    async def handle_ok(self, request: web.Request) -> web.Response:
+        self.peers.append(request.transport.get_extra_info("peername"))
+        return web.json_response({"ok": True})
+
+    async def fetch(self, path: str) -> Any:
+        client: aiohttp.ClientSession = self.registry.client()
+        async with client.get(f"{self.base_url}{path}") as response:
+            return response.status
+
+    def test_shared_connections(self):
+        async def run():
+            for _ in range(3):
+                self.assertEqual(200, await self.fetch("/ok"))
+            self.assertEqual(404, await self.fetch("/missing"))
+            # Concurrent requests are limited to 2 connections to the host.
+            await asyncio.gather(*[self.fetch("/ok") for _ in range(6)])
+
+        self.ev_loop.run_until_complete(run())
+        # The sequential requests all went over the same kept-alive connection.
+        self.assertEqual(1, len(set(self.peers[:3])))
+        self.assertLessEqual(len(set(self.peers)), 2)
+
+        stats: HttpHostStats = self.registry.host_stats["localhost"]
+        self.assertEqual(10, stats.request_count)
+        self.assertEqual(1, stats.error_count)
+        self.assertGreater(stats.max_latency, 0)
+        self.assertEqual(10, self.registry.stats["localhost"]["request_count"])
+
+    def test_close(self):
+        async def get_client() -> aiohttp.ClientSession:
+            return self.registry.client()
+
+        client: aiohttp.ClientSession = self.ev_loop.run_until_complete(get_client())
+        self.assertIs(client, self.ev_loop.run_until_complete(get_client()))
+        self.ev_loop.run_until_complete(self.registry.close())
+        self.assertTrue(client.closed)
+        # A new client is created for the next user.
+        new_client: aiohttp.ClientSession = self.ev_loop.run_until_complete(get_client())
+        self.assertIsNot(client, new_client)
+        self.assertFalse(new_client.closed)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
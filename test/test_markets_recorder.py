@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import os
+import tempfile
+import unittest
+from typing import (
+    Dict,
+    List,
+)
+
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.market.market_base import MarketBase
+from hummingbot.market.markets_recorder import MarketsRecorder
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+
+class MockMarket(MarketBase):
+    def __init__(self):
+        super().__init__()
+        self.open_orders: Dict[str, Dict[str, str]] = {}
+        self.tracking_states_reads: int = 0
+
+    @property
+    def tracking_states(self) -> Dict[str, any]:
+        self.tracking_states_reads += 1
+        return dict(self.open_orders)
+
+
+class MarketsRecorderUnitTest(unittest.TestCase):
+    def setUp(self):
+        db_fd, self.db_path = tempfile.mkstemp(suffix=".sqlite")
+        os.close(db_fd)
+        self.sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        self.market: MockMarket = MockMarket()
+        self.recorder: MarketsRecorder = MarketsRecorder(self.sql, [self.market], "test_config", "test_strategy",
+                                                         flush_interval=60.0)
+        self.recorder.start()
+
+    def tearDown(self):
+        self.recorder.stop()
+        os.unlink(self.db_path)
+
+    def create_order(self, order_id: str):
+        self.market.open_orders[order_id] = {"order_id": order_id}
+        self.market.trigger_event(MarketEvent.BuyOrderCreated,
+                                  BuyOrderCreatedEvent(1000.0, OrderType.LIMIT, "COINALPHA-WETH", Decimal(1),
+                                                       Decimal(10), order_id))
+
+    def test_write_behind(self):
+        for i in range(20):
+            self.create_order(f"order-{i}")
+
+        # Nothing is written, or serialized, on the event path.
+        self.assertEqual(20, self.recorder.pending_writes)
+        self.assertEqual(0, self.market.tracking_states_reads)
+
+        orders: List[Order] = self.recorder.get_orders_for_config_and_market("test_config", self.market)
+        self.assertEqual(20, len(orders))
+        self.assertEqual(0, self.recorder.pending_writes)
+
+        # Twenty market state saves are coalesced into one.
+        self.assertEqual(1, self.market.tracking_states_reads)
+        market_states: MarketState = self.recorder.get_market_states("test_config", self.market)
+        self.assertEqual(20, len(market_states.saved_state))
+        self.assertEqual(1, self.recorder.write_stats["batches_written"])
+
+    def test_order_status_and_fills(self):
+        self.create_order("order-1")
+        self.create_order("order-2")
+        self.market.trigger_event(MarketEvent.OrderFilled,
+                                  OrderFilledEvent(1001.0, "order-1", "COINALPHA-WETH", TradeType.BUY,
+                                                   OrderType.LIMIT, Decimal(10), Decimal(1), TradeFee(Decimal(0))))
+        del self.market.open_orders["order-2"]
+        self.market.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(1002.0, "order-2"))
+
+        trades: List[TradeFill] = self.recorder.get_trades_for_config("test_config")
+        self.assertEqual(1, len(trades))
+        self.assertEqual("order-1", trades[0].order_id)
+        recorded_orders: List[Order] = self.recorder.get_orders_for_config_and_market("test_config", self.market)
+        orders: Dict[str, Order] = {order.id: order for order in recorded_orders}
+        self.assertEqual(MarketEvent.OrderFilled.name, orders["order-1"].last_status)
+        self.assertEqual(MarketEvent.OrderCancelled.name, orders["order-2"].last_status)
+        self.assertEqual(["order-1"], list(self.recorder.get_market_states("test_config",
+                                                                           self.market).saved_state.keys()))
+
+    def test_flush_on_stop(self):
+        self.create_order("order-1")
+        self.recorder.stop()
+        self.assertEqual(0, self.recorder.pending_writes)
+
+        sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        self.assertEqual(1, sql.get_shared_session().query(Order).count())
+        self.assertIsNotNone(sql.get_shared_session().query(MarketState).one_or_none())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import numpy as np
+import time
+import unittest
+from typing import (
+    Dict,
+    Optional,
+)
+
+from hummingbot.core.data_type.multi_process_order_book_tracker import MultiProcessOrderBookTracker
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.shared_order_book_ring import (
+    SharedOrderBookRing,
+    TopOfBookFrame,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    TradeType,
+)
+
+SYMBOL: str = "COINALPHA-WETH"
+
+
+def book_rows(prices, amount: float, update_id: int) -> np.ndarray:
+    return np.array([[price, amount, update_id] for price in prices], dtype="float64")
+
+
+class MockOrderBookTracker(OrderBookTracker):
+    """
+    Stands in for an exchange's order book tracker in the worker process - it sets up an order book with 30 levels on
+    each side, and then applies a diff and a trade to it.
+    """
+    @property
+    def data_source(self) -> Optional[OrderBookTrackerDataSource]:
+        return None
+
+    @property
+    def exchange_name(self) -> str:
+        return "mock"
+
+    async def start(self):
+        order_book: OrderBook = OrderBook()
+        order_book.apply_numpy_snapshot(book_rows(range(99, 69, -1), 1.0, 1), book_rows(range(101, 131), 1.0, 1), 1)
+        self._order_books[SYMBOL] = order_book
+        await asyncio.sleep(0.5)
+        order_book.apply_numpy_diffs(book_rows([99.5], 2.0, 2), book_rows([101], 0.0, 2), 2)
+        order_book.apply_trade(OrderBookTradeEvent(SYMBOL, time.time(), TradeType.BUY, 101.0, 0.5))
+
+    def stop(self):
+        pass
+
+
+class SharedOrderBookRingUnitTest(unittest.TestCase):
+    def test_publish_and_read(self):
+        ring: SharedOrderBookRing = SharedOrderBookRing([SYMBOL, "WETH-DAI"], depth=5, ring_size=4)
+        self.assertIsNone(ring.read(SYMBOL))
+
+        bids: np.ndarray = book_rows(range(99, 89, -1), 1.0, 10)
+        asks: np.ndarray = book_rows(range(101, 104), 2.0, 10)
+        self.assertEqual(1, ring.publish(SYMBOL, bids, asks, 10, 1000.0))
+        frame: TopOfBookFrame = ring.read(SYMBOL)
+        self.assertEqual((1, 1000.0, 10), (frame.sequence, frame.timestamp, frame.update_id))
+        # Only the top 5 bids fit.
+        self.assertTrue(np.array_equal(bids[:5], frame.bids))
+        self.assertTrue(np.array_equal(asks, frame.asks))
+        self.assertIsNone(ring.read(SYMBOL, frame.sequence))
+        self.assertIsNone(ring.read("WETH-DAI"))
+
+        # Readers only see the latest frame, however many have been published since.
+        for update_id in range(11, 21):
+            ring.publish(SYMBOL, bids[update_id - 11:], asks, update_id, 1000.0 + update_id)
+        frame = ring.read(SYMBOL, frame.sequence)
+        self.assertEqual((11, 20), (frame.sequence, frame.update_id))
+        self.assertEqual(90.0, frame.bids[0, 0])
+        self.assertEqual(1, len(frame.bids))
+
+
+class MultiProcessOrderBookTrackerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.order_book_tracker: MultiProcessOrderBookTracker = MultiProcessOrderBookTracker(
+            MockOrderBookTracker, [SYMBOL], "mock", depth=10
+        )
+        self.trade_logger: EventLogger = EventLogger()
+        self.order_book_tracker.order_books[SYMBOL].add_listener(OrderBookEvent.TradeEvent, self.trade_logger)
+
+    def tearDown(self):
+        self.order_book_tracker.stop()
+
+    async def wait_for_trade(self):
+        while len(self.trade_logger.event_log) < 1:
+            await asyncio.sleep(0.05)
+
+    def test_worker_process(self):
+        self.ev_loop.run_until_complete(self.order_book_tracker.start())
+        # Starting the worker process takes a while, since it imports everything anew.
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.wait_for_trade(), timeout=30.0))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+        self.assertTrue(self.order_book_tracker.ready)
+        order_book: OrderBook = self.order_book_tracker.order_books[SYMBOL]
+        self.assertEqual(99.5, order_book.get_price(False))
+        self.assertEqual(102.0, order_book.get_price(True))
+        self.assertEqual(2, order_book.snapshot_uid)
+        # The main process order book has the top 10 levels of each side.
+        self.assertEqual(10, len(list(order_book.bid_entries())))
+        self.assertAlmostEqual((99.5 * 2 + 99) / 3, order_book.get_vwap_for_volume(False, 3).result_price)
+
+        trade_event: OrderBookTradeEvent = self.trade_logger.event_log[0]
+        self.assertEqual((SYMBOL, TradeType.BUY, Decimal("0.5")),
+                         (trade_event.symbol, trade_event.type, Decimal(str(trade_event.amount))))
+
+        stats: Dict[str, any] = self.order_book_tracker.worker_stats
+        self.assertTrue(stats["worker_alive"])
+        self.assertGreaterEqual(stats["frames_applied"], 2)
+        self.assertEqual(1, stats["trades_applied"])
+
+        self.order_book_tracker.stop()
+        self.assertFalse(self.order_book_tracker.worker_stats["worker_alive"])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
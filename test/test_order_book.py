@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import math
+import numpy as np
+import unittest
+from typing import List
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTopChangedEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+
+
+class OrderBookUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.order_book: OrderBook = OrderBook()
+        bids: np.ndarray = np.array([
+            [99.0, 1.0, 1],
+            [98.0, 2.0, 1],
+            [97.0, 3.0, 1],
+        ], dtype="float64")
+        asks: np.ndarray = np.array([
+            [101.0, 1.0, 1],
+            [102.0, 2.0, 1],
+            [103.0, 3.0, 1],
+        ], dtype="float64")
+        self.order_book.apply_numpy_snapshot(bids, asks)
+
+    @staticmethod
+    def reference_vwap(rows: List[OrderBookRow], volume: float) -> float:
+        total_cost: float = 0
+        total_volume: float = 0
+        for row in rows:
+            take: float = min(row.amount, volume - total_volume)
+            total_cost += take * row.price
+            total_volume += take
+            if total_volume >= volume:
+                return total_cost / volume
+        return math.nan
+
+    def test_price_for_volume(self):
+        self.assertEqual(101.0, self.order_book.get_price_for_volume(True, 0.5).result_price)
+        self.assertEqual(102.0, self.order_book.get_price_for_volume(True, 2.5).result_price)
+        self.assertEqual(97.0, self.order_book.get_price_for_volume(False, 6.0).result_price)
+        result = self.order_book.get_price_for_volume(True, 10.0)
+        self.assertTrue(math.isnan(result.result_price))
+        self.assertEqual(6.0, result.result_volume)
+
+    def test_vwap_for_volume(self):
+        asks: List[OrderBookRow] = list(self.order_book.ask_entries())
+        bids: List[OrderBookRow] = list(self.order_book.bid_entries())
+        for volume in [0.5, 1.0, 1.2, 2.5, 4.0, 6.0]:
+            self.assertAlmostEqual(self.reference_vwap(asks, volume),
+                                   self.order_book.get_vwap_for_volume(True, volume).result_price)
+            self.assertAlmostEqual(self.reference_vwap(bids, volume),
+                                   self.order_book.get_vwap_for_volume(False, volume).result_price)
+        self.assertTrue(math.isnan(self.order_book.get_vwap_for_volume(True, 7.0).result_price))
+
+    def test_volume_for_price(self):
+        result = self.order_book.get_volume_for_price(True, 102.5)
+        self.assertEqual(3.0, result.result_volume)
+        self.assertEqual(102.0, result.result_price)
+        result = self.order_book.get_volume_for_price(False, 98.0)
+        self.assertEqual(3.0, result.result_volume)
+        self.assertEqual(98.0, result.result_price)
+        self.assertAlmostEqual(99.0 + 196.0, self.order_book.get_quote_volume_for_price(False, 98.0).result_volume)
+
+    def test_quote_volume_queries(self):
+        self.assertEqual(102.0, self.order_book.get_price_for_quote_volume(True, 200.0).result_price)
+        self.assertAlmostEqual(101.0 + 0.5 * 102.0,
+                               self.order_book.get_quote_volume_for_base_amount(True, 1.5).result_volume)
+
+    def test_depth_index_invalidation(self):
+        version: int = self.order_book.version
+        self.assertEqual(102.0, self.order_book.get_price_for_volume(True, 2.5).result_price)
+        self.assertEqual(version, self.order_book.version)
+
+        # Remove the 102.0 level, the cached depth index must not be used any more.
+        self.order_book.apply_diffs([], [OrderBookRow(102.0, 0.0, 2)], 2)
+        self.assertGreater(self.order_book.version, version)
+        self.assertEqual(103.0, self.order_book.get_price_for_volume(True, 2.5).result_price)
+        self.assertEqual(4.0, self.order_book.get_volume_for_price(True, 103.0).result_volume)
+
+        version = self.order_book.version
+        self.order_book.apply_snapshot([OrderBookRow(50.0, 1.0, 3)], [OrderBookRow(60.0, 1.0, 3)], 3)
+        self.assertGreater(self.order_book.version, version)
+        self.assertEqual(50.0, self.order_book.get_vwap_for_volume(False, 1.0).result_price)
+
+    def test_composite_side_book_cache(self):
+        order_book: CompositeOrderBook = CompositeOrderBook()
+        bids_array, asks_array = self.order_book.get_numpy_snapshot()
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        self.assertEqual(3.0, order_book.get_volume_for_price(True, 102.0).result_volume)
+        self.assertEqual(3.0, order_book.get_volume_for_price(True, 102.0).result_volume)
+
+        # A recorded fill changes the composite entries, even though the order book itself hasn't changed.
+        order_book.record_filled_order(OrderFilledEvent(1.0, "buy-1", "COINALPHA-WETH", TradeType.BUY,
+                                                        OrderType.LIMIT, 101.0, 0.5, TradeFee(0)))
+        self.assertEqual(2.5, order_book.get_volume_for_price(True, 102.0).result_volume)
+        self.assertEqual(102.0, order_book.get_price_for_volume(True, 1.0).result_price)
+        self.assertEqual(3.0, order_book.get_volume_for_price(False, 98.0).result_volume)
+
+        order_book.apply_diffs([], [OrderBookRow(102.0, 0.0, 2)], 2)
+        self.assertEqual(0.5, order_book.get_volume_for_price(True, 102.0).result_volume)
+        order_book.clear_traded_order_book()
+        self.assertEqual(1.0, order_book.get_volume_for_price(True, 102.0).result_volume)
+
+    def test_numpy_snapshot(self):
+        bids_array, asks_array = self.order_book.get_numpy_snapshot()
+        self.assertEqual((3, 3), bids_array.shape)
+        self.assertEqual([99.0, 98.0, 97.0], list(bids_array[:, 0]))
+        self.assertEqual([101.0, 102.0, 103.0], list(asks_array[:, 0]))
+        self.assertEqual([1.0, 2.0, 3.0], list(asks_array[:, 1]))
+
+        bids_array, asks_array = self.order_book.get_numpy_snapshot(depth=2)
+        self.assertEqual((2, 3), bids_array.shape)
+        self.assertEqual((2, 3), asks_array.shape)
+
+        preallocated_bids: np.ndarray = np.zeros((5, 3), dtype="float64")
+        preallocated_asks: np.ndarray = np.zeros((1, 3), dtype="float64")
+        self.assertEqual((3, 1), self.order_book.fill_numpy_snapshot(preallocated_bids, preallocated_asks))
+        self.assertEqual(97.0, preallocated_bids[2, 0])
+        self.assertEqual(0.0, preallocated_bids[3, 0])
+        self.assertEqual(101.0, preallocated_asks[0, 0])
+
+        bids_df, asks_df = self.order_book.snapshot
+        self.assertEqual(list(OrderBookRow._fields), list(bids_df.columns))
+        self.assertEqual([row.price for row in self.order_book.ask_entries()], list(asks_df.price))
+
+    def test_batched_queries_match_single_queries(self):
+        volumes: List[float] = [4.0, 0.5, 10.0, 1.0, 2.5]
+        prices: List[float] = [102.0, 100.0, 110.0, 101.0]
+        for is_buy in [True, False]:
+            batched = self.order_book.get_price_for_volumes(is_buy, volumes)
+            for volume, result in zip(volumes, batched):
+                single = self.order_book.get_price_for_volume(is_buy, volume)
+                self.assertEqual(single.query_volume, result.query_volume)
+                self.assertTrue(single.result_price == result.result_price or
+                                (math.isnan(single.result_price) and math.isnan(result.result_price)))
+                self.assertEqual(single.result_volume, result.result_volume)
+
+            batched = self.order_book.get_vwap_for_volumes(is_buy, volumes)
+            for volume, result in zip(volumes, batched):
+                single = self.order_book.get_vwap_for_volume(is_buy, volume)
+                if math.isnan(single.result_price):
+                    self.assertTrue(math.isnan(result.result_price))
+                else:
+                    self.assertAlmostEqual(single.result_price, result.result_price)
+                self.assertEqual(single.result_volume, result.result_volume)
+
+            batched = self.order_book.get_volume_for_prices(is_buy, prices if is_buy else [98.0, 100.0, 90.0])
+            for price, result in zip(prices if is_buy else [98.0, 100.0, 90.0], batched):
+                single = self.order_book.get_volume_for_price(is_buy, price)
+                self.assertEqual(single.result_volume, result.result_volume)
+
+    def test_top_of_book_changed_events(self):
+        event_logger: EventLogger = EventLogger()
+        self.order_book.add_listener(OrderBookEvent.TopOfBookChanged, event_logger)
+        empty: np.ndarray = np.zeros((0, 3), dtype="float64")
+
+        # No events unless the top levels are watched.
+        self.order_book.apply_numpy_diffs(np.array([[99.0, 2.0, 2]], dtype="float64"), empty)
+        self.assertEqual(0, len(event_logger.event_log))
+
+        self.order_book.top_levels_watched = 2
+        # Changes beyond the top 2 levels are ignored.
+        self.order_book.apply_numpy_diffs(np.array([[97.0, 4.0, 3]], dtype="float64"),
+                                          np.array([[103.0, 4.0, 3]], dtype="float64"))
+        self.assertEqual(0, len(event_logger.event_log))
+
+        self.order_book.apply_numpy_diffs(np.array([[98.0, 0.0, 4]], dtype="float64"), empty)
+        self.assertEqual([OrderBookTopChangedEvent(True, False)], event_logger.event_log)
+        # A new best ask.
+        self.order_book.apply_numpy_diffs(empty, np.array([[100.5, 1.0, 5]], dtype="float64"))
+        self.assertEqual(OrderBookTopChangedEvent(False, True), event_logger.event_log[-1])
+
+        self.order_book.apply_numpy_snapshot(np.array([[99.0, 1.0, 6]], dtype="float64"), empty)
+        self.assertEqual(OrderBookTopChangedEvent(True, True), event_logger.event_log[-1])
+        # With fewer levels than watched, any change is a change to the top levels.
+        self.order_book.apply_numpy_diffs(np.array([[50.0, 1.0, 7]], dtype="float64"), empty)
+        self.assertEqual(4, len(event_logger.event_log))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging
+import numpy as np
+import tempfile
+import unittest
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.core.data_type.order_book_recording import (
+    OrderBookRecording,
+    OrderBookRecordingWriter,
+    SymbolRecording,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import ReplayOrderBookTrackerDataSource
+from hummingbot.core.event.events import TradeType
+
+SYMBOL: str = "COINALPHA-WETH"
+
+
+class MockOrderBookTracker(OrderBookTracker):
+    @property
+    def data_source(self) -> OrderBookTrackerDataSource:
+        raise NotImplementedError
+
+    @property
+    def exchange_name(self) -> str:
+        return "mock_exchange"
+
+    async def start(self):
+        pass
+
+
+def diff_message(update_id: int, bids: List[List[float]], asks: List[List[float]]) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "symbol": SYMBOL,
+        "update_id": update_id,
+        "bids": bids,
+        "asks": asks
+    }, timestamp=float(update_id))
+
+
+class OrderBookRecorderUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.recording_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.tracker: MockOrderBookTracker = MockOrderBookTracker()
+        order_book: OrderBook = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[100.0, 1.0, 1]], dtype="float64"),
+                                        np.array([[101.0, 1.0, 1]], dtype="float64"),
+                                        1)
+        self.tracker.order_books[SYMBOL] = order_book
+
+    def tearDown(self):
+        self.tracker.stop()
+        self.recording_dir.cleanup()
+
+    def test_record_from_routers(self):
+        recorder: OrderBookRecorder = self.tracker.start_recording(self.recording_dir.name, flush_interval=3600.0)
+        self.tracker._order_book_snapshot_router_task = asyncio.ensure_future(
+            self.tracker._order_book_snapshot_router()
+        )
+        snapshot_message: OrderBookMessage = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "symbol": SYMBOL,
+            "update_id": 1,
+            "bids": [[100.0, 1.0]],
+            "asks": [[101.0, 1.0]]
+        }, timestamp=1.0)
+        self.ev_loop.run_until_complete(self.tracker._order_book_snapshot_stream.put(snapshot_message))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertEqual(1, recorder.recording_stats["messages_pending"])
+
+        self.ev_loop.run_until_complete(recorder.flush())
+        stats: Dict[str, Any] = recorder.recording_stats
+        self.assertEqual(0, stats["messages_pending"])
+        self.assertEqual(2, stats["messages_written"])
+        self.assertEqual(1, stats["checkpoints_recorded"])
+        self.assertEqual([SYMBOL], OrderBookRecording(self.recording_dir.name).symbols)
+
+    def test_record_and_seek(self):
+        recorder: OrderBookRecorder = self.tracker.start_recording(self.recording_dir.name,
+                                                                   flush_interval=3600.0,
+                                                                   checkpoint_interval=3600.0)
+        for message in [
+            diff_message(2, [[100.0, 2.0]], []),
+            diff_message(3, [[99.0, 1.0]], [[102.0, 3.0]]),
+            # Order level messages without price levels are skipped.
+            OrderBookMessage(OrderBookMessageType.DIFF, {"symbol": SYMBOL, "update_id": 4}, timestamp=4.0),
+            OrderBookMessage(OrderBookMessageType.TRADE, {
+                "symbol": SYMBOL,
+                "trade_id": "f00",
+                "trade_type": float(TradeType.SELL.value),
+                "price": 100.0,
+                "amount": 0.5
+            }, timestamp=5.0),
+        ]:
+            self.tracker._record_message(message)
+        # The first flush writes a checkpoint snapshot of the tracked order book after the messages.
+        self.ev_loop.run_until_complete(recorder.flush())
+        self.tracker._record_message(diff_message(6, [[100.0, 0.0]], []))
+        self.ev_loop.run_until_complete(recorder.flush())
+
+        stats: Dict[str, Any] = recorder.recording_stats
+        self.assertEqual(5, stats["messages_recorded"])
+        self.assertEqual(1, stats["messages_skipped"])
+        self.assertEqual(1, stats["checkpoints_recorded"])
+        self.assertEqual(5, stats["messages_written"])
+
+        symbol_recording: SymbolRecording = OrderBookRecording(self.recording_dir.name).load(SYMBOL)
+        self.assertEqual([2.0, 3.0, 5.0, 5.0, 6.0], symbol_recording.timestamp.tolist())
+        self.assertEqual([2, 2, 3, 1, 2], symbol_recording.message_type.tolist())
+        self.assertEqual([2, 3, -1, 1, 6], symbol_recording.update_id.tolist())
+        self.assertEqual(3, symbol_recording.last_snapshot_index(5.5))
+        self.assertEqual(-1, symbol_recording.last_snapshot_index(4.0))
+
+        # Seeking starts from the checkpoint, instead of the start of the recording.
+        data_source: ReplayOrderBookTrackerDataSource = ReplayOrderBookTrackerDataSource(self.recording_dir.name)
+        self.assertEqual(2, data_source.seek(6.0))
+        bids, asks = data_source.order_books[SYMBOL].snapshot
+        self.assertEqual([], bids.price.tolist())
+        self.assertEqual([101.0], asks.price.tolist())
+
+    def test_out_of_order_timestamps(self):
+        writer: OrderBookRecordingWriter = OrderBookRecordingWriter(self.recording_dir.name)
+        writer.write_message(diff_message(2, [[100.0, 2.0]], []))
+        # The trade is timestamped with the exchange's time, which is ahead of the local time of the diffs.
+        writer.write_message(OrderBookMessage(OrderBookMessageType.TRADE, {
+            "symbol": SYMBOL,
+            "trade_id": 1,
+            "trade_type": float(TradeType.BUY.value),
+            "price": 101.0,
+            "amount": 0.5
+        }, timestamp=4.0))
+        writer.write_message(diff_message(3, [[99.0, 1.0]], []))
+        self.assertTrue(writer.write_snapshot(SYMBOL, 3, np.array([[100.0, 2.0]]), np.array([[101.0, 0.5]])))
+        writer.write_message(diff_message(5, [[98.0, 1.0]], []))
+        writer.flush()
+
+        symbol_recording: SymbolRecording = OrderBookRecording(self.recording_dir.name).load(SYMBOL)
+        self.assertEqual([2.0, 4.0, 4.0, 4.0, 5.0], symbol_recording.timestamp.tolist())
+        self.assertEqual(-1, symbol_recording.last_snapshot_index(3.5))
+        self.assertEqual(3, symbol_recording.last_snapshot_index(4.0))
+
+        data_source: ReplayOrderBookTrackerDataSource = ReplayOrderBookTrackerDataSource(self.recording_dir.name)
+        self.assertEqual(2, data_source.seek(5.0))
+        bids, asks = data_source.order_books[SYMBOL].snapshot
+        self.assertEqual([100.0, 98.0], bids.price.tolist())
+
+    def test_bounded_pending_messages(self):
+        recorder: OrderBookRecorder = OrderBookRecorder(self.recording_dir.name, max_pending_messages=2)
+        logging.disable(logging.WARNING)
+        try:
+            for update_id in range(2, 5):
+                recorder.record(diff_message(update_id, [[100.0, 1.0]], []))
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertEqual(2, recorder.recording_stats["messages_pending"])
+        self.assertEqual(1, recorder.recording_stats["messages_dropped"])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
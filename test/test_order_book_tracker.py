@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from collections import deque
+import unittest
+from typing import (
+    Deque,
+    List,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    CompactOrderBookMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MockOrderBookTracker(OrderBookTracker):
+    @property
+    def data_source(self) -> OrderBookTrackerDataSource:
+        raise NotImplementedError
+
+    @property
+    def exchange_name(self) -> str:
+        return "mock_exchange"
+
+    async def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+def diff_message(update_id: int, bids: List[List[str]], asks: List[List[str]]) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "symbol": "COINALPHAWETH",
+        "update_id": update_id,
+        "bids": bids,
+        "asks": asks
+    }, timestamp=float(update_id))
+
+
+def compact_diff_message(update_id: int, bids: List[List[str]], asks: List[List[str]]) -> CompactOrderBookMessage:
+    return CompactOrderBookMessage(OrderBookMessageType.DIFF, {
+        "symbol": "COINALPHAWETH",
+        "update_id": update_id,
+        "bids": bids,
+        "asks": asks
+    }, timestamp=float(update_id))
+
+
+class OrderBookTrackerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.tracker: MockOrderBookTracker = MockOrderBookTracker()
+        self.order_book: OrderBook = OrderBook()
+
+    def test_next_message_batch_drains_queue(self):
+        queue: asyncio.Queue = asyncio.Queue()
+        for i in range(5):
+            queue.put_nowait(diff_message(i + 1, [], []))
+        pending: Deque[OrderBookMessage] = deque([diff_message(0, [], [])])
+        batch: List[OrderBookMessage] = asyncio.get_event_loop().run_until_complete(
+            self.tracker._next_message_batch(queue, pending)
+        )
+        self.assertEqual([0, 1, 2, 3, 4, 5], [m.update_id for m in batch])
+        self.assertTrue(queue.empty())
+        self.assertEqual(0, len(pending))
+
+    def test_coalesced_diffs(self):
+        messages: List[OrderBookMessage] = [
+            diff_message(1, [["99", "1"], ["98", "1"]], [["101", "1"]]),
+            diff_message(2, [["99", "2"]], [["102", "1"]]),
+            diff_message(3, [["98", "0"]], [["101", "3"]]),
+        ]
+        past_diffs_window: Deque[OrderBookMessage] = deque()
+        applied: int = self.tracker._apply_message_batch("COINALPHAWETH", self.order_book, messages, past_diffs_window)
+
+        self.assertEqual(3, applied)
+        self.assertEqual(3, len(past_diffs_window))
+        self.assertEqual([(99.0, 2.0)], [(row.price, row.amount) for row in self.order_book.bid_entries()])
+        self.assertEqual([(101.0, 3.0), (102.0, 1.0)],
+                         [(row.price, row.amount) for row in self.order_book.ask_entries()])
+        self.assertEqual(3, self.order_book.last_diff_uid)
+
+        stats = self.tracker.diff_batch_stats
+        self.assertEqual(1, stats["batches_applied"])
+        self.assertEqual(3, stats["messages_batched"])
+        self.assertEqual(7, stats["rows_received"])
+        self.assertEqual(4, stats["rows_applied"])
+
+    def test_compact_message_parsing(self):
+        message: CompactOrderBookMessage = compact_diff_message(5, [["99.5", "1.25", []]], [])
+        self.assertEqual((1, 3), message.bids_array.shape)
+        self.assertEqual([99.5, 1.25, 5.0], list(message.bids_array[0]))
+        self.assertEqual((0, 3), message.asks_array.shape)
+        self.assertEqual("COINALPHAWETH", message.symbol)
+        self.assertEqual(5, message.update_id)
+        self.assertEqual(99.5, message.bids[0].price)
+
+    def test_coalesced_compact_diffs(self):
+        messages: List[OrderBookMessage] = [
+            compact_diff_message(1, [["99", "1"], ["98", "1"]], [["101", "1"]]),
+            compact_diff_message(2, [["99", "2"]], [["102", "1"]]),
+            compact_diff_message(3, [["98", "0"]], [["101", "3"]]),
+        ]
+        self.tracker._apply_message_batch("COINALPHAWETH", self.order_book, messages, deque())
+
+        self.assertEqual([(99.0, 2.0)], [(row.price, row.amount) for row in self.order_book.bid_entries()])
+        self.assertEqual([(101.0, 3.0), (102.0, 1.0)],
+                         [(row.price, row.amount) for row in self.order_book.ask_entries()])
+        self.assertEqual(3, self.order_book.last_diff_uid)
+        self.assertEqual(7, self.tracker.diff_batch_stats["rows_received"])
+        self.assertEqual(4, self.tracker.diff_batch_stats["rows_applied"])
+
+    def test_snapshot_splits_batch(self):
+        snapshot: OrderBookMessage = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "symbol": "COINALPHAWETH",
+            "update_id": 2,
+            "bids": [["97", "5"]],
+            "asks": [["103", "5"]]
+        }, timestamp=2.0)
+        messages: List[OrderBookMessage] = [
+            diff_message(1, [["99", "1"]], []),
+            snapshot,
+            diff_message(3, [["96", "1"]], []),
+        ]
+        self.tracker._apply_message_batch("COINALPHAWETH", self.order_book, messages, deque())
+
+        self.assertEqual([97.0, 96.0], [row.price for row in self.order_book.bid_entries()])
+        self.assertEqual(2, self.tracker.diff_batch_stats["batches_applied"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import unittest
+from typing import (
+    Dict,
+    List,
+)
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.market.market_base import MarketBase
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.order_tracker import OrderTracker
+from hummingbot.strategy.pure_market_making.pure_market_making_order_tracker import PureMarketMakingOrderTracker
+
+
+class OrderTrackerUnitTest(unittest.TestCase):
+    start_timestamp: float = 1000.0
+
+    def setUp(self):
+        self.market: MarketBase = MarketBase()
+        self.market_pair_1: MarketTradingPairTuple = MarketTradingPairTuple(self.market, "WETHDAI", "WETH", "DAI")
+        self.market_pair_2: MarketTradingPairTuple = MarketTradingPairTuple(self.market, "ZRXWETH", "ZRX", "WETH")
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 1000)
+
+    def start_tracking_orders(self, order_tracker: OrderTracker):
+        self.clock.add_iterator(order_tracker)
+        self.clock.backtest_til(self.start_timestamp)
+        order_tracker.start_tracking_limit_order(self.market_pair_1, "bid_1", True, Decimal(99), Decimal(1))
+        order_tracker.start_tracking_limit_order(self.market_pair_1, "ask_1", False, Decimal(101), Decimal(1))
+        order_tracker.start_tracking_limit_order(self.market_pair_2, "bid_2", True, Decimal("0.01"), Decimal(10))
+
+    @staticmethod
+    def order_ids(limit_orders: List[LimitOrder]) -> List[str]:
+        return sorted(limit_order.client_order_id for limit_order in limit_orders)
+
+    def test_active_orders(self):
+        order_tracker: OrderTracker = OrderTracker()
+        self.start_tracking_orders(order_tracker)
+
+        market_pair_to_active_orders: Dict[MarketTradingPairTuple, List[LimitOrder]] = \
+            order_tracker.market_pair_to_active_orders
+        self.assertEqual(["ask_1", "bid_1"], self.order_ids(market_pair_to_active_orders[self.market_pair_1]))
+        self.assertEqual(["bid_2"], self.order_ids(market_pair_to_active_orders[self.market_pair_2]))
+        self.assertEqual(3, len(order_tracker.active_maker_orders))
+        self.assertEqual(["bid_1", "bid_2"], self.order_ids([o for _, o in order_tracker.active_bids]))
+        self.assertEqual(["ask_1"], self.order_ids([o for _, o in order_tracker.active_asks]))
+
+        # The order lists are only rebuilt after the orders have changed.
+        self.assertIs(order_tracker.active_maker_orders, order_tracker.active_maker_orders)
+        market_pair_2_orders: List[LimitOrder] = order_tracker.market_pair_to_active_orders[self.market_pair_2]
+        order_tracker.stop_tracking_limit_order(self.market_pair_1, "bid_1")
+        self.assertIs(market_pair_2_orders, order_tracker.market_pair_to_active_orders[self.market_pair_2])
+        self.assertEqual(["ask_1"], self.order_ids(order_tracker.market_pair_to_active_orders[self.market_pair_1]))
+        self.assertEqual(["bid_2"], self.order_ids([o for _, o in order_tracker.active_bids]))
+
+        order_tracker.stop_tracking_limit_order(self.market_pair_2, "bid_2")
+        self.assertNotIn(self.market_pair_2, order_tracker.market_pair_to_active_orders)
+        self.assertEqual([], order_tracker.active_bids)
+
+    def test_in_flight_cancels(self):
+        order_tracker: OrderTracker = OrderTracker()
+        self.start_tracking_orders(order_tracker)
+
+        self.assertTrue(order_tracker.check_and_track_cancel("bid_1"))
+        self.assertFalse(order_tracker.check_and_track_cancel("bid_1"))
+        self.assertEqual(["ask_1"], self.order_ids(order_tracker.market_pair_to_active_orders[self.market_pair_1]))
+        self.assertEqual(2, len(order_tracker.active_maker_orders))
+
+        # The order is active again after the cancel has expired.
+        self.clock.backtest_til(self.start_timestamp + OrderTracker.CANCEL_EXPIRY_DURATION - 1)
+        self.assertEqual(2, len(order_tracker.active_maker_orders))
+        self.clock.backtest_til(self.start_timestamp + OrderTracker.CANCEL_EXPIRY_DURATION)
+        self.assertEqual({}, order_tracker.in_flight_cancels)
+        self.assertEqual(["ask_1", "bid_1"],
+                         self.order_ids(order_tracker.market_pair_to_active_orders[self.market_pair_1]))
+
+        # An order that stops being tracked isn't put back.
+        self.assertTrue(order_tracker.check_and_track_cancel("ask_1"))
+        order_tracker.stop_tracking_limit_order(self.market_pair_1, "ask_1")
+        self.clock.backtest_til(self.start_timestamp + OrderTracker.CANCEL_EXPIRY_DURATION * 3)
+        self.assertEqual(["bid_1"], self.order_ids(order_tracker.market_pair_to_active_orders[self.market_pair_1]))
+
+    def test_pure_market_making_in_flight_cancels(self):
+        order_tracker: PureMarketMakingOrderTracker = PureMarketMakingOrderTracker()
+        self.start_tracking_orders(order_tracker)
+
+        # Orders being cancelled are still active in the pure market making order tracker.
+        self.assertTrue(order_tracker.check_and_track_cancel("bid_1"))
+        self.assertEqual(3, len(order_tracker.active_maker_orders))
+        self.assertEqual(2, len(order_tracker.active_bids))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
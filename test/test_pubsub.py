@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from enum import Enum
+import gc
+import unittest
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.pubsub import PubSub
+
+
+class MockEvent(Enum):
+    EventA = 1
+    EventB = 2
+
+
+class SubscribingListener(EventListener):
+    """
+    Changes the subscriptions of its caller when it receives an event.
+    """
+    def __init__(self, pubsub: PubSub, add_listeners: List[EventListener], remove_listeners: List[EventListener]):
+        super().__init__()
+        self._pubsub = pubsub
+        self._add_listeners = add_listeners
+        self._remove_listeners = remove_listeners
+        self.call_count = 0
+
+    def __call__(self, arg: Any):
+        self.call_count += 1
+        for listener in self._add_listeners:
+            self._pubsub.add_listener(MockEvent.EventA, listener)
+        for listener in self._remove_listeners:
+            self._pubsub.remove_listener(MockEvent.EventA, listener)
+
+
+class PubSubUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.pubsub: PubSub = PubSub()
+
+    def test_trigger_event(self):
+        logger_a: EventLogger = EventLogger()
+        logger_b: EventLogger = EventLogger()
+        self.pubsub.add_listener(MockEvent.EventA, logger_a)
+        self.pubsub.add_listener(MockEvent.EventA, logger_a)
+        self.pubsub.add_listener(MockEvent.EventB, logger_b)
+        self.assertEqual([logger_a], self.pubsub.get_listeners(MockEvent.EventA))
+
+        self.pubsub.trigger_event(MockEvent.EventA, "a")
+        self.pubsub.trigger_event(MockEvent.EventB, "b")
+        self.pubsub.trigger_event(MockEvent.EventB, "b")
+        self.assertEqual(["a"], logger_a.event_log)
+        self.assertEqual(["b", "b"], logger_b.event_log)
+
+        self.pubsub.remove_listener(MockEvent.EventA, logger_a)
+        self.pubsub.trigger_event(MockEvent.EventA, "a")
+        self.assertEqual(["a"], logger_a.event_log)
+
+        stats: Dict[int, Dict[str, Any]] = self.pubsub.dispatch_stats
+        self.assertEqual(1, stats[MockEvent.EventA.value]["dispatch_count"])
+        self.assertEqual(2, stats[MockEvent.EventB.value]["dispatch_count"])
+        self.assertGreaterEqual(stats[MockEvent.EventB.value]["listener_time"], 0)
+        self.pubsub.reset_dispatch_stats()
+        self.assertEqual({}, self.pubsub.dispatch_stats)
+
+    def test_dead_listeners(self):
+        logger_a: EventLogger = EventLogger()
+        logger_b: EventLogger = EventLogger()
+        self.pubsub.add_listener(MockEvent.EventA, logger_a)
+        self.pubsub.add_listener(MockEvent.EventA, logger_b)
+        del logger_b
+        gc.collect()
+
+        # The dead listener is skipped, and purged after the dispatch.
+        self.pubsub.trigger_event(MockEvent.EventA, "a")
+        self.assertEqual(["a"], logger_a.event_log)
+        self.assertEqual([logger_a], self.pubsub.get_listeners(MockEvent.EventA))
+
+    def test_subscription_changes_during_dispatch(self):
+        logger_a: EventLogger = EventLogger()
+        logger_b: EventLogger = EventLogger()
+        self.pubsub.add_listener(MockEvent.EventA, logger_a)
+        subscribing_listener: SubscribingListener = SubscribingListener(self.pubsub, [logger_b], [logger_a])
+        self.pubsub.add_listener(MockEvent.EventA, subscribing_listener)
+
+        # The changes only take effect after the dispatch. The listener added during the dispatch doesn't receive the
+        # event being dispatched.
+        self.pubsub.trigger_event(MockEvent.EventA, "a1")
+        self.assertEqual(1, subscribing_listener.call_count)
+        self.assertEqual([], logger_b.event_log)
+        self.assertEqual({subscribing_listener, logger_b}, set(self.pubsub.get_listeners(MockEvent.EventA)))
+
+        self.pubsub.trigger_event(MockEvent.EventA, "a2")
+        self.assertEqual(2, subscribing_listener.call_count)
+        self.assertEqual(["a2"], logger_b.event_log)
+        self.assertNotIn("a2", logger_a.event_log)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
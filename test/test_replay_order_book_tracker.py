@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging
+import tempfile
+import unittest
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    CompactOrderBookMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_recording import (
+    OrderBookRecording,
+    OrderBookRecordingWriter,
+    SymbolRecording,
+)
+from hummingbot.core.data_type.replay_order_book_tracker import ReplayOrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    TradeType,
+)
+
+SYMBOL: str = "COINALPHA-WETH"
+
+
+def book_message(message_type: OrderBookMessageType,
+                 timestamp: float,
+                 update_id: int,
+                 bids: List[List[float]],
+                 asks: List[List[float]]) -> OrderBookMessage:
+    return CompactOrderBookMessage(message_type, {
+        "symbol": SYMBOL,
+        "update_id": update_id,
+        "bids": bids,
+        "asks": asks
+    }, timestamp=timestamp)
+
+
+def trade_message(timestamp: float, trade_id: int, trade_type: TradeType, price: float, amount: float):
+    return OrderBookMessage(OrderBookMessageType.TRADE, {
+        "symbol": SYMBOL,
+        "trade_id": trade_id,
+        "trade_type": float(trade_type.value),
+        "price": price,
+        "amount": amount
+    }, timestamp=timestamp)
+
+
+class ReplayOrderBookTrackerUnitTest(unittest.TestCase):
+    start_timestamp: float = 1000.0
+
+    def setUp(self):
+        self.recording_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        writer: OrderBookRecordingWriter = OrderBookRecordingWriter(self.recording_dir.name)
+        for message in [
+            book_message(OrderBookMessageType.SNAPSHOT, self.start_timestamp + 0.5, 1,
+                         [[100.0, 1.0], [99.0, 2.0]], [[101.0, 1.0], [102.0, 2.0]]),
+            book_message(OrderBookMessageType.DIFF, self.start_timestamp + 1.2, 2, [[100.5, 3.0]], []),
+            book_message(OrderBookMessageType.DIFF, self.start_timestamp + 1.4, 3, [[100.5, 4.0]], [[101.0, 0.0]]),
+            trade_message(self.start_timestamp + 1.5, 10, TradeType.BUY, 102.0, 0.5),
+        ]:
+            writer.write_message(message)
+        writer.flush()
+        # Messages written in separate flushes are appended to the same recording.
+        writer.write_message(book_message(OrderBookMessageType.DIFF, self.start_timestamp + 3.0, 4, [[100.0, 0.0]],
+                                          [[102.0, 1.5]]))
+        writer.write_message(trade_message(self.start_timestamp + 3.5, 11, TradeType.SELL, 100.5, 1.0))
+        writer.flush()
+        self.assertEqual(6, writer.messages_written)
+
+    def tearDown(self):
+        self.recording_dir.cleanup()
+
+    def test_recording_round_trip(self):
+        recording: OrderBookRecording = OrderBookRecording(self.recording_dir.name)
+        self.assertEqual([SYMBOL], recording.symbols)
+        symbol_recording: SymbolRecording = recording.load(SYMBOL)
+        self.assertEqual(6, symbol_recording.message_count)
+        self.assertEqual([1, 2, 2, 3, 2, 3], symbol_recording.message_type.tolist())
+        self.assertEqual([1, 2, 3, 10, 4, 11], symbol_recording.update_id.tolist())
+        self.assertEqual([2, 5, 6, 7, 9, 10], symbol_recording.bids_end.tolist())
+        self.assertEqual([4, 5, 7, 8, 10, 11], symbol_recording.levels_end.tolist())
+        self.assertEqual(11, len(symbol_recording.price))
+
+    def test_replay_with_clock(self):
+        tracker: ReplayOrderBookTracker = ReplayOrderBookTracker(self.recording_dir.name)
+        asyncio.get_event_loop().run_until_complete(tracker.start())
+        self.assertTrue(tracker.ready)
+        order_book: OrderBook = tracker.order_books[SYMBOL]
+        trade_logger: EventLogger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TradeEvent, trade_logger)
+
+        # The replay is driven by the clock, so the data source's listeners return immediately.
+        output: asyncio.Queue = asyncio.Queue()
+        for listener in [tracker.data_source.listen_for_order_book_diffs,
+                         tracker.data_source.listen_for_order_book_snapshots,
+                         tracker.data_source.listen_for_trades]:
+            asyncio.get_event_loop().run_until_complete(listener(asyncio.get_event_loop(), output))
+        self.assertTrue(output.empty())
+
+        clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 100.0)
+        clock.add_iterator(tracker.replay_iterator)
+
+        # Nothing is replayed ahead of the clock.
+        clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(100.0, order_book.get_price(False))
+        self.assertEqual(101.0, order_book.get_price(True))
+        self.assertEqual(0, len(trade_logger.event_log))
+
+        clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(100.5, order_book.get_price(False))
+        self.assertEqual(102.0, order_book.get_price(True))
+        bids, asks = order_book.snapshot
+        self.assertEqual([100.5, 100.0, 99.0], bids.price.tolist())
+        self.assertEqual([4.0, 1.0, 2.0], bids.amount.tolist())
+        self.assertEqual(3, order_book.last_diff_uid)
+        self.assertEqual(1, len(trade_logger.event_log))
+        trade: OrderBookTradeEvent = trade_logger.event_log[0]
+        self.assertEqual(TradeType.BUY, trade.type)
+        self.assertEqual(102.0, trade.price)
+        self.assertEqual(0.5, trade.amount)
+
+        # The clock stops at the end of the recording, instead of the end time.
+        clock.backtest()
+        self.assertTrue(tracker.data_source.exhausted)
+        self.assertEqual(self.start_timestamp + 5, clock.current_timestamp)
+        bids, asks = order_book.snapshot
+        self.assertEqual([100.5, 99.0], bids.price.tolist())
+        self.assertEqual([102.0], asks.price.tolist())
+        self.assertEqual(1.5, asks.amount.tolist()[0])
+        self.assertEqual(2, len(trade_logger.event_log))
+        self.assertEqual(TradeType.SELL, trade_logger.event_log[1].type)
+
+        stats: Dict[str, Any] = tracker.data_source.replay_stats
+        self.assertEqual(6, stats["messages_replayed"])
+        self.assertEqual(11, stats["levels_replayed"])
+        self.assertGreater(stats["events_per_second"], 0)
+
+    def test_truncated_recording(self):
+        # Simulate a write that was interrupted after the level columns were written.
+        with open(join(self.recording_dir.name, SYMBOL, "price.col"), "ab") as fd:
+            fd.write(b"\0" * 8)
+        with open(join(self.recording_dir.name, SYMBOL, "timestamp.col"), "ab") as fd:
+            fd.write(b"\0" * 8)
+        logging.disable(logging.WARNING)
+        try:
+            symbol_recording: SymbolRecording = OrderBookRecording(self.recording_dir.name).load(SYMBOL)
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertEqual(6, symbol_recording.message_count)
+        self.assertEqual(11, len(symbol_recording.price))
+        self.assertEqual(11, len(symbol_recording.amount))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()